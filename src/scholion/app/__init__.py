@@ -1,5 +1,17 @@
 """Application composition."""
 
-from scholion.app.app_container import AppContainer
+from typing import TYPE_CHECKING
+
+from scholion.core.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from scholion.app.app_container import AppContainer
 
 __all__ = ["AppContainer"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "scholion.app.app_container": ("AppContainer",),
+    },
+)
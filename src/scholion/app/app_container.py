@@ -1,84 +1,114 @@
+"""Application composition.
+
+Providers name their implementation with ``deferred("module:attribute")`` and factory
+functions import what they build, so creating the container imports nothing beyond
+configuration. A command that asks for the job lifecycle store never loads DuckDB,
+the transcription engines, or the library services.
+"""
+
+from __future__ import annotations
+
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from dependency_injector import containers, providers
 
-from scholion.app.processing_center import ProcessingCenterService
-from scholion.benchmarking.runner import BenchmarkRunner
-from scholion.core.config import AppConfig
-from scholion.core.file_manager_facade import FileManagerFacade
-from scholion.core.health_check import HealthCheck
-from scholion.core.health_probes import (
-    DiskSpaceProbe,
-    FfmpegProbe,
-    SystemResourcesProbe,
-    WorkspaceProbe,
-)
-from scholion.core.ilogger import ILogger
-from scholion.core.logger import configure_logging
-from scholion.core.performance_tracker import PerformanceTracker
-from scholion.interfaces.local_file_manager import LocalFileManager
-from scholion.library.custody import LibraryCustodyService
-from scholion.library.duckdb_index import DuckDbTranscriptIndex
-from scholion.library.duckdb_research_projection import DuckDbResearchProjection
-from scholion.library.duckdb_semantic import DuckDbSemanticIndex
-from scholion.library.evidence import EvidenceLocator
-from scholion.library.locations import JsonLibraryLocationStore, LibraryLocationService
-from scholion.library.playback import PlaybackAuthorizationService
-from scholion.library.research import ResearchNavigationService
-from scholion.library.research_projector import ResearchStateProjector
-from scholion.library.research_search_controls import ResearchSearchControlService
-from scholion.library.research_workspace import ResearchWorkspaceService
-from scholion.library.semantic import EmbeddingProfile, SentenceTransformersE5Provider
-from scholion.library.service import TranscriptLibraryService
-from scholion.library.speaker_label_service import SpeakerLabelService
-from scholion.library.speaker_labels import SpeakerLabelStore
-from scholion.library.speaker_presentation import SpeakerPresentationService
-from scholion.library.sqlite_research_state import SqliteResearchStateStore
-from scholion.library.transcript_tools import TranscriptToolsService
-from scholion.library.workspace_metadata import SqliteWorkspaceMetadataStore
-from scholion.media.probe import FfprobeMediaProbe
-from scholion.media.selection import AudioStreamSelector
-from scholion.model_management.catalog import faster_whisper_model_catalog
-from scholion.model_management.errors import ModelManagementError
-from scholion.model_management.provider import HuggingFaceModelProvider
-from scholion.model_management.service import ModelManager
-from scholion.runner.inspector import RunnerInspector
-from scholion.runner.policy import RunnerPolicyPlanner
-from scholion.runner.topology import (
-    HardwareTopologyInspector,
-    NvidiaSmiAcceleratorProbe,
-)
-from scholion.transcription.adaptive_executor import AdaptiveTranscriptionExecutor
-from scholion.transcription.assembly import TranscriptAssembler
-from scholion.transcription.audio import FfmpegAudioDecoder
-from scholion.transcription.backend import FasterWhisperTranscriber
-from scholion.transcription.capabilities import (
-    EngineCapabilityRegistry,
-    FasterWhisperCapabilityProbe,
+from scholion.app.factories import (
+    create_file_manager,
+    create_job_lifecycle_store,
+    create_logger,
+    create_workspace_paths,
 )
-from scholion.transcription.checkpoint import LocalCheckpointStore
-from scholion.transcription.diarization import PyannoteSpeakerDiarizer
-from scholion.transcription.enhancement import FfmpegAfftdnEnhancer
-from scholion.transcription.errors import ResourceAdmissionError
-from scholion.transcription.export import TranscriptExporter
-from scholion.transcription.language import LinguaLanguageAttributor
-from scholion.transcription.planner import TranscriptionJobPlanner
-from scholion.transcription.segmentation import WaveAudioSegmenter
-from scholion.transcription.storage import StorageAdmissionPolicy, StorageAllocation
-from scholion.transcription.strategy import StrategyEvaluator, faster_whisper_catalog
-from scholion.workspace.lifecycle import JobLifecycleStore
-from scholion.workspace.models import WorkspacePaths
-from scholion.workspace.service import WorkspaceService
-
-
-def _create_logger(config: AppConfig) -> ILogger:
-    """Build the application logger from the same configuration instance."""
-    return configure_logging(config.LOG_LEVEL, config.APP_ENV)
+from scholion.core.config import AppConfig
+from scholion.core.lazy_imports import deferred
+
+if TYPE_CHECKING:
+    from scholion.app.processing_center import ProcessingCenterService
+    from scholion.benchmarking.compare import BenchmarkHistoryStore
+    from scholion.benchmarking.pipeline import PipelineBenchmark
+    from scholion.benchmarking.runner import BenchmarkRunner
+    from scholion.benchmarking.search import SearchBenchmark
+    from scholion.core.file_manager_facade import FileManagerFacade
+    from scholion.core.health_check import HealthCheck
+    from scholion.core.metrics import MetricsObserver, MetricsRegistry
+    from scholion.core.metrics_exporter import MetricsExporter
+    from scholion.core.performance_tracker import PerformanceTracker
+    from scholion.interfaces.local_file_manager import LocalFileManager
+    from scholion.library.custody import LibraryCustodyService
+    from scholion.library.duckdb_index import DuckDbTranscriptIndex
+    from scholion.library.duckdb_research_projection import DuckDbResearchProjection
+    from scholion.library.duckdb_semantic import DuckDbSemanticIndex
+    from scholion.library.evidence import EvidenceLocator
+    from scholion.library.locations import (
+        JsonLibraryLocationStore,
+        LibraryLocationService,
+    )
+    from scholion.library.playback import PlaybackAuthorizationService
+    from scholion.library.playback_leases import PlaybackVerificationLeaseStore
+    from scholion.library.recording_discovery import RecordingDiscoveryCursor
+    from scholion.library.refresh_journal import LibraryRefreshJournal
+    from scholion.library.research import ResearchNavigationService
+    from scholion.library.research_projector import ResearchStateProjector
+    from scholion.library.research_search_controls import (
+        ResearchSearchControlService,
+    )
+    from scholion.library.research_workspace import ResearchWorkspaceService
+    from scholion.library.saved_search_results import SavedSearchResultCache
+    from scholion.library.semantic import (
+        EmbeddingProfile,
+        SentenceTransformersE5Provider,
+    )
+    from scholion.library.service import TranscriptLibraryService
+    from scholion.library.source_fingerprints import SourceFingerprintCache
+    from scholion.library.speaker_label_service import SpeakerLabelService
+    from scholion.library.speaker_labels import SpeakerLabelStore
+    from scholion.library.speaker_presentation import SpeakerPresentationService
+    from scholion.library.sqlite_research_state import SqliteResearchStateStore
+    from scholion.library.transcript_tools import TranscriptToolsService
+    from scholion.library.watch import LibraryChangeFeed, LibraryWatchService
+    from scholion.library.workspace_metadata import SqliteWorkspaceMetadataStore
+    from scholion.library.workspace_usage import WorkspaceUsageMeter
+    from scholion.media.probe import FfprobeMediaProbe
+    from scholion.media.selection import AudioStreamSelector
+    from scholion.model_management.catalog import ModelCatalog
+    from scholion.model_management.provider import HuggingFaceModelProvider
+    from scholion.model_management.service import ModelManager
+    from scholion.runner.inspector import RunnerInspector
+    from scholion.runner.policy import RunnerPolicyPlanner
+    from scholion.runner.topology import (
+        HardwareTopologyInspector,
+        NvidiaSmiAcceleratorProbe,
+    )
+    from scholion.transcription.adaptive_executor import (
+        AdaptiveTranscriptionExecutor,
+    )
+    from scholion.transcription.assembly import TranscriptAssembler
+    from scholion.transcription.audio import FfmpegAudioDecoder
+    from scholion.transcription.backend import FasterWhisperTranscriber
+    from scholion.transcription.capabilities import EngineCapabilityRegistry
+    from scholion.transcription.checkpoint import LocalCheckpointStore
+    from scholion.transcription.diarization import PyannoteSpeakerDiarizer
+    from scholion.transcription.enhancement import FfmpegAfftdnEnhancer
+    from scholion.transcription.export import TranscriptExporter
+    from scholion.transcription.language import LinguaLanguageAttributor
+    from scholion.transcription.planner import TranscriptionJobPlanner
+    from scholion.transcription.segmentation import WaveAudioSegmenter
+    from scholion.transcription.storage import StorageAdmissionPolicy
+    from scholion.transcription.strategy import StrategyCatalog, StrategyEvaluator
+    from scholion.workspace.service import WorkspaceService
 
 
 def _create_health_check(
     config: AppConfig, runner_inspector: RunnerInspector
 ) -> HealthCheck:
+    from scholion.core.health_check import HealthCheck
+    from scholion.core.health_probes import (
+        DiskSpaceProbe,
+        FfmpegProbe,
+        SystemResourcesProbe,
+        WorkspaceProbe,
+    )
+
     return HealthCheck(
         (
             WorkspaceProbe(config.STATE_DIR),
@@ -93,16 +123,9 @@ def _create_health_check(
     )
 
 
-def _create_workspace_paths(config: AppConfig) -> WorkspacePaths:
-    return WorkspacePaths(
-        state_dir=config.STATE_DIR,
-        cache_dir=config.CACHE_DIR,
-        model_dir=config.MODEL_DIR,
-        output_dir=config.OUTPUT_DIR,
-    )
-
-
 def _create_runner_policy_planner(config: AppConfig) -> RunnerPolicyPlanner:
+    from scholion.runner.policy import RunnerPolicyPlanner
+
     return RunnerPolicyPlanner(
         memory_budget_fraction=config.MEMORY_BUDGET_FRACTION,
         max_cpu_threads=config.MAX_CPU_THREADS,
@@ -111,18 +134,26 @@ def _create_runner_policy_planner(config: AppConfig) -> RunnerPolicyPlanner:
 
 
 def _create_media_probe(config: AppConfig) -> FfprobeMediaProbe:
+    from scholion.media.probe import FfprobeMediaProbe
+
     return FfprobeMediaProbe(timeout_seconds=config.FFPROBE_TIMEOUT_SECONDS)
 
 
 def _create_audio_decoder(config: AppConfig) -> FfmpegAudioDecoder:
+    from scholion.transcription.audio import FfmpegAudioDecoder
+
     return FfmpegAudioDecoder(timeout_seconds=config.FFMPEG_PROCESS_TIMEOUT_SECONDS)
 
 
 def _create_audio_enhancer(config: AppConfig) -> FfmpegAfftdnEnhancer:
+    from scholion.transcription.enhancement import FfmpegAfftdnEnhancer
+
     return FfmpegAfftdnEnhancer(timeout_seconds=config.FFMPEG_PROCESS_TIMEOUT_SECONDS)
 
 
 def _create_speaker_diarizer(config: AppConfig) -> PyannoteSpeakerDiarizer:
+    from scholion.transcription.diarization import PyannoteSpeakerDiarizer
+
     return PyannoteSpeakerDiarizer(
         model_cache_path=config.MODEL_DIR / "pyannote",
         model_id=config.PYANNOTE_MODEL_ID,
@@ -131,12 +162,19 @@ def _create_speaker_diarizer(config: AppConfig) -> PyannoteSpeakerDiarizer:
 
 
 def _create_capability_registry() -> EngineCapabilityRegistry:
+    from scholion.transcription.capabilities import (
+        EngineCapabilityRegistry,
+        FasterWhisperCapabilityProbe,
+    )
+
     return EngineCapabilityRegistry((FasterWhisperCapabilityProbe(),))
 
 
 def _create_transcript_index(
     config: AppConfig, file_manager: FileManagerFacade
 ) -> DuckDbTranscriptIndex:
+    from scholion.library.duckdb_index import DuckDbTranscriptIndex
+
     return DuckDbTranscriptIndex(
         config.STATE_DIR / "library" / "transcripts.duckdb",
         file_manager,
@@ -146,15 +184,74 @@ def _create_transcript_index(
 def _create_semantic_index(
     config: AppConfig, file_manager: FileManagerFacade
 ) -> DuckDbSemanticIndex:
+    from scholion.library.duckdb_semantic import DuckDbSemanticIndex
+
     return DuckDbSemanticIndex(
         config.STATE_DIR / "library" / "semantic.duckdb",
         file_manager,
     )
 
 
+def _create_refresh_journal(
+    config: AppConfig, file_manager: FileManagerFacade
+) -> LibraryRefreshJournal:
+    from scholion.library.refresh_journal import LibraryRefreshJournal
+
+    return LibraryRefreshJournal(
+        config.STATE_DIR / "library" / "refresh-journal.json",
+        file_manager,
+    )
+
+
+def _create_library_change_feed() -> LibraryChangeFeed:
+    from scholion.library.change_feed import InotifyChangeFeed, PollingChangeFeed
+
+    return InotifyChangeFeed.create() or PollingChangeFeed()
+
+
+def _create_playback_lease_store(
+    config: AppConfig, file_manager: FileManagerFacade
+) -> PlaybackVerificationLeaseStore:
+    from scholion.library.playback_leases import PlaybackVerificationLeaseStore
+
+    return PlaybackVerificationLeaseStore(
+        config.STATE_DIR / "library" / "playback-leases.json",
+        file_manager,
+    )
+
+
+def _create_workspace_usage_meter(
+    config: AppConfig, file_manager: FileManagerFacade
+) -> WorkspaceUsageMeter:
+    from scholion.library.workspace_usage import (
+        WorkspaceUsageCache,
+        WorkspaceUsageMeter,
+    )
+
+    return WorkspaceUsageMeter(
+        WorkspaceUsageCache(
+            config.STATE_DIR / "library" / "workspace-usage.json",
+            file_manager,
+        )
+    )
+
+
+def _create_source_fingerprint_cache(
+    config: AppConfig, file_manager: FileManagerFacade
+) -> SourceFingerprintCache:
+    from scholion.library.source_fingerprints import SourceFingerprintCache
+
+    return SourceFingerprintCache(
+        config.STATE_DIR / "library" / "source-fingerprints.sqlite3",
+        file_manager,
+    )
+
+
 def _create_speaker_label_store(
     config: AppConfig, file_manager: FileManagerFacade
 ) -> SpeakerLabelStore:
+    from scholion.library.speaker_labels import SpeakerLabelStore
+
     return SpeakerLabelStore(
         config.STATE_DIR / "library" / "user-state" / "speaker-labels.json",
         file_manager,
@@ -164,15 +261,30 @@ def _create_speaker_label_store(
 def _create_library_location_store(
     config: AppConfig, file_manager: FileManagerFacade
 ) -> JsonLibraryLocationStore:
+    from scholion.library.locations import JsonLibraryLocationStore
+
     return JsonLibraryLocationStore(
         config.STATE_DIR / "library" / "user-state" / "library-locations.json",
         file_manager,
     )
 
 
+def _create_recording_discovery_cursor(
+    config: AppConfig, file_manager: FileManagerFacade
+) -> RecordingDiscoveryCursor:
+    from scholion.library.recording_discovery import RecordingDiscoveryCursor
+
+    return RecordingDiscoveryCursor(
+        config.STATE_DIR / "library" / "recording-discovery-cursor.json",
+        file_manager,
+    )
+
+
 def _create_research_state_store(
     config: AppConfig, file_manager: FileManagerFacade
 ) -> SqliteResearchStateStore:
+    from scholion.library.sqlite_research_state import SqliteResearchStateStore
+
     return SqliteResearchStateStore(
         config.STATE_DIR / "library" / "user-state" / "research.sqlite3",
         file_manager,
@@ -183,21 +295,100 @@ def _create_workspace_metadata_store(
     research_state: SqliteResearchStateStore,
     file_manager: FileManagerFacade,
 ) -> SqliteWorkspaceMetadataStore:
+    from scholion.library.workspace_metadata import SqliteWorkspaceMetadataStore
+
     return SqliteWorkspaceMetadataStore(research_state.database_path, file_manager)
 
 
 def _create_research_projection(
-    config: AppConfig, file_manager: FileManagerFacade
+    config: AppConfig,
+    file_manager: FileManagerFacade,
+    metrics_registry: MetricsRegistry,
 ) -> DuckDbResearchProjection:
-    return DuckDbResearchProjection(
+    from scholion.library.duckdb_research_projection import DuckDbResearchProjection
+
+    projection = DuckDbResearchProjection(
         config.STATE_DIR / "library" / "projections" / "research.duckdb",
         file_manager,
     )
+    metrics_registry.register_collector(
+        lambda: (
+            sample
+            for statistics in projection.cache_statistics()
+            for sample in statistics.samples()
+        )
+    )
+    return projection
+
+
+def _create_saved_search_result_cache(
+    config: AppConfig, file_manager: FileManagerFacade
+) -> SavedSearchResultCache | None:
+    if not config.SAVED_SEARCH_RESULT_CACHE:
+        return None
+    from scholion.library.saved_search_results import SavedSearchResultCache
+
+    return SavedSearchResultCache(
+        config.CACHE_DIR / "library" / "saved-search-pages",
+        file_manager,
+    )
+
+
+def _create_benchmark_history(
+    config: AppConfig, file_manager: FileManagerFacade
+) -> BenchmarkHistoryStore:
+    from scholion.benchmarking.compare import BenchmarkHistoryStore
+
+    return BenchmarkHistoryStore(
+        config.STATE_DIR / "benchmarks" / "history.json", file_manager
+    )
+
+
+def _create_strategy_evaluator(
+    config: AppConfig, benchmark_history: BenchmarkHistoryStore
+) -> StrategyEvaluator:
+    from scholion.transcription.strategy import StrategyEvaluator
+
+    if not config.STRATEGY_CALIBRATION:
+        return StrategyEvaluator()
+    return StrategyEvaluator(observation_source=benchmark_history)
+
+
+def _create_metrics_registry() -> MetricsRegistry:
+    from scholion.core.metrics import MetricsRegistry, system_metric_samples
+
+    return MetricsRegistry(collectors=(system_metric_samples,))
+
+
+def _create_metrics_exporter(
+    config: AppConfig,
+    metrics_registry: MetricsRegistry,
+    file_manager: FileManagerFacade,
+) -> MetricsExporter | None:
+    if config.METRICS_EXPORT is None:
+        return None
+    from scholion.core.metrics_exporter import MetricsEndpoint, MetricsExporter
+
+    return MetricsExporter(
+        MetricsEndpoint.parse(config.METRICS_EXPORT), metrics_registry, file_manager
+    )
+
+
+def _create_execution_metrics(
+    config: AppConfig, metrics_registry: MetricsRegistry
+) -> MetricsObserver | None:
+    if config.METRICS_EXPORT is None:
+        return None
+    from scholion.core.metrics import MetricsObserver
+
+    return MetricsObserver(metrics_registry)
 
 
 def _restore_embedding_provider(
     profile: EmbeddingProfile,
 ) -> SentenceTransformersE5Provider:
+    from scholion.library.semantic import SentenceTransformersE5Provider
+
     return SentenceTransformersE5Provider.from_profile(profile)
 
 
@@ -208,6 +399,10 @@ class _ModelStorageAdmitter:
         self.policy = policy
 
     def admit(self, path: Path, required_bytes: int) -> None:
+        from scholion.model_management.errors import ModelManagementError
+        from scholion.transcription.errors import ResourceAdmissionError
+        from scholion.transcription.storage import StorageAllocation
+
         try:
             self.policy.admit((StorageAllocation(path, required_bytes),))
         except ResourceAdmissionError as exc:
@@ -221,42 +416,78 @@ class AppContainer(containers.DeclarativeContainer):
     """Dependency Injection container for application services."""
 
     config = providers.Singleton(AppConfig)
-    logger = providers.Singleton(_create_logger, config=config)
-    local_file_manager = providers.Singleton(LocalFileManager)
-    performance_tracker = providers.Singleton(PerformanceTracker)
+    logger = providers.Singleton(create_logger, config=config)
+    local_file_manager: providers.Singleton[LocalFileManager] = providers.Singleton(
+        deferred("scholion.interfaces.local_file_manager:LocalFileManager")
+    )
+    performance_tracker: providers.Singleton[PerformanceTracker] = providers.Singleton(
+        deferred("scholion.core.performance_tracker:PerformanceTracker")
+    )
     file_manager = providers.Singleton(
-        FileManagerFacade,
+        create_file_manager,
+        config=config,
         file_manager=local_file_manager,
         logger=logger,
         tracker=performance_tracker,
-        path_disclosure=config.provided.LOG_PATHS,
     )
-    runner_inspector = providers.Singleton(RunnerInspector)
-    accelerator_probe = providers.Singleton(NvidiaSmiAcceleratorProbe)
-    hardware_topology_inspector = providers.Singleton(
-        HardwareTopologyInspector,
-        runner_inspector=runner_inspector,
-        accelerator_probe=accelerator_probe,
+    metrics_registry = providers.Singleton(_create_metrics_registry)
+    metrics_exporter = providers.Singleton(
+        _create_metrics_exporter,
+        config=config,
+        metrics_registry=metrics_registry,
+        file_manager=file_manager,
+    )
+    execution_metrics = providers.Factory(
+        _create_execution_metrics, config=config, metrics_registry=metrics_registry
+    )
+    runner_inspector: providers.Singleton[RunnerInspector] = providers.Singleton(
+        deferred("scholion.runner.inspector:RunnerInspector")
+    )
+    accelerator_probe: providers.Singleton[NvidiaSmiAcceleratorProbe] = (
+        providers.Singleton(
+            deferred("scholion.runner.topology:NvidiaSmiAcceleratorProbe")
+        )
+    )
+    hardware_topology_inspector: providers.Singleton[HardwareTopologyInspector] = (
+        providers.Singleton(
+            deferred("scholion.runner.topology:HardwareTopologyInspector"),
+            runner_inspector=runner_inspector,
+            accelerator_probe=accelerator_probe,
+        )
     )
     engine_capability_registry = providers.Singleton(_create_capability_registry)
-    strategy_catalog = providers.Singleton(faster_whisper_catalog)
-    strategy_evaluator = providers.Singleton(StrategyEvaluator)
+    strategy_catalog: providers.Singleton[StrategyCatalog] = providers.Singleton(
+        deferred("scholion.transcription.strategy:faster_whisper_catalog")
+    )
+    benchmark_history = providers.Singleton(
+        _create_benchmark_history, config=config, file_manager=file_manager
+    )
+    strategy_evaluator = providers.Singleton(
+        _create_strategy_evaluator,
+        config=config,
+        benchmark_history=benchmark_history,
+    )
     runner_policy_planner = providers.Singleton(
         _create_runner_policy_planner, config=config
     )
-    storage_admission = providers.Singleton(
-        StorageAdmissionPolicy,
-        minimum_free_bytes=config.provided.MIN_FREE_DISK_BYTES,
+    storage_admission: providers.Singleton[StorageAdmissionPolicy] = (
+        providers.Singleton(
+            deferred("scholion.transcription.storage:StorageAdmissionPolicy"),
+            minimum_free_bytes=config.provided.MIN_FREE_DISK_BYTES,
+        )
+    )
+    model_catalog: providers.Singleton[ModelCatalog] = providers.Singleton(
+        deferred("scholion.model_management.catalog:faster_whisper_model_catalog"),
+        strategies=strategy_catalog,
     )
-    model_catalog = providers.Singleton(
-        faster_whisper_model_catalog, strategies=strategy_catalog
+    model_provider: providers.Singleton[HuggingFaceModelProvider] = providers.Singleton(
+        deferred("scholion.model_management.provider:HuggingFaceModelProvider")
     )
-    model_provider = providers.Singleton(HuggingFaceModelProvider)
     model_storage_admitter = providers.Singleton(
         _ModelStorageAdmitter, policy=storage_admission
     )
-    model_manager = providers.Singleton(
-        ModelManager,
+    model_manager: providers.Singleton[ModelManager] = providers.Singleton(
+        deferred("scholion.model_management.service:ModelManager"),
         catalog=model_catalog,
         provider=model_provider,
         file_store=file_manager,
@@ -264,17 +495,17 @@ class AppContainer(containers.DeclarativeContainer):
         storage_admitter=model_storage_admitter,
     )
     media_probe = providers.Singleton(_create_media_probe, config=config)
-    audio_stream_selector = providers.Singleton(AudioStreamSelector)
-    workspace_paths = providers.Singleton(_create_workspace_paths, config=config)
-    workspace_service = providers.Singleton(
-        WorkspaceService,
+    audio_stream_selector: providers.Singleton[AudioStreamSelector] = (
+        providers.Singleton(deferred("scholion.media.selection:AudioStreamSelector"))
+    )
+    workspace_paths = providers.Singleton(create_workspace_paths, config=config)
+    workspace_service: providers.Singleton[WorkspaceService] = providers.Singleton(
+        deferred("scholion.workspace.service:WorkspaceService"),
         paths=workspace_paths,
         file_manager=file_manager,
     )
     job_lifecycle_store = providers.Singleton(
-        JobLifecycleStore,
-        file_manager=file_manager,
-        paths=workspace_paths,
+        create_job_lifecycle_store, file_manager=file_manager, paths=workspace_paths
     )
     transcript_index = providers.Singleton(
         _create_transcript_index,
@@ -286,11 +517,39 @@ class AppContainer(containers.DeclarativeContainer):
         config=config,
         file_manager=file_manager,
     )
-    playback_authorization = providers.Singleton(
-        PlaybackAuthorizationService,
-        index=transcript_index,
+    refresh_journal = providers.Singleton(
+        _create_refresh_journal,
+        config=config,
+        file_manager=file_manager,
+    )
+    playback_lease_store = providers.Singleton(
+        _create_playback_lease_store,
+        config=config,
+        file_manager=file_manager,
+    )
+    source_fingerprint_cache = providers.Singleton(
+        _create_source_fingerprint_cache,
+        config=config,
+        file_manager=file_manager,
+    )
+    workspace_usage_meter = providers.Singleton(
+        _create_workspace_usage_meter,
+        config=config,
+        file_manager=file_manager,
+    )
+    saved_search_result_cache = providers.Singleton(
+        _create_saved_search_result_cache,
+        config=config,
         file_manager=file_manager,
-        media_probe=media_probe,
+    )
+    playback_authorization: providers.Singleton[PlaybackAuthorizationService] = (
+        providers.Singleton(
+            deferred("scholion.library.playback:PlaybackAuthorizationService"),
+            index=transcript_index,
+            file_manager=file_manager,
+            media_probe=media_probe,
+            lease_store=playback_lease_store,
+        )
     )
     speaker_label_store = providers.Singleton(
         _create_speaker_label_store,
@@ -302,20 +561,29 @@ class AppContainer(containers.DeclarativeContainer):
         config=config,
         file_manager=file_manager,
     )
-    speaker_labels = providers.Singleton(
-        SpeakerLabelService,
-        index=transcript_index,
-        store=speaker_label_store,
+    recording_discovery_cursor = providers.Singleton(
+        _create_recording_discovery_cursor,
+        config=config,
         file_manager=file_manager,
     )
-    speaker_presentation = providers.Singleton(
-        SpeakerPresentationService,
+    speaker_labels: providers.Singleton[SpeakerLabelService] = providers.Singleton(
+        deferred("scholion.library.speaker_label_service:SpeakerLabelService"),
         index=transcript_index,
-        label_store=speaker_label_store,
+        store=speaker_label_store,
         file_manager=file_manager,
     )
-    transcript_tools = providers.Singleton(
-        TranscriptToolsService,
+    speaker_presentation: providers.Singleton[SpeakerPresentationService] = (
+        providers.Singleton(
+            deferred(
+                "scholion.library.speaker_presentation:SpeakerPresentationService"
+            ),
+            index=transcript_index,
+            label_store=speaker_label_store,
+            file_manager=file_manager,
+        )
+    )
+    transcript_tools: providers.Singleton[TranscriptToolsService] = providers.Singleton(
+        deferred("scholion.library.transcript_tools:TranscriptToolsService"),
         index=transcript_index,
         speaker_labels=speaker_labels,
         speaker_presentation=speaker_presentation,
@@ -335,32 +603,53 @@ class AppContainer(containers.DeclarativeContainer):
         _create_research_projection,
         config=config,
         file_manager=file_manager,
+        metrics_registry=metrics_registry,
+    )
+    research_projector: providers.Singleton[ResearchStateProjector] = (
+        providers.Singleton(
+            deferred("scholion.library.research_projector:ResearchStateProjector"),
+            store=research_state_store,
+            projection=research_projection,
+        )
     )
-    research_projector = providers.Singleton(
-        ResearchStateProjector,
-        store=research_state_store,
-        projection=research_projection,
+    semantic_embedding_provider: providers.Factory[SentenceTransformersE5Provider] = (
+        providers.Factory(
+            deferred("scholion.library.semantic:SentenceTransformersE5Provider")
+        )
     )
-    semantic_embedding_provider = providers.Factory(SentenceTransformersE5Provider)
     embedding_provider_factory = providers.Object(_restore_embedding_provider)
-    transcript_library = providers.Singleton(
-        TranscriptLibraryService,
-        index=transcript_index,
-        lifecycle_store=job_lifecycle_store,
-        paths=workspace_paths,
-        file_manager=file_manager,
-        semantic_index=semantic_index,
-        embedding_provider_factory=embedding_provider_factory,
+    transcript_library: providers.Singleton[TranscriptLibraryService] = (
+        providers.Singleton(
+            deferred("scholion.library.service:TranscriptLibraryService"),
+            index=transcript_index,
+            lifecycle_store=job_lifecycle_store,
+            paths=workspace_paths,
+            file_manager=file_manager,
+            semantic_index=semantic_index,
+            embedding_provider_factory=embedding_provider_factory,
+            refresh_journal=refresh_journal,
+            fingerprint_cache=source_fingerprint_cache,
+            observer=execution_metrics,
+        )
     )
-    library_locations = providers.Singleton(
-        LibraryLocationService,
-        store=library_location_store,
+    library_locations: providers.Singleton[LibraryLocationService] = (
+        providers.Singleton(
+            deferred("scholion.library.locations:LibraryLocationService"),
+            store=library_location_store,
+            transcript_library=transcript_library,
+            file_manager=file_manager,
+            paths=workspace_paths,
+            discovery_cursor=recording_discovery_cursor,
+        )
+    )
+    library_watch: providers.Factory[LibraryWatchService] = providers.Factory(
+        deferred("scholion.library.watch:LibraryWatchService"),
+        locations=library_locations,
         transcript_library=transcript_library,
-        file_manager=file_manager,
-        paths=workspace_paths,
+        change_feed=providers.Factory(_create_library_change_feed),
     )
-    library_custody = providers.Singleton(
-        LibraryCustodyService,
+    library_custody: providers.Singleton[LibraryCustodyService] = providers.Singleton(
+        deferred("scholion.library.custody:LibraryCustodyService"),
         transcript_library=transcript_library,
         lexical_index=transcript_index,
         semantic_index=semantic_index,
@@ -369,94 +658,136 @@ class AppContainer(containers.DeclarativeContainer):
         workspace_metadata=workspace_metadata_store,
         paths=workspace_paths,
         file_manager=file_manager,
+        workspace_usage=workspace_usage_meter,
     )
-    evidence_locator = providers.Singleton(EvidenceLocator, file_manager=file_manager)
-    research_navigation = providers.Singleton(
-        ResearchNavigationService,
-        transcript_library=transcript_library,
-        evidence_locator=evidence_locator,
-        speaker_labels=speaker_labels,
+    evidence_locator: providers.Singleton[EvidenceLocator] = providers.Singleton(
+        deferred("scholion.library.evidence:EvidenceLocator"), file_manager=file_manager
     )
-    research_workspace = providers.Singleton(
-        ResearchWorkspaceService,
-        transcript_library=transcript_library,
-        evidence_locator=evidence_locator,
-        navigation=research_navigation,
-        state=research_state_store,
-        projection=research_projection,
-        projector=research_projector,
-        metadata=workspace_metadata_store,
-        logger=logger,
+    research_navigation: providers.Singleton[ResearchNavigationService] = (
+        providers.Singleton(
+            deferred("scholion.library.research:ResearchNavigationService"),
+            transcript_library=transcript_library,
+            evidence_locator=evidence_locator,
+            speaker_labels=speaker_labels,
+        )
     )
-    research_search_control = providers.Singleton(
-        ResearchSearchControlService,
-        workspace=research_workspace,
+    research_workspace: providers.Singleton[ResearchWorkspaceService] = (
+        providers.Singleton(
+            deferred("scholion.library.research_workspace:ResearchWorkspaceService"),
+            transcript_library=transcript_library,
+            evidence_locator=evidence_locator,
+            navigation=research_navigation,
+            state=research_state_store,
+            projection=research_projection,
+            projector=research_projector,
+            metadata=workspace_metadata_store,
+            logger=logger,
+        )
     )
-    checkpoint_store = providers.Factory(
-        LocalCheckpointStore, file_manager=file_manager
+    research_search_control: providers.Singleton[ResearchSearchControlService] = (
+        providers.Singleton(
+            deferred(
+                "scholion.library.research_search_controls:ResearchSearchControlService"
+            ),
+            workspace=research_workspace,
+            result_cache=saved_search_result_cache,
+        )
     )
-    transcription_planner = providers.Singleton(
-        TranscriptionJobPlanner,
-        media_probe=media_probe,
-        workspace_service=workspace_service,
-        runner_inspector=runner_inspector,
-        policy_planner=runner_policy_planner,
-        topology_inspector=hardware_topology_inspector,
-        capability_registry=engine_capability_registry,
-        strategy_catalog=strategy_catalog,
-        strategy_evaluator=strategy_evaluator,
-        audio_stream_selector=audio_stream_selector,
-        model_registry=model_manager,
-        checkpoint_store=checkpoint_store,
+    checkpoint_store: providers.Factory[LocalCheckpointStore] = providers.Factory(
+        deferred("scholion.transcription.checkpoint:LocalCheckpointStore"),
+        file_manager=file_manager,
+        encoding=config.provided.CHECKPOINT_ENCODING,
+    )
+    transcription_planner: providers.Singleton[TranscriptionJobPlanner] = (
+        providers.Singleton(
+            deferred("scholion.transcription.planner:TranscriptionJobPlanner"),
+            media_probe=media_probe,
+            workspace_service=workspace_service,
+            runner_inspector=runner_inspector,
+            policy_planner=runner_policy_planner,
+            topology_inspector=hardware_topology_inspector,
+            capability_registry=engine_capability_registry,
+            strategy_catalog=strategy_catalog,
+            strategy_evaluator=strategy_evaluator,
+            audio_stream_selector=audio_stream_selector,
+            model_registry=model_manager,
+            checkpoint_store=checkpoint_store,
+        )
     )
     audio_decoder = providers.Factory(_create_audio_decoder, config=config)
     audio_enhancer = providers.Factory(_create_audio_enhancer, config=config)
-    audio_segmenter = providers.Factory(WaveAudioSegmenter)
-    transcriber = providers.Factory(FasterWhisperTranscriber)
-    transcript_assembler = providers.Factory(TranscriptAssembler)
-    language_attributor = providers.Singleton(LinguaLanguageAttributor)
+    audio_segmenter: providers.Factory[WaveAudioSegmenter] = providers.Factory(
+        deferred("scholion.transcription.segmentation:WaveAudioSegmenter")
+    )
+    transcriber: providers.Factory[FasterWhisperTranscriber] = providers.Factory(
+        deferred("scholion.transcription.backend:FasterWhisperTranscriber")
+    )
+    transcript_assembler: providers.Factory[TranscriptAssembler] = providers.Factory(
+        deferred("scholion.transcription.assembly:TranscriptAssembler")
+    )
+    language_attributor: providers.Singleton[LinguaLanguageAttributor] = (
+        providers.Singleton(
+            deferred("scholion.transcription.language:LinguaLanguageAttributor")
+        )
+    )
     speaker_diarizer = providers.Factory(_create_speaker_diarizer, config=config)
-    transcription_executor = providers.Factory(
-        AdaptiveTranscriptionExecutor,
-        media_probe=media_probe,
+    transcription_executor: providers.Factory[AdaptiveTranscriptionExecutor] = (
+        providers.Factory(
+            deferred(
+                "scholion.transcription.adaptive_executor:AdaptiveTranscriptionExecutor"
+            ),
+            media_probe=media_probe,
+            workspace_service=workspace_service,
+            file_manager=file_manager,
+            runner_inspector=runner_inspector,
+            policy_planner=runner_policy_planner,
+            audio_decoder=audio_decoder,
+            audio_enhancer=audio_enhancer,
+            audio_segmenter=audio_segmenter,
+            transcriber=transcriber,
+            transcript_assembler=transcript_assembler,
+            checkpoint_store=checkpoint_store,
+            storage_admission=storage_admission,
+            language_attributor=language_attributor,
+            speaker_diarizer=speaker_diarizer,
+            logger=logger,
+            accelerator_probe=accelerator_probe,
+            capability_registry=engine_capability_registry,
+            strategy_catalog=strategy_catalog,
+            strategy_evaluator=strategy_evaluator,
+        )
+    )
+    transcript_exporter: providers.Factory[TranscriptExporter] = providers.Factory(
+        deferred("scholion.transcription.export:TranscriptExporter"),
         workspace_service=workspace_service,
         file_manager=file_manager,
-        runner_inspector=runner_inspector,
-        policy_planner=runner_policy_planner,
-        audio_decoder=audio_decoder,
-        audio_enhancer=audio_enhancer,
-        audio_segmenter=audio_segmenter,
-        transcriber=transcriber,
-        transcript_assembler=transcript_assembler,
-        checkpoint_store=checkpoint_store,
-        storage_admission=storage_admission,
-        language_attributor=language_attributor,
-        speaker_diarizer=speaker_diarizer,
-        logger=logger,
-        accelerator_probe=accelerator_probe,
-        capability_registry=engine_capability_registry,
-        strategy_catalog=strategy_catalog,
-        strategy_evaluator=strategy_evaluator,
     )
-    transcript_exporter = providers.Factory(
-        TranscriptExporter,
+    benchmark_runner: providers.Factory[BenchmarkRunner] = providers.Factory(
+        deferred("scholion.benchmarking.runner:BenchmarkRunner"),
+        file_manager=file_manager,
         workspace_service=workspace_service,
+    )
+    search_benchmark: providers.Factory[SearchBenchmark] = providers.Factory(
+        deferred("scholion.benchmarking.search:SearchBenchmark"),
         file_manager=file_manager,
     )
-    benchmark_runner = providers.Factory(
-        BenchmarkRunner,
+    pipeline_benchmark: providers.Factory[PipelineBenchmark] = providers.Factory(
+        deferred("scholion.benchmarking.pipeline:PipelineBenchmark"),
         file_manager=file_manager,
-        workspace_service=workspace_service,
+        runner_inspector=runner_inspector,
+        logger=logger,
     )
     health_check = providers.Factory(
         _create_health_check, config=config, runner_inspector=runner_inspector
     )
-    processing_center = providers.Singleton(
-        ProcessingCenterService,
-        health_check=health_check,
-        runner_inspector=runner_inspector,
-        policy_planner=runner_policy_planner,
-        planner=transcription_planner,
-        model_manager=model_manager,
-        lifecycle_store=job_lifecycle_store,
+    processing_center: providers.Singleton[ProcessingCenterService] = (
+        providers.Singleton(
+            deferred("scholion.app.processing_center:ProcessingCenterService"),
+            health_check=health_check,
+            runner_inspector=runner_inspector,
+            policy_planner=runner_policy_planner,
+            planner=transcription_planner,
+            model_manager=model_manager,
+            lifecycle_store=job_lifecycle_store,
+        )
     )
@@ -0,0 +1,57 @@
+"""Factories shared by ``AppContainer`` and the container-free ``JobServices``.
+
+This module imports nothing beyond configuration, so ``scholion jobs`` can use it
+without dependency-injector. Each factory imports what it builds, like the container's
+own ``_create_*`` functions, and is the only place its paths and options are chosen.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from scholion.core.config import AppConfig
+    from scholion.core.file_manager_facade import ExecutionTracker, FileManagerFacade
+    from scholion.core.ilogger import ILogger
+    from scholion.interfaces.base_file_manager import FileManager
+    from scholion.workspace.lifecycle import JobLifecycleStore
+    from scholion.workspace.models import WorkspacePaths
+
+
+def create_logger(config: AppConfig) -> ILogger:
+    """Build the application logger from the same configuration instance."""
+    from scholion.core.logger import configure_logging
+
+    return configure_logging(config.LOG_LEVEL, config.APP_ENV)
+
+
+def create_file_manager(
+    config: AppConfig,
+    file_manager: FileManager,
+    logger: ILogger,
+    tracker: ExecutionTracker,
+) -> FileManagerFacade:
+    from scholion.core.file_manager_facade import FileManagerFacade
+
+    return FileManagerFacade(
+        file_manager, logger, tracker, path_disclosure=config.LOG_PATHS
+    )
+
+
+def create_workspace_paths(config: AppConfig) -> WorkspacePaths:
+    from scholion.workspace.models import WorkspacePaths
+
+    return WorkspacePaths(
+        state_dir=config.STATE_DIR,
+        cache_dir=config.CACHE_DIR,
+        model_dir=config.MODEL_DIR,
+        output_dir=config.OUTPUT_DIR,
+    )
+
+
+def create_job_lifecycle_store(
+    file_manager: FileManagerFacade, paths: WorkspacePaths
+) -> JobLifecycleStore:
+    from scholion.workspace.lifecycle import JobLifecycleStore
+
+    return JobLifecycleStore(file_manager=file_manager, paths=paths)
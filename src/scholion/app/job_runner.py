@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import json
+import time
 from collections.abc import Callable, Iterator
-from contextlib import ExitStack, contextmanager, suppress
-from typing import Protocol
+from contextlib import contextmanager, suppress
+from typing import TYPE_CHECKING, Protocol
 
 from scholion.core.errors import ScholionError
-from scholion.core.measurements import ExecutionObserver, NoOpExecutionObserver
+from scholion.core.measurements import (
+    CombinedExecutionObserver,
+    ExecutionObserver,
+    NoOpExecutionObserver,
+)
 from scholion.transcription.models import (
     TranscriptionExecutionResult,
     TranscriptionJobPlan,
@@ -14,6 +20,13 @@ from scholion.transcription.speaker_models import SpeakerDiarizationRequest
 from scholion.workspace.lifecycle import JobLifecycleStore
 from scholion.workspace.models import Job
 
+if TYPE_CHECKING:
+    from scholion.core.file_manager_facade import FileManagerFacade
+    from scholion.core.ilogger import ILogger
+    from scholion.core.profiling import ProfilingObserver
+
+JOB_TRACE_FILENAME = "trace.json"
+
 
 class TranscriptionExecutorLike(Protocol):
     def execute(
@@ -30,11 +43,34 @@ ExecutorFactory = Callable[[ExecutionObserver], TranscriptionExecutorLike]
 
 
 class _LifecycleProgressObserver:
-    def __init__(self, store: JobLifecycleStore, job: Job) -> None:
+    """Coalesce segment progress into cheap live publishes and rare durable checkpoints.
+
+    Every segments metric only updates memory. Live progress is published at most once
+    per ``publish_seconds`` (and always when the final segment lands) through the store's
+    non-durable status file; the registry is checkpointed at most once per
+    ``checkpoint_seconds``. State transitions flush the latest values first, so nothing
+    observed before completion, failure, or interruption is lost.
+    """
+
+    def __init__(
+        self,
+        store: JobLifecycleStore,
+        job: Job,
+        *,
+        publish_seconds: float,
+        checkpoint_seconds: float,
+        clock: Callable[[], float],
+    ) -> None:
         self.store = store
         self.job = job
+        self.publish_seconds = publish_seconds
+        self.checkpoint_seconds = checkpoint_seconds
+        self.clock = clock
         self.total_segments: int | None = None
         self.completed_segments = 0
+        self._published: tuple[int, int] | None = None
+        self._published_at: float | None = None
+        self._checkpointed_at: float | None = None
 
     @contextmanager
     def span(self, name: str) -> Iterator[None]:
@@ -50,39 +86,71 @@ class _LifecycleProgressObserver:
             return
         if self.total_segments is None:
             return
-        self.store.record_progress(
+        now = self.clock()
+        if self._checkpointed_at is None or (
+            now - self._checkpointed_at >= self.checkpoint_seconds
+        ):
+            self.store.record_progress(
+                self.job,
+                completed_segments=self.completed_segments,
+                total_segments=self.total_segments,
+            )
+            self._checkpointed_at = now
+        if (
+            self._published_at is None
+            or now - self._published_at >= self.publish_seconds
+            or self.completed_segments >= self.total_segments
+        ):
+            self._publish(self.total_segments, now)
+
+    def flush(self) -> None:
+        """Publish any coalesced progress so the next transition folds it in."""
+        if self.total_segments is not None:
+            self._publish(self.total_segments, self.clock())
+
+    def _publish(self, total_segments: int, now: float) -> None:
+        current = (self.completed_segments, total_segments)
+        if current == self._published:
+            return
+        self.store.publish_progress(
             self.job,
             completed_segments=self.completed_segments,
-            total_segments=self.total_segments,
+            total_segments=total_segments,
         )
-
-
-class _CombinedExecutionObserver:
-    def __init__(self, *observers: ExecutionObserver) -> None:
-        self.observers = observers
-
-    @contextmanager
-    def span(self, name: str) -> Iterator[None]:
-        with ExitStack() as stack:
-            for observer in self.observers:
-                stack.enter_context(observer.span(name))
-            yield
-
-    def record_value(self, name: str, value: int | float) -> None:
-        for observer in self.observers:
-            observer.record_value(name, value)
+        self._published = current
+        self._published_at = now
 
 
 class TranscriptionJobRunner:
-    """Own lifecycle state around one synchronous transcription execution."""
+    """Own lifecycle state around one synchronous transcription execution.
+
+    With a ``trace_file_manager``, every execution is also recorded by a
+    ``ProfilingObserver`` and its Chrome trace is written to ``trace.json`` in the job
+    workspace once the job's outcome is settled, whether it completed, failed, or was
+    interrupted. A trace that cannot be written is reported to ``logger`` and never
+    changes that outcome.
+    """
 
     def __init__(
         self,
         lifecycle_store: JobLifecycleStore,
         executor_factory: ExecutorFactory,
+        *,
+        progress_publish_seconds: float = 0.5,
+        progress_checkpoint_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+        trace_file_manager: FileManagerFacade | None = None,
+        logger: ILogger | None = None,
     ) -> None:
+        if progress_publish_seconds < 0 or progress_checkpoint_seconds < 0:
+            raise ValueError("progress intervals cannot be negative")
         self.lifecycle_store = lifecycle_store
         self.executor_factory = executor_factory
+        self.progress_publish_seconds = progress_publish_seconds
+        self.progress_checkpoint_seconds = progress_checkpoint_seconds
+        self.clock = clock
+        self.trace_file_manager = trace_file_manager
+        self.logger = logger
 
     def execute(
         self,
@@ -94,27 +162,70 @@ class TranscriptionJobRunner:
         observer: ExecutionObserver | None = None,
     ) -> TranscriptionExecutionResult:
         self.lifecycle_store.start(plan.job)
-        lifecycle_observer = _LifecycleProgressObserver(self.lifecycle_store, plan.job)
-        combined = _CombinedExecutionObserver(
+        lifecycle_observer = _LifecycleProgressObserver(
+            self.lifecycle_store,
+            plan.job,
+            publish_seconds=self.progress_publish_seconds,
+            checkpoint_seconds=self.progress_checkpoint_seconds,
+            clock=self.clock,
+        )
+        profiler = self._profiler()
+        combined = CombinedExecutionObserver(
             lifecycle_observer,
             observer or NoOpExecutionObserver(),
+            *(() if profiler is None else (profiler,)),
         )
         executor = self.executor_factory(combined)
         try:
-            result = executor.execute(
-                plan,
-                resume=resume,
-                diarization_request=diarization_request,
-                allow_diarization_model_download=allow_diarization_model_download,
+            try:
+                result = executor.execute(
+                    plan,
+                    resume=resume,
+                    diarization_request=diarization_request,
+                    allow_diarization_model_download=allow_diarization_model_download,
+                )
+            except KeyboardInterrupt:
+                with suppress(Exception):
+                    lifecycle_observer.flush()
+                with suppress(Exception):
+                    self.lifecycle_store.interrupt(plan.job)
+                raise
+            except BaseException as exc:
+                error_code = exc.code.value if isinstance(exc, ScholionError) else None
+                with suppress(Exception):
+                    lifecycle_observer.flush()
+                with suppress(Exception):
+                    self.lifecycle_store.fail(plan.job, error_code=error_code)
+                raise
+            self.lifecycle_store.complete(result.job, result.artifact)
+            return result
+        finally:
+            if profiler is not None:
+                self._write_trace(plan.job, profiler)
+
+    def _profiler(self) -> ProfilingObserver | None:
+        if self.trace_file_manager is None:
+            return None
+        # Imported only when tracing is enabled; it brings in psutil.
+        from scholion.core.profiling import ProfilingObserver
+
+        return ProfilingObserver()
+
+    def _write_trace(self, job: Job, profiler: ProfilingObserver) -> None:
+        # A trace is diagnostic: a workspace that was never claimed or cannot be
+        # written costs the trace, never the job's outcome.
+        if self.trace_file_manager is None or not job.workspace_dir.is_dir():
+            return
+        try:
+            payload = json.dumps(profiler.to_chrome_trace(), sort_keys=True)
+            self.trace_file_manager.save_file(
+                payload.encode("utf-8"),
+                job.workspace_dir / JOB_TRACE_FILENAME,
+                private=True,
+                durable=False,
             )
-        except KeyboardInterrupt:
-            with suppress(Exception):
-                self.lifecycle_store.interrupt(plan.job)
-            raise
-        except BaseException as exc:
-            error_code = exc.code.value if isinstance(exc, ScholionError) else None
-            with suppress(Exception):
-                self.lifecycle_store.fail(plan.job, error_code=error_code)
-            raise
-        self.lifecycle_store.complete(result.job, result.artifact)
-        return result
+        except Exception as exc:
+            if self.logger is not None:
+                self.logger.warning(
+                    "job_trace_write_failed", exception_type=type(exc).__name__
+                )
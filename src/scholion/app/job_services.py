@@ -0,0 +1,51 @@
+"""The job lifecycle store, composed without the application container.
+
+``scholion jobs`` only lists, shows, and discards lifecycle records. Building the
+``AppContainer`` for that imports dependency-injector and declares every provider,
+which costs more than the command itself. ``JobServices`` builds the same store through
+the factories in ``scholion.app.factories`` that the container calls, and nothing else.
+The metrics exporter is not started, because these commands record no metrics. Logging
+is configured on the first message the configured level lets through, so a quiet
+listing never imports structlog.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from scholion.app.factories import (
+    create_file_manager,
+    create_job_lifecycle_store,
+    create_logger,
+    create_workspace_paths,
+)
+from scholion.core.config import AppConfig
+
+if TYPE_CHECKING:
+    from scholion.workspace.lifecycle import JobLifecycleStore
+
+
+class JobServices:
+    """Lazily built lifecycle store; the subset of ``AppContainer`` used by ``jobs``."""
+
+    def __init__(self, config: AppConfig) -> None:
+        self.config = config
+        self._store: JobLifecycleStore | None = None
+
+    def job_lifecycle_store(self) -> JobLifecycleStore:
+        if self._store is None:
+            from scholion.core.deferred_logger import DeferredLogger
+            from scholion.core.performance_tracker import PerformanceTracker
+            from scholion.interfaces.local_file_manager import LocalFileManager
+
+            config = self.config
+            file_manager = create_file_manager(
+                config,
+                LocalFileManager(),
+                DeferredLogger(config.LOG_LEVEL, lambda: create_logger(config)),
+                PerformanceTracker(),
+            )
+            self._store = create_job_lifecycle_store(
+                file_manager, create_workspace_paths(config)
+            )
+        return self._store
@@ -1,12 +1,16 @@
+import importlib
 from pathlib import Path
 from unittest.mock import Mock
 
 import pytest
 
 from scholion.app.app_container import AppContainer, _ModelStorageAdmitter
+from scholion.core.config import AppConfig
 from scholion.core.file_manager_facade import FileManagerFacade
 from scholion.core.health_check import HealthCheck
+from scholion.core.lazy_imports import deferred
 from scholion.interfaces.local_file_manager import LocalFileManager
+from scholion.library.saved_search_results import SavedSearchResultCache
 from scholion.media.probe import FfprobeMediaProbe
 from scholion.model_management.errors import ModelManagementError
 from scholion.model_management.service import ModelManager
@@ -118,3 +122,29 @@ def test_container_composes_per_execution_audio_segmentation_and_engine_services
     assert first.workspace_service is container.workspace_service()
     assert first.file_manager is container.file_manager()
     assert first.logger is container.logger()
+
+
+def test_saved_search_result_cache_is_opt_in(tmp_path: Path):
+    container = AppContainer()
+    assert container.saved_search_result_cache() is None
+
+    enabled = AppContainer()
+    enabled.config.override(
+        AppConfig(CACHE_DIR=tmp_path, SAVED_SEARCH_RESULT_CACHE=True, _env_file=None)
+    )
+    cache = enabled.saved_search_result_cache()
+    assert isinstance(cache, SavedSearchResultCache)
+    assert cache.directory == tmp_path / "library" / "saved-search-pages"
+
+
+def test_deferred_providers_name_importable_targets():
+    targets = [
+        provider.provides
+        for provider in AppContainer.providers.values()
+        if isinstance(getattr(provider, "provides", None), deferred)
+    ]
+
+    assert len(targets) > 20
+    for target in targets:
+        module, _, attribute = target.target.partition(":")
+        assert callable(getattr(importlib.import_module(module), attribute)), target
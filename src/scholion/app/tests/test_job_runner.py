@@ -1,10 +1,14 @@
+import json
 from contextlib import nullcontext
 from unittest.mock import Mock
 
 import pytest
 
-from scholion.app.job_runner import TranscriptionJobRunner
+from scholion.app.job_runner import JOB_TRACE_FILENAME, TranscriptionJobRunner
 from scholion.core.errors import ScholionError
+from scholion.core.file_manager_facade import FileManagerFacade
+from scholion.core.performance_tracker import PerformanceTracker
+from scholion.interfaces.local_file_manager import LocalFileManager
 from scholion.transcription.models import TranscriptionExecutionResult
 from scholion.workspace.models import Artifact, ArtifactKind, Job, JobId
 
@@ -63,12 +67,13 @@ def test_runner_records_progress_and_completion(tmp_path):
 
     assert returned is result
     lifecycle.start.assert_called_once_with(job)
-    lifecycle.record_progress.assert_any_call(
-        job, completed_segments=1, total_segments=3
-    )
-    lifecycle.record_progress.assert_any_call(
-        job, completed_segments=3, total_segments=3
+    lifecycle.record_progress.assert_called_once_with(
+        job, completed_segments=0, total_segments=3
     )
+    assert [call.kwargs for call in lifecycle.publish_progress.call_args_list] == [
+        {"completed_segments": 0, "total_segments": 3},
+        {"completed_segments": 3, "total_segments": 3},
+    ]
     lifecycle.complete.assert_called_once_with(job, artifact)
     lifecycle.fail.assert_not_called()
     lifecycle.interrupt.assert_not_called()
@@ -112,3 +117,132 @@ def test_runner_records_typed_and_untyped_failures(tmp_path):
     with pytest.raises(RuntimeError):
         untyped_runner.execute(Mock(job=job))
     untyped_lifecycle.fail.assert_called_once_with(job, error_code=None)
+
+
+def test_runner_coalesces_progress_and_flushes_before_failure(tmp_path):
+    job = _job(tmp_path)
+    now = [0.0]
+
+    class _ChattyExecutor:
+        def __init__(self, observer):
+            self.observer = observer
+
+        def execute(self, plan, **kwargs):
+            del plan, kwargs
+            self.observer.record_value("segments.total", 100)
+            for completed in range(1, 61):
+                now[0] = completed * 0.1
+                self.observer.record_value("segments.completed", completed)
+            raise RuntimeError("boom")
+
+    lifecycle = Mock()
+    runner = TranscriptionJobRunner(
+        lifecycle,
+        _ChattyExecutor,
+        progress_publish_seconds=1.0,
+        progress_checkpoint_seconds=5.0,
+        clock=lambda: now[0],
+    )
+
+    with pytest.raises(RuntimeError):
+        runner.execute(Mock(job=job))
+
+    checkpoints = [
+        call.kwargs["completed_segments"]
+        for call in lifecycle.record_progress.call_args_list
+    ]
+    published = [
+        call.kwargs["completed_segments"]
+        for call in lifecycle.publish_progress.call_args_list
+    ]
+    assert checkpoints == [0, 50]
+    assert len(published) <= 8
+    assert published[-1] == 60
+    lifecycle.fail.assert_called_once_with(job, error_code=None)
+    with pytest.raises(ValueError, match="cannot be negative"):
+        TranscriptionJobRunner(lifecycle, _ChattyExecutor, progress_publish_seconds=-1)
+
+
+class _SpanExecutor(_Executor):
+    def execute(self, plan, **kwargs):
+        with self.observer.span("segment.transcribe"):
+            return super().execute(plan, **kwargs)
+
+
+@pytest.mark.parametrize("outcome", ["completed", RuntimeError("boom")])
+def test_traced_runner_writes_a_chrome_trace_into_the_job_workspace(tmp_path, outcome):
+    job = _job(tmp_path)
+    result = Mock(spec=TranscriptionExecutionResult)
+    result.job = job
+    result.artifact = Artifact(
+        job.job_id, ArtifactKind.CANONICAL_JSON, job.output_dir / "a.json"
+    )
+    lifecycle = Mock()
+    runner = TranscriptionJobRunner(
+        lifecycle,
+        lambda observer: _SpanExecutor(
+            result if outcome == "completed" else outcome, observer
+        ),
+        trace_file_manager=FileManagerFacade(
+            LocalFileManager(), Mock(), PerformanceTracker()
+        ),
+    )
+
+    if outcome == "completed":
+        runner.execute(Mock(job=job))
+    else:
+        with pytest.raises(RuntimeError):
+            runner.execute(Mock(job=job))
+
+    trace = json.loads((job.workspace_dir / JOB_TRACE_FILENAME).read_text())
+    assert [event["name"] for event in trace["traceEvents"] if event["ph"] == "X"] == [
+        "segment.transcribe"
+    ]
+    assert any(event["name"] == "segments.completed" for event in trace["traceEvents"])
+
+
+@pytest.mark.parametrize("outcome", ["completed", RuntimeError("boom")])
+def test_a_failing_trace_writer_never_changes_the_job_outcome(tmp_path, outcome):
+    job = _job(tmp_path)
+    result = Mock(spec=TranscriptionExecutionResult)
+    result.job = job
+    result.artifact = Artifact(
+        job.job_id, ArtifactKind.CANONICAL_JSON, job.output_dir / "a.json"
+    )
+    lifecycle = Mock()
+    trace_writer = Mock()
+    trace_writer.save_file.side_effect = TypeError("not serializable")
+    logger = Mock()
+    runner = TranscriptionJobRunner(
+        lifecycle,
+        lambda observer: _Executor(
+            result if outcome == "completed" else outcome, observer
+        ),
+        trace_file_manager=trace_writer,
+        logger=logger,
+    )
+
+    if outcome == "completed":
+        assert runner.execute(Mock(job=job)) is result
+        lifecycle.complete.assert_called_once_with(job, result.artifact)
+    else:
+        with pytest.raises(RuntimeError, match="boom"):
+            runner.execute(Mock(job=job))
+        lifecycle.fail.assert_called_once_with(job, error_code=None)
+
+    trace_writer.save_file.assert_called_once()
+    logger.warning.assert_called_once_with(
+        "job_trace_write_failed", exception_type="TypeError"
+    )
+
+
+def test_untraced_runner_writes_no_trace(tmp_path):
+    job = _job(tmp_path)
+    runner = TranscriptionJobRunner(
+        Mock(), lambda observer: _Executor(RuntimeError("boom"), observer)
+    )
+
+    with pytest.raises(RuntimeError):
+        runner.execute(Mock(job=job))
+
+    assert list(job.workspace_dir.iterdir()) == []
@@ -0,0 +1,25 @@
+from scholion.app.app_container import AppContainer
+from scholion.app.job_services import JobServices
+from scholion.core.config import AppConfig
+from scholion.core.deferred_logger import DeferredLogger
+
+
+def test_job_services_build_the_same_lifecycle_store_as_the_container(tmp_path):
+    config = AppConfig(
+        STATE_DIR=tmp_path / "state",
+        CACHE_DIR=tmp_path / "cache",
+        OUTPUT_DIR=tmp_path / "output",
+        LOG_PATHS="full",
+    )
+    container = AppContainer()
+    container.config.override(config)
+    services = JobServices(config)
+
+    store = services.job_lifecycle_store()
+    expected = container.job_lifecycle_store()
+
+    assert services.job_lifecycle_store() is store
+    assert store.paths == expected.paths
+    assert store.database_path == expected.database_path
+    assert store.file_manager.path_disclosure is expected.file_manager.path_disclosure
+    assert isinstance(store.file_manager.logger, DeferredLogger)
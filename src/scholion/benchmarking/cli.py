@@ -1,7 +1,9 @@
 import json
+import sys
+import tempfile
 from pathlib import Path
 from time import perf_counter
-from typing import Annotated
+from typing import Annotated, NoReturn
 
 import typer
 from pydantic import ValidationError
@@ -9,13 +11,34 @@ from rich.console import Console
 from rich.table import Table
 
 from scholion.app.app_container import AppContainer
+from scholion.benchmarking.compare import (
+    BenchmarkComparison,
+    BenchmarkObservation,
+    RegressionThresholds,
+    StrategyTrend,
+    compare_observations,
+    read_benchmark_observation,
+)
 from scholion.benchmarking.models import (
     BenchmarkRunError,
     BenchmarkRunResult,
 )
+from scholion.benchmarking.pipeline import (
+    PipelineBenchmarkResult,
+    PipelineBenchmarkSpec,
+)
+from scholion.benchmarking.search import (
+    SearchBenchmarkResult,
+    SyntheticCorpus,
+    SyntheticCorpusSpec,
+    dump_query_mix,
+    load_query_mix,
+    synthetic_query_mix,
+)
 from scholion.core.config import AppConfig
 from scholion.core.errors import ScholionError
 from scholion.core.measurements import ExecutionObserver
+from scholion.core.profiling import ProfilingObserver
 from scholion.runner.models import ProcessingProfile
 from scholion.transcription.models import (
     TranscriptionExecutionResult,
@@ -86,6 +109,38 @@ def _execute(
     return executor.execute(plan)
 
 
+def _exit_for_run_error(exc: BenchmarkRunError) -> NoReturn:
+    typer.echo(f"Scholion benchmark report: {exc.report_path}", err=True)
+    if isinstance(exc.cause, KeyboardInterrupt):
+        typer.echo(
+            "Scholion benchmark interrupted; completed checkpoints were retained.",
+            err=True,
+        )
+        raise typer.Exit(code=130) from None
+    if isinstance(exc.cause, ScholionError):
+        typer.echo(exc.cause.public_message, err=True)
+        raise typer.Exit(code=exc.cause.exit_code) from None
+    typer.echo(
+        f"Scholion benchmark failed internally ({type(exc.cause).__name__})",
+        err=True,
+    )
+    raise typer.Exit(code=3) from None
+
+
+def _profiler(trace: bool, profile_spans: list[str] | None) -> ProfilingObserver | None:
+    if not trace and not profile_spans:
+        return None
+    return ProfilingObserver(sampled_spans=frozenset(profile_spans or ()))
+
+
+def _record(container: AppContainer, result: BenchmarkRunResult) -> None:
+    observation = BenchmarkObservation.from_report(
+        json.dumps(result.report.to_dict()).encode("utf-8")
+    )
+    if observation is not None:
+        container.benchmark_history().record((observation,))
+
+
 def _format_bytes(value: int) -> str:
     units = ("B", "KiB", "MiB", "GiB", "TiB")
     amount = float(value)
@@ -101,7 +156,7 @@ def _render(result: BenchmarkRunResult) -> None:
     table = Table(title="Scholion empirical benchmark")
     table.add_column("Measurement")
     table.add_column("Value")
-    rows = (
+    rows = [
         ("Status", report.status.value),
         ("Job ID", report.job_id),
         ("Real-time factor", f"{report.real_time_factor:.3f}x"),
@@ -112,7 +167,9 @@ def _render(result: BenchmarkRunResult) -> None:
         ("Peak sampled CPU", f"{report.process_tree.peak_cpu_percent:.1f}%"),
         ("Benchmark report", str(result.report_path)),
         ("Transcript artifact", str(result.transcription.artifact.path)),
-    )
+    ]
+    if result.trace_path is not None:
+        rows.append(("Execution trace", str(result.trace_path)))
     for name, value in rows:
         table.add_row(name, value)
     Console().print(table)
@@ -163,6 +220,28 @@ def benchmark(
             help="Measure a validated resume of an interrupted job.",
         ),
     ] = None,
+    record: Annotated[
+        bool,
+        typer.Option(
+            "--record",
+            help="Add the completed run to the local benchmark history.",
+        ),
+    ] = False,
+    trace: Annotated[
+        bool,
+        typer.Option(
+            "--trace",
+            help="Write a Chrome trace-event file of every span beside the report.",
+        ),
+    ] = False,
+    profile_spans: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--profile-span",
+            metavar="NAME",
+            help="Sample Python stacks while this span is open; implies --trace.",
+        ),
+    ] = None,
     json_output: Annotated[
         bool,
         typer.Option("--json", help="Emit the benchmark result as JSON."),
@@ -193,25 +272,276 @@ def benchmark(
             ),
             resume=resume is not None,
             planning_wall_seconds=planning_wall_seconds,
+            profiler=_profiler(trace, profile_spans),
         )
+        if record:
+            _record(container, result)
     except typer.BadParameter:
         raise
     except BenchmarkRunError as exc:
-        typer.echo(f"Scholion benchmark report: {exc.report_path}", err=True)
-        if isinstance(exc.cause, KeyboardInterrupt):
-            typer.echo(
-                "Scholion benchmark interrupted; completed checkpoints were retained.",
-                err=True,
+        _exit_for_run_error(exc)
+    except ScholionError as exc:
+        typer.echo(exc.public_message, err=True)
+        raise typer.Exit(code=exc.exit_code) from None
+    except ValidationError:
+        typer.echo("Invalid Scholion configuration", err=True)
+        raise typer.Exit(code=1) from None
+    except Exception as exc:
+        typer.echo(
+            f"Scholion benchmark failed internally ({type(exc).__name__})",
+            err=True,
+        )
+        raise typer.Exit(code=3) from None
+
+    if json_output:
+        typer.echo(json.dumps(result.to_dict(), sort_keys=True))
+    else:
+        _render(result)
+
+
+search_app = typer.Typer(
+    name="scholion-benchmark search",
+    help="Measure transcript search over a deterministic synthetic corpus.",
+)
+
+
+def _render_search(result: SearchBenchmarkResult) -> None:
+    report = result.report
+    table = Table(title="Scholion search benchmark")
+    table.add_column("Measurement")
+    table.add_column("Items/s")
+    table.add_column("p50")
+    table.add_column("p95")
+    table.add_column("p99")
+    for name, item in sorted(report.throughput.items()):
+        rate = item.items_per_second
+        table.add_row(name, "-" if rate is None else f"{rate:,.1f}", "", "", "")
+    for name, latency in sorted(report.latency.items()):
+        table.add_row(
+            f"{name} latency",
+            "",
+            f"{latency.p50_seconds * 1000:.2f} ms",
+            f"{latency.p95_seconds * 1000:.2f} ms",
+            f"{latency.p99_seconds * 1000:.2f} ms",
+        )
+    for name, size in sorted(report.index_bytes.items()):
+        table.add_row(f"{name} size", _format_bytes(size), "", "", "")
+    Console().print(table)
+    Console().print(f"Benchmark report: {result.report_path}")
+
+
+@search_app.command()
+def search(
+    documents: Annotated[
+        int,
+        typer.Option(min=1, max=100_000, help="Synthetic transcripts to generate."),
+    ] = 1_000,
+    segments_per_document: Annotated[
+        int, typer.Option(min=1, help="Canonical segments in each transcript.")
+    ] = 40,
+    vocabulary_size: Annotated[
+        int, typer.Option(min=10, help="Distinct pseudo-words in the corpus.")
+    ] = 5_000,
+    seed: Annotated[int, typer.Option(help="Seed for corpus and query mix.")] = 0,
+    queries: Annotated[
+        int, typer.Option(min=1, help="Queries to draw for the generated mix.")
+    ] = 200,
+    query_file: Annotated[
+        Path | None,
+        typer.Option(
+            exists=True,
+            dir_okay=False,
+            readable=True,
+            resolve_path=True,
+            help="Replay a query mix saved with --save-queries.",
+        ),
+    ] = None,
+    save_queries: Annotated[
+        Path | None,
+        typer.Option(
+            dir_okay=False,
+            resolve_path=True,
+            help="Write the query mix so a later run can replay it.",
+        ),
+    ] = None,
+    repetitions: Annotated[
+        int, typer.Option(min=1, help="Times the query mix is replayed.")
+    ] = 3,
+    config_file: Annotated[
+        Path | None,
+        typer.Option(
+            "--config",
+            exists=True,
+            file_okay=True,
+            dir_okay=False,
+            readable=True,
+            resolve_path=True,
+            help="Explicit Scholion dotenv configuration file.",
+        ),
+    ] = None,
+    output_dir: Annotated[
+        Path | None,
+        typer.Option(
+            help="Directory for the search benchmark report.",
+            file_okay=False,
+            resolve_path=True,
+        ),
+    ] = None,
+    json_output: Annotated[
+        bool,
+        typer.Option("--json", help="Emit the benchmark result as JSON."),
+    ] = False,
+) -> None:
+    """Index a synthetic corpus, replay a query mix, and report latency percentiles."""
+    try:
+        container = _container(config_file)
+        config = container.config()
+        file_manager = container.file_manager()
+        corpus = SyntheticCorpus(
+            SyntheticCorpusSpec(
+                documents=documents,
+                segments_per_document=segments_per_document,
+                vocabulary_size=vocabulary_size,
+                seed=seed,
+            )
+        )
+        if query_file is None:
+            mix = synthetic_query_mix(corpus, count=queries, seed=seed)
+        else:
+            mix = load_query_mix(file_manager.read_file(query_file))
+        if save_queries is not None:
+            file_manager.save_file(dump_query_mix(mix), save_queries)
+        scratch_root = config.CACHE_DIR / "benchmarks"
+        file_manager.ensure_directory_exists(scratch_root, private=True)
+        with tempfile.TemporaryDirectory(
+            prefix="search-", dir=scratch_root
+        ) as work_dir:
+            result = container.search_benchmark().run(
+                corpus,
+                mix,
+                work_dir=Path(work_dir),
+                output_dir=output_dir or config.OUTPUT_DIR,
+                repetitions=repetitions,
             )
-            raise typer.Exit(code=130) from None
-        if isinstance(exc.cause, ScholionError):
-            typer.echo(exc.cause.public_message, err=True)
-            raise typer.Exit(code=exc.cause.exit_code) from None
+    except ScholionError as exc:
+        typer.echo(exc.public_message, err=True)
+        raise typer.Exit(code=exc.exit_code) from None
+    except ValidationError:
+        typer.echo("Invalid Scholion configuration", err=True)
+        raise typer.Exit(code=1) from None
+    except ValueError as exc:
+        typer.echo(str(exc), err=True)
+        raise typer.Exit(code=2) from None
+    except Exception as exc:
         typer.echo(
-            f"Scholion benchmark failed internally ({type(exc.cause).__name__})",
+            f"Scholion search benchmark failed internally ({type(exc).__name__})",
             err=True,
         )
         raise typer.Exit(code=3) from None
+
+    if json_output:
+        typer.echo(json.dumps(result.to_dict(), sort_keys=True))
+    else:
+        _render_search(result)
+
+
+pipeline_app = typer.Typer(
+    name="scholion-benchmark pipeline",
+    help="Time the transcription pipeline around a model-free stand-in engine.",
+)
+
+
+def _render_pipeline(result: PipelineBenchmarkResult) -> None:
+    table = Table(title="Scholion pipeline benchmark")
+    table.add_column("Duration")
+    table.add_column("Stage")
+    table.add_column("Count")
+    table.add_column("Total")
+    table.add_column("p99")
+    table.add_column("Max")
+    for run in result.report.runs:
+        duration = f"{run.spec.duration_seconds} s"
+        table.add_row(duration, "wall", "1", f"{run.wall_seconds:.3f} s", "", "")
+        table.add_row(
+            duration, "overhead", "", f"{run.pipeline_overhead_seconds:.3f} s", "", ""
+        )
+        for stage in run.stages:
+            p99 = stage.percentile(99)
+            table.add_row(
+                duration,
+                stage.name,
+                str(stage.count),
+                f"{stage.total_seconds:.3f} s",
+                "" if p99 is None else f"{p99:.3f} s",
+                f"{stage.max_seconds:.3f} s",
+            )
+    Console().print(table)
+    Console().print(f"Benchmark report: {result.report_path}")
+
+
+@pipeline_app.command()
+def pipeline(
+    durations: Annotated[
+        list[int] | None,
+        typer.Option(
+            "--duration",
+            min=60,
+            max=36_000,
+            help="Synthetic recording length in seconds; repeat for several runs.",
+        ),
+    ] = None,
+    segment_duration: Annotated[
+        int, typer.Option(min=1, help="Planned audio window length in seconds.")
+    ] = 600,
+    seed: Annotated[int, typer.Option(help="Seed for synthetic audio and text.")] = 0,
+    config_file: Annotated[
+        Path | None,
+        typer.Option(
+            "--config",
+            exists=True,
+            file_okay=True,
+            dir_okay=False,
+            readable=True,
+            resolve_path=True,
+            help="Explicit Scholion dotenv configuration file.",
+        ),
+    ] = None,
+    output_dir: Annotated[
+        Path | None,
+        typer.Option(
+            help="Directory for the pipeline benchmark report.",
+            file_okay=False,
+            resolve_path=True,
+        ),
+    ] = None,
+    json_output: Annotated[
+        bool,
+        typer.Option("--json", help="Emit the benchmark result as JSON."),
+    ] = False,
+) -> None:
+    """Run the executor over synthetic PCM and report per-stage measurements."""
+    try:
+        container = _container(config_file)
+        config = container.config()
+        file_manager = container.file_manager()
+        specs = tuple(
+            PipelineBenchmarkSpec(
+                duration_seconds=duration,
+                segment_duration_seconds=segment_duration,
+                seed=seed,
+            )
+            for duration in durations or (60, 600, 3_600)
+        )
+        scratch_root = config.CACHE_DIR / "benchmarks"
+        file_manager.ensure_directory_exists(scratch_root, private=True)
+        with tempfile.TemporaryDirectory(
+            prefix="pipeline-", dir=scratch_root
+        ) as work_dir:
+            result = container.pipeline_benchmark().run(
+                specs,
+                work_dir=Path(work_dir),
+                output_dir=output_dir or config.OUTPUT_DIR,
+            )
     except ScholionError as exc:
         typer.echo(exc.public_message, err=True)
         raise typer.Exit(code=exc.exit_code) from None
@@ -220,7 +550,7 @@ def benchmark(
         raise typer.Exit(code=1) from None
     except Exception as exc:
         typer.echo(
-            f"Scholion benchmark failed internally ({type(exc).__name__})",
+            f"Scholion pipeline benchmark failed internally ({type(exc).__name__})",
             err=True,
         )
         raise typer.Exit(code=3) from None
@@ -228,8 +558,181 @@ def benchmark(
     if json_output:
         typer.echo(json.dumps(result.to_dict(), sort_keys=True))
     else:
-        _render(result)
+        _render_pipeline(result)
+
+
+compare_app = typer.Typer(
+    name="scholion-benchmark compare",
+    help="Compare transcription benchmark reports and flag regressions.",
+)
+
+
+def _render_comparison(
+    comparison: BenchmarkComparison, trends: tuple[StrategyTrend, ...]
+) -> None:
+    console = Console()
+    for group in comparison.groups:
+        table = Table(
+            title=(
+                f"Candidate {group.candidate.benchmark_id} "
+                f"({group.candidate.scholion_version}) "
+                f"vs {len(group.baseline_ids)} baseline run(s)"
+            )
+        )
+        table.add_column("Metric")
+        table.add_column("Baseline median")
+        table.add_column("Candidate")
+        table.add_column("Delta")
+        table.add_column("Allowed")
+        table.add_column("Result")
+        for delta in group.deltas:
+            relative = delta.relative_delta
+            table.add_row(
+                delta.metric,
+                f"{delta.baseline_median:.4f}",
+                f"{delta.candidate:.4f}",
+                f"{delta.delta:+.4f}"
+                + ("" if relative is None else f" ({relative:+.1%})"),
+                f"{delta.allowed_increase:.4f}",
+                "REGRESSED" if delta.regressed else "ok",
+            )
+        console.print(table)
+    if comparison.unmatched_ids:
+        console.print(
+            "No comparable baseline for: " + ", ".join(comparison.unmatched_ids)
+        )
+    if comparison.skipped_incomplete:
+        console.print(
+            f"Skipped {comparison.skipped_incomplete} failed or interrupted report(s)"
+        )
+    if trends:
+        table = Table(title="Real-time factor by strategy and release")
+        table.add_column("Strategy")
+        table.add_column("Machine")
+        table.add_column("Scholion")
+        table.add_column("Runs")
+        table.add_column("Median RTF")
+        for trend in trends:
+            table.add_row(
+                trend.strategy,
+                trend.machine,
+                trend.scholion_version,
+                str(trend.runs),
+                f"{trend.median_real_time_factor:.3f}x",
+            )
+        console.print(table)
+
+
+@compare_app.command()
+def compare(
+    reports: Annotated[
+        list[Path],
+        typer.Argument(
+            metavar="REPORT...",
+            exists=True,
+            dir_okay=False,
+            readable=True,
+            resolve_path=True,
+            help="Transcription benchmark reports, oldest first.",
+        ),
+    ],
+    history: Annotated[
+        bool,
+        typer.Option(
+            "--history/--no-history",
+            help="Use and extend the local benchmark history as extra baseline.",
+        ),
+    ] = True,
+    relative_tolerance: Annotated[
+        float,
+        typer.Option(min=0, help="Allowed increase as a fraction of the baseline."),
+    ] = 0.10,
+    noise_multiplier: Annotated[
+        float,
+        typer.Option(
+            min=0,
+            help="Allowed increase in scaled baseline median absolute deviations.",
+        ),
+    ] = 3.0,
+    config_file: Annotated[
+        Path | None,
+        typer.Option(
+            "--config",
+            exists=True,
+            file_okay=True,
+            dir_okay=False,
+            readable=True,
+            resolve_path=True,
+            help="Explicit Scholion dotenv configuration file.",
+        ),
+    ] = None,
+    json_output: Annotated[
+        bool,
+        typer.Option("--json", help="Emit the comparison as JSON."),
+    ] = False,
+) -> None:
+    """Align reports by source, strategy, and machine; exit 1 when a metric regresses."""
+    try:
+        container = _container(config_file)
+        file_manager = container.file_manager()
+        loaded = tuple(
+            read_benchmark_observation(path, file_manager) for path in reports
+        )
+        observations = tuple(item for item in loaded if item is not None)
+        store = container.benchmark_history() if history else None
+        baseline = () if store is None else store.observations()
+        comparison = compare_observations(
+            baseline + observations,
+            thresholds=RegressionThresholds(
+                relative=relative_tolerance, mad_multiplier=noise_multiplier
+            ),
+            skipped_incomplete=len(loaded) - len(observations),
+        )
+        trends: tuple[StrategyTrend, ...] = ()
+        if store is not None:
+            store.record(observations)
+            trends = store.trends()
+    except ScholionError as exc:
+        typer.echo(exc.public_message, err=True)
+        raise typer.Exit(code=exc.exit_code) from None
+    except ValidationError:
+        typer.echo("Invalid Scholion configuration", err=True)
+        raise typer.Exit(code=1) from None
+    except Exception as exc:
+        typer.echo(
+            f"Scholion benchmark comparison failed internally ({type(exc).__name__})",
+            err=True,
+        )
+        raise typer.Exit(code=3) from None
+
+    if json_output:
+        typer.echo(
+            json.dumps(
+                {
+                    **comparison.to_dict(),
+                    "trends": [trend.to_dict() for trend in trends],
+                },
+                sort_keys=True,
+            )
+        )
+    else:
+        _render_comparison(comparison, trends)
+    if comparison.regressed:
+        raise typer.Exit(code=1)
+
+
+_MODES = {"search": search_app, "pipeline": pipeline_app, "compare": compare_app}
+
 
+def main(argv: list[str] | None = None) -> None:
+    """Dispatch named benchmark modes; anything else is the transcription benchmark.
 
-def main() -> None:
-    app()
+    The transcription benchmark predates the named modes and takes the recording as its
+    first positional argument, so modes are routed by name instead of becoming Typer
+    subcommands that would change its command line.
+    """
+    args = sys.argv[1:] if argv is None else argv
+    if args and args[0] in _MODES:
+        _MODES[args[0]](args=args[1:], prog_name=f"scholion-benchmark {args[0]}")
+        return
+    app(args=args, prog_name="scholion-benchmark")
@@ -0,0 +1,537 @@
+"""Compare transcription benchmark reports and keep a local history of them.
+
+A benchmark number only means something next to another run of the same work on the same
+machine. Reports are therefore grouped by three identities before anything is compared:
+
+- the source digest and duration from ``TranscriptSource``;
+- the execution contract (engine, model revision, device, compute type, threads, beam,
+  decoder, and segmentation), which is what the planner's strategy choice produces; and
+- a machine fingerprint over platform, architecture, processor, logical CPUs, and memory.
+
+Within a group the newest report is the candidate and the others, plus any matching
+history entries, are its baseline. One timing is noisy, so a metric regresses only when
+the candidate exceeds the baseline median by more than the widest of a relative
+tolerance, a multiple of the baseline's scaled median absolute deviation, and an absolute
+floor that keeps sub-second stages from flapping.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import statistics
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+
+from scholion.core.errors import StorageError
+from scholion.core.file_manager_facade import FileManagerFacade
+from scholion.runner.models import machine_fingerprint
+from scholion.transcription.calibration import StrategyObservation
+
+from .models import BenchmarkReportError, BenchmarkStatus
+
+_HISTORY_SCHEMA_VERSION = 1
+_MAX_REPORT_BYTES = 4 * 1024 * 1024
+_MAX_HISTORY_BYTES = 32 * 1024 * 1024
+_DEFAULT_MAX_HISTORY_ENTRIES = 5_000
+_MAD_SCALE = 1.4826
+
+
+class _ReportSource(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
+    sha256: str
+    duration_seconds: float
+
+
+class _ReportRunner(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
+    platform: str
+    machine: str
+    logical_cpus: int
+    memory_total_bytes: int
+    processor_name: str | None = None
+
+
+class _ReportPolicy(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
+    profile: str
+
+
+class _ReportContract(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
+    engine: dict[str, object]
+    decoder: dict[str, object]
+    segmentation: dict[str, object]
+
+
+class _ReportStage(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
+    name: str
+    count: int
+    total_seconds: float
+
+
+class _ReportProcessTree(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
+    peak_rss_bytes: int
+
+
+class _ReportObserved(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
+    real_time_factor: float
+    process_tree: _ReportProcessTree
+    peak_rss_to_estimate_ratio: float | None = None
+    stages: list[_ReportStage]
+
+
+class _ReportEnvironment(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
+    scholion_version: str
+
+
+class _ReportDocument(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
+    schema_version: int
+    benchmark_id: str
+    status: BenchmarkStatus
+    environment: _ReportEnvironment
+    source: _ReportSource
+    runner: _ReportRunner
+    policy: _ReportPolicy
+    execution_contract: _ReportContract
+    observed: _ReportObserved
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkObservation:
+    """The comparable facts of one completed transcription benchmark report."""
+
+    benchmark_id: str
+    scholion_version: str
+    source: str
+    strategy: str
+    machine: str
+    metrics: dict[str, float] = field(default_factory=dict)
+    configuration: dict[str, str] = field(default_factory=dict)
+    peak_rss_bytes: int | None = None
+
+    def __post_init__(self) -> None:
+        if not self.benchmark_id:
+            raise ValueError("benchmark_id cannot be empty")
+        if any(value < 0 for value in self.metrics.values()):
+            raise ValueError("benchmark metrics cannot be negative")
+        if self.peak_rss_bytes is not None and self.peak_rss_bytes < 0:
+            raise ValueError("peak_rss_bytes cannot be negative")
+
+    def strategy_observation(self) -> StrategyObservation | None:
+        """Return calibration evidence, or ``None`` when the run lacks any part of it."""
+        real_time_factor = self.metrics.get("real_time_factor")
+        if not real_time_factor or not self.peak_rss_bytes:
+            return None
+        try:
+            return StrategyObservation(
+                engine=self.configuration["engine"],
+                model=self.configuration["model"],
+                device=self.configuration["device"],
+                compute_type=self.configuration["compute_type"],
+                real_time_factor=real_time_factor,
+                peak_memory_bytes=self.peak_rss_bytes,
+            )
+        except (KeyError, ValueError):
+            return None
+
+    @property
+    def group(self) -> tuple[str, str, str]:
+        return (self.source, self.strategy, self.machine)
+
+    @classmethod
+    def from_report(cls, payload: bytes) -> BenchmarkObservation | None:
+        """Project a report; incomplete runs return ``None`` because they are not comparable."""
+        try:
+            document = _ReportDocument.model_validate(json.loads(payload))
+        except (UnicodeDecodeError, json.JSONDecodeError, ValidationError) as exc:
+            raise BenchmarkReportError(
+                "File is not a Scholion transcription benchmark report", cause=exc
+            ) from exc
+        if document.schema_version != 1:
+            raise BenchmarkReportError("Unsupported benchmark report schema version")
+        if document.status is not BenchmarkStatus.COMPLETED:
+            return None
+        contract = document.execution_contract
+        runner = document.runner
+        metrics = {"real_time_factor": document.observed.real_time_factor}
+        if document.observed.peak_rss_to_estimate_ratio is not None:
+            metrics["peak_rss_to_estimate_ratio"] = (
+                document.observed.peak_rss_to_estimate_ratio
+            )
+        for stage in document.observed.stages:
+            metrics[f"stage.{stage.name}.seconds"] = stage.total_seconds
+        return cls(
+            benchmark_id=document.benchmark_id,
+            scholion_version=document.environment.scholion_version,
+            source=f"{document.source.sha256}:{document.source.duration_seconds}",
+            strategy=_digest(
+                {
+                    "profile": document.policy.profile,
+                    "engine": contract.engine,
+                    "decoder": contract.decoder,
+                    "segmentation": contract.segmentation,
+                }
+            ),
+            machine=machine_fingerprint(
+                platform=runner.platform,
+                machine=runner.machine,
+                processor_name=runner.processor_name,
+                logical_cpus=runner.logical_cpus,
+                memory_total_bytes=runner.memory_total_bytes,
+            ),
+            metrics=metrics,
+            configuration={
+                name: str(contract.engine[name])
+                for name in ("engine", "model", "device", "compute_type")
+                if name in contract.engine
+            },
+            peak_rss_bytes=document.observed.process_tree.peak_rss_bytes,
+        )
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "benchmark_id": self.benchmark_id,
+            "scholion_version": self.scholion_version,
+            "source": self.source,
+            "strategy": self.strategy,
+            "machine": self.machine,
+            "metrics": dict(sorted(self.metrics.items())),
+            "configuration": dict(sorted(self.configuration.items())),
+            "peak_rss_bytes": self.peak_rss_bytes,
+        }
+
+
+def read_benchmark_observation(
+    path: Path, file_manager: FileManagerFacade
+) -> BenchmarkObservation | None:
+    if file_manager.get_file_metadata(path)["size"] > _MAX_REPORT_BYTES:
+        raise BenchmarkReportError("Benchmark report is too large to compare")
+    return BenchmarkObservation.from_report(file_manager.read_file(path))
+
+
+@dataclass(frozen=True, slots=True)
+class RegressionThresholds:
+    """How far above the baseline median a metric may drift before it regresses."""
+
+    relative: float = 0.10
+    mad_multiplier: float = 3.0
+    absolute_seconds: float = 0.05
+    absolute_ratio: float = 0.02
+
+    def __post_init__(self) -> None:
+        for name in (
+            "relative",
+            "mad_multiplier",
+            "absolute_seconds",
+            "absolute_ratio",
+        ):
+            if getattr(self, name) < 0:
+                raise ValueError(f"{name} cannot be negative")
+
+    def allowed(self, metric: str, baseline: list[float]) -> float:
+        median = statistics.median(baseline)
+        deviation = statistics.median(abs(value - median) for value in baseline)
+        floor = (
+            self.absolute_seconds
+            if metric.endswith(".seconds")
+            else self.absolute_ratio
+        )
+        return max(
+            self.relative * median, self.mad_multiplier * _MAD_SCALE * deviation, floor
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class MetricDelta:
+    metric: str
+    baseline_median: float
+    baseline_samples: int
+    candidate: float
+    allowed_increase: float
+
+    @property
+    def delta(self) -> float:
+        return self.candidate - self.baseline_median
+
+    @property
+    def relative_delta(self) -> float | None:
+        if self.baseline_median == 0:
+            return None
+        return self.delta / self.baseline_median
+
+    @property
+    def regressed(self) -> bool:
+        return self.delta > self.allowed_increase
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "metric": self.metric,
+            "baseline_median": self.baseline_median,
+            "baseline_samples": self.baseline_samples,
+            "candidate": self.candidate,
+            "delta": self.delta,
+            "relative_delta": self.relative_delta,
+            "allowed_increase": self.allowed_increase,
+            "regressed": self.regressed,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class GroupComparison:
+    """One candidate report against every earlier run of the same work and machine."""
+
+    candidate: BenchmarkObservation
+    baseline_ids: tuple[str, ...]
+    deltas: tuple[MetricDelta, ...]
+
+    @property
+    def regressions(self) -> tuple[MetricDelta, ...]:
+        return tuple(delta for delta in self.deltas if delta.regressed)
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "source": self.candidate.source,
+            "strategy": self.candidate.strategy,
+            "machine": self.candidate.machine,
+            "candidate_id": self.candidate.benchmark_id,
+            "candidate_version": self.candidate.scholion_version,
+            "baseline_ids": list(self.baseline_ids),
+            "deltas": [delta.to_dict() for delta in self.deltas],
+            "regressed": bool(self.regressions),
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkComparison:
+    groups: tuple[GroupComparison, ...]
+    unmatched_ids: tuple[str, ...]
+    skipped_incomplete: int
+
+    @property
+    def regressed(self) -> bool:
+        return any(group.regressions for group in self.groups)
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "groups": [group.to_dict() for group in self.groups],
+            "unmatched_ids": list(self.unmatched_ids),
+            "skipped_incomplete": self.skipped_incomplete,
+            "regressed": self.regressed,
+        }
+
+
+def compare_observations(
+    observations: tuple[BenchmarkObservation, ...],
+    *,
+    thresholds: RegressionThresholds | None = None,
+    skipped_incomplete: int = 0,
+) -> BenchmarkComparison:
+    """Compare the last observation of every aligned group with the earlier ones.
+
+    Order is significant: observations must be oldest first. Metrics missing from the
+    baseline or the candidate are not compared; a stage that only now appears has no
+    baseline to regress against.
+    """
+    thresholds = thresholds or RegressionThresholds()
+    grouped: dict[tuple[str, str, str], list[BenchmarkObservation]] = {}
+    for observation in observations:
+        members = grouped.setdefault(observation.group, [])
+        members[:] = [
+            item for item in members if item.benchmark_id != observation.benchmark_id
+        ]
+        members.append(observation)
+    groups: list[GroupComparison] = []
+    unmatched: list[str] = []
+    for members in grouped.values():
+        *baseline, candidate = members
+        if not baseline:
+            unmatched.append(candidate.benchmark_id)
+            continue
+        deltas = []
+        for metric, value in sorted(candidate.metrics.items()):
+            samples = [
+                item.metrics[metric] for item in baseline if metric in item.metrics
+            ]
+            if not samples:
+                continue
+            deltas.append(
+                MetricDelta(
+                    metric=metric,
+                    baseline_median=statistics.median(samples),
+                    baseline_samples=len(samples),
+                    candidate=value,
+                    allowed_increase=thresholds.allowed(metric, samples),
+                )
+            )
+        groups.append(
+            GroupComparison(
+                candidate=candidate,
+                baseline_ids=tuple(item.benchmark_id for item in baseline),
+                deltas=tuple(deltas),
+            )
+        )
+    return BenchmarkComparison(
+        groups=tuple(groups),
+        unmatched_ids=tuple(unmatched),
+        skipped_incomplete=skipped_incomplete,
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class StrategyTrend:
+    """Median real-time factor of one strategy on one machine for one release."""
+
+    strategy: str
+    machine: str
+    scholion_version: str
+    runs: int
+    median_real_time_factor: float
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "strategy": self.strategy,
+            "machine": self.machine,
+            "scholion_version": self.scholion_version,
+            "runs": self.runs,
+            "median_real_time_factor": self.median_real_time_factor,
+        }
+
+
+class _StoredObservation(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    benchmark_id: str = Field(min_length=1)
+    scholion_version: str
+    source: str
+    strategy: str
+    machine: str
+    metrics: dict[str, float]
+    configuration: dict[str, str] = Field(default_factory=dict)
+    peak_rss_bytes: int | None = None
+
+
+class _StoredHistory(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    schema_version: int
+    observations: list[_StoredObservation]
+
+
+class BenchmarkHistoryStore:
+    """Private, bounded, oldest-first record of compared benchmark observations.
+
+    History holds digests, versions, engine configurations, and metrics, never paths. It
+    feeds trend reading and strategy calibration: an unreadable file is treated as empty
+    and rewritten on the next record, and the oldest entries fall off once
+    ``max_entries`` is reached.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        file_manager: FileManagerFacade,
+        *,
+        max_entries: int = _DEFAULT_MAX_HISTORY_ENTRIES,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be positive")
+        self.path = path.expanduser().resolve(strict=False)
+        self.file_manager = file_manager
+        self.max_entries = max_entries
+
+    def observations(self) -> tuple[BenchmarkObservation, ...]:
+        if not self.file_manager.file_exists(self.path):
+            return ()
+        try:
+            if (
+                self.file_manager.get_file_metadata(self.path)["size"]
+                > _MAX_HISTORY_BYTES
+            ):
+                return ()
+            stored = _StoredHistory.model_validate(
+                json.loads(self.file_manager.read_file(self.path))
+            )
+            if stored.schema_version != _HISTORY_SCHEMA_VERSION:
+                return ()
+            return tuple(
+                BenchmarkObservation(**item.model_dump())
+                for item in stored.observations
+            )
+        except (
+            StorageError,
+            UnicodeDecodeError,
+            json.JSONDecodeError,
+            ValidationError,
+            ValueError,
+        ):
+            return ()
+
+    def record(self, observations: tuple[BenchmarkObservation, ...]) -> None:
+        """Append new observations; a benchmark ID already present is not duplicated."""
+        current = list(self.observations())
+        known = {item.benchmark_id for item in current}
+        for observation in observations:
+            if observation.benchmark_id not in known:
+                current.append(observation)
+                known.add(observation.benchmark_id)
+        current = current[-self.max_entries :]
+        payload = json.dumps(
+            {
+                "schema_version": _HISTORY_SCHEMA_VERSION,
+                "observations": [item.to_dict() for item in current],
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+        ).encode("utf-8")
+        self.file_manager.ensure_directory_exists(self.path.parent, private=True)
+        self.file_manager.save_file(payload + b"\n", self.path, private=True)
+
+    def strategy_observations(self, machine: str) -> tuple[StrategyObservation, ...]:
+        """Return calibration evidence recorded on one machine fingerprint."""
+        evidence = (
+            item.strategy_observation()
+            for item in self.observations()
+            if item.machine == machine
+        )
+        return tuple(item for item in evidence if item is not None)
+
+    def trends(self) -> tuple[StrategyTrend, ...]:
+        """Summarize real-time factor per strategy, machine, and release in first-seen order."""
+        samples: dict[tuple[str, str, str], list[float]] = {}
+        for item in self.observations():
+            value = item.metrics.get("real_time_factor")
+            if value is not None:
+                key = (item.strategy, item.machine, item.scholion_version)
+                samples.setdefault(key, []).append(value)
+        return tuple(
+            StrategyTrend(
+                strategy=strategy,
+                machine=machine,
+                scholion_version=version,
+                runs=len(values),
+                median_real_time_factor=statistics.median(values),
+            )
+            for (strategy, machine, version), values in samples.items()
+        )
+
+
+def _digest(value: object) -> str:
+    encoded = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:16]
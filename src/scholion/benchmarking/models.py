@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from enum import StrEnum
 from pathlib import Path
 
+from scholion.core.errors import ErrorCode, ScholionError
 from scholion.core.measurements import StageMeasurement
 from scholion.transcription.models import (
     TranscriptionExecutionResult,
@@ -39,6 +40,7 @@ class BenchmarkReport:
     values: dict[str, int | float]
     canonical_artifact_bytes: int | None = None
     error_type: str | None = None
+    trace_file: str | None = None
     schema_version: int = 1
 
     def __post_init__(self) -> None:
@@ -120,6 +122,7 @@ class BenchmarkReport:
                 "peak_rss_to_estimate_ratio": self.peak_rss_to_estimate_ratio,
             },
             "error_type": self.error_type,
+            "trace_file": self.trace_file,
         }
 
 
@@ -128,11 +131,13 @@ class BenchmarkRunResult:
     report_path: Path
     report: BenchmarkReport
     transcription: TranscriptionExecutionResult
+    trace_path: Path | None = None
 
     def to_dict(self) -> dict[str, object]:
         return {
             "benchmark_report_path": str(self.report_path),
             "transcript_artifact_path": str(self.transcription.artifact.path),
+            "trace_path": None if self.trace_path is None else str(self.trace_path),
             "report": self.report.to_dict(),
         }
 
@@ -150,3 +155,10 @@ class BenchmarkRunError(Exception):
         self.status = status
         self.cause = cause
         super().__init__(f"benchmark {status.value}")
+
+
+class BenchmarkReportError(ScholionError):
+    """A benchmark report could not be read for comparison."""
+
+    code = ErrorCode.INVALID_INPUT
+    exit_code = 2
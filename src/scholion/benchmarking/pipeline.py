@@ -0,0 +1,478 @@
+"""Model-free micro-benchmark of the transcription pipeline around the ASR engine.
+
+The real benchmark needs faster-whisper and an installed model. This harness drives the
+production ``TranscriptionExecutor`` with the real segmenter, checkpoint store, assembler,
+canonicalization, and artifact publication, and replaces only the parts that need media
+tools or a model:
+
+- ``SyntheticPcmDecoder`` writes canonical PCM WAV of the requested duration where FFmpeg
+  would have written the normalized audio;
+- ``SyntheticSessionTranscriber`` returns deterministic aligned segments at conversational
+  segment and word densities; and
+- ``SyntheticLanguageAttributor`` returns per-line spans with a fixed share of a second
+  language, so language projection does real work.
+
+Every stage the executor observes is reported as a ``StageMeasurement``. The engine stage
+(``segment.transcribe``) is nearly free here, so the rest of the report measures the
+pipeline's own overhead and regressions in it are visible without a GPU or a model.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import platform
+import random
+import wave
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter
+
+from scholion.benchmarking.runner import _benchmark_id, _scholion_version
+from scholion.core.file_manager_facade import FileManagerFacade
+from scholion.core.ilogger import ILogger
+from scholion.core.measurements import MeasurementRecorder, StageMeasurement
+from scholion.media.models import InputIdentity, MediaInfo, MediaStream, StreamKind
+from scholion.runner.inspector import RunnerInspector
+from scholion.runner.models import ProcessingProfile
+from scholion.runner.policy import RunnerPolicyPlanner
+from scholion.transcription.alignment import AlignedRecognizedSegment, AlignedWord
+from scholion.transcription.assembly import TranscriptAssembler
+from scholion.transcription.audio import DecodedAudio
+from scholion.transcription.checkpoint import LocalCheckpointStore
+from scholion.transcription.executor import TranscriptionExecutor
+from scholion.transcription.models import (
+    CpuEngineConfiguration,
+    DecodeConfiguration,
+    DecodeStrategy,
+    EngineTranscript,
+    LanguageAttributionProvenance,
+    LanguageSpan,
+    ResourceEstimate,
+    SegmentationConfiguration,
+    TranscriptionJobPlan,
+)
+from scholion.transcription.segmentation import WaveAudioSegmenter
+from scholion.workspace.models import Artifact, ArtifactKind, Job, JobId, WorkspacePaths
+from scholion.workspace.service import WorkspaceService
+
+_MIN_DURATION_SECONDS = 60
+_MAX_DURATION_SECONDS = 10 * 60 * 60
+_SAMPLE_RATE_HZ = 16_000
+_SAMPLE_WIDTH_BYTES = 2
+_ENGINE_VERSION = "synthetic-1"
+_WORDS = (
+    "the", "and", "we", "that", "it", "was", "so", "people", "really", "think",
+    "about", "housing", "rent", "work", "family", "city", "year", "time", "know",
+    "because", "school", "money", "community", "said", "going", "just", "then",
+    "there", "would", "never", "always", "market", "neighbors", "street", "job",
+)  # fmt: skip
+
+
+@dataclass(frozen=True, slots=True)
+class PipelineBenchmarkSpec:
+    """Synthetic recording shape driven through the executor."""
+
+    duration_seconds: int
+    segment_duration_seconds: int = 600
+    words_per_minute: int = 150
+    secondary_language_share: float = 0.1
+    seed: int = 0
+
+    def __post_init__(self) -> None:
+        if not _MIN_DURATION_SECONDS <= self.duration_seconds <= _MAX_DURATION_SECONDS:
+            raise ValueError("duration_seconds must be between 60 and 36000")
+        if self.segment_duration_seconds < 1:
+            raise ValueError("segment_duration_seconds must be positive")
+        if self.words_per_minute < 1:
+            raise ValueError("words_per_minute must be positive")
+        if not 0 <= self.secondary_language_share <= 1:
+            raise ValueError("secondary_language_share must be between 0 and 1")
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "duration_seconds": self.duration_seconds,
+            "segment_duration_seconds": self.segment_duration_seconds,
+            "words_per_minute": self.words_per_minute,
+            "secondary_language_share": self.secondary_language_share,
+            "seed": self.seed,
+        }
+
+
+class SyntheticPcmDecoder:
+    """Write canonical 16 kHz mono PCM of a fixed duration in place of FFmpeg output."""
+
+    def __init__(self, duration_seconds: int, *, seed: int = 0) -> None:
+        self.duration_seconds = duration_seconds
+        rng = random.Random(f"pcm:{seed}")  # noqa: S311
+        self._second = b"".join(
+            rng.randint(-256, 256).to_bytes(_SAMPLE_WIDTH_BYTES, "little", signed=True)
+            for _ in range(_SAMPLE_RATE_HZ)
+        )
+
+    def decode(
+        self,
+        media: MediaInfo,
+        configuration: DecodeConfiguration,
+        workspace_dir: Path,
+    ) -> DecodedAudio:
+        del media
+        if (
+            configuration.sample_rate_hz != _SAMPLE_RATE_HZ
+            or configuration.channels != 1
+        ):
+            raise ValueError("synthetic PCM is 16 kHz mono")
+        destination = (workspace_dir / "normalized.wav").resolve(strict=False)
+        with destination.open("xb") as raw, wave.open(raw, "wb") as output:
+            output.setnchannels(1)
+            output.setsampwidth(_SAMPLE_WIDTH_BYTES)
+            output.setframerate(_SAMPLE_RATE_HZ)
+            for _ in range(self.duration_seconds):
+                output.writeframesraw(self._second)
+        return DecodedAudio(destination, temporary=True)
+
+    @staticmethod
+    def cleanup(audio: DecodedAudio) -> None:
+        if audio.temporary:
+            audio.path.unlink(missing_ok=True)
+
+
+class _SyntheticSession:
+    engine_version = _ENGINE_VERSION
+
+    def __init__(self, *, words_per_minute: int, seed: int) -> None:
+        self.words_per_second = words_per_minute / 60
+        self.seed = seed
+
+    def transcribe(self, audio_path: Path) -> EngineTranscript:
+        with wave.open(str(audio_path), "rb") as source:
+            duration = source.getnframes() / source.getframerate()
+        rng = random.Random(f"{self.seed}:{audio_path.name}")  # noqa: S311
+        segments: list[AlignedRecognizedSegment] = []
+        cursor = rng.uniform(0.1, 0.6)
+        while cursor < duration - 0.5:
+            end = min(duration, cursor + rng.uniform(2.0, 8.0))
+            count = max(1, round((end - cursor) * self.words_per_second))
+            step = (end - cursor) / count
+            words = tuple(
+                AlignedWord(
+                    start_seconds=cursor + index * step,
+                    end_seconds=cursor + (index + 0.85) * step,
+                    text=rng.choice(_WORDS),
+                    probability=round(rng.uniform(0.6, 1.0), 3),
+                )
+                for index in range(count)
+            )
+            segments.append(
+                AlignedRecognizedSegment(
+                    index=len(segments),
+                    start_seconds=cursor,
+                    end_seconds=end,
+                    text=" ".join(word.text for word in words) + ".",
+                    average_log_probability=-rng.uniform(0.05, 0.6),
+                    no_speech_probability=rng.uniform(0.0, 0.1),
+                    words=words,
+                )
+            )
+            cursor = end + rng.uniform(0.1, 1.2)
+        return EngineTranscript(tuple(segments), "en", 0.97, self.engine_version)
+
+
+class SyntheticSessionTranscriber:
+    """Deterministic stand-in for an ASR engine at conversational speech density."""
+
+    def __init__(self, *, words_per_minute: int = 150, seed: int = 0) -> None:
+        self.words_per_minute = words_per_minute
+        self.seed = seed
+
+    def open_session(self, configuration: CpuEngineConfiguration) -> _SyntheticSession:
+        del configuration
+        return _SyntheticSession(words_per_minute=self.words_per_minute, seed=self.seed)
+
+
+class SyntheticLanguageAttributor:
+    """Attribute each transcript line, switching a fixed share to a second language."""
+
+    def __init__(self, *, secondary_share: float = 0.1, seed: int = 0) -> None:
+        self.secondary_share = secondary_share
+        self.seed = seed
+
+    @property
+    def provenance(self) -> LanguageAttributionProvenance:
+        return LanguageAttributionProvenance("synthetic", _ENGINE_VERSION, "line")
+
+    def attribute(self, text: str) -> tuple[LanguageSpan, ...]:
+        rng = random.Random(f"languages:{self.seed}")  # noqa: S311
+        spans: list[LanguageSpan] = []
+        start = 0
+        for line in text.split("\n"):
+            end = start + len(line)
+            if line.strip():
+                language = "de" if rng.random() < self.secondary_share else "en"
+                spans.append(LanguageSpan(start, end, language, 0.9))
+            start = end + 1
+        return tuple(spans)
+
+
+class _PlannedMediaProbe:
+    def __init__(self, media: MediaInfo) -> None:
+        self.media = media
+
+    def probe(self, input_path: str | Path) -> MediaInfo:
+        del input_path
+        return self.media
+
+
+@dataclass(frozen=True, slots=True)
+class PipelineRun:
+    """Stage measurements for one synthetic recording duration."""
+
+    spec: PipelineBenchmarkSpec
+    wall_seconds: float
+    windows: int
+    segments: int
+    words: int
+    artifact_bytes: int
+    stages: tuple[StageMeasurement, ...]
+
+    @property
+    def pipeline_overhead_seconds(self) -> float:
+        """Executor wall time outside the stand-in engine call."""
+        engine = sum(
+            stage.total_seconds
+            for stage in self.stages
+            if stage.name == "segment.transcribe"
+        )
+        return max(0.0, self.wall_seconds - engine)
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "input": self.spec.to_dict(),
+            "wall_seconds": self.wall_seconds,
+            "pipeline_overhead_seconds": self.pipeline_overhead_seconds,
+            "real_time_factor": self.wall_seconds / self.spec.duration_seconds,
+            "work": {
+                "windows": self.windows,
+                "segments": self.segments,
+                "words": self.words,
+            },
+            "artifact_bytes": self.artifact_bytes,
+            "stages": [stage.to_dict() for stage in self.stages],
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class PipelineBenchmarkReport:
+    benchmark_id: str
+    scholion_version: str
+    python_version: str
+    runs: tuple[PipelineRun, ...]
+    schema_version: int = 1
+
+    def __post_init__(self) -> None:
+        if self.schema_version != 1:
+            raise ValueError("unsupported pipeline benchmark schema version")
+        if not self.benchmark_id:
+            raise ValueError("benchmark ID cannot be empty")
+        if not self.runs:
+            raise ValueError("pipeline benchmark requires at least one run")
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "schema_version": self.schema_version,
+            "kind": "pipeline",
+            "benchmark_id": self.benchmark_id,
+            "environment": {
+                "scholion_version": self.scholion_version,
+                "python_version": self.python_version,
+                "engine": _ENGINE_VERSION,
+            },
+            "runs": [run.to_dict() for run in self.runs],
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class PipelineBenchmarkResult:
+    report_path: Path
+    report: PipelineBenchmarkReport
+
+    def to_dict(self) -> dict[str, object]:
+        return {"report_path": str(self.report_path), "report": self.report.to_dict()}
+
+
+class PipelineBenchmark:
+    """Run the production executor over synthetic recordings of increasing length."""
+
+    def __init__(
+        self,
+        *,
+        file_manager: FileManagerFacade,
+        runner_inspector: RunnerInspector,
+        logger: ILogger,
+        clock: Callable[[], float] = perf_counter,
+        id_factory: Callable[[], str] = _benchmark_id,
+        version_factory: Callable[[], str] = _scholion_version,
+        python_version_factory: Callable[[], str] = platform.python_version,
+    ) -> None:
+        self.file_manager = file_manager
+        self.runner_inspector = runner_inspector
+        self.logger = logger
+        self.clock = clock
+        self.id_factory = id_factory
+        self.version_factory = version_factory
+        self.python_version_factory = python_version_factory
+
+    def run(
+        self,
+        specs: tuple[PipelineBenchmarkSpec, ...],
+        *,
+        work_dir: Path,
+        output_dir: Path,
+    ) -> PipelineBenchmarkResult:
+        """Execute every spec and write ``scholion-pipeline-benchmark-<id>.json``.
+
+        Each spec gets its own private workspace under ``work_dir``, which the caller
+        owns. Canonical transcripts are published there too, so ``output_dir`` only
+        receives the path-free report.
+        """
+        if not specs:
+            raise ValueError("pipeline benchmark requires at least one duration")
+        benchmark_id = self.id_factory()
+        runs = tuple(
+            self._run_one(spec, work_dir / f"run-{index:02d}")
+            for index, spec in enumerate(specs)
+        )
+        report = PipelineBenchmarkReport(
+            benchmark_id=benchmark_id,
+            scholion_version=self.version_factory(),
+            python_version=self.python_version_factory(),
+            runs=runs,
+        )
+        report_path = (
+            output_dir / f"scholion-pipeline-benchmark-{benchmark_id}.json"
+        ).resolve(strict=False)
+        self.file_manager.ensure_directory_exists(report_path.parent)
+        document = json.dumps(
+            report.to_dict(), ensure_ascii=False, sort_keys=True, separators=(",", ":")
+        )
+        self.file_manager.save_file(f"{document}\n".encode(), report_path)
+        return PipelineBenchmarkResult(report_path, report)
+
+    def _run_one(self, spec: PipelineBenchmarkSpec, root: Path) -> PipelineRun:
+        paths = WorkspacePaths(
+            root / "state", root / "cache", root / "cache" / "models", root / "output"
+        )
+        workspace = WorkspaceService(paths, self.file_manager)
+        workspace.initialize()
+        plan = self._plan(spec, paths)
+        recorder = MeasurementRecorder(self.clock)
+        executor = TranscriptionExecutor(
+            media_probe=_PlannedMediaProbe(plan.media),
+            workspace_service=workspace,
+            file_manager=self.file_manager,
+            runner_inspector=self.runner_inspector,
+            policy_planner=RunnerPolicyPlanner(memory_budget_fraction=1),
+            audio_decoder=SyntheticPcmDecoder(spec.duration_seconds, seed=spec.seed),
+            audio_segmenter=WaveAudioSegmenter(),
+            transcriber=SyntheticSessionTranscriber(
+                words_per_minute=spec.words_per_minute, seed=spec.seed
+            ),
+            transcript_assembler=TranscriptAssembler(),
+            logger=self.logger,
+            checkpoint_store=LocalCheckpointStore(self.file_manager),
+            language_attributor=SyntheticLanguageAttributor(
+                secondary_share=spec.secondary_language_share, seed=spec.seed
+            ),
+            observer=recorder,
+        )
+        started = self.clock()
+        result = executor.execute(plan)
+        wall_seconds = max(0.0, self.clock() - started)
+        segments = result.transcript.segments
+        return PipelineRun(
+            spec=spec,
+            wall_seconds=wall_seconds,
+            windows=int(recorder.values().get("segments.total", 0)),
+            segments=len(segments),
+            words=sum(
+                len(segment.words)
+                for segment in segments
+                if isinstance(segment, AlignedRecognizedSegment)
+            ),
+            artifact_bytes=int(
+                self.file_manager.get_file_metadata(result.artifact.path)["size"]
+            ),
+            stages=recorder.stages(),
+        )
+
+    def _plan(
+        self, spec: PipelineBenchmarkSpec, paths: WorkspacePaths
+    ) -> TranscriptionJobPlan:
+        source = paths.state_dir / "synthetic-recording.wav"
+        self.file_manager.save_file(b"synthetic", source, private=True)
+        stat = source.stat()
+        job_id = JobId(f"pipeline-{spec.duration_seconds}s")
+        job = Job(job_id, source, paths.jobs_dir / job_id.value, paths.output_dir)
+        media = MediaInfo(
+            InputIdentity(
+                source,
+                stat.st_size,
+                stat.st_mtime_ns,
+                hashlib.sha256(b"synthetic").hexdigest(),
+            ),
+            "wav",
+            float(spec.duration_seconds),
+            (
+                MediaStream(
+                    0,
+                    StreamKind.AUDIO,
+                    "pcm_s16le",
+                    float(spec.duration_seconds),
+                    _SAMPLE_RATE_HZ,
+                    1,
+                ),
+            ),
+            0,
+        )
+        runner = self.runner_inspector.inspect()
+        pcm_bytes = spec.duration_seconds * _SAMPLE_RATE_HZ * _SAMPLE_WIDTH_BYTES
+        return TranscriptionJobPlan(
+            job,
+            Artifact(
+                job_id,
+                ArtifactKind.CANONICAL_JSON,
+                paths.output_dir / "synthetic-recording.json",
+            ),
+            media,
+            runner,
+            RunnerPolicyPlanner(memory_budget_fraction=1).plan(
+                runner, ProcessingProfile.BALANCED
+            ),
+            CpuEngineConfiguration(
+                "synthetic",
+                "synthetic",
+                "cpu",
+                "float32",
+                1,
+                1,
+                None,
+                paths.model_dir / "synthetic",
+                _ENGINE_VERSION,
+            ),
+            DecodeConfiguration(
+                DecodeStrategy.FFMPEG_NORMALIZE, "pcm_s16le", _SAMPLE_RATE_HZ, 1
+            ),
+            ResourceEstimate(
+                private_workspace_bytes=2 * pcm_bytes,
+                public_output_bytes=pcm_bytes // 100,
+                model_cache_bytes=0,
+                estimated_peak_memory_bytes=1,
+                memory_budget_bytes=runner.effective_memory_available_bytes,
+                fits_memory_budget=True,
+            ),
+            (),
+            segmentation=SegmentationConfiguration(
+                segment_duration_seconds=spec.segment_duration_seconds
+            ),
+        )
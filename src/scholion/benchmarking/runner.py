@@ -10,7 +10,12 @@ from typing import Protocol
 from uuid import uuid4
 
 from scholion.core.file_manager_facade import FileManagerFacade
-from scholion.core.measurements import ExecutionObserver, MeasurementRecorder
+from scholion.core.measurements import (
+    CombinedExecutionObserver,
+    ExecutionObserver,
+    MeasurementRecorder,
+)
+from scholion.core.profiling import ProfilingObserver
 from scholion.transcription.models import (
     TranscriptionExecutionResult,
     TranscriptionJobPlan,
@@ -72,12 +77,22 @@ class BenchmarkRunner:
         execute: Callable[[ExecutionObserver], TranscriptionExecutionResult],
         resume: bool = False,
         planning_wall_seconds: float = 0.0,
+        profiler: ProfilingObserver | None = None,
     ) -> BenchmarkRunResult:
+        """Execute once; with a profiler, a trace file is written beside the report."""
         if planning_wall_seconds < 0:
             raise ValueError("planning_wall_seconds cannot be negative")
         benchmark_id = self.id_factory()
         report_path = self._reserve_report(plan, benchmark_id)
+        trace_path = (
+            None if profiler is None else self._reserve_trace(report_path, benchmark_id)
+        )
         recorder = MeasurementRecorder(clock=self.clock)
+        observer: ExecutionObserver = (
+            recorder
+            if profiler is None
+            else CombinedExecutionObserver(recorder, profiler)
+        )
         sampler = self.sampler_factory()
         started = self.clock()
         sampler.start()
@@ -86,7 +101,7 @@ class BenchmarkRunner:
         error: BaseException | None = None
         status = BenchmarkStatus.COMPLETED
         try:
-            result = execute(recorder)
+            result = execute(observer)
         except KeyboardInterrupt as exc:
             status = BenchmarkStatus.INTERRUPTED
             error = exc
@@ -112,7 +127,10 @@ class BenchmarkRunner:
             values=recorder.values(),
             canonical_artifact_bytes=self._artifact_size(result),
             error_type=None if error is None else type(error).__name__,
+            trace_file=None if trace_path is None else trace_path.name,
         )
+        if profiler is not None and trace_path is not None:
+            self._write_json(trace_path, profiler.to_chrome_trace())
         self._write_report(report_path, report)
 
         if error is not None:
@@ -121,7 +139,7 @@ class BenchmarkRunner:
             raise RuntimeError(
                 "completed benchmark did not produce a transcription result"
             )
-        return BenchmarkRunResult(report_path, report, result)
+        return BenchmarkRunResult(report_path, report, result, trace_path)
 
     def _reserve_report(self, plan: TranscriptionJobPlan, benchmark_id: str) -> Path:
         self.workspace_service.initialize(plan.job.output_dir)
@@ -131,14 +149,24 @@ class BenchmarkRunner:
         self.file_manager.reserve_file(report_path)
         return report_path
 
+    def _reserve_trace(self, report_path: Path, benchmark_id: str) -> Path:
+        trace_path = report_path.with_name(
+            f"scholion-benchmark-{benchmark_id}.trace.json"
+        )
+        self.file_manager.reserve_file(trace_path)
+        return trace_path
+
     def _artifact_size(self, result: TranscriptionExecutionResult | None) -> int | None:
         if result is None or not self.file_manager.file_exists(result.artifact.path):
             return None
         return int(self.file_manager.get_file_metadata(result.artifact.path)["size"])
 
     def _write_report(self, path: Path, report: BenchmarkReport) -> None:
+        self._write_json(path, report.to_dict())
+
+    def _write_json(self, path: Path, payload: dict[str, object]) -> None:
         document = json.dumps(
-            report.to_dict(),
+            payload,
             ensure_ascii=False,
             sort_keys=True,
             separators=(",", ":"),
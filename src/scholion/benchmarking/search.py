@@ -0,0 +1,647 @@
+"""Synthetic-corpus benchmarks for transcript search, retrieval, and evidence location.
+
+Real libraries are private, so search performance is measured against generated canonical
+transcripts instead. Generation is deterministic for a given ``SyntheticCorpusSpec``: the
+vocabulary, the Zipf-like term distribution, per-document speaker counts, and speaker
+turn-taking all come from one seeded generator, so two runs with the same spec index
+byte-identical canonicals. Queries are drawn from the same vocabulary and can be saved and
+replayed, so the same query mix can be run against two builds.
+
+Semantic and hybrid retrieval use ``HashingEmbeddingProvider``, a feature-hashing stand-in
+that needs no model download. Its vectors measure the vector index and fusion paths, not
+embedding quality.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import platform
+import random
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter
+
+from scholion.benchmarking.runner import _benchmark_id, _scholion_version
+from scholion.core.file_manager_facade import FileManagerFacade
+from scholion.library.duckdb_index import DuckDbTranscriptIndex
+from scholion.library.duckdb_semantic import DuckDbSemanticIndex
+from scholion.library.evidence import EvidenceLocator
+from scholion.library.index import IndexedTranscript, SearchOperator, SearchQuery
+from scholion.library.projection import load_indexed_transcript
+from scholion.library.retrieval import RetrievalMode, TranscriptSearch
+from scholion.library.semantic import (
+    ChunkingProfile,
+    EmbeddingProfile,
+    EmbeddingVector,
+    SemanticState,
+    build_search_chunks,
+    corpus_fingerprint,
+)
+from scholion.library.text import lexical_tokens
+
+_MAX_DOCUMENTS = 100_000
+_SYLLABLES = (
+    "ka", "lo", "mi", "ra", "te", "su", "no", "vi", "de", "pa",
+    "zu", "ne", "ko", "ri", "sa", "tu", "me", "la", "bo", "fi",
+)  # fmt: skip
+_QUERY_MIX_VERSION = 1
+
+
+@dataclass(frozen=True, slots=True)
+class SyntheticCorpusSpec:
+    """Shape of a generated transcript library."""
+
+    documents: int = 1_000
+    segments_per_document: int = 40
+    words_per_segment: int = 18
+    vocabulary_size: int = 5_000
+    max_speakers: int = 4
+    seed: int = 0
+
+    def __post_init__(self) -> None:
+        if self.documents < 1 or self.documents > _MAX_DOCUMENTS:
+            raise ValueError("documents must be between 1 and 100000")
+        if self.segments_per_document < 1:
+            raise ValueError("segments_per_document must be positive")
+        if self.words_per_segment < 1:
+            raise ValueError("words_per_segment must be positive")
+        if self.vocabulary_size < 10:
+            raise ValueError("vocabulary_size must be at least 10")
+        if self.max_speakers < 1:
+            raise ValueError("max_speakers must be positive")
+
+    def to_dict(self) -> dict[str, int]:
+        return {
+            "documents": self.documents,
+            "segments_per_document": self.segments_per_document,
+            "words_per_segment": self.words_per_segment,
+            "vocabulary_size": self.vocabulary_size,
+            "max_speakers": self.max_speakers,
+            "seed": self.seed,
+        }
+
+
+class SyntheticCorpus:
+    """Deterministic canonical transcripts with Zipf term and skewed speaker shares."""
+
+    def __init__(self, spec: SyntheticCorpusSpec) -> None:
+        self.spec = spec
+        self.vocabulary = _vocabulary(spec.vocabulary_size, spec.seed)
+        self._cumulative_weights = tuple(
+            _cumulative(1.0 / rank for rank in range(1, spec.vocabulary_size + 1))
+        )
+
+    def document_id(self, index: int) -> str:
+        return f"synthetic-{index:06d}"
+
+    def canonical_payload(self, index: int, *, revision: int = 0) -> bytes:
+        """Return one canonical transcript; a new ``revision`` changes its text."""
+        if index < 0 or index >= self.spec.documents:
+            raise ValueError("document index is outside the synthetic corpus")
+        rng = random.Random(f"{self.spec.seed}:{index}:{revision}")  # noqa: S311
+        speakers = tuple(
+            f"speaker-{number:02d}"
+            for number in range(1, rng.randint(1, self.spec.max_speakers) + 1)
+        )
+        speaker_weights = tuple(
+            _cumulative(1.0 / rank for rank in range(1, len(speakers) + 1))
+        )
+        segments: list[dict[str, object]] = []
+        cursor = 0.0
+        speaker = speakers[0]
+        for position in range(self.spec.segments_per_document):
+            if rng.random() < 0.35:
+                speaker = rng.choices(speakers, cum_weights=speaker_weights)[0]
+            words = rng.choices(
+                self.vocabulary,
+                cum_weights=self._cumulative_weights,
+                k=self.spec.words_per_segment,
+            )
+            duration = 0.3 * len(words) + rng.random()
+            step = duration / len(words)
+            segments.append(
+                {
+                    "segment_id": f"segment-{position:06d}",
+                    "start_seconds": round(cursor, 3),
+                    "end_seconds": round(cursor + duration, 3),
+                    "text": " ".join(words),
+                    "language": "en",
+                    "speaker_ref": speaker,
+                    "words": [
+                        {
+                            "start_seconds": round(cursor + offset * step, 3),
+                            "end_seconds": round(cursor + (offset + 1) * step, 3),
+                            "text": word,
+                            "speaker_ref": speaker,
+                        }
+                        for offset, word in enumerate(words)
+                    ],
+                }
+            )
+            cursor += duration + 0.2
+        source = hashlib.sha256(self.document_id(index).encode("utf-8")).hexdigest()
+        document = {
+            "schema_version": 1,
+            "job_id": self.document_id(index),
+            "source": {"sha256": source, "size_bytes": 1, "modified_ns": 0},
+            "detected_language": "en",
+            "segments": segments,
+        }
+        return json.dumps(document, sort_keys=True, separators=(",", ":")).encode()
+
+    def write(
+        self,
+        directory: Path,
+        file_manager: FileManagerFacade,
+        *,
+        indices: range | tuple[int, ...] | None = None,
+        revision: int = 0,
+    ) -> tuple[Path, ...]:
+        file_manager.ensure_directory_exists(directory, private=True)
+        written: list[Path] = []
+        for index in range(self.spec.documents) if indices is None else indices:
+            path = directory / f"{self.document_id(index)}.json"
+            file_manager.save_file(
+                self.canonical_payload(index, revision=revision), path, private=True
+            )
+            written.append(path)
+        return tuple(written)
+
+
+class HashingEmbeddingProvider:
+    """Offline feature-hashing embeddings that exercise vector search paths."""
+
+    def __init__(self, *, dimensions: int = 64) -> None:
+        self._profile = EmbeddingProfile(
+            profile_id=f"synthetic-hashing-{dimensions}",
+            provider="synthetic",
+            model_id="scholion/synthetic-hashing",
+            resolved_revision="1",
+            dimensions=dimensions,
+            normalization="l2",
+            pooling="sum",
+            distance_metric="dot",
+            query_prefix="query: ",
+            passage_prefix="passage: ",
+            chunking_profile_id=ChunkingProfile().profile_id,
+            snapshot_path="synthetic",
+        )
+
+    @property
+    def profile(self) -> EmbeddingProfile:
+        return self._profile
+
+    def embed_queries(self, texts: tuple[str, ...]) -> tuple[EmbeddingVector, ...]:
+        return tuple(self._embed(text) for text in texts)
+
+    def embed_passages(self, texts: tuple[str, ...]) -> tuple[EmbeddingVector, ...]:
+        return tuple(self._embed(text) for text in texts)
+
+    def _embed(self, text: str) -> EmbeddingVector:
+        vector = [0.0] * self._profile.dimensions
+        for token in lexical_tokens(text):
+            digest = hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest()
+            value = int.from_bytes(digest, "big")
+            sign = 1.0 if value & 1 else -1.0
+            vector[(value >> 1) % len(vector)] += sign
+        norm = math.sqrt(sum(item * item for item in vector))
+        if norm == 0:
+            vector[0] = 1.0
+            return tuple(vector)
+        return tuple(item / norm for item in vector)
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkQuery:
+    """One replayable retrieval request."""
+
+    text: str
+    mode: RetrievalMode = RetrievalMode.LEXICAL
+    operator: SearchOperator = SearchOperator.ANY
+    phrase: bool = False
+    limit: int = 20
+
+    def __post_init__(self) -> None:
+        if not self.text.strip():
+            raise ValueError("benchmark query text cannot be empty")
+        if self.limit < 1:
+            raise ValueError("benchmark query limit must be positive")
+
+    def search_query(self) -> SearchQuery:
+        return SearchQuery(
+            self.text, operator=self.operator, phrase=self.phrase, limit=self.limit
+        )
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "text": self.text,
+            "mode": self.mode.value,
+            "operator": self.operator.value,
+            "phrase": self.phrase,
+            "limit": self.limit,
+        }
+
+
+def synthetic_query_mix(
+    corpus: SyntheticCorpus, *, count: int = 200, seed: int = 0
+) -> tuple[BenchmarkQuery, ...]:
+    """Draw common, rare, conjunctive, phrase, semantic, and hybrid queries."""
+    if count < 1:
+        raise ValueError("query count must be positive")
+    rng = random.Random(f"queries:{corpus.spec.seed}:{seed}")  # noqa: S311
+    vocabulary = corpus.vocabulary
+    common = vocabulary[: max(1, len(vocabulary) // 100)]
+    rare = vocabulary[len(vocabulary) // 2 :]
+    phrase_source = json.loads(corpus.canonical_payload(0))["segments"]
+    queries: list[BenchmarkQuery] = []
+    for _ in range(count):
+        roll = rng.random()
+        if roll < 0.3:
+            queries.append(BenchmarkQuery(rng.choice(common)))
+        elif roll < 0.5:
+            queries.append(BenchmarkQuery(f"{rng.choice(common)} {rng.choice(rare)}"))
+        elif roll < 0.6:
+            queries.append(
+                BenchmarkQuery(
+                    f"{rng.choice(common)} {rng.choice(common)}",
+                    operator=SearchOperator.ALL,
+                )
+            )
+        elif roll < 0.7:
+            words = str(rng.choice(phrase_source)["text"]).split()
+            start = rng.randrange(max(1, len(words) - 1))
+            queries.append(
+                BenchmarkQuery(" ".join(words[start : start + 2]), phrase=True)
+            )
+        else:
+            mode = RetrievalMode.SEMANTIC if roll < 0.85 else RetrievalMode.HYBRID
+            text = " ".join(rng.choice(common + rare) for _ in range(3))
+            queries.append(BenchmarkQuery(text, mode=mode))
+    return tuple(queries)
+
+
+def dump_query_mix(queries: tuple[BenchmarkQuery, ...]) -> bytes:
+    document = {
+        "schema_version": _QUERY_MIX_VERSION,
+        "queries": [query.to_dict() for query in queries],
+    }
+    return (json.dumps(document, sort_keys=True, indent=2) + "\n").encode("utf-8")
+
+
+def load_query_mix(payload: bytes) -> tuple[BenchmarkQuery, ...]:
+    try:
+        document = json.loads(payload)
+        if document["schema_version"] != _QUERY_MIX_VERSION:
+            raise ValueError("unsupported query mix schema version")
+        return tuple(
+            BenchmarkQuery(
+                text=str(item["text"]),
+                mode=RetrievalMode(item["mode"]),
+                operator=SearchOperator(item["operator"]),
+                phrase=bool(item["phrase"]),
+                limit=int(item["limit"]),
+            )
+            for item in document["queries"]
+        )
+    except (KeyError, TypeError, UnicodeDecodeError, json.JSONDecodeError) as exc:
+        raise ValueError("query mix is not a valid Scholion query file") from exc
+
+
+@dataclass(frozen=True, slots=True)
+class LatencySummary:
+    """Nearest-rank latency percentiles for one operation, in seconds."""
+
+    count: int
+    p50_seconds: float
+    p95_seconds: float
+    p99_seconds: float
+    max_seconds: float
+
+    @classmethod
+    def from_samples(cls, samples: list[float]) -> LatencySummary:
+        if not samples:
+            raise ValueError("latency summary requires at least one sample")
+        ordered = sorted(samples)
+        return cls(
+            count=len(ordered),
+            p50_seconds=_nearest_rank(ordered, 0.50),
+            p95_seconds=_nearest_rank(ordered, 0.95),
+            p99_seconds=_nearest_rank(ordered, 0.99),
+            max_seconds=ordered[-1],
+        )
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "count": self.count,
+            "p50_seconds": self.p50_seconds,
+            "p95_seconds": self.p95_seconds,
+            "p99_seconds": self.p99_seconds,
+            "max_seconds": self.max_seconds,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class ThroughputMeasurement:
+    items: int
+    wall_seconds: float
+
+    @property
+    def items_per_second(self) -> float | None:
+        if self.wall_seconds <= 0:
+            return None
+        return self.items / self.wall_seconds
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "items": self.items,
+            "wall_seconds": self.wall_seconds,
+            "items_per_second": self.items_per_second,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class SearchBenchmarkReport:
+    """Path-free search benchmark evidence for one synthetic corpus and query mix."""
+
+    benchmark_id: str
+    scholion_version: str
+    python_version: str
+    corpus: SyntheticCorpusSpec
+    segment_count: int
+    chunk_count: int
+    query_count: int
+    repetitions: int
+    throughput: dict[str, ThroughputMeasurement]
+    latency: dict[str, LatencySummary]
+    index_bytes: dict[str, int]
+    schema_version: int = 1
+
+    def __post_init__(self) -> None:
+        if self.schema_version != 1:
+            raise ValueError("unsupported search benchmark schema version")
+        if not self.benchmark_id:
+            raise ValueError("benchmark ID cannot be empty")
+        if self.repetitions < 1:
+            raise ValueError("repetitions must be positive")
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "schema_version": self.schema_version,
+            "kind": "search",
+            "benchmark_id": self.benchmark_id,
+            "environment": {
+                "scholion_version": self.scholion_version,
+                "python_version": self.python_version,
+            },
+            "corpus": {
+                **self.corpus.to_dict(),
+                "segments": self.segment_count,
+                "semantic_chunks": self.chunk_count,
+            },
+            "queries": {"count": self.query_count, "repetitions": self.repetitions},
+            "observed": {
+                "throughput": {
+                    name: item.to_dict()
+                    for name, item in sorted(self.throughput.items())
+                },
+                "latency": {
+                    name: item.to_dict() for name, item in sorted(self.latency.items())
+                },
+                "index_bytes": dict(sorted(self.index_bytes.items())),
+            },
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class SearchBenchmarkResult:
+    report_path: Path
+    report: SearchBenchmarkReport
+
+    def to_dict(self) -> dict[str, object]:
+        return {"report_path": str(self.report_path), "report": self.report.to_dict()}
+
+
+class SearchBenchmark:
+    """Build, refresh, and query the real search backends over a synthetic corpus."""
+
+    def __init__(
+        self,
+        *,
+        file_manager: FileManagerFacade,
+        clock: Callable[[], float] = perf_counter,
+        id_factory: Callable[[], str] = _benchmark_id,
+        version_factory: Callable[[], str] = _scholion_version,
+        python_version_factory: Callable[[], str] = platform.python_version,
+        embedding_dimensions: int = 64,
+    ) -> None:
+        self.file_manager = file_manager
+        self.clock = clock
+        self.id_factory = id_factory
+        self.version_factory = version_factory
+        self.python_version_factory = python_version_factory
+        self.embedding_dimensions = embedding_dimensions
+
+    def run(
+        self,
+        corpus: SyntheticCorpus,
+        queries: tuple[BenchmarkQuery, ...],
+        *,
+        work_dir: Path,
+        output_dir: Path,
+        repetitions: int = 3,
+        refresh_fraction: float = 0.01,
+    ) -> SearchBenchmarkResult:
+        """Measure one corpus and write ``scholion-search-benchmark-<id>.json``.
+
+        ``work_dir`` receives the generated canonicals and both DuckDB indexes; the
+        caller owns its lifetime. Only the path-free report is written to ``output_dir``.
+        """
+        if not queries:
+            raise ValueError("search benchmark requires at least one query")
+        if repetitions < 1:
+            raise ValueError("repetitions must be positive")
+        if refresh_fraction <= 0 or refresh_fraction > 1:
+            raise ValueError("refresh_fraction must be in (0, 1]")
+        benchmark_id = self.id_factory()
+        throughput: dict[str, ThroughputMeasurement] = {}
+        canonical_dir = work_dir / "canonical"
+        documents = corpus.spec.documents
+
+        started = self.clock()
+        paths = corpus.write(canonical_dir, self.file_manager)
+        self._record(throughput, "generate_documents", documents, started)
+        started = self.clock()
+        transcripts = tuple(self._project(path) for path in paths)
+        self._record(throughput, "project_documents", documents, started)
+        segment_count = sum(len(item.segments) for item in transcripts)
+
+        provider = HashingEmbeddingProvider(dimensions=self.embedding_dimensions)
+        lexical_path = work_dir / "transcripts.duckdb"
+        semantic_path = work_dir / "semantic.duckdb"
+        lexical = DuckDbTranscriptIndex(lexical_path, self.file_manager)
+        semantic = DuckDbSemanticIndex(semantic_path, self.file_manager)
+        try:
+            started = self.clock()
+            lexical.rebuild(transcripts)
+            self._record(throughput, "lexical_rebuild_segments", segment_count, started)
+            chunks = build_search_chunks(transcripts)
+            started = self.clock()
+            semantic.rebuild(
+                state=SemanticState(
+                    profile=provider.profile,
+                    corpus_fingerprint=corpus_fingerprint(transcripts),
+                    chunk_count=len(chunks),
+                ),
+                chunks=chunks,
+                vectors=provider.embed_passages(tuple(item.text for item in chunks)),
+            )
+            self._record(throughput, "semantic_rebuild_chunks", len(chunks), started)
+            self._refresh(
+                corpus,
+                transcripts,
+                lexical,
+                semantic,
+                provider,
+                canonical_dir=canonical_dir,
+                changed=max(1, round(documents * refresh_fraction)),
+                throughput=throughput,
+            )
+            latency = self._query(
+                queries,
+                TranscriptSearch(
+                    lexical=lexical, semantic=semantic, embedding_provider=provider
+                ),
+                repetitions=repetitions,
+            )
+        finally:
+            lexical.close()
+            semantic.close()
+        report = SearchBenchmarkReport(
+            benchmark_id=benchmark_id,
+            scholion_version=self.version_factory(),
+            python_version=self.python_version_factory(),
+            corpus=corpus.spec,
+            segment_count=segment_count,
+            chunk_count=len(chunks),
+            query_count=len(queries),
+            repetitions=repetitions,
+            throughput=throughput,
+            latency=latency,
+            index_bytes={
+                "canonical": sum(self._size(path) for path in paths),
+                "lexical": self._size(lexical_path),
+                "semantic": self._size(semantic_path),
+            },
+        )
+        report_path = (
+            output_dir / f"scholion-search-benchmark-{benchmark_id}.json"
+        ).resolve(strict=False)
+        self.file_manager.ensure_directory_exists(report_path.parent)
+        document = json.dumps(
+            report.to_dict(), ensure_ascii=False, sort_keys=True, separators=(",", ":")
+        )
+        self.file_manager.save_file(f"{document}\n".encode(), report_path)
+        return SearchBenchmarkResult(report_path, report)
+
+    def _refresh(
+        self,
+        corpus: SyntheticCorpus,
+        transcripts: tuple[IndexedTranscript, ...],
+        lexical: DuckDbTranscriptIndex,
+        semantic: DuckDbSemanticIndex,
+        provider: HashingEmbeddingProvider,
+        *,
+        canonical_dir: Path,
+        changed: int,
+        throughput: dict[str, ThroughputMeasurement],
+    ) -> None:
+        stride = max(1, corpus.spec.documents // changed)
+        indices = tuple(range(0, corpus.spec.documents, stride))[:changed]
+        paths = corpus.write(
+            canonical_dir, self.file_manager, indices=indices, revision=1
+        )
+        started = self.clock()
+        upserts = tuple(self._project(path) for path in paths)
+        lexical.apply_delta(upserts=upserts, removals=())
+        replaced = {item.document_id: item for item in upserts}
+        current = tuple(replaced.get(item.document_id, item) for item in transcripts)
+        chunks = build_search_chunks(upserts)
+        semantic.apply_delta(
+            corpus_fingerprint=corpus_fingerprint(current),
+            upserts=chunks,
+            vectors=provider.embed_passages(tuple(item.text for item in chunks)),
+            removals=tuple(replaced),
+        )
+        self._record(throughput, "refresh_documents", len(indices), started)
+
+    def _query(
+        self,
+        queries: tuple[BenchmarkQuery, ...],
+        search: TranscriptSearch,
+        *,
+        repetitions: int,
+    ) -> dict[str, LatencySummary]:
+        locator = EvidenceLocator(self.file_manager)
+        samples: dict[str, list[float]] = {}
+        for _ in range(repetitions):
+            for query in queries:
+                started = self.clock()
+                response = search.search(query.search_query(), mode=query.mode)
+                searched = self.clock()
+                locator.locate_response(response, context_segments=1)
+                located = self.clock()
+                samples.setdefault(query.mode.value, []).append(searched - started)
+                samples.setdefault("locate", []).append(located - searched)
+                samples.setdefault("end_to_end", []).append(located - started)
+        return {
+            name: LatencySummary.from_samples(values)
+            for name, values in samples.items()
+        }
+
+    def _record(
+        self,
+        throughput: dict[str, ThroughputMeasurement],
+        name: str,
+        items: int,
+        started: float,
+    ) -> None:
+        throughput[name] = ThroughputMeasurement(
+            items=items, wall_seconds=max(0.0, self.clock() - started)
+        )
+
+    def _project(self, path: Path) -> IndexedTranscript:
+        return load_indexed_transcript(
+            path, source_path=None, file_manager=self.file_manager
+        )
+
+    def _size(self, path: Path) -> int:
+        if not self.file_manager.file_exists(path):
+            return 0
+        return int(self.file_manager.get_file_metadata(path)["size"])
+
+
+def _vocabulary(size: int, seed: int) -> tuple[str, ...]:
+    rng = random.Random(f"vocabulary:{seed}")  # noqa: S311
+    words: dict[str, None] = {}
+    length = 2
+    while len(words) < size:
+        candidate = "".join(rng.choice(_SYLLABLES) for _ in range(length))
+        words.setdefault(candidate, None)
+        if len(words) >= len(_SYLLABLES) ** length // 2:
+            length += 1
+    return tuple(words)
+
+
+def _cumulative(weights: Iterable[float]) -> Iterator[float]:
+    total = 0.0
+    for weight in weights:
+        total += weight
+        yield total
+
+
+def _nearest_rank(ordered: list[float], quantile: float) -> float:
+    rank = max(1, math.ceil(quantile * len(ordered)))
+    return ordered[rank - 1]
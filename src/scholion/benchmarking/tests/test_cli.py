@@ -44,7 +44,9 @@ class FakeContainer:
 
         benchmark_runner = Mock()
 
-        def run(plan, *, execute, resume=False, planning_wall_seconds=0.0):
+        def run(
+            plan, *, execute, resume=False, planning_wall_seconds=0.0, profiler=None
+        ):
             execute(NoOpExecutionObserver())
             report = SimpleNamespace(
                 status=BenchmarkStatus.COMPLETED,
@@ -61,6 +63,7 @@ class FakeContainer:
             return SimpleNamespace(
                 report=report,
                 report_path=Path("benchmark.json"),
+                trace_path=None if profiler is None else Path("benchmark.trace.json"),
                 transcription=SimpleNamespace(
                     artifact=SimpleNamespace(path=Path("transcript.json"))
                 ),
@@ -0,0 +1,197 @@
+import json
+from dataclasses import replace
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+from typer.testing import CliRunner
+
+from scholion.benchmarking import cli
+from scholion.benchmarking.compare import (
+    BenchmarkHistoryStore,
+    BenchmarkObservation,
+    RegressionThresholds,
+    compare_observations,
+)
+from scholion.benchmarking.models import (
+    BenchmarkReport,
+    BenchmarkReportError,
+    BenchmarkStatus,
+)
+from scholion.benchmarking.resources import ProcessTreeObservation
+from scholion.benchmarking.tests.test_runner import MIB, _plan
+from scholion.core.file_manager_facade import FileManagerFacade
+from scholion.core.measurements import StageMeasurement
+from scholion.core.performance_tracker import PerformanceTracker
+from scholion.interfaces.local_file_manager import LocalFileManager
+from scholion.transcription.models import TranscriptSource
+
+runner = CliRunner()
+
+
+def _facade() -> FileManagerFacade:
+    return FileManagerFacade(LocalFileManager(), Mock(), PerformanceTracker())
+
+
+def _report(
+    tmp_path: Path,
+    benchmark_id: str,
+    *,
+    execution_seconds: float = 5.0,
+    decode_seconds: float = 0.4,
+    status: BenchmarkStatus = BenchmarkStatus.COMPLETED,
+    version: str = "1.0.0",
+    cpus: int = 8,
+) -> bytes:
+    plan, _ = _plan(tmp_path)
+    plan = replace(plan, runner=replace(plan.runner, logical_cpus=cpus))
+    report = BenchmarkReport(
+        benchmark_id=benchmark_id,
+        job_id="job-1",
+        status=status,
+        resume=False,
+        scholion_version=version,
+        python_version="3.12.0",
+        source=TranscriptSource.from_media(plan.media),
+        plan=plan,
+        planning_wall_seconds=0.0,
+        execution_wall_seconds=execution_seconds,
+        process_tree=ProcessTreeObservation(0.25, 4, 100 * MIB, 1_152 * MIB, 0, 0, 0),
+        stages=(StageMeasurement("decode", 1, 0, decode_seconds, decode_seconds),),
+        values={},
+        error_type=None if status is BenchmarkStatus.COMPLETED else "RuntimeError",
+    )
+    return json.dumps(report.to_dict()).encode()
+
+
+def _observation(tmp_path: Path, benchmark_id: str, **kwargs) -> BenchmarkObservation:
+    observation = BenchmarkObservation.from_report(
+        _report(tmp_path, benchmark_id, **kwargs)
+    )
+    assert observation is not None
+    return observation
+
+
+def test_reports_align_on_source_strategy_and_machine(tmp_path: Path) -> None:
+    first = _observation(tmp_path, "a")
+    assert first.metrics == {
+        "real_time_factor": 0.5,
+        "peak_rss_to_estimate_ratio": 0.5,
+        "stage.decode.seconds": 0.4,
+    }
+    assert first.group == _observation(tmp_path, "b", execution_seconds=9).group
+    assert first.machine == _plan(tmp_path)[0].runner.fingerprint
+    assert first.machine != _observation(tmp_path, "c", cpus=16).machine
+    assert (
+        BenchmarkObservation.from_report(
+            _report(tmp_path, "d", status=BenchmarkStatus.FAILED)
+        )
+        is None
+    )
+    with pytest.raises(BenchmarkReportError):
+        BenchmarkObservation.from_report(b'{"schema_version": 1}')
+
+
+def test_regressions_respect_relative_noise_and_absolute_thresholds(
+    tmp_path: Path,
+) -> None:
+    steady = tuple(
+        _observation(tmp_path, f"base-{index}", execution_seconds=seconds)
+        for index, seconds in enumerate((5.0, 5.1, 4.9))
+    )
+    within = compare_observations(
+        (*steady, _observation(tmp_path, "new", execution_seconds=5.4))
+    )
+    (group,) = within.groups
+    assert group.baseline_ids == ("base-0", "base-1", "base-2")
+    assert not within.regressed
+
+    slower = compare_observations(
+        (
+            *steady,
+            _observation(tmp_path, "new", execution_seconds=6.0, decode_seconds=0.44),
+        )
+    )
+    assert [delta.metric for delta in slower.groups[0].regressions] == [
+        "real_time_factor"
+    ]
+    assert slower.regressed
+
+    noisy = tuple(
+        _observation(tmp_path, f"noisy-{index}", execution_seconds=seconds)
+        for index, seconds in enumerate((4.0, 5.0, 6.0))
+    )
+    assert not compare_observations(
+        (*noisy, _observation(tmp_path, "new", execution_seconds=7.5))
+    ).regressed
+    assert compare_observations(
+        (*noisy, _observation(tmp_path, "new", execution_seconds=7.5)),
+        thresholds=RegressionThresholds(relative=0.1, mad_multiplier=0),
+    ).regressed
+
+    lonely = compare_observations((_observation(tmp_path, "solo", cpus=2),))
+    assert lonely.unmatched_ids == ("solo",)
+    assert lonely.groups == ()
+
+
+def test_history_is_bounded_deduplicated_and_summarizes_trends(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "state" / "benchmarks" / "history.json"
+    store = BenchmarkHistoryStore(path, _facade(), max_entries=3)
+    store.record((_observation(tmp_path, "a"), _observation(tmp_path, "a")))
+    store.record(
+        (
+            _observation(tmp_path, "b", execution_seconds=6.0),
+            _observation(tmp_path, "c", execution_seconds=4.0, version="1.1.0"),
+            _observation(tmp_path, "d", execution_seconds=3.0, version="1.1.0"),
+        )
+    )
+    assert [item.benchmark_id for item in store.observations()] == ["b", "c", "d"]
+    assert [
+        (trend.scholion_version, trend.runs, trend.median_real_time_factor)
+        for trend in store.trends()
+    ] == [("1.0.0", 1, 0.6), ("1.1.0", 2, 0.35)]
+    assert str(tmp_path) not in path.read_text(encoding="utf-8")
+    (evidence, *_) = store.strategy_observations(_observation(tmp_path, "e").machine)
+    assert (evidence.model, evidence.compute_type) == ("small", "int8")
+    assert evidence.peak_memory_bytes == 1_152 * MIB
+    assert store.strategy_observations("elsewhere") == ()
+
+    path.write_text("{not json", encoding="utf-8")
+    assert store.observations() == ()
+
+
+def test_compare_command_exits_non_zero_on_regression(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    store = BenchmarkHistoryStore(tmp_path / "history.json", _facade())
+    container = Mock()
+    container.file_manager.return_value = _facade()
+    container.benchmark_history.return_value = store
+    monkeypatch.setattr(cli, "_container", lambda config_file: container)
+    paths = []
+    for benchmark_id, seconds in (("a", 5.0), ("b", 5.1), ("c", 8.0)):
+        path = tmp_path / f"scholion-benchmark-{benchmark_id}.json"
+        path.write_bytes(_report(tmp_path, benchmark_id, execution_seconds=seconds))
+        paths.append(str(path))
+
+    ok = runner.invoke(cli.compare_app, [*paths[:2], "--json"])
+    assert ok.exit_code == 0, ok.output
+    assert json.loads(ok.stdout)["groups"][0]["candidate_id"] == "b"
+
+    regressed = runner.invoke(cli.compare_app, [paths[2], "--json"])
+    assert regressed.exit_code == 1
+    document = json.loads(regressed.stdout)
+    assert document["groups"][0]["baseline_ids"] == ["a", "b"]
+    assert document["regressed"] is True
+    assert [item.benchmark_id for item in store.observations()] == ["a", "b", "c"]
+
+    isolated = runner.invoke(cli.compare_app, [paths[2], "--no-history", "--json"])
+    assert isolated.exit_code == 0
+    assert json.loads(isolated.stdout)["unmatched_ids"] == ["c"]
+
+    invalid = tmp_path / "not-a-report.json"
+    invalid.write_text("[]", encoding="utf-8")
+    rejected = runner.invoke(cli.compare_app, [str(invalid), "--no-history"])
+    assert rejected.exit_code == 2
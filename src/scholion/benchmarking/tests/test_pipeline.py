@@ -0,0 +1,91 @@
+import json
+import wave
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from scholion.benchmarking.pipeline import (
+    PipelineBenchmark,
+    PipelineBenchmarkSpec,
+    SyntheticLanguageAttributor,
+    SyntheticSessionTranscriber,
+)
+from scholion.core.file_manager_facade import FileManagerFacade
+from scholion.core.performance_tracker import PerformanceTracker
+from scholion.interfaces.local_file_manager import LocalFileManager
+from scholion.transcription.tests.test_executor import resources
+
+
+def _benchmark() -> PipelineBenchmark:
+    inspector = Mock()
+    inspector.inspect.return_value = resources()
+    logger = Mock()
+    logger.bind.return_value = logger
+    return PipelineBenchmark(
+        file_manager=FileManagerFacade(
+            LocalFileManager(), Mock(), PerformanceTracker()
+        ),
+        runner_inspector=inspector,
+        logger=logger,
+        id_factory=lambda: "bench-1",
+        version_factory=lambda: "1.2.3",
+        python_version_factory=lambda: "3.12.0",
+    )
+
+
+def test_pipeline_benchmark_reports_every_executor_stage(tmp_path: Path) -> None:
+    spec = PipelineBenchmarkSpec(duration_seconds=60, segment_duration_seconds=25)
+
+    result = _benchmark().run((spec,), work_dir=tmp_path / "work", output_dir=tmp_path)
+
+    assert result.report_path == tmp_path / "scholion-pipeline-benchmark-bench-1.json"
+    document = json.loads(result.report_path.read_text(encoding="utf-8"))
+    assert document == result.report.to_dict()
+    (run,) = document["runs"]
+    assert run["work"]["windows"] == 3
+    assert 100 <= run["work"]["words"] <= 200
+    assert run["work"]["segments"] > 6
+    assert run["artifact_bytes"] > 0
+    stages = {stage["name"]: stage for stage in run["stages"]}
+    for name in (
+        "decode",
+        "segment.materialize",
+        "segment.transcribe",
+        "checkpoint.write",
+        "transcript.assemble",
+        "transcript.languages",
+        "artifact.write",
+    ):
+        assert stages[name]["failed_count"] == 0
+    assert stages["segment.materialize"]["count"] == 3
+    assert stages["checkpoint.write"]["count"] == 3
+    assert 0 <= run["pipeline_overhead_seconds"] <= run["wall_seconds"]
+    assert str(tmp_path) not in json.dumps(document)
+    assert not list((tmp_path / "work").rglob("normalized.wav"))
+
+
+def test_stand_ins_are_deterministic_and_validate_their_inputs(tmp_path: Path) -> None:
+    audio = tmp_path / "segment-000000.wav"
+    with wave.open(str(audio), "wb") as output:
+        output.setnchannels(1)
+        output.setsampwidth(2)
+        output.setframerate(16_000)
+        output.writeframes(b"\0\0" * 16_000 * 30)
+    session = SyntheticSessionTranscriber(seed=3).open_session(Mock())
+    first = session.transcribe(audio)
+    assert first == session.transcribe(audio)
+    assert first.segments[-1].end_seconds <= 30
+    assert all(segment.text.endswith(".") for segment in first.segments)
+
+    attributor = SyntheticLanguageAttributor(secondary_share=1.0)
+    spans = attributor.attribute("hello\n\nthere")
+    assert [(span.start_char, span.end_char, span.language) for span in spans] == [
+        (0, 5, "de"),
+        (7, 12, "de"),
+    ]
+
+    with pytest.raises(ValueError, match="between 60 and 36000"):
+        PipelineBenchmarkSpec(duration_seconds=36_001)
+    with pytest.raises(ValueError, match="at least one"):
+        _benchmark().run((), work_dir=tmp_path, output_dir=tmp_path)
@@ -10,6 +10,7 @@ from scholion.benchmarking.resources import ProcessTreeObservation
 from scholion.benchmarking.runner import BenchmarkRunner, _scholion_version
 from scholion.core.file_manager_facade import FileManagerFacade
 from scholion.core.performance_tracker import PerformanceTracker
+from scholion.core.profiling import ProfilingObserver
 from scholion.interfaces.local_file_manager import LocalFileManager
 from scholion.media.models import InputIdentity, MediaInfo, MediaStream, StreamKind
 from scholion.runner.models import ExecutionPolicy, ProcessingProfile, RunnerResources
@@ -206,6 +207,8 @@ def test_completed_run_persists_path_minimized_extensible_report(tmp_path):
     assert result.report.canonical_artifact_bytes == len(b'{"transcript":true}\n')
     assert result.report.values == {"segments.completed": 1, "segments.total": 1}
     assert result.report.stages[0].name == "segment.transcribe"
+    stage = result.report.to_dict()["observed"]["stages"][0]
+    assert stage["p50_seconds"] == stage["p99_seconds"] == stage["max_seconds"]
     assert result.report.to_dict()["execution_contract"]["engine"]["model"] == "small"
 
     serialized = result.report_path.read_text()
@@ -217,6 +220,45 @@ def test_completed_run_persists_path_minimized_extensible_report(tmp_path):
     assert result.to_dict()["benchmark_report_path"] == str(result.report_path)
 
 
+def test_profiled_run_writes_trace_beside_report(tmp_path):
+    plan, paths = _plan(tmp_path)
+    runner, _, workspace = _runner(paths)
+
+    def execute(observer):
+        job = workspace.create_job(
+            plan.job.input_path,
+            output_dir=plan.job.output_dir,
+            job_id=plan.job.job_id,
+        )
+        artifact = workspace.reserve_artifact(job, ArtifactKind.CANONICAL_JSON)
+        with observer.span("decode"), observer.span("segment.transcribe"):
+            observer.record_value("segments.completed", 1)
+        return _result(plan, artifact)
+
+    result = runner.run(
+        plan, execute=execute, profiler=ProfilingObserver(clock=StepClock())
+    )
+
+    assert result.trace_path == result.report_path.with_name(
+        "scholion-benchmark-benchmark-1.trace.json"
+    )
+    assert result.report.trace_file == result.trace_path.name
+    assert json.loads(result.report_path.read_text())["trace_file"] == (
+        result.trace_path.name
+    )
+    trace = json.loads(result.trace_path.read_text())
+    spans = {event["name"]: event for event in trace["traceEvents"]}
+    assert (
+        spans["segment.transcribe"]["args"]["parent_id"]
+        == (spans["decode"]["args"]["span_id"])
+    )
+    assert [stage.name for stage in result.report.stages] == [
+        "decode",
+        "segment.transcribe",
+    ]
+    assert str(plan.job.input_path) not in result.trace_path.read_text()
+
+
 def test_keyboard_interrupt_persists_partial_report_and_retains_error_type(tmp_path):
     plan, paths = _plan(tmp_path)
     runner, _, _ = _runner(paths)
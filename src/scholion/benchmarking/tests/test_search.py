@@ -0,0 +1,201 @@
+import json
+import math
+from itertools import count
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+from typer.testing import CliRunner
+
+from scholion.benchmarking import cli
+from scholion.benchmarking.search import (
+    BenchmarkQuery,
+    HashingEmbeddingProvider,
+    LatencySummary,
+    SearchBenchmark,
+    SyntheticCorpus,
+    SyntheticCorpusSpec,
+    dump_query_mix,
+    load_query_mix,
+    synthetic_query_mix,
+)
+from scholion.core.file_manager_facade import FileManagerFacade
+from scholion.core.performance_tracker import PerformanceTracker
+from scholion.interfaces.local_file_manager import LocalFileManager
+from scholion.library.retrieval import RetrievalMode
+
+runner = CliRunner()
+
+
+def _facade() -> FileManagerFacade:
+    return FileManagerFacade(LocalFileManager(), Mock(), PerformanceTracker())
+
+
+def _corpus(**overrides: int) -> SyntheticCorpus:
+    values = {
+        "documents": 4,
+        "segments_per_document": 3,
+        "words_per_segment": 6,
+        "vocabulary_size": 40,
+        "max_speakers": 3,
+        "seed": 7,
+    } | overrides
+    return SyntheticCorpus(SyntheticCorpusSpec(**values))
+
+
+def test_synthetic_corpus_is_deterministic_and_revisions_change_text() -> None:
+    corpus = _corpus()
+    assert corpus.canonical_payload(2) == _corpus().canonical_payload(2)
+    assert corpus.canonical_payload(2) != _corpus(seed=8).canonical_payload(2)
+    assert corpus.canonical_payload(2) != corpus.canonical_payload(2, revision=1)
+
+    document = json.loads(corpus.canonical_payload(0))
+    assert document["job_id"] == "synthetic-000000"
+    assert len(document["segments"]) == 3
+    speakers = {segment["speaker_ref"] for segment in document["segments"]}
+    assert speakers <= {"speaker-01", "speaker-02", "speaker-03"}
+    words = document["segments"][0]["words"]
+    assert " ".join(word["text"] for word in words) == document["segments"][0]["text"]
+    assert len(set(corpus.vocabulary)) == 40
+
+    with pytest.raises(ValueError, match="outside"):
+        corpus.canonical_payload(4)
+    with pytest.raises(ValueError, match="between 1 and 100000"):
+        SyntheticCorpusSpec(documents=100_001)
+
+
+def test_query_mix_round_trips_and_hashing_embeddings_are_normalized() -> None:
+    corpus = _corpus()
+    queries = synthetic_query_mix(corpus, count=40, seed=3)
+    assert queries == synthetic_query_mix(corpus, count=40, seed=3)
+    assert {query.mode for query in queries} == set(RetrievalMode)
+    assert load_query_mix(dump_query_mix(queries)) == queries
+    with pytest.raises(ValueError, match="query file"):
+        load_query_mix(b'{"schema_version": 1}')
+
+    provider = HashingEmbeddingProvider(dimensions=16)
+    (first, second) = provider.embed_passages(("ka lo", "ka lo"))
+    assert first == second
+    assert math.isclose(sum(value * value for value in first), 1.0)
+    assert provider.embed_queries(("",))[0][0] == 1.0
+
+
+def test_latency_summary_uses_nearest_rank_percentiles() -> None:
+    summary = LatencySummary.from_samples([float(value) for value in range(100, 0, -1)])
+    assert (summary.p50_seconds, summary.p95_seconds, summary.p99_seconds) == (
+        50.0,
+        95.0,
+        99.0,
+    )
+    assert summary.max_seconds == 100.0
+    with pytest.raises(ValueError, match="at least one"):
+        LatencySummary.from_samples([])
+
+
+def test_search_benchmark_measures_real_backends_and_writes_report(
+    tmp_path: Path,
+) -> None:
+    corpus = _corpus()
+    queries = (
+        BenchmarkQuery(corpus.vocabulary[0]),
+        BenchmarkQuery(corpus.vocabulary[1], mode=RetrievalMode.SEMANTIC),
+        BenchmarkQuery(corpus.vocabulary[2], mode=RetrievalMode.HYBRID),
+    )
+    ticks = count()
+    result = SearchBenchmark(
+        file_manager=_facade(),
+        clock=lambda: float(next(ticks)),
+        id_factory=lambda: "bench-1",
+        version_factory=lambda: "1.2.3",
+        python_version_factory=lambda: "3.12.0",
+        embedding_dimensions=8,
+    ).run(
+        corpus,
+        queries,
+        work_dir=tmp_path / "work",
+        output_dir=tmp_path / "out",
+        repetitions=2,
+        refresh_fraction=0.5,
+    )
+
+    assert (
+        result.report_path
+        == tmp_path / "out" / "scholion-search-benchmark-bench-1.json"
+    )
+    document = json.loads(result.report_path.read_text(encoding="utf-8"))
+    assert document == result.report.to_dict()
+    assert document["corpus"]["segments"] == 12
+    observed = document["observed"]
+    assert set(observed["throughput"]) == {
+        "generate_documents",
+        "project_documents",
+        "lexical_rebuild_segments",
+        "semantic_rebuild_chunks",
+        "refresh_documents",
+    }
+    assert observed["throughput"]["refresh_documents"]["items"] == 2
+    assert set(observed["latency"]) == {
+        "lexical",
+        "semantic",
+        "hybrid",
+        "locate",
+        "end_to_end",
+    }
+    assert observed["latency"]["lexical"]["count"] == 2
+    assert observed["latency"]["end_to_end"]["count"] == 6
+    assert all(size > 0 for size in observed["index_bytes"].values())
+    assert str(tmp_path) not in json.dumps(document)
+
+
+def test_cli_routes_named_modes_and_keeps_the_positional_benchmark(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    benchmark = Mock()
+    benchmark.run.return_value = SimpleNamespace(
+        to_dict=lambda: {"report_path": "report.json"}
+    )
+    container = SimpleNamespace(
+        config=lambda: SimpleNamespace(
+            CACHE_DIR=tmp_path / "cache", OUTPUT_DIR=tmp_path / "out"
+        ),
+        file_manager=_facade,
+        search_benchmark=lambda: benchmark,
+    )
+    monkeypatch.setattr(cli, "_container", lambda config_file: container)
+    saved = tmp_path / "queries.json"
+
+    result = runner.invoke(
+        cli.search_app,
+        ["--documents", "3", "--queries", "5", "--save-queries", str(saved), "--json"],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.stdout) == {"report_path": "report.json"}
+    corpus, mix = benchmark.run.call_args.args
+    assert corpus.spec.documents == 3
+    assert load_query_mix(saved.read_bytes()) == mix
+    assert benchmark.run.call_args.kwargs["output_dir"] == tmp_path / "out"
+    assert not any((tmp_path / "cache" / "benchmarks").iterdir())
+
+    replayed = runner.invoke(cli.search_app, ["--query-file", str(saved), "--json"])
+    assert replayed.exit_code == 0, replayed.output
+    assert benchmark.run.call_args.args[1] == mix
+
+    routed: list[tuple[str, dict[str, object]]] = []
+    monkeypatch.setattr(
+        cli, "_MODES", {"search": lambda **kwargs: routed.append(("search", kwargs))}
+    )
+    monkeypatch.setattr(cli, "app", lambda **kwargs: routed.append(("run", kwargs)))
+    cli.main(["search", "--documents", "5"])
+    cli.main(["recording.wav", "--json"])
+    assert routed == [
+        (
+            "search",
+            {"args": ["--documents", "5"], "prog_name": "scholion-benchmark search"},
+        ),
+        (
+            "run",
+            {"args": ["recording.wav", "--json"], "prog_name": "scholion-benchmark"},
+        ),
+    ]
@@ -1,46 +1,124 @@
+from __future__ import annotations
+
 import json
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Annotated, cast
+from typing import TYPE_CHECKING, Annotated, cast
 
 import typer
 from pydantic import ValidationError
-from rich.console import Console
-from rich.table import Table
-
-from scholion.app.app_container import AppContainer
-from scholion.app.job_runner import TranscriptionJobRunner
-from scholion.cli_jobs import register_job_commands
-from scholion.cli_library import register_library_commands
-from scholion.cli_models import register_model_commands
-from scholion.cli_progress import RichTranscriptionProgress
-from scholion.core.config import AppConfig
+
+from scholion.cli_lazy import LazyCommand, lazy_command_group
 from scholion.core.errors import ScholionError
-from scholion.core.health_check import HealthReport
-from scholion.core.measurements import ExecutionObserver
 from scholion.media.models import StreamKind
-from scholion.runner.models import ExecutionPolicy, ProcessingProfile, RunnerResources
+from scholion.runner.models import ProcessingProfile
 from scholion.transcription.export import TranscriptExportFormat, TranscriptExportResult
-from scholion.transcription.models import (
-    TranscriptionExecutionResult,
-    TranscriptionJobPlan,
-)
 from scholion.transcription.speaker_models import SpeakerDiarizationRequest
-from scholion.workspace.models import JobId, WorkspacePaths
+from scholion.workspace.models import JobId
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from scholion.app.app_container import AppContainer
+    from scholion.app.job_services import JobServices
+    from scholion.core.health_check import HealthReport
+    from scholion.core.measurements import ExecutionObserver
+    from scholion.runner.models import ExecutionPolicy, RunnerResources
+    from scholion.transcription.models import (
+        TranscriptionExecutionResult,
+        TranscriptionJobPlan,
+    )
+    from scholion.workspace.models import WorkspacePaths
+
+
+@dataclass(frozen=True, slots=True)
+class CliOptions:
+    config_file: Path | None = None
+
+
+def _container(context: typer.Context) -> AppContainer:
+    # Imported here so that `--help` and argument errors never build the container.
+    from scholion.app.app_container import AppContainer
+    from scholion.core.config import AppConfig
+
+    container = AppContainer()
+    options = context.ensure_object(CliOptions)
+    if options.config_file is not None:
+        container.config.override(AppConfig.load(options.config_file))
+    _start_metrics_export(context, container)
+    return container
+
+
+def _start_metrics_export(context: typer.Context, container: AppContainer) -> None:
+    # Metrics are an observer of the command; an endpoint that cannot be opened or
+    # written is logged and never fails the command itself.
+    exporter = container.metrics_exporter()
+    if exporter is None:
+        return
+    try:
+        exporter.start()
+    except ScholionError as exc:
+        container.logger().warning(
+            "metrics_export_unavailable", phase="start", error_code=exc.code.value
+        )
+        return
+
+    def stop() -> None:
+        try:
+            exporter.stop()
+        except ScholionError as exc:
+            container.logger().warning(
+                "metrics_export_unavailable", phase="stop", error_code=exc.code.value
+            )
+
+    context.call_on_close(stop)
+
+
+def _job_services(context: typer.Context) -> JobServices:
+    # `jobs` needs only the lifecycle store, so it skips the application container.
+    from scholion.app.job_services import JobServices
+    from scholion.core.config import AppConfig
+
+    options = context.ensure_object(CliOptions)
+    return JobServices(AppConfig.load(options.config_file))
+
+
+def _console() -> Console:
+    # Imported on first render, so JSON output and plain messages never load rich.
+    from rich.console import Console
+
+    return Console()
+
+
+# Listed by name and help; each module is imported when its group is invoked.
+_COMMAND_GROUPS = (
+    LazyCommand(
+        "jobs",
+        "Inspect and clean up private local transcription jobs.",
+        "scholion.cli_jobs:register_job_commands",
+        factory=_job_services,
+    ),
+    LazyCommand(
+        "library",
+        "Search and inspect the local transcript research library.",
+        "scholion.cli_library:register_library_commands",
+    ),
+    LazyCommand(
+        "models",
+        "Inspect, recommend, install, and remove private local models.",
+        "scholion.cli_models:register_model_commands",
+    ),
+)
 
 app = typer.Typer(
     name="scholion",
     help="Local-first audio processing and transcription.",
     no_args_is_help=False,
     invoke_without_command=True,
+    cls=lazy_command_group(_container, *_COMMAND_GROUPS),
 )
 
 
-@dataclass(frozen=True, slots=True)
-class CliOptions:
-    config_file: Path | None = None
-
-
 @app.callback()
 def root(
     context: typer.Context,
@@ -63,20 +141,9 @@ def root(
         typer.echo(context.get_help())
 
 
-def _container(context: typer.Context) -> AppContainer:
-    container = AppContainer()
-    options = context.ensure_object(CliOptions)
-    if options.config_file is not None:
-        container.config.override(AppConfig.load(options.config_file))
-    return container
-
-
-register_job_commands(app, _container)
-register_library_commands(app, _container)
-register_model_commands(app, _container)
-
-
 def _render_report(report: HealthReport, console: Console) -> None:
+    from rich.table import Table
+
     table = Table(title=f"Scholion doctor: {report.status.value}")
     table.add_column("Check")
     table.add_column("Status")
@@ -87,6 +154,8 @@ def _render_report(report: HealthReport, console: Console) -> None:
 
 
 def _render_paths(paths: WorkspacePaths, console: Console) -> None:
+    from rich.table import Table
+
     table = Table(title="Scholion directories initialized")
     table.add_column("Purpose")
     table.add_column("Path")
@@ -98,6 +167,8 @@ def _render_paths(paths: WorkspacePaths, console: Console) -> None:
 def _render_runner(
     resources: RunnerResources, policy: ExecutionPolicy, console: Console
 ) -> None:
+    from rich.table import Table
+
     table = Table(title="Scholion runner policy")
     table.add_column("Setting")
     table.add_column("Value")
@@ -129,6 +200,8 @@ def _format_bytes(value: int) -> str:
 def _render_strategies(
     assessments: tuple[dict[str, object], ...], console: Console
 ) -> None:
+    from rich.table import Table
+
     table = Table(title="Scholion local transcription strategies")
     table.add_column("Strategy")
     table.add_column("Target")
@@ -163,6 +236,8 @@ def _render_strategies(
 
 
 def _render_transcription_plan(plan: TranscriptionJobPlan, console: Console) -> None:
+    from rich.table import Table
+
     audio = plan.media.primary_audio_stream
     audio_streams = ", ".join(
         str(stream.index)
@@ -213,6 +288,8 @@ def _render_transcription_result(
     exports: TranscriptExportResult,
     console: Console,
 ) -> None:
+    from rich.table import Table
+
     transcript = result.transcript
     enhancement = transcript.enhancement
     table = Table(title="Scholion transcription complete")
@@ -221,6 +298,7 @@ def _render_transcription_result(
     rows = [
         ("Job ID", result.job.job_id.value),
         ("Canonical output", str(result.artifact.path)),
+        ("Canonical SHA-256", result.canonical_sha256 or "not recorded"),
         ("Profile", transcript.profile.value),
         ("Provisional", str(transcript.provisional).lower()),
         ("Engine", f"{transcript.engine.name} {transcript.engine.package_version}"),
@@ -290,7 +368,7 @@ def initialize(
     if json_output:
         typer.echo(json.dumps(paths.to_dict(), sort_keys=True))
     else:
-        _render_paths(paths, Console())
+        _render_paths(paths, _console())
 
 
 @app.command()
@@ -334,7 +412,7 @@ def doctor(
     if json_output:
         typer.echo(json.dumps(report.to_dict(), sort_keys=True))
     else:
-        _render_report(report, Console())
+        _render_report(report, _console())
     if report.exit_code(strict=strict):
         raise typer.Exit(code=1)
 
@@ -378,7 +456,7 @@ def inspect_runner(
             )
         )
     else:
-        _render_runner(resources, policy, Console())
+        _render_runner(resources, policy, _console())
 
 
 @app.command("strategies")
@@ -415,7 +493,7 @@ def strategies(
     if json_output:
         typer.echo(json.dumps(list(assessments), sort_keys=True))
     else:
-        _render_strategies(assessments, Console())
+        _render_strategies(assessments, _console())
 
 
 def _validate_resume_options(
@@ -516,12 +594,25 @@ def _execute_transcription(
     allow_diarization_model_download: bool,
     observer: ExecutionObserver | None = None,
 ) -> TranscriptionExecutionResult:
+    from scholion.app.job_runner import TranscriptionJobRunner
+    from scholion.core.measurements import CombinedExecutionObserver
+
+    tracing = container.config().TRACE_JOBS
     runner = TranscriptionJobRunner(
         lifecycle_store=container.job_lifecycle_store(),
         executor_factory=lambda execution_observer: container.transcription_executor(
             observer=execution_observer
         ),
+        trace_file_manager=container.file_manager() if tracing else None,
+        logger=container.logger() if tracing else None,
     )
+    metrics = container.execution_metrics()
+    if metrics is not None:
+        observer = (
+            metrics
+            if observer is None
+            else CombinedExecutionObserver(observer, metrics)
+        )
     return runner.execute(
         plan,
         resume=resume,
@@ -557,7 +648,7 @@ def _render_transcription_command_output(
         if json_output:
             typer.echo(json.dumps(plan.to_dict(), sort_keys=True))
         else:
-            _render_transcription_plan(plan, Console())
+            _render_transcription_plan(plan, _console())
         return
     execution_result = cast("TranscriptionExecutionResult", result)
     if json_output:
@@ -565,7 +656,7 @@ def _render_transcription_command_output(
         document["exports"] = exports.to_dict()
         typer.echo(json.dumps(document, sort_keys=True))
     else:
-        _render_transcription_result(execution_result, exports, Console())
+        _render_transcription_result(execution_result, exports, _console())
 
 
 def _execute_cli_plan(
@@ -592,6 +683,8 @@ def _execute_cli_plan(
             allow_diarization_model_download=allow_diarization_model_download,
         )
     else:
+        from scholion.cli_progress import RichTranscriptionProgress
+
         with RichTranscriptionProgress() as progress:
             result = _execute_transcription(
                 container,
@@ -4,13 +4,12 @@ from __future__ import annotations
 
 import json
 from collections.abc import Callable
-from typing import Annotated, cast
+from typing import TYPE_CHECKING, Annotated, cast
 
 import typer
 from rich.console import Console
 from rich.table import Table
 
-from scholion.app.app_container import AppContainer
 from scholion.cli_refresh import register_refresh_command
 from scholion.core.errors import ScholionError
 from scholion.library.custody import (
@@ -25,7 +24,10 @@ from scholion.library.custody import (
     RetentionReceipt,
 )
 
-ContainerFactory = Callable[[typer.Context], AppContainer]
+if TYPE_CHECKING:
+    from scholion.app.app_container import AppContainer
+
+ContainerFactory = Callable[[typer.Context], "AppContainer"]
 
 
 def _root_context(context: typer.Context) -> typer.Context:
@@ -82,6 +84,7 @@ def _candidate_dict(candidate: RetentionCandidate) -> dict[str, object]:
         "updated_at": candidate.updated_at,
         "workspace_path": candidate.workspace_path,
         "resume_capability_lost": candidate.resume_capability_lost,
+        "reclaimable_bytes": candidate.reclaimable_bytes,
     }
 
 
@@ -90,8 +93,10 @@ def _retention_plan_dict(plan: RetentionPlan) -> dict[str, object]:
         "policy": {
             "execution_days": plan.policy.execution_days,
             "include_incomplete": plan.policy.include_incomplete,
+            "reclaim_bytes": plan.policy.reclaim_bytes,
         },
         "candidates": [_candidate_dict(item) for item in plan.candidates],
+        "reclaimable_bytes": plan.reclaimable_bytes,
         "confirmation_token": plan.confirmation_token,
         "preserves_canonical_transcripts": True,
         "preserves_research_knowledge": True,
@@ -104,6 +109,7 @@ def _retention_receipt_dict(receipt: RetentionReceipt) -> dict[str, object]:
     return {
         "confirmation_token": receipt.confirmation_token,
         "discarded_job_ids": list(receipt.discarded_job_ids),
+        "reclaimed_bytes": receipt.reclaimed_bytes,
         "preserves_canonical_transcripts": True,
         "preserves_research_knowledge": True,
         "preserves_lifecycle_manifests": True,
@@ -162,6 +168,7 @@ def _render_retention_plan(plan: RetentionPlan) -> None:
     table.add_column("Status")
     table.add_column("Updated")
     table.add_column("Resume lost?")
+    table.add_column("Bytes", justify="right")
     table.add_column("Private workspace")
     for item in plan.candidates:
         table.add_row(
@@ -169,9 +176,11 @@ def _render_retention_plan(plan: RetentionPlan) -> None:
             item.status.value,
             item.updated_at,
             "yes" if item.resume_capability_lost else "no",
+            f"{item.reclaimable_bytes:,}",
             item.workspace_path,
         )
     Console().print(table)
+    typer.echo(f"Reclaimable: {plan.reclaimable_bytes:,} bytes.")
     typer.echo(
         "This policy deletes only private job workspaces. Canonical transcripts, "
         "research knowledge, and lifecycle manifests are preserved."
@@ -184,8 +193,8 @@ def _render_retention_plan(plan: RetentionPlan) -> None:
 
 def _render_retention_receipt(receipt: RetentionReceipt) -> None:
     typer.echo(
-        f"Deleted {len(receipt.discarded_job_ids)} private execution workspace(s). "
-        "Canonical evidence and user-authored research state were preserved."
+        f"Deleted {len(receipt.discarded_job_ids)} private execution workspace(s), "
+        f"reclaiming {receipt.reclaimed_bytes:,} bytes. Canonical evidence and user-authored research state were preserved."
     )
 
 
@@ -246,6 +255,7 @@ def _retention(
     *,
     execution_days: int,
     include_incomplete: bool,
+    reclaim_bytes: int | None,
     confirm: str | None,
     json_output: bool,
 ) -> None:
@@ -254,6 +264,7 @@ def _retention(
         policy = RetentionPolicy(
             execution_days=execution_days,
             include_incomplete=include_incomplete,
+            reclaim_bytes=reclaim_bytes,
         )
         if confirm is None:
             plan = service.plan_retention(policy)
@@ -338,6 +349,15 @@ def register_custody_commands(
                 "capability. Running jobs are never eligible."
             ),
         ),
+        reclaim_bytes: int | None = typer.Option(
+            None,
+            "--reclaim-bytes",
+            min=1,
+            help=(
+                "Stop the sweep once the oldest eligible workspaces add up to at "
+                "least this many bytes."
+            ),
+        ),
         confirm: str | None = typer.Option(
             None,
             "--confirm",
@@ -350,6 +370,7 @@ def register_custody_commands(
             container_factory,
             execution_days=execution_days,
             include_incomplete=include_incomplete,
+            reclaim_bytes=reclaim_bytes,
             confirm=confirm,
             json_output=json_output,
         )
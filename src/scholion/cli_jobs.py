@@ -2,18 +2,31 @@ from __future__ import annotations
 
 import json
 from collections.abc import Callable
-from typing import cast
+from typing import TYPE_CHECKING, Protocol, cast
 
 import typer
-from rich.console import Console
-from rich.table import Table
 
-from scholion.app.app_container import AppContainer
 from scholion.core.errors import ScholionError
 from scholion.workspace.lifecycle import JobLifecycleRecord, JobStatus
 from scholion.workspace.models import JobId
 
-ContainerFactory = Callable[[typer.Context], AppContainer]
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from scholion.workspace.lifecycle import JobLifecycleStore
+
+
+class JobServicesLike(Protocol):
+    def job_lifecycle_store(self) -> JobLifecycleStore: ...
+
+
+ContainerFactory = Callable[[typer.Context], JobServicesLike]
+
+
+def _console() -> Console:
+    from rich.console import Console
+
+    return Console()
 
 
 def _root_context(context: typer.Context) -> typer.Context:
@@ -27,7 +40,7 @@ def _progress_text(record: JobLifecycleRecord) -> str:
 
 
 def _record_document(
-    container: AppContainer, record: JobLifecycleRecord
+    container: JobServicesLike, record: JobLifecycleRecord
 ) -> dict[str, object]:
     document = record.to_dict()
     document["resumable"] = container.job_lifecycle_store().is_resumable(record.job_id)
@@ -35,10 +48,12 @@ def _record_document(
 
 
 def _render_jobs(
-    container: AppContainer,
+    container: JobServicesLike,
     records: tuple[JobLifecycleRecord, ...],
     console: Console,
 ) -> None:
+    from rich.table import Table
+
     table = Table(title="Scholion jobs")
     table.add_column("Job ID")
     table.add_column("Status")
@@ -59,10 +74,12 @@ def _render_jobs(
 
 
 def _render_job(
-    container: AppContainer,
+    container: JobServicesLike,
     record: JobLifecycleRecord,
     console: Console,
 ) -> None:
+    from rich.table import Table
+
     resumable = container.job_lifecycle_store().is_resumable(record.job_id)
     table = Table(title=f"Scholion job {record.job_id.value}")
     table.add_column("Setting")
@@ -119,7 +136,7 @@ def _list_jobs(
             )
         )
         return
-    _render_jobs(container, records, Console())
+    _render_jobs(container, records, _console())
 
 
 def _show_job(
@@ -140,7 +157,7 @@ def _show_job(
     if json_output:
         typer.echo(json.dumps(_record_document(container, record), sort_keys=True))
         return
-    _render_job(container, record, Console())
+    _render_job(container, record, _console())
 
 
 def _discard_job(
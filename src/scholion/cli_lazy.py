@@ -0,0 +1,77 @@
+"""Command groups whose modules are imported only when a command is dispatched.
+
+Typer builds every command from its function signature, so registering the ``jobs``,
+``library``, and ``models`` groups eagerly imports their modules and everything those
+modules import. ``lazy_command_group`` returns a ``TyperGroup`` class that lists such
+groups by name and help text alone, and imports and registers a group the first time
+click resolves it, including during shell completion.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import typer
+from typer.core import TyperCommand, TyperGroup
+
+from scholion.core.lazy_imports import deferred
+
+if TYPE_CHECKING:
+    from typer._click import Command, Context
+
+
+@dataclass(frozen=True, slots=True)
+class LazyCommand:
+    """A top-level command group registered by ``register(app, container_factory)``.
+
+    ``factory`` replaces the group's container factory for groups that need only a few
+    services and should not pay for building the application container.
+    """
+
+    name: str
+    help: str
+    register: str
+    factory: Callable[[typer.Context], Any] | None = None
+
+
+def lazy_command_group(
+    container_factory: Callable[[typer.Context], Any], *commands: LazyCommand
+) -> type[TyperGroup]:
+    lazy = {command.name: command for command in commands}
+
+    class LazyCommandGroup(TyperGroup):
+        def list_commands(self, ctx: Context) -> list[str]:
+            loaded = super().list_commands(ctx)
+            return [*loaded, *(name for name in lazy if name not in self.commands)]
+
+        def get_command(self, ctx: Context, cmd_name: str) -> Command | None:
+            command = super().get_command(ctx, cmd_name)
+            if command is not None or cmd_name not in lazy:
+                return command
+            # Help rendering only needs a name and a summary line.
+            return TyperCommand(cmd_name, help=lazy[cmd_name].help)
+
+        def resolve_command(
+            self, ctx: Context, args: list[str]
+        ) -> tuple[str | None, Command | None, list[str]]:
+            name = args[0] if args else None
+            if name is not None and name not in self.commands:
+                # An unknown name loads every group so typo suggestions cover them.
+                pending = [lazy[name]] if name in lazy else list(lazy.values())
+                for command in pending:
+                    if command.name not in self.commands:
+                        self.add_command(_load(command, container_factory))
+            return super().resolve_command(ctx, args)
+
+    return LazyCommandGroup
+
+
+def _load(
+    command: LazyCommand, container_factory: Callable[[typer.Context], Any]
+) -> Command:
+    holder = typer.Typer()
+    deferred(command.register)(holder, command.factory or container_factory)
+    group = typer.main.get_group(holder)
+    return group.commands[command.name]
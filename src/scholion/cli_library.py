@@ -3,14 +3,13 @@ from __future__ import annotations
 import json
 from collections.abc import Callable
 from pathlib import Path
-from typing import Annotated, cast
+from typing import TYPE_CHECKING, Annotated, cast
 
 import typer
 from rich.console import Console
 from rich.table import Table
 from rich.text import Text
 
-from scholion.app.app_container import AppContainer
 from scholion.cli_discovery import register_discovery_command
 from scholion.cli_research import register_research_commands
 from scholion.cli_speakers import register_speaker_commands
@@ -41,7 +40,10 @@ from scholion.library.service import (
 )
 from scholion.media.time_coordinates import format_elapsed_timestamp
 
-ContainerFactory = Callable[[typer.Context], AppContainer]
+if TYPE_CHECKING:
+    from scholion.app.app_container import AppContainer
+
+ContainerFactory = Callable[[typer.Context], "AppContainer"]
 
 
 def _root_context(context: typer.Context) -> typer.Context:
@@ -2,19 +2,21 @@ from __future__ import annotations
 
 import json
 from collections.abc import Callable
-from typing import Annotated, cast
+from typing import TYPE_CHECKING, Annotated, cast
 
 import typer
 from rich.console import Console
 from rich.table import Table
 
-from scholion.app.app_container import AppContainer
 from scholion.core.errors import ScholionError
 from scholion.model_management.errors import ModelManagementError
 from scholion.model_management.models import ManagedModelManifest, ModelInventoryItem
 from scholion.runner.models import ProcessingProfile
 
-ContainerFactory = Callable[[typer.Context], AppContainer]
+if TYPE_CHECKING:
+    from scholion.app.app_container import AppContainer
+
+ContainerFactory = Callable[[typer.Context], "AppContainer"]
 
 
 def _root_context(context: typer.Context) -> typer.Context:
@@ -1,19 +1,22 @@
-"""CLI for incremental transcript-library reconciliation."""
+"""CLI for incremental transcript-library reconciliation and watch mode."""
 
 from __future__ import annotations
 
 import json
 from collections.abc import Callable
 from pathlib import Path
-from typing import Annotated, cast
+from typing import TYPE_CHECKING, Annotated, cast
 
 import typer
 
-from scholion.app.app_container import AppContainer
 from scholion.core.errors import ScholionError
 from scholion.library.service import LibraryRefreshReport
+from scholion.library.watch import LibraryWatchBatch
 
-ContainerFactory = Callable[[typer.Context], AppContainer]
+if TYPE_CHECKING:
+    from scholion.app.app_container import AppContainer
+
+ContainerFactory = Callable[[typer.Context], "AppContainer"]
 
 
 def _root_context(context: typer.Context) -> typer.Context:
@@ -35,10 +38,21 @@ def _report_dict(report: LibraryRefreshReport) -> dict[str, object]:
         "skipped_files": report.skipped_files,
         "semantic_invalidated": report.semantic_invalidated,
         "verified_all_tracked": report.verified_all_tracked,
+        "semantic_updated": report.semantic_updated,
         "changed": report.changed,
     }
 
 
+def _batch_dict(batch: LibraryWatchBatch) -> dict[str, object]:
+    return {
+        "directories": list(batch.directories),
+        "full_refresh": batch.full_refresh,
+        "refresh": None if batch.refresh is None else _report_dict(batch.refresh),
+        "unavailable_location_ids": list(batch.unavailable_location_ids),
+        "error": batch.error,
+    }
+
+
 def _handle_error(exc: Exception) -> None:
     if isinstance(exc, ScholionError):
         typer.echo(exc.public_message, err=True)
@@ -64,6 +78,8 @@ def _render_report(report: LibraryRefreshReport) -> None:
         typer.echo(
             f"Skipped {report.skipped_files} unrelated or invalid untracked JSON file(s)."
         )
+    if report.semantic_updated:
+        typer.echo("Semantic embeddings were updated for the changed transcripts.")
     if report.semantic_invalidated:
         typer.echo(
             "Semantic embeddings were invalidated because indexed evidence changed; "
@@ -98,6 +114,47 @@ def _refresh(
     _render_report(report)
 
 
+def _render_batch(batch: LibraryWatchBatch, *, json_output: bool) -> None:
+    if json_output:
+        typer.echo(json.dumps(_batch_dict(batch), sort_keys=True))
+        return
+    if batch.error is not None:
+        typer.echo(f"Watch refresh deferred: {batch.error}", err=True)
+        return
+    if batch.refresh is not None and (batch.full_refresh or batch.refresh.changed):
+        _render_report(batch.refresh)
+
+
+def _watch(
+    context: typer.Context,
+    container_factory: ContainerFactory,
+    *,
+    debounce_seconds: float,
+    json_output: bool,
+) -> None:
+    try:
+        watcher = container_factory(_root_context(context)).library_watch(
+            debounce_seconds=debounce_seconds,
+            max_delay_seconds=max(debounce_seconds, 10.0),
+        )
+    except Exception as exc:
+        _handle_error(exc)
+        return
+    if not json_output:
+        typer.echo("Watching library locations; press Ctrl-C to stop.")
+    try:
+        watcher.run(
+            lambda: False,
+            lambda batch: _render_batch(batch, json_output=json_output),
+        )
+    except KeyboardInterrupt:
+        return
+    except Exception as exc:
+        _handle_error(exc)
+    finally:
+        watcher.close()
+
+
 def register_refresh_command(
     library_app: typer.Typer,
     container_factory: ContainerFactory,
@@ -122,8 +179,8 @@ def register_refresh_command(
             "--verify",
             help=(
                 "Re-hash and validate every tracked canonical transcript instead of "
-                "using the stored size/mtime fast path; unchanged generations are "
-                "still not rewritten."
+                "using the refresh journal and stored size/mtime fast path; unchanged "
+                "generations are still not rewritten."
             ),
         ),
         json_output: bool = typer.Option(False, "--json"),
@@ -135,3 +192,27 @@ def register_refresh_command(
             verify=verify,
             json_output=json_output,
         )
+
+    @library_app.command("watch")
+    def watch_library(
+        context: typer.Context,
+        debounce: float = typer.Option(
+            2.0,
+            "--debounce",
+            min=0.0,
+            help=(
+                "Seconds a changed directory must stay quiet before it is "
+                "reconciled; bursts are flushed after at most ten seconds."
+            ),
+        ),
+        json_output: bool = typer.Option(
+            False, "--json", help="Emit one JSON object per reconciled batch."
+        ),
+    ) -> None:
+        """Keep the library current as transcripts appear, change, or disappear."""
+        _watch(
+            context,
+            container_factory,
+            debounce_seconds=debounce,
+            json_output=json_output,
+        )
@@ -4,13 +4,12 @@ from __future__ import annotations
 
 import json
 from collections.abc import Callable
-from typing import Annotated, cast
+from typing import TYPE_CHECKING, Annotated, cast
 
 import typer
 from rich.console import Console
 from rich.table import Table
 
-from scholion.app.app_container import AppContainer
 from scholion.cli_custody import register_custody_commands
 from scholion.cli_saved_searches import register_saved_search_commands
 from scholion.core.errors import ScholionError
@@ -22,7 +21,10 @@ from scholion.library.research_workspace import (
 )
 from scholion.media.time_coordinates import format_elapsed_timestamp
 
-ContainerFactory = Callable[[typer.Context], AppContainer]
+if TYPE_CHECKING:
+    from scholion.app.app_container import AppContainer
+
+ContainerFactory = Callable[[typer.Context], "AppContainer"]
 
 
 def _root_context(context: typer.Context) -> typer.Context:
@@ -5,13 +5,12 @@ from __future__ import annotations
 import json
 from collections.abc import Callable
 from pathlib import Path
-from typing import Annotated, cast
+from typing import TYPE_CHECKING, Annotated, cast
 
 import typer
 from rich.console import Console
 from rich.table import Table
 
-from scholion.app.app_container import AppContainer
 from scholion.core.errors import ScholionError
 from scholion.library.index import SearchOperator, SearchQuery, SearchSort
 from scholion.library.research_workspace import (
@@ -27,7 +26,10 @@ from scholion.library.workspace_metadata import (
 )
 from scholion.media.time_coordinates import format_elapsed_timestamp
 
-ContainerFactory = Callable[[typer.Context], AppContainer]
+if TYPE_CHECKING:
+    from scholion.app.app_container import AppContainer
+
+ContainerFactory = Callable[[typer.Context], "AppContainer"]
 
 
 def _root_context(context: typer.Context) -> typer.Context:
@@ -4,13 +4,12 @@ from __future__ import annotations
 
 import json
 from collections.abc import Callable
-from typing import cast
+from typing import TYPE_CHECKING, cast
 
 import typer
 from rich.console import Console
 from rich.table import Table
 
-from scholion.app.app_container import AppContainer
 from scholion.core.errors import ScholionError
 from scholion.library.speaker_label_service import SpeakerRosterEntry
 from scholion.library.speaker_presentation import (
@@ -19,7 +18,10 @@ from scholion.library.speaker_presentation import (
 )
 from scholion.media.time_coordinates import format_elapsed_timestamp
 
-ContainerFactory = Callable[[typer.Context], AppContainer]
+if TYPE_CHECKING:
+    from scholion.app.app_container import AppContainer
+
+ContainerFactory = Callable[[typer.Context], "AppContainer"]
 
 
 def _root_context(context: typer.Context) -> typer.Context:
@@ -0,0 +1,47 @@
+"""Canonical JSON produced a piece at a time.
+
+Scholion's canonical documents are
+``json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(",", ":"))``
+followed by a newline. Building that string for a long word-level transcript holds the
+dictionary tree, the string, and its UTF-8 bytes at once. ``iter_canonical_json``
+yields the same bytes for a top-level mapping whose large arrays are wrapped in
+``StreamedArray``: each element is encoded and released before the next is produced,
+so peak memory follows the largest element rather than the whole document.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable, Iterator, Mapping
+
+_ENCODER = json.JSONEncoder(ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+
+
+class StreamedArray:
+    """A JSON array whose elements are produced and encoded one at a time."""
+
+    __slots__ = ("items",)
+
+    def __init__(self, items: Iterable[object]) -> None:
+        self.items = items
+
+
+def iter_canonical_json(document: Mapping[str, object]) -> Iterator[bytes]:
+    """Yield the canonical encoding of ``document`` and its trailing newline."""
+    separator = "{"
+    for key, value in sorted(document.items()):
+        yield f"{separator}{_ENCODER.encode(key)}:".encode()
+        separator = ","
+        if isinstance(value, StreamedArray):
+            yield from _iter_array(value)
+        else:
+            yield _ENCODER.encode(value).encode()
+    yield b"{}\n" if separator == "{" else b"}\n"
+
+
+def _iter_array(array: StreamedArray) -> Iterator[bytes]:
+    separator = "["
+    for item in array.items:
+        yield f"{separator}{_ENCODER.encode(item)}".encode()
+        separator = ","
+    yield b"[]" if separator == "[" else b"]"
@@ -7,6 +7,7 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 from scholion.core.errors import ConfigurationError
 from scholion.core.privacy import PathDisclosure
 from scholion.runner.models import ProcessingProfile
+from scholion.transcription.models import CheckpointEncoding
 
 APP_NAME = "Scholion"
 _LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
@@ -56,6 +57,16 @@ class AppConfig(BaseSettings):
         default=PathDisclosure.REDACT,
         description="Whether routine logs may disclose local filesystem paths",
     )
+    METRICS_EXPORT: str | None = Field(
+        default=None,
+        description=(
+            "Local metrics endpoint: textfile:PATH, unix:PATH, or http://127.0.0.1:PORT"
+        ),
+    )
+    TRACE_JOBS: bool = Field(
+        default=False,
+        description="Write a Chrome trace of each transcription job into its workspace",
+    )
 
     # Resource-policy settings
     PROCESSING_PROFILE: ProcessingProfile = Field(
@@ -78,6 +89,10 @@ class AppConfig(BaseSettings):
         le=1,
         description="Fraction of currently available memory a job may budget",
     )
+    STRATEGY_CALIBRATION: bool = Field(
+        default=False,
+        description="Adjust strategy estimates from local benchmark history",
+    )
 
     # Local application settings
     STATE_DIR: Path = Field(
@@ -96,6 +111,14 @@ class AppConfig(BaseSettings):
         default_factory=_default_output_dir,
         description="Default directory for user-visible artifacts",
     )
+    CHECKPOINT_ENCODING: CheckpointEncoding = Field(
+        default=CheckpointEncoding.JSON,
+        description="Encoding for completed-segment checkpoints of new jobs",
+    )
+    SAVED_SEARCH_RESULT_CACHE: bool = Field(
+        default=False,
+        description="Reuse rendered saved-search pages while their inputs are unchanged",
+    )
     MIN_FREE_DISK_BYTES: int = Field(
         default=512 * 1024 * 1024, ge=0, description="Required free disk space"
     )
@@ -134,6 +157,15 @@ class AppConfig(BaseSettings):
             )
         return value.upper()
 
+    @field_validator("METRICS_EXPORT")
+    @classmethod
+    def validate_metrics_export(cls, value: str | None) -> str | None:
+        if value is not None:
+            from scholion.core.metrics_exporter import MetricsEndpoint
+
+            MetricsEndpoint.parse(value)
+        return value
+
     @field_validator("STATE_DIR", "CACHE_DIR", "MODEL_DIR", "OUTPUT_DIR", mode="before")
     @classmethod
     def expand_local_path(cls, value: str | Path) -> Path:
@@ -0,0 +1,66 @@
+"""A logger that configures the structured backend on its first enabled message.
+
+``configure_logging`` imports structlog, which imports rich for its console renderer.
+A short command whose routine messages all sit below the configured level needs
+neither. ``DeferredLogger`` answers the level check itself and builds the real adapter
+only when a message will actually be written.
+"""
+
+import logging
+from collections.abc import Callable
+from copy import copy
+from typing import Self
+
+from scholion.core.ilogger import ILogger
+
+
+class _Backend:
+    __slots__ = ("factory", "logger")
+
+    def __init__(self, factory: Callable[[], ILogger]) -> None:
+        self.factory = factory
+        self.logger: ILogger | None = None
+
+    def get(self) -> ILogger:
+        if self.logger is None:
+            self.logger = self.factory()
+        return self.logger
+
+
+class DeferredLogger:
+    """``ILogger`` that calls ``factory`` once, for the first message at ``level``+."""
+
+    def __init__(self, level: str, factory: Callable[[], ILogger]) -> None:
+        levels = logging.getLevelNamesMapping()
+        if level.upper() not in levels:
+            raise ValueError(f"Invalid LOG_LEVEL: {level}")
+        self._threshold = levels[level.upper()]
+        self._backend = _Backend(factory)
+        self._context: dict[str, object] = {}
+
+    def debug(self, message: str, **kwargs: object) -> None:
+        self._log(logging.DEBUG, "debug", message, kwargs)
+
+    def info(self, message: str, **kwargs: object) -> None:
+        self._log(logging.INFO, "info", message, kwargs)
+
+    def warning(self, message: str, **kwargs: object) -> None:
+        self._log(logging.WARNING, "warning", message, kwargs)
+
+    def error(self, message: str, **kwargs: object) -> None:
+        self._log(logging.ERROR, "error", message, kwargs)
+
+    def bind(self, **kwargs: object) -> Self:
+        bound = copy(self)
+        bound._context = {**self._context, **kwargs}
+        return bound
+
+    def _log(
+        self, level: int, method: str, message: str, fields: dict[str, object]
+    ) -> None:
+        if level < self._threshold:
+            return
+        logger = self._backend.get()
+        if self._context:
+            logger = logger.bind(**self._context)
+        getattr(logger, method)(message, **fields)
@@ -1,4 +1,4 @@
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from contextlib import AbstractContextManager
 from pathlib import Path
 from typing import Protocol, TypeVar
@@ -53,10 +53,24 @@ class FileManagerFacade:
         return result
 
     def save_file(
-        self, content: bytes, file_path: str | Path, *, private: bool = False
+        self,
+        content: bytes,
+        file_path: str | Path,
+        *,
+        private: bool = False,
+        durable: bool = True,
+        mode: int | None = None,
     ) -> None:
         def action() -> None:
-            if private:
+            if mode is not None:
+                self.file_manager.save_file(
+                    content, file_path, private=private, durable=durable, mode=mode
+                )
+            elif not durable:
+                self.file_manager.save_file(
+                    content, file_path, private=private, durable=False
+                )
+            elif private:
                 self.file_manager.save_file(content, file_path, private=True)
             else:
                 self.file_manager.save_file(content, file_path)
@@ -65,6 +79,25 @@ class FileManagerFacade:
             "save_file",
             action,
             private=private,
+            durable=durable,
+            **path_log_context(self.path_disclosure, path=file_path),
+        )
+
+    def save_stream(
+        self,
+        chunks: Iterable[bytes],
+        file_path: str | Path,
+        *,
+        private: bool = False,
+        durable: bool = True,
+    ) -> str:
+        return self._execute(
+            "save_stream",
+            lambda: self.file_manager.save_stream(
+                chunks, file_path, private=private, durable=durable
+            ),
+            private=private,
+            durable=durable,
             **path_log_context(self.path_disclosure, path=file_path),
         )
 
@@ -0,0 +1,66 @@
+"""Package re-exports that import their defining module on first access.
+
+Package ``__init__`` modules re-export their public names for convenience, but an eager
+re-export makes ``import scholion.library.index`` pay for DuckDB, and
+``import scholion.transcription.models`` pay for the engine backends. ``lazy_exports``
+returns a module ``__getattr__`` and ``__dir__`` pair (PEP 562) so a package can keep
+its public surface while importing nothing until a name is used. Packages still import
+the same names under ``TYPE_CHECKING`` so static analysis sees ordinary re-exports.
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from collections.abc import Callable, Mapping
+from typing import Any
+
+
+def lazy_exports(
+    package: str, exports: Mapping[str, tuple[str, ...]]
+) -> tuple[Callable[[str], object], Callable[[], list[str]]]:
+    """Return ``(__getattr__, __dir__)`` for ``package``.
+
+    ``exports`` maps each defining module to the names it contributes. A resolved name
+    is stored on the package, so later lookups are ordinary attribute reads.
+    """
+    modules = {name: module for module, names in exports.items() for name in names}
+
+    def __getattr__(name: str) -> object:
+        module = modules.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*vars(sys.modules[package]), *modules})
+
+    return __getattr__, __dir__
+
+
+class deferred:  # noqa: N801 - used like a function in provider declarations
+    """Callable placeholder for ``module:attribute``, imported on first call.
+
+    Dependency-injection providers hold one of these instead of the class itself, so
+    declaring a provider costs nothing until the application actually asks for it.
+    """
+
+    __slots__ = ("_target", "target")
+
+    def __init__(self, target: str) -> None:
+        module, separator, attribute = target.partition(":")
+        if not separator or not module or not attribute:
+            raise ValueError("deferred targets must be written module:attribute")
+        self.target = target
+        self._target: Callable[..., Any] | None = None
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        if self._target is None:
+            module, _, attribute = self.target.partition(":")
+            self._target = getattr(importlib.import_module(module), attribute)
+        return self._target(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"deferred({self.target!r})"
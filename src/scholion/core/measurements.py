@@ -1,12 +1,88 @@
 from __future__ import annotations
 
+import math
 from collections.abc import Callable, Iterator
-from contextlib import AbstractContextManager, contextmanager
-from dataclasses import dataclass
+from contextlib import AbstractContextManager, ExitStack, contextmanager
+from dataclasses import dataclass, field
 from threading import Lock
 from time import perf_counter
 from typing import Protocol
 
+_HISTOGRAM_MIN_SECONDS = 1e-6
+_HISTOGRAM_BUCKETS_PER_DOUBLING = 8
+_HISTOGRAM_LOG_GROWTH = math.log(2) / _HISTOGRAM_BUCKETS_PER_DOUBLING
+
+
+@dataclass(frozen=True, slots=True)
+class LatencyHistogram:
+    """Sparse log-bucketed duration counts that merge by adding buckets.
+
+    Bucket ``0`` holds durations up to one microsecond. Bucket ``i`` holds durations up to
+    ``2 ** (i / 8)`` microseconds, so a percentile read back from the upper bound is at
+    most about 9% above the true duration. A day-long span needs fewer than 300 buckets.
+    """
+
+    buckets: tuple[tuple[int, int], ...] = ()
+
+    def __post_init__(self) -> None:
+        indices = [index for index, _ in self.buckets]
+        if indices != sorted(set(indices)):
+            raise ValueError("histogram buckets must be sorted and unique")
+        if any(index < 0 or count < 1 for index, count in self.buckets):
+            raise ValueError("histogram buckets must have positive counts")
+
+    @classmethod
+    def from_counts(cls, counts: dict[int, int]) -> LatencyHistogram:
+        return cls(tuple(sorted((index, n) for index, n in counts.items() if n)))
+
+    @staticmethod
+    def bucket_index(seconds: float) -> int:
+        if seconds <= _HISTOGRAM_MIN_SECONDS:
+            return 0
+        return max(
+            0,
+            math.ceil(
+                math.log(seconds / _HISTOGRAM_MIN_SECONDS) / _HISTOGRAM_LOG_GROWTH
+                - 1e-9
+            ),
+        )
+
+    @staticmethod
+    def upper_bound_seconds(index: int) -> float:
+        return _HISTOGRAM_MIN_SECONDS * math.exp(index * _HISTOGRAM_LOG_GROWTH)
+
+    @property
+    def count(self) -> int:
+        return sum(count for _, count in self.buckets)
+
+    def merge(self, other: LatencyHistogram) -> LatencyHistogram:
+        counts = dict(self.buckets)
+        for index, count in other.buckets:
+            counts[index] = counts.get(index, 0) + count
+        return LatencyHistogram.from_counts(counts)
+
+    def percentile(self, percent: float) -> float | None:
+        """Nearest-rank percentile as a bucket upper bound; ``None`` when empty."""
+        if not 0 < percent <= 100:
+            raise ValueError("percent must be greater than 0 and at most 100")
+        total = self.count
+        if total == 0:
+            return None
+        rank = math.ceil(percent / 100 * total)
+        seen = 0
+        for index, count in self.buckets:
+            seen += count
+            if seen >= rank:
+                return self.upper_bound_seconds(index)
+        raise AssertionError("unreachable: rank exceeds histogram count")
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "min_seconds": _HISTOGRAM_MIN_SECONDS,
+            "buckets_per_doubling": _HISTOGRAM_BUCKETS_PER_DOUBLING,
+            "buckets": [[index, count] for index, count in self.buckets],
+        }
+
 
 @dataclass(frozen=True, slots=True)
 class StageMeasurement:
@@ -17,6 +93,24 @@ class StageMeasurement:
     failed_count: int
     total_seconds: float
     max_seconds: float
+    histogram: LatencyHistogram = LatencyHistogram()
+
+    def percentile(self, percent: float) -> float | None:
+        """Histogram percentile, never above the exact observed maximum."""
+        value = self.histogram.percentile(percent)
+        return None if value is None else min(value, self.max_seconds)
+
+    def merge(self, other: StageMeasurement) -> StageMeasurement:
+        if other.name != self.name:
+            raise ValueError("only measurements of the same stage can be merged")
+        return StageMeasurement(
+            name=self.name,
+            count=self.count + other.count,
+            failed_count=self.failed_count + other.failed_count,
+            total_seconds=self.total_seconds + other.total_seconds,
+            max_seconds=max(self.max_seconds, other.max_seconds),
+            histogram=self.histogram.merge(other.histogram),
+        )
 
     def to_dict(self) -> dict[str, object]:
         return {
@@ -25,6 +119,10 @@ class StageMeasurement:
             "failed_count": self.failed_count,
             "total_seconds": self.total_seconds,
             "max_seconds": self.max_seconds,
+            "p50_seconds": self.percentile(50),
+            "p90_seconds": self.percentile(90),
+            "p99_seconds": self.percentile(99),
+            "histogram": self.histogram.to_dict(),
         }
 
 
@@ -47,12 +145,31 @@ class NoOpExecutionObserver:
         del name, value
 
 
+class CombinedExecutionObserver:
+    """Fan one execution's spans and values out to several observers, in order."""
+
+    def __init__(self, *observers: ExecutionObserver) -> None:
+        self.observers = observers
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        with ExitStack() as stack:
+            for observer in self.observers:
+                stack.enter_context(observer.span(name))
+            yield
+
+    def record_value(self, name: str, value: int | float) -> None:
+        for observer in self.observers:
+            observer.record_value(name, value)
+
+
 @dataclass(slots=True)
 class _MutableStage:
     count: int = 0
     failed_count: int = 0
     total_seconds: float = 0.0
     max_seconds: float = 0.0
+    buckets: dict[int, int] = field(default_factory=dict)
 
 
 class MeasurementRecorder:
@@ -75,12 +192,14 @@ class MeasurementRecorder:
             raise
         finally:
             duration = max(0.0, self.clock() - started)
+            bucket = LatencyHistogram.bucket_index(duration)
             with self._lock:
                 stage = self._stages.setdefault(name, _MutableStage())
                 stage.count += 1
                 stage.failed_count += int(failed)
                 stage.total_seconds += duration
                 stage.max_seconds = max(stage.max_seconds, duration)
+                stage.buckets[bucket] = stage.buckets.get(bucket, 0) + 1
 
     def record_value(self, name: str, value: int | float) -> None:
         with self._lock:
@@ -95,6 +214,7 @@ class MeasurementRecorder:
                     failed_count=stage.failed_count,
                     total_seconds=stage.total_seconds,
                     max_seconds=stage.max_seconds,
+                    histogram=LatencyHistogram.from_counts(stage.buckets),
                 )
                 for name, stage in sorted(self._stages.items())
             )
@@ -0,0 +1,424 @@
+"""Process-local metrics rendered in Prometheus text or OpenMetrics format.
+
+``MetricsRegistry`` holds counters, gauges, and fixed-bucket duration histograms, and
+asks registered collectors for point-in-time samples when it renders. ``MetricsObserver``
+is an ``ExecutionObserver`` that feeds stage latencies and segment throughput into a
+registry, so any pipeline that already accepts an observer can be scraped.
+
+Labels follow the same rule as the logs in ``core.privacy``: metrics never disclose
+local paths or transcript text. Label values must be short identifiers such as stage
+names or cache names; anything with a separator, whitespace, or more than 64
+characters is rejected when it is recorded rather than escaped when it is rendered.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import threading
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from enum import StrEnum
+from time import perf_counter
+
+from scholion.core.performance_tracker import collect_system_metrics
+from scholion.core.profiling import current_process_rss
+
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+DURATION_BUCKETS_SECONDS = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    300.0,
+    900.0,
+)
+
+_METRIC_NAME = re.compile(r"[a-z_][a-z0-9_]*\Z")
+_LABEL_NAME = re.compile(r"[a-z_][a-z0-9_]*\Z")
+_LABEL_VALUE = re.compile(r"[A-Za-z0-9_.:+-]{1,64}\Z")
+_RESERVED_LABELS = frozenset({"le"})
+
+type MetricLabels = tuple[tuple[str, str], ...]
+
+
+class MetricKind(StrEnum):
+    COUNTER = "counter"
+    GAUGE = "gauge"
+    HISTOGRAM = "histogram"
+
+
+def metric_labels(labels: Mapping[str, str] | None = None) -> MetricLabels:
+    """Validate labels against the privacy rules and return them in render order."""
+    if not labels:
+        return ()
+    for name, value in labels.items():
+        if not _LABEL_NAME.match(name) or name in _RESERVED_LABELS:
+            raise ValueError(f"invalid metric label name: {name!r}")
+        if not _LABEL_VALUE.match(value):
+            raise ValueError(
+                f"metric label {name!r} must be a short identifier, "
+                "never a path or free text"
+            )
+    return tuple(sorted(labels.items()))
+
+
+def _validate_name(name: str) -> None:
+    if not _METRIC_NAME.match(name):
+        raise ValueError(f"invalid metric name: {name!r}")
+
+
+@dataclass(frozen=True, slots=True)
+class MetricSample:
+    """One counter or gauge value produced by a collector at render time."""
+
+    name: str
+    kind: MetricKind
+    value: float
+    labels: MetricLabels = ()
+    help: str = ""
+
+    def __post_init__(self) -> None:
+        _validate_name(self.name)
+        if self.kind is MetricKind.HISTOGRAM:
+            raise ValueError("collectors can only produce counters and gauges")
+        if not math.isfinite(self.value):
+            raise ValueError("metric values must be finite")
+        if self.kind is MetricKind.COUNTER and self.value < 0:
+            raise ValueError("counter values cannot be negative")
+        metric_labels(dict(self.labels))
+
+
+type MetricsCollector = Callable[[], Iterable[MetricSample]]
+
+
+@dataclass(frozen=True, slots=True)
+class CacheStatistics:
+    """Lifetime hit and miss counts of one named in-process cache."""
+
+    name: str
+    hits: int
+    misses: int
+
+    def __post_init__(self) -> None:
+        if self.hits < 0 or self.misses < 0:
+            raise ValueError("cache counts cannot be negative")
+
+    @property
+    def hit_rate(self) -> float | None:
+        lookups = self.hits + self.misses
+        return None if lookups == 0 else self.hits / lookups
+
+    def samples(self) -> tuple[MetricSample, ...]:
+        labels = metric_labels({"cache": self.name})
+        return (
+            MetricSample(
+                "scholion_cache_hits",
+                MetricKind.COUNTER,
+                self.hits,
+                labels,
+                "Cache lookups answered from memory",
+            ),
+            MetricSample(
+                "scholion_cache_misses",
+                MetricKind.COUNTER,
+                self.misses,
+                labels,
+                "Cache lookups that had to be computed",
+            ),
+        )
+
+
+def system_metric_samples() -> tuple[MetricSample, ...]:
+    """Collector for ``collect_system_metrics()`` and this process's resident memory."""
+    snapshot = collect_system_metrics()
+    samples = [
+        MetricSample(
+            "scholion_system_memory_available_bytes",
+            MetricKind.GAUGE,
+            snapshot.memory_available_bytes,
+            help="Memory available to new processes",
+        ),
+        MetricSample(
+            "scholion_system_memory_total_bytes",
+            MetricKind.GAUGE,
+            snapshot.memory_total_bytes,
+            help="Physical memory installed",
+        ),
+    ]
+    if snapshot.logical_cpus is not None:
+        samples.append(
+            MetricSample(
+                "scholion_system_logical_cpus",
+                MetricKind.GAUGE,
+                snapshot.logical_cpus,
+                help="Logical CPUs visible to the operating system",
+            )
+        )
+    rss = current_process_rss()
+    if rss is not None:
+        samples.append(
+            MetricSample(
+                "scholion_process_resident_memory_bytes",
+                MetricKind.GAUGE,
+                rss,
+                help="Resident memory of this Scholion process",
+            )
+        )
+    return tuple(samples)
+
+
+@dataclass(slots=True)
+class _Histogram:
+    counts: list[int]
+    total_seconds: float = 0.0
+
+
+@dataclass(slots=True)
+class _Family:
+    kind: MetricKind
+    help: str
+    values: dict[MetricLabels, float | _Histogram] = field(default_factory=dict)
+
+
+class MetricsRegistry:
+    """Thread-safe store of named metric families and render-time collectors."""
+
+    def __init__(
+        self,
+        *,
+        collectors: Iterable[MetricsCollector] = (),
+        duration_buckets_seconds: tuple[float, ...] = DURATION_BUCKETS_SECONDS,
+    ) -> None:
+        if not duration_buckets_seconds or list(duration_buckets_seconds) != sorted(
+            set(duration_buckets_seconds)
+        ):
+            raise ValueError("duration buckets must be strictly increasing")
+        self.duration_buckets_seconds = duration_buckets_seconds
+        self._collectors = list(collectors)
+        self._families: dict[str, _Family] = {}
+        self._lock = threading.Lock()
+
+    def register_collector(self, collector: MetricsCollector) -> None:
+        with self._lock:
+            self._collectors.append(collector)
+
+    def increment(
+        self,
+        name: str,
+        amount: float = 1,
+        *,
+        labels: Mapping[str, str] | None = None,
+        help: str = "",
+    ) -> None:
+        if amount < 0 or not math.isfinite(amount):
+            raise ValueError("counters can only increase")
+        key = metric_labels(labels)
+        with self._lock:
+            values = self._family(name, MetricKind.COUNTER, help).values
+            previous = values.get(key, 0.0)
+            values[key] = (
+                0.0 if isinstance(previous, _Histogram) else previous
+            ) + amount
+
+    def set_gauge(
+        self,
+        name: str,
+        value: float,
+        *,
+        labels: Mapping[str, str] | None = None,
+        help: str = "",
+    ) -> None:
+        if not math.isfinite(value):
+            raise ValueError("metric values must be finite")
+        key = metric_labels(labels)
+        with self._lock:
+            self._family(name, MetricKind.GAUGE, help).values[key] = value
+
+    def observe(
+        self,
+        name: str,
+        seconds: float,
+        *,
+        labels: Mapping[str, str] | None = None,
+        help: str = "",
+    ) -> None:
+        if seconds < 0 or not math.isfinite(seconds):
+            raise ValueError("observed durations must be finite and non-negative")
+        key = metric_labels(labels)
+        index = bisect_left(self.duration_buckets_seconds, seconds)
+        with self._lock:
+            values = self._family(name, MetricKind.HISTOGRAM, help).values
+            histogram = values.get(key)
+            if not isinstance(histogram, _Histogram):
+                histogram = _Histogram([0] * (len(self.duration_buckets_seconds) + 1))
+                values[key] = histogram
+            histogram.counts[index] += 1
+            histogram.total_seconds += seconds
+
+    def render(self, *, openmetrics: bool = False) -> str:
+        """Return every family in Prometheus text 0.0.4, or OpenMetrics 1.0 text."""
+        with self._lock:
+            collectors = list(self._collectors)
+            families = {
+                name: _Family(
+                    family.kind,
+                    family.help,
+                    {
+                        labels: _Histogram(list(value.counts), value.total_seconds)
+                        if isinstance(value, _Histogram)
+                        else value
+                        for labels, value in family.values.items()
+                    },
+                )
+                for name, family in self._families.items()
+            }
+        for collector in collectors:
+            for sample in collector():
+                family = families.setdefault(
+                    sample.name, _Family(sample.kind, sample.help)
+                )
+                if family.kind is not sample.kind:
+                    raise ValueError(f"metric {sample.name!r} changed kind")
+                family.values[sample.labels] = sample.value
+        lines: list[str] = []
+        for name in sorted(families):
+            lines.extend(self._render_family(name, families[name], openmetrics))
+        if openmetrics:
+            lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def _family(self, name: str, kind: MetricKind, help: str) -> _Family:
+        family = self._families.get(name)
+        if family is None:
+            _validate_name(name)
+            family = _Family(kind, help)
+            self._families[name] = family
+        elif family.kind is not kind:
+            raise ValueError(f"metric {name!r} is already a {family.kind.value}")
+        return family
+
+    def _render_family(
+        self, name: str, family: _Family, openmetrics: bool
+    ) -> Iterator[str]:
+        counter = family.kind is MetricKind.COUNTER
+        family_name = f"{name}_total" if counter and not openmetrics else name
+        yield f"# TYPE {family_name} {family.kind.value}"
+        if family.help:
+            yield f"# HELP {family_name} {_escape_help(family.help)}"
+        for labels, value in sorted(family.values.items()):
+            if isinstance(value, _Histogram):
+                yield from self._render_histogram(name, labels, value)
+            else:
+                sample_name = f"{name}_total" if counter else name
+                yield f"{sample_name}{_render_labels(labels)} {_render_value(value)}"
+
+    def _render_histogram(
+        self, name: str, labels: MetricLabels, histogram: _Histogram
+    ) -> Iterator[str]:
+        cumulative = 0
+        bounds = (*self.duration_buckets_seconds, math.inf)
+        for bound, count in zip(bounds, histogram.counts, strict=True):
+            cumulative += count
+            le = "+Inf" if math.isinf(bound) else repr(bound)
+            bucket_labels = (*labels, ("le", le))
+            yield f"{name}_bucket{_render_labels(bucket_labels)} {cumulative}"
+        yield f"{name}_count{_render_labels(labels)} {cumulative}"
+        yield (
+            f"{name}_sum{_render_labels(labels)} "
+            f"{_render_value(histogram.total_seconds)}"
+        )
+
+
+class MetricsObserver:
+    """Publish execution spans and segment progress into a ``MetricsRegistry``.
+
+    Every span becomes an observation of ``scholion_stage_duration_seconds`` labelled
+    with the span name, and failed spans also count in ``scholion_stage_failures``.
+    ``segments.completed`` is a running total per job, so only its increase is added
+    to ``scholion_segments_completed``; segments restored from a checkpoint are not
+    counted again. Every other value is kept as a gauge labelled with its name.
+    """
+
+    def __init__(
+        self, registry: MetricsRegistry, *, clock: Callable[[], float] = perf_counter
+    ) -> None:
+        self.registry = registry
+        self.clock = clock
+        self._completed: float = 0
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        labels = {"stage": name}
+        metric_labels(labels)
+        started = self.clock()
+        failed = False
+        try:
+            yield
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            self.registry.observe(
+                "scholion_stage_duration_seconds",
+                max(0.0, self.clock() - started),
+                labels=labels,
+                help="Wall time spent in each measured stage",
+            )
+            if failed:
+                self.registry.increment(
+                    "scholion_stage_failures",
+                    labels=labels,
+                    help="Measured stages that ended with an error",
+                )
+
+    def record_value(self, name: str, value: int | float) -> None:
+        if name == "segments.completed":
+            with self._lock:
+                increase = max(0, value - self._completed)
+                self._completed = max(self._completed, value)
+            if increase:
+                self.registry.increment(
+                    "scholion_segments_completed",
+                    increase,
+                    help="Segments transcribed, excluding checkpoint restores",
+                )
+        elif name == "segments.restored":
+            with self._lock:
+                self._completed = max(self._completed, value)
+        self.registry.set_gauge(
+            "scholion_execution_value",
+            value,
+            labels={"name": name},
+            help="Latest value recorded by a running execution",
+        )
+
+
+def _render_labels(labels: MetricLabels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{value}"' for name, value in labels) + "}"
+
+
+def _render_value(value: float) -> str:
+    if float(value).is_integer() and abs(value) < 2**53:
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
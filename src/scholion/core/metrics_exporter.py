@@ -0,0 +1,265 @@
+"""Expose a ``MetricsRegistry`` to a scraper on the local machine only.
+
+Three transports are supported, chosen by ``SCHOLION_METRICS_EXPORT``:
+
+``textfile:PATH``
+    Rewrite ``PATH`` (ending in ``.prom``) atomically at a fixed interval and on exit,
+    for node_exporter's textfile collector. Suited to short-lived worker processes.
+``unix:PATH``
+    Serve ``GET /metrics`` over a Unix socket readable only by the current user. A
+    missing parent directory is created private; an existing one keeps its mode. A
+    leftover socket is replaced only when nothing is listening on it.
+``http://127.0.0.1:PORT``
+    Serve ``GET /metrics`` over HTTP on a loopback address. Other hosts are refused.
+
+HTTP transports answer in OpenMetrics when the scraper asks for it and in Prometheus
+text otherwise. Request logging is disabled so client addresses never reach the logs.
+"""
+
+from __future__ import annotations
+
+import errno
+import ipaddress
+import os
+import socket
+import socketserver
+import stat
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass
+from enum import StrEnum
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Protocol, cast
+from urllib.parse import urlsplit
+
+from scholion.core.errors import ConfigurationError, StorageError
+from scholion.core.file_manager_facade import FileManagerFacade
+from scholion.core.metrics import (
+    OPENMETRICS_CONTENT_TYPE,
+    PROMETHEUS_CONTENT_TYPE,
+    MetricsRegistry,
+)
+
+_METRICS_PATHS = frozenset({"/", "/metrics"})
+_SOCKET_PROBE_SECONDS = 1.0
+
+
+class MetricsTransport(StrEnum):
+    TEXTFILE = "textfile"
+    UNIX = "unix"
+    HTTP = "http"
+
+
+def _is_loopback(host: str) -> bool:
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+@dataclass(frozen=True, slots=True)
+class MetricsEndpoint:
+    """Where metrics are published; always on the local machine."""
+
+    transport: MetricsTransport
+    path: Path | None = None
+    host: str | None = None
+    port: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.transport is MetricsTransport.HTTP:
+            if self.host is None or not _is_loopback(self.host):
+                raise ValueError("metrics HTTP endpoints must use a loopback address")
+            if self.port is None or not 0 <= self.port <= 65_535:
+                raise ValueError("metrics HTTP endpoints need a port")
+            return
+        if self.path is None:
+            raise ValueError(f"{self.transport.value} metrics endpoints need a path")
+        if self.transport is MetricsTransport.TEXTFILE and self.path.suffix != ".prom":
+            raise ValueError("metrics textfiles must end in .prom")
+
+    @classmethod
+    def parse(cls, value: str) -> MetricsEndpoint:
+        scheme, separator, rest = value.partition(":")
+        if not separator or not rest:
+            raise ValueError(
+                "metrics endpoint must be textfile:PATH, unix:PATH, "
+                "or http://127.0.0.1:PORT"
+            )
+        if scheme in (MetricsTransport.TEXTFILE, MetricsTransport.UNIX):
+            return cls(MetricsTransport(scheme), path=Path(rest).expanduser())
+        if scheme == MetricsTransport.HTTP:
+            parts = urlsplit(value)
+            if parts.path not in ("", *_METRICS_PATHS) or parts.query:
+                raise ValueError("metrics HTTP endpoints are served at /metrics")
+            return cls(MetricsTransport.HTTP, host=parts.hostname, port=parts.port)
+        raise ValueError(f"unknown metrics transport: {scheme!r}")
+
+
+class _RegistryServer(Protocol):
+    registry: MetricsRegistry
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:
+        if self.path.partition("?")[0] not in _METRICS_PATHS:
+            self.send_error(404)
+            return
+        openmetrics = "application/openmetrics-text" in self.headers.get("Accept", "")
+        registry = cast(_RegistryServer, self.server).registry
+        body = registry.render(openmetrics=openmetrics).encode("utf-8")
+        self.send_response(200)
+        self.send_header(
+            "Content-Type",
+            OPENMETRICS_CONTENT_TYPE if openmetrics else PROMETHEUS_CONTENT_TYPE,
+        )
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        del format, args
+
+
+class _HttpMetricsServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, host: str, port: int, registry: MetricsRegistry) -> None:
+        self.registry = registry
+        super().__init__((host, port), _MetricsHandler)
+
+
+class _UnixMetricsServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: Path, registry: MetricsRegistry) -> None:
+        self.registry = registry
+        super().__init__(str(path), _MetricsHandler)
+
+
+class MetricsExporter:
+    """Publish one registry at one endpoint for the lifetime of ``serving()``."""
+
+    def __init__(
+        self,
+        endpoint: MetricsEndpoint,
+        registry: MetricsRegistry,
+        file_manager: FileManagerFacade,
+        *,
+        interval_seconds: float = 15.0,
+    ) -> None:
+        if interval_seconds <= 0:
+            raise ValueError("interval_seconds must be positive")
+        self.endpoint = endpoint
+        self.registry = registry
+        self.file_manager = file_manager
+        self.interval_seconds = interval_seconds
+        self._server: socketserver.BaseServer | None = None
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+
+    @property
+    def port(self) -> int | None:
+        """Bound HTTP port, which differs from the configured one when that is 0."""
+        if isinstance(self._server, _HttpMetricsServer):
+            return int(self._server.server_address[1])
+        return None
+
+    @contextmanager
+    def serving(self) -> Iterator[MetricsExporter]:
+        self.start()
+        try:
+            yield self
+        finally:
+            self.stop()
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        if self.endpoint.transport is MetricsTransport.TEXTFILE:
+            self.write_textfile()
+            target = self._write_periodically
+        else:
+            self._server = self._open_server()
+            target = self._server.serve_forever
+        self._thread = threading.Thread(
+            target=target, name="scholion-metrics", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stop.set()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+            if self.endpoint.transport is MetricsTransport.UNIX:
+                self._socket_path().unlink(missing_ok=True)
+        self._thread.join()
+        self._thread = None
+        if self.endpoint.transport is MetricsTransport.TEXTFILE:
+            self.write_textfile()
+
+    def write_textfile(self) -> None:
+        if self.endpoint.path is None:
+            raise ValueError("only path endpoints can be written")
+        # The textfile collector usually runs as another account.
+        self.file_manager.save_file(
+            self.registry.render().encode("utf-8"),
+            self.endpoint.path,
+            durable=False,
+            mode=0o644,
+        )
+
+    def _write_periodically(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            # A failed rewrite leaves the previous file in place until the next tick.
+            with suppress(StorageError):
+                self.write_textfile()
+
+    def _open_server(self) -> socketserver.BaseServer:
+        try:
+            if self.endpoint.transport is MetricsTransport.HTTP:
+                return _HttpMetricsServer(
+                    cast(str, self.endpoint.host),
+                    cast(int, self.endpoint.port),
+                    self.registry,
+                )
+            path = self._socket_path()
+            if not path.parent.exists():
+                self.file_manager.reserve_directory(path.parent, private=True)
+            _remove_stale_socket(path)
+            server = _UnixMetricsServer(path, self.registry)
+            os.chmod(path, 0o600)
+            return server
+        except OSError as exc:
+            raise ConfigurationError(
+                "Metrics endpoint could not be opened", cause=exc
+            ) from exc
+
+    def _socket_path(self) -> Path:
+        return cast(Path, self.endpoint.path)
+
+
+def _remove_stale_socket(path: Path) -> None:
+    try:
+        mode = path.lstat().st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError(f"refusing to replace a non-socket at {path.name}")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        probe.settimeout(_SOCKET_PROBE_SECONDS)
+        try:
+            probe.connect(str(path))
+        except ConnectionRefusedError:
+            path.unlink()
+            return
+    raise OSError(errno.EADDRINUSE, f"metrics socket {path.name} is in use")
@@ -3,8 +3,6 @@ from contextlib import contextmanager
 from dataclasses import dataclass
 from time import perf_counter
 
-import psutil
-
 
 @dataclass(frozen=True, slots=True)
 class SystemMetricsSnapshot:
@@ -38,6 +36,8 @@ class PerformanceTracker:
 
 def collect_system_metrics() -> SystemMetricsSnapshot:
     """Collect a nonblocking resource snapshot; callers decide how to present it."""
+    import psutil
+
     memory = psutil.virtual_memory()
     return SystemMetricsSnapshot(
         logical_cpus=psutil.cpu_count(logical=True),
@@ -0,0 +1,355 @@
+"""Hierarchical execution traces that open in Perfetto or ``chrome://tracing``.
+
+``ProfilingObserver`` is an ``ExecutionObserver`` that keeps every span rather than an
+aggregate: start and end time, parent span, thread, and process RSS on entry and exit.
+Values recorded through the observer become counter tracks. The result exports as
+Chrome trace-event JSON, so a slow job's trace can sit next to its benchmark report and
+be read without a debugger.
+
+Named spans can also be sampled. While such a span is open, a daemon thread reads the
+span thread's Python stack at a fixed interval and counts collapsed stacks. Frames are
+labelled ``module:qualified_name`` so traces carry code locations, never file paths or
+argument values.
+
+Overhead is bounded: at most ``max_events`` spans and counters are kept and the rest are
+counted as dropped, and RSS reading can be turned off with ``rss_reader=None``.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from time import perf_counter
+from types import FrameType
+
+import psutil
+
+_DEFAULT_MAX_EVENTS = 100_000
+_MAX_PROFILE_STACKS = 200
+
+
+def current_process_rss() -> int | None:
+    try:
+        return int(psutil.Process().memory_info().rss)
+    except psutil.Error:
+        return None
+
+
+@dataclass(frozen=True, slots=True)
+class TraceSpan:
+    """One completed span on one thread."""
+
+    span_id: int
+    parent_id: int | None
+    name: str
+    thread_id: int
+    start_seconds: float
+    end_seconds: float
+    rss_start_bytes: int | None
+    rss_end_bytes: int | None
+    failed: bool = False
+
+    def __post_init__(self) -> None:
+        if self.end_seconds < self.start_seconds:
+            raise ValueError("span cannot end before it starts")
+
+    @property
+    def duration_seconds(self) -> float:
+        return self.end_seconds - self.start_seconds
+
+    @property
+    def rss_delta_bytes(self) -> int | None:
+        if self.rss_start_bytes is None or self.rss_end_bytes is None:
+            return None
+        return self.rss_end_bytes - self.rss_start_bytes
+
+
+@dataclass(frozen=True, slots=True)
+class TraceCounter:
+    name: str
+    thread_id: int
+    at_seconds: float
+    value: int | float
+
+
+@dataclass(frozen=True, slots=True)
+class StackProfile:
+    """Collapsed Python stacks sampled while one span was open."""
+
+    span_id: int
+    interval_seconds: float
+    samples: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def sample_count(self) -> int:
+        return sum(self.samples.values())
+
+    def to_dict(self) -> dict[str, object]:
+        top = sorted(self.samples.items(), key=lambda item: (-item[1], item[0]))
+        return {
+            "interval_ms": self.interval_seconds * 1000,
+            "sample_count": self.sample_count,
+            "stacks": dict(top[:_MAX_PROFILE_STACKS]),
+        }
+
+
+class _StackSampler:
+    def __init__(
+        self, thread_ident: int, interval_seconds: float, max_depth: int
+    ) -> None:
+        self.thread_ident = thread_ident
+        self.interval_seconds = interval_seconds
+        self.max_depth = max_depth
+        self.samples: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="scholion-stack-sampler", daemon=True
+        )
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> Counter[str]:
+        self._stop.set()
+        self._thread.join()
+        return self.samples
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            frame = sys._current_frames().get(self.thread_ident)
+            if frame is not None:
+                self.samples[self._collapse(frame)] += 1
+
+    def _collapse(self, frame: FrameType) -> str:
+        labels: list[str] = []
+        current: FrameType | None = frame
+        while current is not None and len(labels) < self.max_depth:
+            module = current.f_globals.get("__name__", "?")
+            labels.append(f"{module}:{current.f_code.co_qualname}")
+            current = current.f_back
+        return ";".join(reversed(labels))
+
+
+@dataclass(slots=True)
+class _OpenSpan:
+    span_id: int
+    name: str
+    started: float
+    rss: int | None
+
+
+class ProfilingObserver:
+    """Thread-safe recorder of nested spans, counters, and optional stack samples."""
+
+    def __init__(
+        self,
+        *,
+        clock: Callable[[], float] = perf_counter,
+        rss_reader: Callable[[], int | None] | None = current_process_rss,
+        sampled_spans: frozenset[str] = frozenset(),
+        sample_interval_seconds: float = 0.005,
+        max_stack_depth: int = 64,
+        max_events: int = _DEFAULT_MAX_EVENTS,
+        process_id: int | None = None,
+    ) -> None:
+        if sample_interval_seconds <= 0:
+            raise ValueError("sample_interval_seconds must be positive")
+        if max_stack_depth < 1:
+            raise ValueError("max_stack_depth must be positive")
+        if max_events < 1:
+            raise ValueError("max_events must be positive")
+        self.clock = clock
+        self.rss_reader = rss_reader
+        self.sampled_spans = sampled_spans
+        self.sample_interval_seconds = sample_interval_seconds
+        self.max_stack_depth = max_stack_depth
+        self.max_events = max_events
+        self.process_id = os.getpid() if process_id is None else process_id
+        self.origin = clock()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._next_id = 1
+        self._spans: list[TraceSpan] = []
+        self._counters: list[TraceCounter] = []
+        self._profiles: list[StackProfile] = []
+        self._thread_names: dict[int, str] = {}
+        self._dropped = 0
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        stack = self._stack()
+        with self._lock:
+            span_id = self._next_id
+            self._next_id += 1
+        parent_id = stack[-1].span_id if stack else None
+        sampler = self._start_sampler(name)
+        opened = _OpenSpan(span_id, name, self.clock(), self._rss())
+        stack.append(opened)
+        failed = False
+        try:
+            yield
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            stack.pop()
+            ended = max(opened.started, self.clock())
+            span = TraceSpan(
+                span_id=span_id,
+                parent_id=parent_id,
+                name=name,
+                thread_id=threading.get_native_id(),
+                start_seconds=opened.started - self.origin,
+                end_seconds=ended - self.origin,
+                rss_start_bytes=opened.rss,
+                rss_end_bytes=self._rss(),
+                failed=failed,
+            )
+            samples = None if sampler is None else sampler.stop()
+            with self._lock:
+                if self._has_room():
+                    self._spans.append(span)
+                if samples:
+                    self._profiles.append(
+                        StackProfile(
+                            span_id, self.sample_interval_seconds, dict(samples)
+                        )
+                    )
+
+    def record_value(self, name: str, value: int | float) -> None:
+        counter = TraceCounter(
+            name=name,
+            thread_id=self._thread_id(),
+            at_seconds=self.clock() - self.origin,
+            value=value,
+        )
+        with self._lock:
+            if self._has_room():
+                self._counters.append(counter)
+
+    def spans(self) -> tuple[TraceSpan, ...]:
+        with self._lock:
+            return tuple(sorted(self._spans, key=lambda span: span.span_id))
+
+    def counters(self) -> tuple[TraceCounter, ...]:
+        with self._lock:
+            return tuple(self._counters)
+
+    def profiles(self) -> tuple[StackProfile, ...]:
+        with self._lock:
+            return tuple(self._profiles)
+
+    @property
+    def dropped_events(self) -> int:
+        with self._lock:
+            return self._dropped
+
+    def to_chrome_trace(self) -> dict[str, object]:
+        """Return trace-event JSON with timestamps in microseconds since creation."""
+        with self._lock:
+            spans = sorted(self._spans, key=lambda span: span.span_id)
+            counters = list(self._counters)
+            profiles = {profile.span_id: profile for profile in self._profiles}
+            thread_names = dict(self._thread_names)
+            dropped = self._dropped
+        events: list[dict[str, object]] = [
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": self.process_id,
+                "tid": 0,
+                "args": {"name": "scholion"},
+            }
+        ]
+        events.extend(
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": self.process_id,
+                "tid": thread_id,
+                "args": {"name": thread_name},
+            }
+            for thread_id, thread_name in sorted(thread_names.items())
+        )
+        timed: list[dict[str, object]] = []
+        for span in spans:
+            args: dict[str, object] = {
+                "span_id": span.span_id,
+                "parent_id": span.parent_id,
+                "failed": span.failed,
+                "rss_start_bytes": span.rss_start_bytes,
+                "rss_delta_bytes": span.rss_delta_bytes,
+            }
+            if span.span_id in profiles:
+                args["profile"] = profiles[span.span_id].to_dict()
+            timed.append(
+                {
+                    "name": span.name,
+                    "cat": "scholion",
+                    "ph": "X",
+                    "ts": _microseconds(span.start_seconds),
+                    "dur": _microseconds(span.duration_seconds),
+                    "pid": self.process_id,
+                    "tid": span.thread_id,
+                    "args": args,
+                }
+            )
+        timed.extend(
+            {
+                "name": counter.name,
+                "cat": "scholion",
+                "ph": "C",
+                "ts": _microseconds(counter.at_seconds),
+                "pid": self.process_id,
+                "tid": counter.thread_id,
+                "args": {"value": counter.value},
+            }
+            for counter in counters
+        )
+        timed.sort(key=lambda event: (event["ts"], event["ph"] != "X"))
+        return {
+            "displayTimeUnit": "ms",
+            "otherData": {"dropped_events": dropped},
+            "traceEvents": events + timed,
+        }
+
+    def _stack(self) -> list[_OpenSpan]:
+        stack: list[_OpenSpan] | None = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = []
+            self._local.stack = stack
+            thread = threading.current_thread()
+            with self._lock:
+                self._thread_names[thread.native_id or 0] = thread.name
+        return stack
+
+    def _thread_id(self) -> int:
+        self._stack()
+        return threading.get_native_id()
+
+    def _rss(self) -> int | None:
+        return None if self.rss_reader is None else self.rss_reader()
+
+    def _start_sampler(self, name: str) -> _StackSampler | None:
+        if name not in self.sampled_spans:
+            return None
+        sampler = _StackSampler(
+            threading.get_ident(), self.sample_interval_seconds, self.max_stack_depth
+        )
+        sampler.start()
+        return sampler
+
+    def _has_room(self) -> bool:
+        if len(self._spans) + len(self._counters) < self.max_events:
+            return True
+        self._dropped += 1
+        return False
+
+
+def _microseconds(seconds: float) -> float:
+    return round(seconds * 1_000_000, 3)
@@ -0,0 +1,56 @@
+import json
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from scholion.core.canonical_json import StreamedArray, iter_canonical_json
+
+json_values = st.recursive(
+    st.none() | st.booleans() | st.integers() | st.floats(allow_nan=False) | st.text(),
+    lambda children: (
+        st.lists(children, max_size=4)
+        | st.dictionaries(st.text(), children, max_size=4)
+    ),
+    max_leaves=20,
+)
+
+
+def canonical(value: object) -> bytes:
+    return (
+        json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+        + "\n"
+    ).encode("utf-8")
+
+
+@given(st.dictionaries(st.text(), json_values), st.lists(json_values))
+def test_streamed_documents_match_canonical_dumps_byte_for_byte(document, items):
+    streamed = {**document, "segments": StreamedArray(iter(items))}
+
+    assert b"".join(iter_canonical_json(streamed)) == canonical(
+        {**document, "segments": items}
+    )
+
+
+@pytest.mark.parametrize("document", [{}, {"segments": StreamedArray(())}])
+def test_empty_documents_and_arrays_match_canonical_dumps(document):
+    expected = {key: [] for key in document}
+
+    assert b"".join(iter_canonical_json(document)) == canonical(expected)
+
+
+def test_streamed_elements_are_produced_only_as_output_is_consumed():
+    produced: list[int] = []
+
+    def segments():
+        for index in range(3):
+            produced.append(index)
+            yield {"index": index, "text": "é"}
+
+    chunks = iter_canonical_json({"a": 1, "segments": StreamedArray(segments())})
+
+    assert next(chunks) == b'{"a":'
+    assert next(chunks) == b"1"
+    assert next(chunks) == b',"segments":'
+    assert next(chunks) == '[{"index":0,"text":"é"}'.encode()
+    assert produced == [0]
@@ -6,6 +6,7 @@ from scholion.core.config import AppConfig, _platform_dirs
 from scholion.core.errors import ConfigurationError
 from scholion.core.privacy import PathDisclosure
 from scholion.runner.models import ProcessingProfile
+from scholion.transcription.models import CheckpointEncoding
 
 
 def test_local_defaults_are_valid():
@@ -14,10 +15,14 @@ def test_local_defaults_are_valid():
     assert config.DEBUG is False
     assert config.LOG_LEVEL == "INFO"
     assert config.LOG_PATHS is PathDisclosure.REDACT
+    assert config.METRICS_EXPORT is None
     assert config.PROCESSING_PROFILE is ProcessingProfile.BALANCED
     assert config.MAX_CPU_THREADS is None
     assert config.MAX_MEMORY_BYTES is None
     assert config.MEMORY_BUDGET_FRACTION == 0.75
+    assert config.STRATEGY_CALIBRATION is False
+    assert config.CHECKPOINT_ENCODING is CheckpointEncoding.JSON
+    assert config.SAVED_SEARCH_RESULT_CACHE is False
     assert config.MIN_FREE_DISK_BYTES == 512 * 1024 * 1024
     assert config.WARN_FREE_DISK_BYTES == 2 * 1024 * 1024 * 1024
     assert config.FFMPEG_TIMEOUT_SECONDS == 2.0
@@ -245,6 +250,12 @@ def test_configuration_field_descriptions_are_stable_public_schema():
         "DEBUG": "Enable debug mode",
         "LOG_LEVEL": "Logging level",
         "LOG_PATHS": "Whether routine logs may disclose local filesystem paths",
+        "METRICS_EXPORT": (
+            "Local metrics endpoint: textfile:PATH, unix:PATH, or http://127.0.0.1:PORT"
+        ),
+        "TRACE_JOBS": (
+            "Write a Chrome trace of each transcription job into its workspace"
+        ),
         "PROCESSING_PROFILE": "Default processing intent used for resource planning",
         "MAX_CPU_THREADS": (
             "Optional ceiling on CPU threads used by one processing job"
@@ -255,10 +266,19 @@ def test_configuration_field_descriptions_are_stable_public_schema():
         "MEMORY_BUDGET_FRACTION": (
             "Fraction of currently available memory a job may budget"
         ),
+        "STRATEGY_CALIBRATION": (
+            "Adjust strategy estimates from local benchmark history"
+        ),
         "STATE_DIR": "Private application state and job workspace",
         "CACHE_DIR": "Private disposable application cache",
         "MODEL_DIR": "Private downloaded-model cache",
         "OUTPUT_DIR": "Default directory for user-visible artifacts",
+        "CHECKPOINT_ENCODING": (
+            "Encoding for completed-segment checkpoints of new jobs"
+        ),
+        "SAVED_SEARCH_RESULT_CACHE": (
+            "Reuse rendered saved-search pages while their inputs are unchanged"
+        ),
         "MIN_FREE_DISK_BYTES": "Required free disk space",
         "WARN_FREE_DISK_BYTES": "Recommended free disk space",
         "FFMPEG_TIMEOUT_SECONDS": None,
@@ -0,0 +1,36 @@
+from unittest.mock import Mock
+
+import pytest
+
+from scholion.core.deferred_logger import DeferredLogger
+
+
+def test_messages_below_the_level_never_build_the_backend():
+    factory = Mock()
+    logger = DeferredLogger("warning", factory)
+
+    logger.debug("routine")
+    logger.bind(job_id="job-1").info("routine")
+
+    factory.assert_not_called()
+
+
+def test_enabled_messages_build_the_backend_once_and_keep_bound_context():
+    backend = Mock()
+    factory = Mock(return_value=backend)
+    logger = DeferredLogger("INFO", factory)
+
+    logger.info("started", step=1)
+    logger.bind(job_id="job-1").error("failed", code="x")
+    logger.warning("slow")
+
+    factory.assert_called_once_with()
+    backend.info.assert_called_once_with("started", step=1)
+    backend.bind.assert_called_once_with(job_id="job-1")
+    backend.bind.return_value.error.assert_called_once_with("failed", code="x")
+    backend.warning.assert_called_once_with("slow")
+
+
+def test_unknown_levels_are_rejected():
+    with pytest.raises(ValueError, match="Invalid LOG_LEVEL"):
+        DeferredLogger("LOUD", Mock())
@@ -0,0 +1,40 @@
+import importlib
+import sys
+
+import pytest
+
+from scholion.core.lazy_imports import deferred
+
+LAZY_PACKAGES = (
+    "scholion.app",
+    "scholion.interfaces",
+    "scholion.library",
+    "scholion.media",
+    "scholion.model_management",
+    "scholion.runner",
+    "scholion.transcription",
+)
+
+
+@pytest.mark.parametrize("name", LAZY_PACKAGES)
+def test_lazy_packages_export_exactly_their_public_names(name: str) -> None:
+    package = importlib.import_module(name)
+
+    assert set(package.__all__) <= set(dir(package))
+    for export in package.__all__:
+        assert getattr(package, export) is not None
+        assert export in vars(package)
+    with pytest.raises(AttributeError, match="no attribute 'missing'"):
+        _ = package.missing
+
+
+def test_deferred_imports_its_target_on_first_call(monkeypatch) -> None:
+    monkeypatch.delitem(sys.modules, "colorsys", raising=False)
+    to_hsv = deferred("colorsys:rgb_to_hsv")
+
+    assert "colorsys" not in sys.modules
+    assert to_hsv(1.0, 0.0, 0.0) == (0.0, 1.0, 1.0)
+    assert "colorsys" in sys.modules
+    assert repr(to_hsv) == "deferred('colorsys:rgb_to_hsv')"
+    with pytest.raises(ValueError, match="module:attribute"):
+        deferred("colorsys.rgb_to_hsv")
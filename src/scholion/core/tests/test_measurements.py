@@ -1,6 +1,11 @@
 import pytest
 
-from scholion.core.measurements import MeasurementRecorder, NoOpExecutionObserver
+from scholion.core.measurements import (
+    LatencyHistogram,
+    MeasurementRecorder,
+    NoOpExecutionObserver,
+    StageMeasurement,
+)
 
 
 class StepClock:
@@ -45,3 +50,52 @@ def test_recorder_marks_failed_span_without_swallowing_exception():
     assert stage.count == 1
     assert stage.failed_count == 1
     assert stage.total_seconds == 1.0
+
+
+class ScriptedClock:
+    def __init__(self, durations: list[float]) -> None:
+        self.readings = [value for duration in durations for value in (0.0, duration)]
+
+    def __call__(self) -> float:
+        return self.readings.pop(0)
+
+
+def test_recorder_histogram_exposes_tail_latency_percentiles():
+    durations = [0.1] * 299 + [40.0]
+    recorder = MeasurementRecorder(clock=ScriptedClock(durations))
+
+    for _ in durations:
+        with recorder.span("segment.materialize"):
+            pass
+
+    (stage,) = recorder.stages()
+    assert stage.histogram.count == 300
+    assert stage.percentile(50) == pytest.approx(0.1, rel=0.095)
+    assert stage.percentile(50) >= 0.1
+    assert stage.percentile(99) == pytest.approx(0.1, rel=0.095)
+    assert stage.percentile(100) == 40.0
+    document = stage.to_dict()
+    assert document["p90_seconds"] == stage.percentile(90)
+    assert len(document["histogram"]["buckets"]) == 2
+
+
+def test_histograms_merge_like_one_recording():
+    first = MeasurementRecorder(clock=ScriptedClock([0.001, 2.0]))
+    second = MeasurementRecorder(clock=ScriptedClock([0.001, 0.0, 30.0]))
+    combined = MeasurementRecorder(clock=ScriptedClock([0.001, 2.0, 0.001, 0.0, 30.0]))
+    for recorder, runs in ((first, 2), (second, 3), (combined, 5)):
+        for _ in range(runs):
+            with recorder.span("decode"):
+                pass
+
+    merged = first.stages()[0].merge(second.stages()[0])
+    assert merged == combined.stages()[0]
+    assert merged.percentile(99) == 30.0
+    assert LatencyHistogram().percentile(50) is None
+    assert LatencyHistogram.bucket_index(0.0) == 0
+    bound = LatencyHistogram.upper_bound_seconds(LatencyHistogram.bucket_index(1.0))
+    assert 1.0 <= bound < 2 ** (1 / 8)
+    with pytest.raises(ValueError, match="same stage"):
+        merged.merge(StageMeasurement("other", 1, 0, 1.0, 1.0))
+    with pytest.raises(ValueError, match="sorted and unique"):
+        LatencyHistogram(((3, 1), (2, 1)))
@@ -0,0 +1,252 @@
+import http.client
+import socket
+import stat
+from pathlib import Path
+
+import pytest
+
+from scholion.core.errors import ConfigurationError
+from scholion.core.metrics import (
+    CacheStatistics,
+    MetricKind,
+    MetricSample,
+    MetricsObserver,
+    MetricsRegistry,
+    system_metric_samples,
+)
+from scholion.core.metrics_exporter import (
+    MetricsEndpoint,
+    MetricsExporter,
+    MetricsTransport,
+)
+from scholion.core.tests.test_measurements import StepClock
+
+
+class RecordingFileManager:
+    def __init__(self) -> None:
+        self.saved: list[tuple[bytes, str, bool]] = []
+        self.modes: list[int | None] = []
+        self.directories: list[str] = []
+
+    def save_file(
+        self,
+        content: bytes,
+        file_path: object,
+        *,
+        private=False,
+        durable=True,
+        mode=None,
+    ) -> None:
+        del private
+        self.saved.append((content, str(file_path), durable))
+        self.modes.append(mode)
+
+    def reserve_directory(self, directory_path: object, *, private=False) -> None:
+        assert private
+        Path(str(directory_path)).mkdir(mode=0o700)
+        self.directories.append(str(directory_path))
+
+
+def test_observer_publishes_stage_histograms_and_segment_throughput() -> None:
+    registry = MetricsRegistry(duration_buckets_seconds=(0.5, 1.0))
+    observer = MetricsObserver(registry, clock=StepClock())
+
+    observer.record_value("segments.restored", 2)
+    observer.record_value("segments.completed", 2)
+    with observer.span("segment.transcribe"):
+        observer.record_value("segments.completed", 3)
+    with pytest.raises(RuntimeError), observer.span("artifact.write"):
+        raise RuntimeError("transcript text")
+    observer.record_value("segments.completed", 5)
+
+    text = registry.render()
+    assert "transcript text" not in text
+    assert "# TYPE scholion_segments_completed_total counter" in text
+    assert "scholion_segments_completed_total 3" in text
+    assert 'scholion_stage_failures_total{stage="artifact.write"} 1' in text
+    assert (
+        'scholion_stage_duration_seconds_bucket{stage="segment.transcribe",le="1.0"} 1'
+    ) in text
+    assert (
+        'scholion_stage_duration_seconds_bucket{stage="segment.transcribe",le="0.5"} 0'
+    ) in text
+    assert 'scholion_stage_duration_seconds_count{stage="artifact.write"} 1' in text
+    assert 'scholion_execution_value{name="segments.completed"} 5' in text
+    assert not text.endswith("# EOF\n")
+
+    openmetrics = registry.render(openmetrics=True)
+    assert "# TYPE scholion_segments_completed counter" in openmetrics
+    assert openmetrics.endswith("# EOF\n")
+
+
+@pytest.mark.parametrize(
+    "value", ["/home/user/interview.wav", "speaker said hello", "x" * 65, ""]
+)
+def test_labels_that_could_disclose_paths_or_text_are_rejected(value: str) -> None:
+    registry = MetricsRegistry()
+
+    with pytest.raises(ValueError, match="never a path or free text"):
+        registry.increment("scholion_events", labels={"stage": value})
+    with pytest.raises(ValueError, match="never a path or free text"):
+        MetricsObserver(registry).span(value).__enter__()
+    assert registry.render() == "\n"
+
+
+def test_collectors_add_cache_and_system_samples_at_render_time() -> None:
+    statistics = CacheStatistics("research.notes", hits=3, misses=1)
+    registry = MetricsRegistry(collectors=(system_metric_samples,))
+    registry.register_collector(statistics.samples)
+
+    text = registry.render()
+    assert statistics.hit_rate == 0.75
+    assert CacheStatistics("empty", 0, 0).hit_rate is None
+    assert 'scholion_cache_hits_total{cache="research.notes"} 3' in text
+    assert 'scholion_cache_misses_total{cache="research.notes"} 1' in text
+    assert "scholion_system_memory_total_bytes " in text
+
+    registry.set_gauge("scholion_cache_hits", 1)
+    with pytest.raises(ValueError, match="changed kind"):
+        registry.render()
+    with pytest.raises(ValueError, match="already a gauge"):
+        registry.increment("scholion_cache_hits")
+    with pytest.raises(ValueError, match="counter values"):
+        MetricSample("scholion_cache_hits", MetricKind.COUNTER, -1)
+
+
+def test_endpoints_are_local_only() -> None:
+    assert MetricsEndpoint.parse("http://127.0.0.1:9464/metrics") == MetricsEndpoint(
+        MetricsTransport.HTTP, host="127.0.0.1", port=9464
+    )
+    assert MetricsEndpoint.parse("unix:/run/scholion.sock").path is not None
+    for value in (
+        "http://0.0.0.0:9464",
+        "http://example.org:9464",
+        "textfile:/var/lib/node_exporter/scholion.txt",
+        "tcp://127.0.0.1:9464",
+        "unix:",
+    ):
+        with pytest.raises(ValueError):
+            MetricsEndpoint.parse(value)
+
+
+def test_http_exporter_negotiates_openmetrics_on_loopback() -> None:
+    registry = MetricsRegistry()
+    registry.increment("scholion_segments_completed", 4)
+    exporter = MetricsExporter(
+        MetricsEndpoint.parse("http://127.0.0.1:0"), registry, RecordingFileManager()
+    )
+
+    with exporter.serving():
+        assert exporter.port is not None
+        connection = http.client.HTTPConnection("127.0.0.1", exporter.port, timeout=5)
+        connection.request(
+            "GET", "/metrics", headers={"Accept": "application/openmetrics-text"}
+        )
+        response = connection.getresponse()
+        body = response.read().decode()
+        connection.request("GET", "/jobs")
+        missing = connection.getresponse()
+        missing.read()
+        connection.close()
+
+    assert response.status == 200
+    assert response.getheader("Content-Type", "").startswith(
+        "application/openmetrics-text"
+    )
+    assert "scholion_segments_completed_total 4" in body
+    assert body.endswith("# EOF\n")
+    assert missing.status == 404
+    assert exporter.port is None
+
+
+def test_unix_socket_exporter_is_private_and_replaces_stale_sockets(
+    tmp_path,
+) -> None:
+    path = tmp_path / "metrics.sock"
+    stale = socket.socket(socket.AF_UNIX)
+    stale.bind(str(path))
+    stale.close()
+    registry = MetricsRegistry()
+    registry.set_gauge("scholion_queue_depth", 2)
+    exporter = MetricsExporter(
+        MetricsEndpoint.parse(f"unix:{path}"), registry, RecordingFileManager()
+    )
+
+    with exporter.serving():
+        assert stat.S_IMODE(path.stat().st_mode) == 0o600
+        client = socket.socket(socket.AF_UNIX)
+        client.connect(str(path))
+        client.sendall(b"GET /metrics HTTP/1.0\r\n\r\n")
+        response = b""
+        while chunk := client.recv(4096):
+            response += chunk
+        client.close()
+
+    assert response.startswith(b"HTTP/1.0 200")
+    assert b"scholion_queue_depth 2" in response
+    assert not path.exists()
+
+
+def test_unix_socket_exporter_creates_only_a_missing_directory(tmp_path) -> None:
+    path = tmp_path / "run" / "metrics.sock"
+    file_manager = RecordingFileManager()
+    exporter = MetricsExporter(
+        MetricsEndpoint.parse(f"unix:{path}"), MetricsRegistry(), file_manager
+    )
+
+    with exporter.serving():
+        assert stat.S_IMODE(path.parent.stat().st_mode) == 0o700
+    with exporter.serving():
+        pass
+
+    assert file_manager.directories == [str(path.parent)]
+
+
+def test_unix_socket_exporter_leaves_a_live_socket_and_its_directory_alone(
+    tmp_path,
+) -> None:
+    tmp_path.chmod(0o755)
+    path = tmp_path / "metrics.sock"
+    live = socket.socket(socket.AF_UNIX)
+    live.bind(str(path))
+    live.listen()
+    file_manager = RecordingFileManager()
+    exporter = MetricsExporter(
+        MetricsEndpoint.parse(f"unix:{path}"), MetricsRegistry(), file_manager
+    )
+
+    try:
+        with pytest.raises(ConfigurationError):
+            exporter.start()
+        client = socket.socket(socket.AF_UNIX)
+        client.connect(str(path))
+        client.close()
+    finally:
+        live.close()
+
+    assert stat.S_IMODE(tmp_path.stat().st_mode) == 0o755
+    assert file_manager.directories == []
+
+
+def test_textfile_exporter_writes_atomically_on_start_and_exit(tmp_path) -> None:
+    registry = MetricsRegistry()
+    file_manager = RecordingFileManager()
+    exporter = MetricsExporter(
+        MetricsEndpoint.parse(f"textfile:{tmp_path / 'scholion.prom'}"),
+        registry,
+        file_manager,
+        interval_seconds=60,
+    )
+
+    with exporter.serving():
+        registry.increment("scholion_segments_completed")
+
+    first, last = file_manager.saved[0], file_manager.saved[-1]
+    assert first[0] == b"\n"
+    assert last == (
+        b"# TYPE scholion_segments_completed_total counter\n"
+        b"scholion_segments_completed_total 1\n",
+        str(tmp_path / "scholion.prom"),
+        False,
+    )
+    assert set(file_manager.modes) == {0o644}
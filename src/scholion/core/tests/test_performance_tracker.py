@@ -29,9 +29,9 @@ def test_unknown_metric_returns_none():
     assert PerformanceTracker().get_metric("missing") is None
 
 
-@patch("scholion.core.performance_tracker.psutil.cpu_count", return_value=8)
+@patch("psutil.cpu_count", return_value=8)
 @patch(
-    "scholion.core.performance_tracker.psutil.virtual_memory",
+    "psutil.virtual_memory",
     return_value=SimpleNamespace(available=1024, total=4096),
 )
 def test_resource_snapshot_is_data_not_a_logging_side_effect(_memory, _cpu):
@@ -0,0 +1,112 @@
+import json
+import threading
+import time
+
+import pytest
+
+from scholion.core.measurements import CombinedExecutionObserver, MeasurementRecorder
+from scholion.core.profiling import ProfilingObserver
+from scholion.core.tests.test_measurements import StepClock
+
+
+class StepRss:
+    def __init__(self) -> None:
+        self.value = 0
+
+    def __call__(self) -> int:
+        self.value += 1024
+        return self.value
+
+
+def _prefetch(profiler: ProfilingObserver) -> None:
+    with profiler.span("prefetch"):
+        pass
+
+
+def test_spans_nest_per_thread_with_rss_deltas_and_counters() -> None:
+    profiler = ProfilingObserver(clock=StepClock(), rss_reader=StepRss(), process_id=7)
+
+    with profiler.span("job"):
+        with profiler.span("segment.transcribe"):
+            profiler.record_value("segments.completed", 1)
+        worker = threading.Thread(target=_prefetch, args=(profiler,), name="prefetch")
+        worker.start()
+        worker.join()
+        with pytest.raises(RuntimeError), profiler.span("artifact.write"):
+            raise RuntimeError("private detail")
+
+    job, transcribe, prefetch, artifact = profiler.spans()
+    assert (job.name, job.parent_id) == ("job", None)
+    assert (prefetch.parent_id, prefetch.thread_id) == (None, worker.native_id)
+    assert transcribe.parent_id == job.span_id
+    assert artifact.parent_id == job.span_id
+    assert artifact.failed and not transcribe.failed
+    assert transcribe.rss_delta_bytes == 1024
+    assert transcribe.thread_id == threading.get_native_id()
+    assert job.start_seconds < transcribe.start_seconds < transcribe.end_seconds
+
+    trace = profiler.to_chrome_trace()
+    document = json.dumps(trace)
+    assert "private detail" not in document
+    events = trace["traceEvents"]
+    assert isinstance(events, list)
+    complete = [event for event in events if event["ph"] == "X"]
+    assert [event["name"] for event in complete] == [
+        "job",
+        "segment.transcribe",
+        "prefetch",
+        "artifact.write",
+    ]
+    assert complete[1]["args"]["parent_id"] == complete[0]["args"]["span_id"]
+    assert complete[1]["dur"] == 2_000_000
+    assert {event["pid"] for event in events} == {7}
+    (counter,) = [event for event in events if event["ph"] == "C"]
+    assert counter["args"] == {"value": 1}
+    thread_names = {
+        event["args"]["name"] for event in events if event["name"] == "thread_name"
+    }
+    assert {threading.current_thread().name, "prefetch"} <= thread_names
+
+
+def test_event_budget_is_bounded_and_combined_with_aggregates() -> None:
+    recorder = MeasurementRecorder(clock=StepClock())
+    profiler = ProfilingObserver(clock=StepClock(), rss_reader=None, max_events=2)
+    observer = CombinedExecutionObserver(recorder, profiler)
+
+    for _ in range(3):
+        with observer.span("segment.transcribe"):
+            pass
+
+    assert recorder.stages()[0].count == 3
+    assert len(profiler.spans()) == 2
+    assert profiler.dropped_events == 1
+    assert profiler.spans()[0].rss_delta_bytes is None
+    assert profiler.to_chrome_trace()["otherData"] == {"dropped_events": 1}
+
+
+def _busy_wait(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def test_named_spans_are_stack_sampled_without_file_paths() -> None:
+    profiler = ProfilingObserver(
+        sampled_spans=frozenset({"segment.transcribe"}),
+        sample_interval_seconds=0.001,
+    )
+
+    with profiler.span("segment.transcribe"):
+        _busy_wait(0.05)
+    with profiler.span("artifact.write"):
+        _busy_wait(0.01)
+
+    (profile,) = profiler.profiles()
+    assert profile.span_id == profiler.spans()[0].span_id
+    assert profile.sample_count > 0
+    assert any(f"{__name__}:_busy_wait" in stack for stack in profile.samples)
+    trace = json.dumps(profiler.to_chrome_trace())
+    assert "/" not in trace and "\\" not in trace
+
+    with pytest.raises(ValueError, match="sample_interval_seconds"):
+        ProfilingObserver(sample_interval_seconds=0)
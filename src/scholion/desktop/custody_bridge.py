@@ -20,6 +20,8 @@ from scholion.desktop.host_protocol import (
     success_response,
 )
 from scholion.library.custody import (
+    BatchDeletionPlan,
+    BatchDeletionReceipt,
     DeletionPlan,
     DeletionReceipt,
     DeletionScope,
@@ -33,6 +35,8 @@ LifecycleMethod = Literal[
     "lifecycle.documents.list",
     "lifecycle.deletion.plan",
     "lifecycle.deletion.execute",
+    "lifecycle.deletion.batch.plan",
+    "lifecycle.deletion.batch.execute",
     "lifecycle.retention.plan",
     "lifecycle.retention.execute",
 ]
@@ -88,11 +92,51 @@ class _DeletionExecuteParams(_DeletionPlanParams):
         return stripped
 
 
+class _BatchDeletionPlanParams(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    document_ids: tuple[str, ...] = Field(min_length=1, max_length=1_000)
+    scopes: tuple[DeletionScope, ...] = Field(min_length=1, max_length=16)
+    allow_source: bool = False
+
+    @field_validator("document_ids")
+    @classmethod
+    def strip_document_ids(cls, values: tuple[str, ...]) -> tuple[str, ...]:
+        stripped = tuple(value.strip() for value in values)
+        if any(not value or len(value) > 1_024 for value in stripped):
+            raise ValueError("document_ids must be non-blank and bounded")
+        if len(stripped) != len(set(stripped)):
+            raise ValueError("document_ids cannot repeat")
+        return stripped
+
+    @field_validator("scopes")
+    @classmethod
+    def unique_scopes(
+        cls, values: tuple[DeletionScope, ...]
+    ) -> tuple[DeletionScope, ...]:
+        if len(values) != len(set(values)):
+            raise ValueError("deletion scopes cannot repeat")
+        return values
+
+
+class _BatchDeletionExecuteParams(_BatchDeletionPlanParams):
+    confirmation_token: str = Field(min_length=1, max_length=4_096)
+
+    @field_validator("confirmation_token")
+    @classmethod
+    def strip_confirmation_token(cls, value: str) -> str:
+        stripped = value.strip()
+        if not stripped:
+            raise ValueError("confirmation_token cannot be blank")
+        return stripped
+
+
 class _RetentionPlanParams(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
     execution_days: int = Field(default=30, ge=0, le=36_500)
     include_incomplete: bool = False
+    reclaim_bytes: int | None = Field(default=None, ge=1)
 
 
 class _RetentionExecuteParams(_RetentionPlanParams):
@@ -152,11 +196,37 @@ def _serialize_deletion_receipt(receipt: DeletionReceipt) -> dict[str, object]:
     }
 
 
+def _serialize_batch_deletion_plan(plan: BatchDeletionPlan) -> dict[str, object]:
+    return {
+        "document_ids": list(plan.document_ids),
+        "requested_scopes": [scope.value for scope in plan.requested_scopes],
+        "effective_scopes": [scope.value for scope in plan.effective_scopes],
+        "plans": [
+            {
+                key: value
+                for key, value in _serialize_deletion_plan(item).items()
+                if key != "confirmation_token"
+            }
+            for item in plan.plans
+        ],
+        "confirmation_token": plan.confirmation_token,
+    }
+
+
+def _serialize_batch_deletion_receipt(
+    receipt: BatchDeletionReceipt,
+) -> dict[str, object]:
+    return {
+        "receipts": [_serialize_deletion_receipt(item) for item in receipt.receipts]
+    }
+
+
 def _serialize_retention_plan(plan: RetentionPlan) -> dict[str, object]:
     return {
         "policy": {
             "execution_days": plan.policy.execution_days,
             "include_incomplete": plan.policy.include_incomplete,
+            "reclaim_bytes": plan.policy.reclaim_bytes,
         },
         "candidates": [
             {
@@ -164,15 +234,20 @@ def _serialize_retention_plan(plan: RetentionPlan) -> dict[str, object]:
                 "status": candidate.status.value,
                 "updated_at": candidate.updated_at,
                 "resume_capability_lost": candidate.resume_capability_lost,
+                "reclaimable_bytes": candidate.reclaimable_bytes,
             }
             for candidate in plan.candidates
         ],
+        "reclaimable_bytes": plan.reclaimable_bytes,
         "confirmation_token": plan.confirmation_token,
     }
 
 
 def _serialize_retention_receipt(receipt: RetentionReceipt) -> dict[str, object]:
-    return {"discarded_job_ids": list(receipt.discarded_job_ids)}
+    return {
+        "discarded_job_ids": list(receipt.discarded_job_ids),
+        "reclaimed_bytes": receipt.reclaimed_bytes,
+    }
 
 
 def dispatch_custody(
@@ -203,6 +278,25 @@ def dispatch_custody(
                 allow_source=deletion_execute.allow_source,
             )
         )
+    if method == "lifecycle.deletion.batch.plan":
+        batch_plan = _BatchDeletionPlanParams.model_validate(params)
+        return _serialize_batch_deletion_plan(
+            service.plan_batch_deletion(
+                batch_plan.document_ids,
+                batch_plan.scopes,
+                allow_source=batch_plan.allow_source,
+            )
+        )
+    if method == "lifecycle.deletion.batch.execute":
+        batch_execute = _BatchDeletionExecuteParams.model_validate(params)
+        return _serialize_batch_deletion_receipt(
+            service.execute_batch_deletion(
+                batch_execute.document_ids,
+                batch_execute.scopes,
+                confirmation_token=batch_execute.confirmation_token,
+                allow_source=batch_execute.allow_source,
+            )
+        )
     if method == "lifecycle.retention.plan":
         retention_plan = _RetentionPlanParams.model_validate(params)
         return _serialize_retention_plan(
@@ -210,6 +304,7 @@ def dispatch_custody(
                 RetentionPolicy(
                     execution_days=retention_plan.execution_days,
                     include_incomplete=retention_plan.include_incomplete,
+                    reclaim_bytes=retention_plan.reclaim_bytes,
                 )
             )
         )
@@ -220,6 +315,7 @@ def dispatch_custody(
                 RetentionPolicy(
                     execution_days=retention_execute.execution_days,
                     include_incomplete=retention_execute.include_incomplete,
+                    reclaim_bytes=retention_execute.reclaim_bytes,
                 ),
                 confirmation_token=retention_execute.confirmation_token,
             )
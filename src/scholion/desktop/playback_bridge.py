@@ -37,6 +37,7 @@ class _AuthorizeParams(BaseModel):
     document_id: str = Field(min_length=1, max_length=1_024)
     canonical_sha256: str = Field(pattern=r"^[0-9a-f]{64}$")
     seek_seconds: float = Field(ge=0)
+    verify: bool = False
 
     @field_validator("document_id")
     @classmethod
@@ -77,6 +78,7 @@ def dispatch_playback(
             parsed.document_id,
             expected_canonical_sha256=parsed.canonical_sha256,
             seek_seconds=parsed.seek_seconds,
+            verify=parsed.verify,
         )
     )
 
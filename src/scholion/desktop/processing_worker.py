@@ -146,11 +146,14 @@ class _ModelRemove(BaseModel):
 
 
 def _runner(container: AppContainer) -> TranscriptionJobRunner:
+    tracing = container.config().TRACE_JOBS
     return TranscriptionJobRunner(
         lifecycle_store=container.job_lifecycle_store(),
         executor_factory=lambda observer: container.transcription_executor(
             observer=observer
         ),
+        trace_file_manager=container.file_manager() if tracing else None,
+        logger=container.logger() if tracing else None,
     )
 
 
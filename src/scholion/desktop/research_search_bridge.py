@@ -23,6 +23,9 @@ from scholion.library.research_workspace import (
 from scholion.library.retrieval import RetrievalMode
 from scholion.library.workspace_metadata import SavedSearch
 
+# Bump when the serialized search page changes shape so materialized pages are not reused.
+_SEARCH_PAGE_FORMAT = "research-search-page-v1"
+
 
 class _SearchIntentParams(BaseModel):
     model_config = ConfigDict(extra="forbid")
@@ -231,6 +234,14 @@ def _serialize_search(
     }
 
 
+def _serialize_saved_run(
+    saved: SavedSearch, response: WorkspaceSearchResponse
+) -> dict[str, object]:
+    return _serialize_search(
+        ResearchSearchIntent.from_saved_intent(saved.intent), response
+    )
+
+
 def dispatch_research_search(
     method: str,
     params: dict[str, object],
@@ -276,9 +287,11 @@ def dispatch_research_search(
         )
     if method == "workspace.research.search.saved.run":
         run_params = _SavedIdentifierParams.model_validate(params)
-        saved, response = service.run_saved_search(run_params.saved_search_id)
-        intent = ResearchSearchIntent.from_saved_intent(saved.intent)
-        return _serialize_search(intent, response)
+        return service.run_saved_search_page(
+            run_params.saved_search_id,
+            render=_serialize_saved_run,
+            page_format=_SEARCH_PAGE_FORMAT,
+        )
     if method == "workspace.research.search.saved.delete":
         delete_params = _DeleteSavedParams.model_validate(params)
         service.delete_saved_search(
@@ -7,6 +7,8 @@ from pydantic import ValidationError
 
 from scholion.desktop.custody_bridge import dispatch_custody, handle_request
 from scholion.library.custody import (
+    BatchDeletionPlan,
+    BatchDeletionReceipt,
     DeletionAction,
     DeletionPlan,
     DeletionReceipt,
@@ -23,6 +25,7 @@ from scholion.workspace.lifecycle import JobStatus
 
 _DELETE_CONFIRMATION = "delete:bound-plan"
 _RETENTION_CONFIRMATION = "retention:bound-plan"
+_BATCH_CONFIRMATION = "delete-batch:bound-plan"
 
 
 class _TranscriptLibrary:
@@ -93,6 +96,46 @@ class _CustodyFake:
             affected_saved_search_ids=("search-1",),
         )
 
+    def plan_batch_deletion(
+        self,
+        document_ids: tuple[str, ...],
+        scopes: tuple[DeletionScope, ...],
+        *,
+        allow_source: bool = False,
+    ) -> BatchDeletionPlan:
+        return BatchDeletionPlan(
+            document_ids=document_ids,
+            requested_scopes=scopes,
+            effective_scopes=scopes,
+            plans=tuple(
+                self.plan_deletion(document_id, scopes, allow_source=allow_source)
+                for document_id in document_ids
+            ),
+            confirmation_token=_BATCH_CONFIRMATION,
+        )
+
+    def execute_batch_deletion(
+        self,
+        document_ids: tuple[str, ...],
+        scopes: tuple[DeletionScope, ...],
+        *,
+        confirmation_token: str,
+        allow_source: bool = False,
+    ) -> BatchDeletionReceipt:
+        assert confirmation_token == _BATCH_CONFIRMATION
+        return BatchDeletionReceipt(
+            confirmation_token=confirmation_token,
+            receipts=tuple(
+                self.execute_deletion(
+                    document_id,
+                    scopes,
+                    confirmation_token=_DELETE_CONFIRMATION,
+                    allow_source=allow_source,
+                )
+                for document_id in document_ids
+            ),
+        )
+
     def plan_retention(self, policy: RetentionPolicy) -> RetentionPlan:
         self.retention_policy = policy
         return RetentionPlan(
@@ -104,6 +147,7 @@ class _CustodyFake:
                     updated_at="2026-07-01T00:00:00+00:00",
                     workspace_path="/private/state/jobs/job-1",
                     resume_capability_lost=True,
+                    reclaimable_bytes=4_096,
                 ),
             ),
             confirmation_token=_RETENTION_CONFIRMATION,
@@ -120,6 +164,7 @@ class _CustodyFake:
         return RetentionReceipt(
             confirmation_token=confirmation_token,
             discarded_job_ids=("job-1",),
+            reclaimed_bytes=4_096,
         )
 
 
@@ -191,6 +236,37 @@ def test_deletion_execute_forwards_exact_plan_confirmation() -> None:
     }
 
 
+def test_batch_deletion_exposes_one_confirmation_and_no_paths() -> None:
+    fake = _CustodyFake()
+    plan = dispatch_custody(
+        "lifecycle.deletion.batch.plan",
+        {"document_ids": [" doc-1 ", "doc-2"], "scopes": ["canonical-transcript"]},
+        _service(fake),
+    )
+
+    assert isinstance(plan, dict)
+    assert plan["document_ids"] == ["doc-1", "doc-2"]
+    assert plan["confirmation_token"] == _BATCH_CONFIRMATION
+    assert _DELETE_CONFIRMATION not in repr(plan)
+    assert "/private/" not in repr(plan)
+
+    receipt = dispatch_custody(
+        "lifecycle.deletion.batch.execute",
+        {
+            "document_ids": ["doc-1", "doc-2"],
+            "scopes": ["canonical-transcript"],
+            "confirmation_token": _BATCH_CONFIRMATION,
+        },
+        _service(fake),
+    )
+
+    assert isinstance(receipt, dict)
+    assert [item["document_id"] for item in receipt["receipts"]] == [
+        "doc-1",
+        "doc-2",
+    ]
+
+
 def test_retention_plan_omits_private_workspace_path_and_reports_resume_loss() -> None:
     fake = _CustodyFake()
     result = dispatch_custody(
@@ -206,8 +282,10 @@ def test_retention_plan_omits_private_workspace_path_and_reports_resume_loss() -
             "status": "interrupted",
             "updated_at": "2026-07-01T00:00:00+00:00",
             "resume_capability_lost": True,
+            "reclaimable_bytes": 4_096,
         }
     ]
+    assert result["reclaimable_bytes"] == 4_096
     assert fake.retention_policy == RetentionPolicy(
         execution_days=45,
         include_incomplete=True,
@@ -228,7 +306,7 @@ def test_retention_execute_forwards_reviewed_policy_and_token() -> None:
         _service(fake),
     )
 
-    assert result == {"discarded_job_ids": ["job-1"]}
+    assert result == {"discarded_job_ids": ["job-1"], "reclaimed_bytes": 4_096}
     assert fake.retention_policy == RetentionPolicy(execution_days=30)
 
 
@@ -243,6 +321,10 @@ def test_retention_execute_forwards_reviewed_policy_and_token() -> None:
                 "scopes": ["library-view", "library-view"],
             },
         ),
+        (
+            "lifecycle.deletion.batch.plan",
+            {"document_ids": ["doc-1", "doc-1"], "scopes": ["library-view"]},
+        ),
         (
             "lifecycle.retention.plan",
             {"execution_days": 36_501, "include_incomplete": False},
@@ -20,6 +20,7 @@ class PlaybackStub:
         *,
         expected_canonical_sha256: str,
         seek_seconds: float,
+        verify: bool = False,
     ) -> PlaybackGrant:
         self.calls.append((document_id, expected_canonical_sha256, seek_seconds))
         return PlaybackGrant(
@@ -44,6 +45,7 @@ class PlaybackFailureStub(PlaybackStub):
         *,
         expected_canonical_sha256: str,
         seek_seconds: float,
+        verify: bool = False,
     ) -> PlaybackGrant:
         raise PlaybackAuthorizationError("Original recording does not match")
 
@@ -55,6 +57,7 @@ class UnexpectedFailureStub(PlaybackStub):
         *,
         expected_canonical_sha256: str,
         seek_seconds: float,
+        verify: bool = False,
     ) -> PlaybackGrant:
         raise RuntimeError("private source path detail")
 
@@ -7,6 +7,7 @@ from typing import Any, cast
 
 import pytest
 
+from scholion.core.config import AppConfig
 from scholion.desktop import processing_worker as worker
 from scholion.runner.models import ProcessingProfile
 from scholion.transcription.export import TranscriptExportFormat
@@ -66,6 +67,18 @@ class _Container:
         self.lifecycle = _Lifecycle()
         self.models = _ModelManager()
         self.executor_observers: list[object] = []
+        self.settings = AppConfig()
+        self.files = object()
+        self.log = object()
+
+    def config(self) -> AppConfig:
+        return self.settings
+
+    def file_manager(self) -> object:
+        return self.files
+
+    def logger(self) -> object:
+        return self.log
 
     def transcription_planner(self) -> _Planner:
         return self.planner
@@ -301,6 +314,18 @@ def test_worker_runner_uses_existing_lifecycle_and_executor_authorities() -> Non
     assert result.lifecycle_store is container.lifecycle
     assert executor == "executor"
     assert len(container.executor_observers) == 1
+    assert result.trace_file_manager is None
+    assert result.logger is None
+
+
+def test_worker_runner_traces_jobs_when_configured() -> None:
+    container = _Container()
+    container.settings = AppConfig(TRACE_JOBS=True)
+
+    result = worker._runner(cast(Any, container))
+
+    assert result.trace_file_manager is container.files
+    assert result.logger is container.log
 
 
 def test_publish_is_noop_without_formats_and_rejects_unexpected_result() -> None:
@@ -1,4 +1,20 @@
-from scholion.interfaces.base_file_manager import FileManager, FileMetadata
-from scholion.interfaces.local_file_manager import LocalFileManager
+from typing import TYPE_CHECKING
+
+from scholion.core.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from scholion.interfaces.base_file_manager import FileManager, FileMetadata
+    from scholion.interfaces.local_file_manager import LocalFileManager
 
 __all__ = ["FileManager", "FileMetadata", "LocalFileManager"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "scholion.interfaces.base_file_manager": (
+            "FileManager",
+            "FileMetadata",
+        ),
+        "scholion.interfaces.local_file_manager": ("LocalFileManager",),
+    },
+)
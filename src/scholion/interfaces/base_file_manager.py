@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Protocol, TypedDict, runtime_checkable
 
@@ -13,8 +14,22 @@ class FileManager(Protocol):
     """Local storage capability consumed by the application service."""
 
     def save_file(
-        self, content: bytes, file_path: str | Path, *, private: bool = False
+        self,
+        content: bytes,
+        file_path: str | Path,
+        *,
+        private: bool = False,
+        durable: bool = True,
+        mode: int | None = None,
     ) -> None: ...
+    def save_stream(
+        self,
+        chunks: Iterable[bytes],
+        file_path: str | Path,
+        *,
+        private: bool = False,
+        durable: bool = True,
+    ) -> str: ...
     def read_file(self, file_path: str | Path) -> bytes: ...
     def file_exists(self, file_path: str | Path) -> bool: ...
     def get_file_metadata(self, file_path: str | Path) -> FileMetadata: ...
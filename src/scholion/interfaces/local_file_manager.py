@@ -1,6 +1,9 @@
 import os
 import shutil
 import tempfile
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from hashlib import sha256
 from pathlib import Path
 
 from scholion.core.errors import (
@@ -32,27 +35,100 @@ class LocalFileManager:
         self.private_storage = private_storage or default_private_storage_policy()
 
     def save_file(
-        self, content: bytes, file_path: str | Path, *, private: bool = False
+        self,
+        content: bytes,
+        file_path: str | Path,
+        *,
+        private: bool = False,
+        durable: bool = True,
+        mode: int | None = None,
+    ) -> None:
+        """Atomically replace ``file_path``; ``durable=False`` skips the fsync.
+
+        Non-durable writes still never expose a torn file to readers, but may be lost
+        on power failure. They suit frequently rewritten, disposable status files.
+        ``mode`` publishes a shared file with explicit permissions, for files another
+        account has to read. ``private`` takes precedence; without either, the file keeps
+        the owner-only mode of its temporary file.
+        """
+        self._replace_file(
+            file_path,
+            lambda write_chunk: write_chunk(content),
+            private=private,
+            durable=durable,
+            mode=mode,
+        )
+
+    def save_stream(
+        self,
+        chunks: Iterable[bytes],
+        file_path: str | Path,
+        *,
+        private: bool = False,
+        durable: bool = True,
+    ) -> str:
+        """Atomically replace ``file_path`` with ``chunks`` and return their SHA-256.
+
+        Chunks are hashed as they are written, so the content is never held whole and
+        never read back. A durable write still fsyncs once, after the last chunk. An
+        exception raised by ``chunks`` itself propagates unchanged; only filesystem
+        failures become ``StorageError``.
+        """
+        digest = sha256()
+
+        def fill(write_chunk: Callable[[bytes], None]) -> None:
+            for chunk in chunks:
+                digest.update(chunk)
+                write_chunk(chunk)
+
+        self._replace_file(file_path, fill, private=private, durable=durable, mode=None)
+        return digest.hexdigest()
+
+    def _replace_file(
+        self,
+        file_path: str | Path,
+        fill: Callable[[Callable[[bytes], None]], object],
+        *,
+        private: bool,
+        durable: bool,
+        mode: int | None,
     ) -> None:
         destination = Path(file_path).absolute()
         temporary_path: Path | None = None
         try:
-            with tempfile.NamedTemporaryFile(
-                mode="wb", delete=False, dir=destination.parent
-            ) as temporary_file:
+            with self._storage_errors("write", destination):
+                # Entered below, outside the wrapper, so producer errors stay raw.
+                temporary_file = tempfile.NamedTemporaryFile(  # noqa: SIM115
+                    mode="wb", delete=False, dir=destination.parent
+                )
+            with temporary_file:
                 temporary_path = Path(temporary_file.name)
+                with self._storage_errors("write", destination):
+                    if private:
+                        self.private_storage.protect_file(temporary_path)
+                    elif mode is not None:
+                        os.chmod(temporary_path, mode)
+
+                def write_chunk(chunk: bytes) -> None:
+                    try:
+                        temporary_file.write(chunk)
+                    except Exception as exc:
+                        raise self._error("write", destination, exc) from exc
+
+                fill(write_chunk)
+                with self._storage_errors("write", destination):
+                    temporary_file.flush()
+                    if durable:
+                        os.fsync(temporary_file.fileno())
+            with self._storage_errors("write", destination):
+                os.replace(temporary_path, destination)
                 if private:
-                    self.private_storage.protect_file(temporary_path)
-                temporary_file.write(content)
-                temporary_file.flush()
-                os.fsync(temporary_file.fileno())
-            os.replace(temporary_path, destination)
-            if private:
-                self.private_storage.protect_file(destination)
-        except Exception as exc:
+                    self.private_storage.protect_file(destination)
+        except BaseException:
+            # Interrupts and producer errors must not leave a temporary sibling behind.
             if temporary_path is not None:
                 temporary_path.unlink(missing_ok=True)
-            raise self._error("write", destination, exc) from exc
+            raise
 
     def read_file(self, file_path: str | Path) -> bytes:
         path = Path(file_path)
@@ -161,6 +237,13 @@ class LocalFileManager:
             return f"_{sanitized}"
         return sanitized
 
+    @contextmanager
+    def _storage_errors(self, operation: str, path: Path) -> Iterator[None]:
+        try:
+            yield
+        except Exception as exc:
+            raise self._error(operation, path, exc) from exc
+
     @staticmethod
     def _error(operation: str, path: Path, exc: Exception) -> StorageError:
         if isinstance(exc, FileExistsError):
@@ -1,3 +1,4 @@
+import hashlib
 import os
 from concurrent.futures import ProcessPoolExecutor
 from itertools import repeat
@@ -83,6 +84,18 @@ def test_private_file_writes_are_owner_only(manager, tmp_path):
     assert destination.stat().st_mode & 0o777 == 0o600
 
 
+@pytest.mark.skipif(os.name == "nt", reason="POSIX mode contract")
+def test_only_an_explicit_mode_widens_a_shared_file(manager, tmp_path):
+    transcript = tmp_path / "transcript.json"
+    metrics = tmp_path / "scholion.prom"
+
+    manager.save_file(b"text", transcript)
+    manager.save_file(b"metrics", metrics, durable=False, mode=0o644)
+
+    assert transcript.stat().st_mode & 0o777 == 0o600
+    assert metrics.stat().st_mode & 0o777 == 0o644
+
+
 def test_private_operations_delegate_to_platform_policy(tmp_path):
     policy = Mock()
     manager = LocalFileManager(private_storage=policy)
@@ -216,3 +229,45 @@ def test_list_excludes_nested_files(manager, tmp_path):
     nested.mkdir()
     (nested / "hidden.txt").write_text("hidden")
     assert manager.list_files(tmp_path) == []
+
+
+def test_streamed_write_returns_the_digest_of_the_bytes_written(manager, tmp_path):
+    destination = tmp_path / "transcript.json"
+
+    digest = manager.save_stream(iter((b"{", b'"a":1', b"}\n")), destination)
+
+    assert destination.read_bytes() == b'{"a":1}\n'
+    assert digest == hashlib.sha256(b'{"a":1}\n').hexdigest()
+
+
+@pytest.mark.parametrize(
+    "failure", [TypeError("not serializable"), KeyboardInterrupt(), OSError("source")]
+)
+def test_failed_stream_cleans_temp_and_preserves_destination(
+    manager, tmp_path, failure
+):
+    destination = tmp_path / "existing.json"
+    destination.write_bytes(b"original")
+    before = set(tmp_path.iterdir())
+
+    def chunks():
+        yield b"partial"
+        raise failure
+
+    with pytest.raises(type(failure)) as raised:
+        manager.save_stream(chunks(), destination)
+    assert raised.value is failure
+    assert destination.read_bytes() == b"original"
+    assert set(tmp_path.iterdir()) == before
+
+
+def test_stream_write_failures_are_storage_errors(manager, tmp_path, monkeypatch):
+    destination = tmp_path / "transcript.json"
+
+    def fail_fsync(descriptor):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "fsync", fail_fsync)
+    with pytest.raises(StorageError):
+        manager.save_stream(iter((b"{}\n",)), destination)
+    assert list(tmp_path.iterdir()) == []
@@ -1,56 +1,62 @@
 """Local evidence-first transcript library and rebuildable search contracts."""
 
-from scholion.library.duckdb_index import DuckDbTranscriptIndex
-from scholion.library.duckdb_semantic import DuckDbSemanticIndex
-from scholion.library.evidence import (
-    EvidenceContextSegment,
-    EvidenceLocation,
-    EvidenceLocator,
-    EvidenceWord,
-)
-from scholion.library.index import (
-    IndexedDocument,
-    IndexedSegment,
-    IndexedTranscript,
-    SearchOperator,
-    SearchQuery,
-    SearchSort,
-    TranscriptIndex,
-    TranscriptMatch,
-)
-from scholion.library.research import (
-    LocatedSearchPassage,
-    ResearchNavigationService,
-    ResearchSearchResponse,
-    SpeakerDisplay,
-)
-from scholion.library.retrieval import (
-    LexicalRetriever,
-    RetrievalMode,
-    SearchPassage,
-    SearchResponse,
-    TranscriptSearch,
-)
-from scholion.library.semantic import (
-    ChunkingProfile,
-    EmbeddingProfile,
-    EmbeddingProvider,
-    EmbeddingVector,
-    SearchChunk,
-    SemanticCandidate,
-    SemanticIndex,
-    SemanticState,
-    SentenceTransformersE5Provider,
-    build_search_chunks,
-    corpus_fingerprint,
-)
-from scholion.library.service import (
-    LibraryEvidenceReceipt,
-    LibraryRebuildReport,
-    SemanticRebuildReport,
-    SourceIntegrity,
-    TranscriptLibraryService,
-)
+from typing import TYPE_CHECKING
+
+from scholion.core.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from scholion.library.duckdb_index import DuckDbTranscriptIndex
+    from scholion.library.duckdb_semantic import DuckDbSemanticIndex
+    from scholion.library.evidence import (
+        EvidenceContextSegment,
+        EvidenceLocation,
+        EvidenceLocator,
+        EvidenceWord,
+    )
+    from scholion.library.index import (
+        EvidenceScope,
+        IndexedDocument,
+        IndexedSegment,
+        IndexedTranscript,
+        SearchOperator,
+        SearchQuery,
+        SearchSort,
+        TranscriptIndex,
+        TranscriptMatch,
+    )
+    from scholion.library.research import (
+        LocatedSearchPassage,
+        ResearchNavigationService,
+        ResearchSearchResponse,
+        SpeakerDisplay,
+    )
+    from scholion.library.retrieval import (
+        LexicalRetriever,
+        RetrievalMode,
+        SearchPassage,
+        SearchResponse,
+        TranscriptSearch,
+    )
+    from scholion.library.semantic import (
+        ChunkingProfile,
+        EmbeddingProfile,
+        EmbeddingProvider,
+        EmbeddingVector,
+        SearchChunk,
+        SemanticCandidate,
+        SemanticIndex,
+        SemanticState,
+        SentenceTransformersE5Provider,
+        build_search_chunks,
+        corpus_fingerprint,
+    )
+    from scholion.library.service import (
+        LibraryEvidenceReceipt,
+        LibraryRebuildReport,
+        SemanticRebuildReport,
+        SourceIntegrity,
+        TranscriptLibraryService,
+    )
 
 __all__ = [
     "ChunkingProfile",
@@ -62,6 +68,7 @@ __all__ = [
     "EvidenceContextSegment",
     "EvidenceLocation",
     "EvidenceLocator",
+    "EvidenceScope",
     "EvidenceWord",
     "IndexedDocument",
     "IndexedSegment",
@@ -93,3 +100,61 @@ __all__ = [
     "build_search_chunks",
     "corpus_fingerprint",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "scholion.library.duckdb_index": ("DuckDbTranscriptIndex",),
+        "scholion.library.duckdb_semantic": ("DuckDbSemanticIndex",),
+        "scholion.library.evidence": (
+            "EvidenceContextSegment",
+            "EvidenceLocation",
+            "EvidenceLocator",
+            "EvidenceWord",
+        ),
+        "scholion.library.index": (
+            "EvidenceScope",
+            "IndexedDocument",
+            "IndexedSegment",
+            "IndexedTranscript",
+            "SearchOperator",
+            "SearchQuery",
+            "SearchSort",
+            "TranscriptIndex",
+            "TranscriptMatch",
+        ),
+        "scholion.library.research": (
+            "LocatedSearchPassage",
+            "ResearchNavigationService",
+            "ResearchSearchResponse",
+            "SpeakerDisplay",
+        ),
+        "scholion.library.retrieval": (
+            "LexicalRetriever",
+            "RetrievalMode",
+            "SearchPassage",
+            "SearchResponse",
+            "TranscriptSearch",
+        ),
+        "scholion.library.semantic": (
+            "ChunkingProfile",
+            "EmbeddingProfile",
+            "EmbeddingProvider",
+            "EmbeddingVector",
+            "SearchChunk",
+            "SemanticCandidate",
+            "SemanticIndex",
+            "SemanticState",
+            "SentenceTransformersE5Provider",
+            "build_search_chunks",
+            "corpus_fingerprint",
+        ),
+        "scholion.library.service": (
+            "LibraryEvidenceReceipt",
+            "LibraryRebuildReport",
+            "SemanticRebuildReport",
+            "SourceIntegrity",
+            "TranscriptLibraryService",
+        ),
+    },
+)
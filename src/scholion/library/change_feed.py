@@ -0,0 +1,165 @@
+"""Directory change feeds for library refresh and watch mode.
+
+Scholion never requires inotify. On other platforms, or when the kernel refuses a watch,
+callers fall back to stat-based polling of the same directories. Both feeds report
+only *which directories* were touched; every decision about what changed is still made
+by re-reading filesystem state, so a dropped or coalesced event can only cause extra
+verification, never a missed one (queue overflow is reported as "unknown").
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import struct
+import sys
+from pathlib import Path
+
+from scholion.library.refresh_journal import DirectorySignature, capture_directory
+
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_WATCH_MASK = (
+    _IN_MODIFY
+    | _IN_ATTRIB
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+    | _IN_DELETE_SELF
+    | _IN_MOVE_SELF
+    | _IN_ONLYDIR
+)
+_EVENT_HEADER = struct.Struct("iIII")
+_READ_BUFFER_BYTES = 64 * 1024
+
+
+class InotifyChangeFeed:
+    """Report directories touched since the previous drain using Linux inotify."""
+
+    def __init__(self) -> None:
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is only available on Linux")
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        descriptor = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if descriptor < 0:
+            raise OSError(ctypes.get_errno(), "inotify could not be initialized")
+        self._descriptor: int | None = descriptor
+        self._directories: dict[int, Path] = {}
+        self._touched: set[Path] = set()
+        self._overflowed = False
+
+    @classmethod
+    def create(cls) -> InotifyChangeFeed | None:
+        """Return a feed when the platform supports it, otherwise None."""
+        try:
+            return cls()
+        except (OSError, AttributeError):
+            return None
+
+    def fileno(self) -> int:
+        return self._require_open()
+
+    def watch(self, directories: tuple[Path, ...]) -> None:
+        descriptor = self._require_open()
+        known = set(self._directories.values())
+        for directory in directories:
+            resolved = directory.expanduser().resolve(strict=False)
+            if resolved in known:
+                continue
+            watch_id = self._libc.inotify_add_watch(
+                descriptor, os.fsencode(resolved), _WATCH_MASK
+            )
+            if watch_id < 0:
+                continue
+            self._directories[watch_id] = resolved
+            known.add(resolved)
+
+    def watched(self) -> frozenset[Path]:
+        return frozenset(self._directories.values())
+
+    def drain(self) -> frozenset[Path] | None:
+        self._read_pending()
+        touched = frozenset(self._touched)
+        overflowed = self._overflowed
+        self._touched.clear()
+        self._overflowed = False
+        return None if overflowed else touched
+
+    def close(self) -> None:
+        if self._descriptor is None:
+            return
+        os.close(self._descriptor)
+        self._descriptor = None
+        self._directories.clear()
+
+    def _read_pending(self) -> None:
+        descriptor = self._require_open()
+        while True:
+            try:
+                buffer = os.read(descriptor, _READ_BUFFER_BYTES)
+            except BlockingIOError:
+                return
+            if not buffer:
+                return
+            self._consume(buffer)
+
+    def _consume(self, buffer: bytes) -> None:
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(buffer):
+            watch_id, mask, _cookie, length = _EVENT_HEADER.unpack_from(buffer, offset)
+            offset += _EVENT_HEADER.size + length
+            if mask & _IN_Q_OVERFLOW:
+                self._overflowed = True
+                continue
+            directory = self._directories.get(watch_id)
+            if directory is None:
+                continue
+            self._touched.add(directory)
+            if mask & _IN_IGNORED:
+                del self._directories[watch_id]
+
+    def _require_open(self) -> int:
+        if self._descriptor is None:
+            raise OSError("inotify change feed is closed")
+        return self._descriptor
+
+
+class PollingChangeFeed:
+    """Report directories whose stat signature changed since the previous drain."""
+
+    def __init__(self) -> None:
+        self._signatures: dict[Path, DirectorySignature] = {}
+
+    def watch(self, directories: tuple[Path, ...]) -> None:
+        for directory in directories:
+            resolved = directory.expanduser().resolve(strict=False)
+            if resolved not in self._signatures:
+                self._signatures[resolved] = capture_directory(resolved)
+
+    def watched(self) -> frozenset[Path]:
+        return frozenset(self._signatures)
+
+    def drain(self) -> frozenset[Path] | None:
+        touched: set[Path] = set()
+        for directory, previous in self._signatures.items():
+            current = capture_directory(directory)
+            if current != previous:
+                self._signatures[directory] = current
+                touched.add(directory)
+        return frozenset(touched)
+
+    def close(self) -> None:
+        self._signatures.clear()
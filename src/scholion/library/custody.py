@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import hashlib
-from dataclasses import dataclass
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from datetime import UTC, datetime, timedelta
 from enum import StrEnum
 from pathlib import Path
@@ -19,15 +21,20 @@ from scholion.library.service import (
     TranscriptLibraryService,
 )
 from scholion.library.workspace_metadata import WorkspaceMetadataStore
+from scholion.library.workspace_usage import WorkspaceUsageMeter
+from scholion.workspace.errors import JobNotFoundError, UnsafePathError
 from scholion.workspace.lifecycle import (
     JobLifecycleRecord,
     JobLifecycleStore,
     JobStatus,
 )
-from scholion.workspace.models import WorkspacePaths
+from scholion.workspace.models import JobId, WorkspacePaths
 
 _DERIVED_EXPORT_SUFFIXES = (".txt", ".srt", ".vtt")
 _MAX_RESEARCH_OBJECTS = 10_000
+_MAX_BATCH_DOCUMENTS = 1_000
+_DEFAULT_DELETION_WORKERS = 4
+_RETENTION_PAGE_SIZE = 256
 
 
 class DeletionScope(StrEnum):
@@ -114,16 +121,53 @@ class DeletionReceipt:
     affected_saved_search_ids: tuple[str, ...]
 
 
+@dataclass(frozen=True, slots=True)
+class BatchDeletionPlan:
+    """Per-document deletion plans reviewed and confirmed with one token."""
+
+    document_ids: tuple[str, ...]
+    requested_scopes: tuple[DeletionScope, ...]
+    effective_scopes: tuple[DeletionScope, ...]
+    plans: tuple[DeletionPlan, ...]
+    confirmation_token: str
+
+    def __post_init__(self) -> None:
+        if not self.document_ids:
+            raise ValueError("batch deletion plan needs at least one document")
+        if tuple(plan.document_id for plan in self.plans) != self.document_ids:
+            raise ValueError("batch deletion plans must follow document order")
+        if not self.confirmation_token.strip():
+            raise ValueError("batch deletion confirmation token cannot be empty")
+
+
+@dataclass(frozen=True, slots=True)
+class BatchDeletionReceipt:
+    """Completed per-document mutations after one batch confirmation succeeded."""
+
+    confirmation_token: str
+    receipts: tuple[DeletionReceipt, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class _SharedLookups:
+    notes: dict[str, tuple[ResearchNote, ...]]
+    saved_search_ids: dict[str, tuple[str, ...]]
+    semantic_active: bool
+
+
 @dataclass(frozen=True, slots=True)
 class RetentionPolicy:
     """Automatic-retention policy restricted to private execution workspaces."""
 
     execution_days: int = 30
     include_incomplete: bool = False
+    reclaim_bytes: int | None = None
 
     def __post_init__(self) -> None:
         if self.execution_days < 0 or self.execution_days > 36_500:
             raise ValueError("execution retention days must be between 0 and 36500")
+        if self.reclaim_bytes is not None and self.reclaim_bytes < 1:
+            raise ValueError("retention byte budget must be positive")
 
 
 @dataclass(frozen=True, slots=True)
@@ -133,10 +177,13 @@ class RetentionCandidate:
     updated_at: str
     workspace_path: str
     resume_capability_lost: bool
+    reclaimable_bytes: int = 0
 
     def __post_init__(self) -> None:
         if not self.job_id.strip() or not self.workspace_path.strip():
             raise ValueError("retention candidate identity and path cannot be empty")
+        if self.reclaimable_bytes < 0:
+            raise ValueError("retention candidate size cannot be negative")
 
 
 @dataclass(frozen=True, slots=True)
@@ -151,11 +198,16 @@ class RetentionPlan:
         if not self.confirmation_token.strip():
             raise ValueError("retention confirmation token cannot be empty")
 
+    @property
+    def reclaimable_bytes(self) -> int:
+        return sum(item.reclaimable_bytes for item in self.candidates)
+
 
 @dataclass(frozen=True, slots=True)
 class RetentionReceipt:
     confirmation_token: str
     discarded_job_ids: tuple[str, ...]
+    reclaimed_bytes: int = 0
 
 
 class LibraryCustodyService:
@@ -171,6 +223,7 @@ class LibraryCustodyService:
         workspace_metadata: WorkspaceMetadataStore,
         paths: WorkspacePaths,
         file_manager: FileManagerFacade,
+        workspace_usage: WorkspaceUsageMeter | None = None,
     ) -> None:
         self.transcript_library = transcript_library
         self.lexical_index = lexical_index
@@ -180,6 +233,7 @@ class LibraryCustodyService:
         self.workspace_metadata = workspace_metadata
         self.paths = paths
         self.file_manager = file_manager
+        self.workspace_usage = workspace_usage or WorkspaceUsageMeter()
 
     def plan_deletion(
         self,
@@ -191,12 +245,72 @@ class LibraryCustodyService:
         requested = self._normalized_scopes(scopes)
         effective = self._effective_scopes(requested)
         receipt = self.transcript_library.inspect(document_id)
-        document = receipt.document
-        canonical_sha256 = self._canonical_digest(document)
+        canonical_sha256 = self._canonical_digest(receipt.document)
         self._validate_source_request(receipt, effective, allow_source=allow_source)
+        lookups = _SharedLookups(
+            notes={document_id: self._generation_notes(document_id, canonical_sha256)},
+            saved_search_ids={
+                document_id: self._affected_saved_search_ids(document_id)
+            },
+            semantic_active=self._semantic_active(effective),
+        )
+        return self._document_plan(receipt, requested, effective, lookups)
 
-        notes = self._generation_notes(document_id, canonical_sha256)
-        saved_search_ids = self._affected_saved_search_ids(document_id)
+    def plan_batch_deletion(
+        self,
+        document_ids: tuple[str, ...],
+        scopes: tuple[DeletionScope, ...],
+        *,
+        allow_source: bool = False,
+    ) -> BatchDeletionPlan:
+        """Plan the same custody scopes for many transcripts with shared lookups.
+
+        The index, saved searches, notes, and semantic state are each read once for the
+        whole batch, and source recordings are only fingerprinted when the source scope
+        is requested (reusing cached fingerprints for unchanged files).
+        """
+        ordered = self._batch_document_ids(document_ids)
+        requested = self._normalized_scopes(scopes)
+        effective = self._effective_scopes(requested)
+        receipts = self.transcript_library.inspect_many(
+            ordered,
+            verify_source=DeletionScope.SOURCE_RECORDING in effective,
+        )
+        digests = {
+            receipt.document.document_id: self._canonical_digest(receipt.document)
+            for receipt in receipts
+        }
+        for receipt in receipts:
+            self._validate_source_request(receipt, effective, allow_source=allow_source)
+        lookups = _SharedLookups(
+            notes=self._generation_notes_many(digests),
+            saved_search_ids=self._affected_saved_search_ids_many(ordered),
+            semantic_active=self._semantic_active(effective),
+        )
+        plans = tuple(
+            self._document_plan(receipt, requested, effective, lookups)
+            for receipt in receipts
+        )
+        return BatchDeletionPlan(
+            document_ids=ordered,
+            requested_scopes=requested,
+            effective_scopes=effective,
+            plans=plans,
+            confirmation_token=self._batch_token(plans),
+        )
+
+    def _document_plan(
+        self,
+        receipt: LibraryEvidenceReceipt,
+        requested: tuple[DeletionScope, ...],
+        effective: tuple[DeletionScope, ...],
+        lookups: _SharedLookups,
+    ) -> DeletionPlan:
+        document = receipt.document
+        document_id = document.document_id
+        canonical_sha256 = self._canonical_digest(document)
+        notes = lookups.notes.get(document_id, ())
+        saved_search_ids = lookups.saved_search_ids.get(document_id, ())
         preserved_note_ids = (
             ()
             if DeletionScope.RESEARCH_NOTES in effective
@@ -208,6 +322,7 @@ class LibraryCustodyService:
             scopes=effective,
             note_ids=tuple(note.note_id for note in notes),
             saved_search_ids=saved_search_ids,
+            semantic_active=lookups.semantic_active,
         )
         token = self._deletion_token(
             document_id,
@@ -256,33 +371,155 @@ class LibraryCustodyService:
             affected_saved_search_ids=plan.affected_saved_search_ids,
         )
 
-    def plan_retention(
+    def execute_batch_deletion(
+        self,
+        document_ids: tuple[str, ...],
+        scopes: tuple[DeletionScope, ...],
+        *,
+        confirmation_token: str,
+        allow_source: bool = False,
+        max_workers: int = _DEFAULT_DELETION_WORKERS,
+    ) -> BatchDeletionReceipt:
+        """Re-plan, confirm, then apply every plan phase by phase across the batch.
+
+        Phases keep the single-document order (rebuildable indexes, disposable files,
+        canonical evidence, source recordings, then authoritative user state). File
+        deletions inside a phase run on at most ``max_workers`` threads; a phase starts
+        only after the previous one fully succeeded.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be positive")
+        batch = self.plan_batch_deletion(
+            document_ids, scopes, allow_source=allow_source
+        )
+        if confirmation_token != batch.confirmation_token:
+            raise CustodyOperationError(
+                "Deletion plan changed or confirmation token is invalid; "
+                "review the plan again"
+            )
+        for plan in batch.plans:
+            self._validate_destructive_inputs(plan)
+        actions = tuple(action for plan in batch.plans for action in plan.actions)
+
+        lexical = [
+            action
+            for action in actions
+            if action.target is DeletionTarget.LEXICAL_INDEX
+        ]
+        for action in lexical:
+            self.lexical_index.remove(action.object_id)
+        if lexical:
+            self.transcript_library.invalidate_refresh_journal()
+        if self.semantic_index is not None and any(
+            action.target is DeletionTarget.SEMANTIC_INDEX for action in actions
+        ):
+            self.semantic_index.clear()
+        for targets in (
+            {DeletionTarget.DERIVED_ARTIFACT, DeletionTarget.EXECUTION_STATE},
+            {DeletionTarget.CANONICAL_TRANSCRIPT},
+            {DeletionTarget.SOURCE_RECORDING},
+        ):
+            self._execute_parallel(
+                tuple(action for action in actions if action.target in targets),
+                max_workers=max_workers,
+            )
+        for target, delete in (
+            (DeletionTarget.SAVED_SEARCH, self.workspace_metadata.delete_saved_search),
+            (DeletionTarget.RESEARCH_NOTE, self.research_state.delete_note),
+        ):
+            self._execute_unique(actions, target, delete)
+        return BatchDeletionReceipt(
+            confirmation_token=batch.confirmation_token,
+            receipts=tuple(
+                DeletionReceipt(
+                    document_id=plan.document_id,
+                    confirmation_token=plan.confirmation_token,
+                    executed_targets=tuple(action.target for action in plan.actions),
+                    preserved_note_ids=plan.preserved_note_ids,
+                    affected_saved_search_ids=plan.affected_saved_search_ids,
+                )
+                for plan in batch.plans
+            ),
+        )
+
+    def iter_retention_candidates(
         self,
         policy: RetentionPolicy,
         *,
         now: datetime | None = None,
-    ) -> RetentionPlan:
+    ) -> Iterator[RetentionCandidate]:
+        """Stream eligible workspaces oldest first, each with its measured size.
+
+        Lifecycle records are read one keyset page at a time from the registry index,
+        and each page's workspaces are measured concurrently before it is yielded, so a
+        caller that stops early never reads or measures the rest of the history.
+        """
         current = self._aware_now(now)
         cutoff = current - timedelta(days=policy.execution_days)
-        candidates = tuple(
-            candidate
-            for record in self.lifecycle_store.list_records()
-            if (
-                candidate := self._retention_candidate(
-                    record,
-                    cutoff=cutoff,
-                    include_incomplete=policy.include_incomplete,
+        statuses = (
+            (JobStatus.COMPLETED, JobStatus.INTERRUPTED, JobStatus.FAILED)
+            if policy.include_incomplete
+            else (JobStatus.COMPLETED,)
+        )
+        after = None
+        while True:
+            page = self.lifecycle_store.list_page(
+                statuses=statuses,
+                updated_before=cutoff,
+                after=after,
+                limit=_RETENTION_PAGE_SIZE,
+                oldest_first=True,
+            )
+            candidates = [
+                candidate
+                for record in page.records
+                if (
+                    candidate := self._retention_candidate(
+                        record,
+                        cutoff=cutoff,
+                        include_incomplete=policy.include_incomplete,
+                    )
                 )
+                is not None
+            ]
+            sizes = self.workspace_usage.measure(
+                {Path(item.workspace_path): item.updated_at for item in candidates}
             )
-            is not None
-        )
-        ordered = tuple(
-            sorted(candidates, key=lambda item: (item.updated_at, item.job_id))
-        )
+            for candidate in candidates:
+                yield replace(
+                    candidate,
+                    reclaimable_bytes=sizes[Path(candidate.workspace_path)],
+                )
+            if page.next_cursor is None:
+                return
+            after = page.next_cursor
+
+    def plan_retention(
+        self,
+        policy: RetentionPolicy,
+        *,
+        now: datetime | None = None,
+    ) -> RetentionPlan:
+        """Plan a sweep of the oldest eligible workspaces.
+
+        With ``policy.reclaim_bytes`` the sweep stops at the first workspace that brings
+        the planned total to the budget, leaving newer workspaces unread.
+        """
+        selected: list[RetentionCandidate] = []
+        planned_bytes = 0
+        for candidate in self.iter_retention_candidates(policy, now=now):
+            selected.append(candidate)
+            planned_bytes += candidate.reclaimable_bytes
+            if (
+                policy.reclaim_bytes is not None
+                and planned_bytes >= policy.reclaim_bytes
+            ):
+                break
+        candidates = tuple(selected)
         return RetentionPlan(
             policy=policy,
-            candidates=ordered,
-            confirmation_token=self._retention_token(policy, ordered),
+            candidates=candidates,
+            confirmation_token=self._retention_token(policy, candidates),
         )
 
     def execute_retention(
@@ -291,23 +528,38 @@ class LibraryCustodyService:
         *,
         confirmation_token: str,
         now: datetime | None = None,
+        max_workers: int = _DEFAULT_DELETION_WORKERS,
     ) -> RetentionReceipt:
+        """Re-plan, confirm, then delete the planned workspaces on a bounded pool."""
+        if max_workers < 1:
+            raise ValueError("max_workers must be positive")
         plan = self.plan_retention(policy, now=now)
         if confirmation_token != plan.confirmation_token:
             raise CustodyOperationError(
                 "Retention plan changed or confirmation token is invalid; "
                 "review the plan again"
             )
-        discarded: list[str] = []
         for candidate in plan.candidates:
-            workspace = Path(candidate.workspace_path)
-            self._validate_workspace_path(workspace)
-            if workspace.is_dir():
-                self.file_manager.delete_directory(workspace)
-                discarded.append(candidate.job_id)
+            self._validate_workspace_path(Path(candidate.workspace_path))
+        discarded: list[RetentionCandidate] = []
+        if plan.candidates:
+            with ThreadPoolExecutor(
+                max_workers=min(max_workers, len(plan.candidates)),
+                thread_name_prefix="scholion-retention",
+            ) as pool:
+                removed = tuple(pool.map(self._discard_workspace, plan.candidates))
+            discarded = [
+                candidate
+                for candidate, was_removed in zip(plan.candidates, removed, strict=True)
+                if was_removed
+            ]
+            self.workspace_usage.forget(
+                Path(candidate.workspace_path) for candidate in plan.candidates
+            )
         return RetentionReceipt(
             confirmation_token=plan.confirmation_token,
-            discarded_job_ids=tuple(discarded),
+            discarded_job_ids=tuple(candidate.job_id for candidate in discarded),
+            reclaimed_bytes=sum(candidate.reclaimable_bytes for candidate in discarded),
         )
 
     @staticmethod
@@ -334,6 +586,25 @@ class LibraryCustodyService:
             )
         return tuple(scope for scope in DeletionScope if scope in expanded)
 
+    @staticmethod
+    def _batch_document_ids(document_ids: tuple[str, ...]) -> tuple[str, ...]:
+        if not document_ids:
+            raise ValueError("at least one transcript ID is required")
+        if len(document_ids) > _MAX_BATCH_DOCUMENTS:
+            raise ValueError(
+                f"a deletion batch can contain at most {_MAX_BATCH_DOCUMENTS} transcripts"
+            )
+        if len(set(document_ids)) != len(document_ids):
+            raise ValueError("transcript IDs in a deletion batch must be unique")
+        return document_ids
+
+    def _semantic_active(self, scopes: tuple[DeletionScope, ...]) -> bool:
+        return (
+            DeletionScope.LIBRARY_VIEW in scopes
+            and self.semantic_index is not None
+            and self.semantic_index.state() is not None
+        )
+
     @staticmethod
     def _canonical_digest(document: IndexedDocument) -> str:
         if document.canonical_sha256 is None:
@@ -377,13 +648,30 @@ class LibraryCustodyService:
             if note.anchor.canonical_sha256 == canonical_sha256
         )
 
+    def _generation_notes_many(
+        self, digests: dict[str, str]
+    ) -> dict[str, tuple[ResearchNote, ...]]:
+        notes = self.research_state.notes(limit=_MAX_RESEARCH_OBJECTS)
+        if len(notes) >= _MAX_RESEARCH_OBJECTS:
+            # The shared read may be truncated; fall back to bounded per-document reads.
+            return {
+                document_id: self._generation_notes(document_id, canonical_sha256)
+                for document_id, canonical_sha256 in digests.items()
+            }
+        grouped: dict[str, list[ResearchNote]] = {}
+        for note in notes:
+            if digests.get(note.anchor.document_id) == note.anchor.canonical_sha256:
+                grouped.setdefault(note.anchor.document_id, []).append(note)
+        return {document_id: tuple(items) for document_id, items in grouped.items()}
+
+    def _affected_saved_search_ids_many(
+        self, document_ids: tuple[str, ...]
+    ) -> dict[str, tuple[str, ...]]:
+        return self.workspace_metadata.saved_search_ids_by_document(document_ids)
+
     def _affected_saved_search_ids(self, document_id: str) -> tuple[str, ...]:
-        return tuple(
-            saved.saved_search_id
-            for saved in self.workspace_metadata.saved_searches(
-                limit=_MAX_RESEARCH_OBJECTS
-            )
-            if document_id in saved.intent.query.document_ids
+        return self.workspace_metadata.saved_search_ids_by_document((document_id,)).get(
+            document_id, ()
         )
 
     def _deletion_actions(
@@ -394,10 +682,15 @@ class LibraryCustodyService:
         scopes: tuple[DeletionScope, ...],
         note_ids: tuple[str, ...],
         saved_search_ids: tuple[str, ...],
+        semantic_active: bool,
     ) -> tuple[DeletionAction, ...]:
         actions: list[DeletionAction] = []
         if DeletionScope.LIBRARY_VIEW in scopes:
-            actions.extend(self._library_actions(document.document_id))
+            actions.extend(
+                self._library_actions(
+                    document.document_id, semantic_active=semantic_active
+                )
+            )
         if DeletionScope.DERIVED_ARTIFACTS in scopes:
             actions.extend(self._derived_artifact_actions(document))
         if DeletionScope.EXECUTION_STATE in scopes:
@@ -431,7 +724,10 @@ class LibraryCustodyService:
             actions.extend(self._research_actions(note_ids))
         return tuple(actions)
 
-    def _library_actions(self, document_id: str) -> tuple[DeletionAction, ...]:
+    @staticmethod
+    def _library_actions(
+        document_id: str, *, semantic_active: bool
+    ) -> tuple[DeletionAction, ...]:
         actions = [
             DeletionAction(
                 target=DeletionTarget.LEXICAL_INDEX,
@@ -439,7 +735,7 @@ class LibraryCustodyService:
                 description="remove transcript from the rebuildable lexical index",
             )
         ]
-        if self.semantic_index is not None and self.semantic_index.state() is not None:
+        if semantic_active:
             actions.append(
                 DeletionAction(
                     target=DeletionTarget.SEMANTIC_INDEX,
@@ -471,15 +767,9 @@ class LibraryCustodyService:
         return tuple(actions)
 
     def _execution_action(self, document_id: str) -> DeletionAction | None:
-        record = next(
-            (
-                item
-                for item in self.lifecycle_store.list_records()
-                if item.job_id.value == document_id
-            ),
-            None,
-        )
-        if record is None:
+        try:
+            self.lifecycle_store.get(JobId(document_id))
+        except (JobNotFoundError, UnsafePathError):
             return None
         workspace = self.paths.jobs_dir / document_id
         if not workspace.is_dir():
@@ -549,6 +839,7 @@ class LibraryCustodyService:
     def _execute_action(self, action: DeletionAction) -> None:
         if action.target is DeletionTarget.LEXICAL_INDEX:
             self.lexical_index.remove(action.object_id)
+            self.transcript_library.invalidate_refresh_journal()
             return
         if action.target is DeletionTarget.SEMANTIC_INDEX:
             if self.semantic_index is not None:
@@ -567,6 +858,31 @@ class LibraryCustodyService:
         if action.path is not None and self.file_manager.file_exists(action.path):
             self.file_manager.delete_file(action.path)
 
+    def _execute_parallel(
+        self, actions: tuple[DeletionAction, ...], *, max_workers: int
+    ) -> None:
+        if not actions:
+            return
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(actions)),
+            thread_name_prefix="scholion-deletion",
+        ) as pool:
+            # Consume results so the first failure propagates after in-flight work.
+            tuple(pool.map(self._execute_action, actions))
+
+    @staticmethod
+    def _execute_unique(
+        actions: tuple[DeletionAction, ...],
+        target: DeletionTarget,
+        delete: Callable[[str], object],
+    ) -> None:
+        # Several documents can share one saved search; delete each object once.
+        seen: set[str] = set()
+        for action in actions:
+            if action.target is target and action.object_id not in seen:
+                seen.add(action.object_id)
+                delete(action.object_id)
+
     def _retention_candidate(
         self,
         record: JobLifecycleRecord,
@@ -593,6 +909,13 @@ class LibraryCustodyService:
             resume_capability_lost=record.status is not JobStatus.COMPLETED,
         )
 
+    def _discard_workspace(self, candidate: RetentionCandidate) -> bool:
+        workspace = Path(candidate.workspace_path)
+        if not workspace.is_dir():
+            return False
+        self.file_manager.delete_directory(workspace)
+        return True
+
     def _validate_workspace_path(self, workspace: Path) -> None:
         jobs_dir = self.paths.jobs_dir.resolve(strict=False)
         resolved = workspace.expanduser().resolve(strict=False)
@@ -653,18 +976,25 @@ class LibraryCustodyService:
         digest = hashlib.sha256("\n".join(parts).encode()).hexdigest()
         return f"delete:{document_id}:{canonical_sha256[:12]}:{digest[:16]}"
 
+    @staticmethod
+    def _batch_token(plans: tuple[DeletionPlan, ...]) -> str:
+        parts = ["delete-batch-v1", *(plan.confirmation_token for plan in plans)]
+        digest = hashlib.sha256("\n".join(parts).encode()).hexdigest()
+        return f"delete-batch:{len(plans)}:{digest[:24]}"
+
     @staticmethod
     def _retention_token(
         policy: RetentionPolicy,
         candidates: tuple[RetentionCandidate, ...],
     ) -> str:
         parts = [
-            "retention-v1",
+            "retention-v2",
             str(policy.execution_days),
             str(policy.include_incomplete),
+            str(policy.reclaim_bytes),
             *(
                 f"{item.job_id}:{item.status.value}:{item.updated_at}:"
-                f"{item.workspace_path}"
+                f"{item.workspace_path}:{item.reclaimable_bytes}"
                 for item in candidates
             ),
         ]
@@ -1,3 +1,4 @@
+import uuid
 from collections import Counter
 from pathlib import Path
 
@@ -5,6 +6,7 @@ import duckdb
 
 from scholion.core.file_manager_facade import FileManagerFacade
 from scholion.library.duckdb_safety import atomic_duckdb_transaction
+from scholion.library.duckdb_scope import DuckDbEvidenceScopes
 from scholion.library.index import (
     IndexedDocument,
     IndexedTranscript,
@@ -19,11 +21,6 @@ _SEARCH_SQL_PREFIX = """
     WITH query_terms AS (
         SELECT UNNEST(?::VARCHAR[]) AS term
     ),
-    evidence_scope AS (
-        SELECT UNNEST(?::VARCHAR[]) AS document_id,
-               UNNEST(?::VARCHAR[]) AS canonical_sha256,
-               UNNEST(?::VARCHAR[]) AS segment_id
-    ),
     corpus AS (
         SELECT COUNT(*)::DOUBLE AS segment_count,
                COALESCE(AVG(token_count), 0)::DOUBLE AS average_length
@@ -69,11 +66,10 @@ _SEARCH_SQL_PREFIX = """
       AND (? = FALSE OR list_contains(?::VARCHAR[], s.language))
       AND (? = FALSE OR list_contains(?::VARCHAR[], s.document_id))
       AND (
-          ? = FALSE OR EXISTS (
-              SELECT 1 FROM evidence_scope requested
-              WHERE requested.document_id = s.document_id
-                AND requested.canonical_sha256 = d.canonical_sha256
-                AND requested.segment_id = s.segment_id
+          ? = FALSE OR (s.document_id, d.canonical_sha256, s.segment_id) IN (
+              SELECT document_id, canonical_sha256, segment_id
+              FROM scholion_evidence_scope
+              WHERE scope_id = ?
           )
       )
 """
@@ -109,6 +105,7 @@ class DuckDbTranscriptIndex:
         self._connection = duckdb.connect(str(self.database_path))
         self._closed = False
         self._initialize()
+        self._scopes = DuckDbEvidenceScopes(self._connection)
 
     @property
     def backend_id(self) -> str:
@@ -149,7 +146,19 @@ class DuckDbTranscriptIndex:
                 term_frequency INTEGER NOT NULL,
                 PRIMARY KEY (document_id, segment_id, term)
             );
+            CREATE TABLE IF NOT EXISTS index_state (
+                singleton INTEGER PRIMARY KEY,
+                instance_id VARCHAR NOT NULL,
+                generation BIGINT NOT NULL
+            );
+            """
+        )
+        self._connection.execute(
             """
+            INSERT INTO index_state VALUES (1, ?, 0)
+            ON CONFLICT (singleton) DO NOTHING
+            """,
+            [uuid.uuid4().hex],
         )
         self._connection.execute(
             "ALTER TABLE documents ADD COLUMN IF NOT EXISTS canonical_sha256 VARCHAR"
@@ -167,6 +176,7 @@ class DuckDbTranscriptIndex:
             self._clear_tables()
             for transcript in transcripts:
                 self._insert_transcript(transcript)
+            self._advance_generation()
 
     def apply_delta(
         self,
@@ -195,6 +205,7 @@ class DuckDbTranscriptIndex:
             for transcript in upserts:
                 self._delete_document(transcript.document_id)
                 self._insert_transcript(transcript)
+            self._advance_generation()
 
     def upsert(self, transcript: IndexedTranscript) -> None:
         self.apply_delta(upserts=(transcript,), removals=())
@@ -322,30 +333,27 @@ class DuckDbTranscriptIndex:
             if query.sort is SearchSort.TIMELINE
             else _RELEVANCE_SEARCH_SQL
         )
-        scope = query.evidence_scope
-        scope_documents = [] if scope is None else [key[0] for key in scope]
-        scope_hashes = [] if scope is None else [key[1] for key in scope]
-        scope_segments = [] if scope is None else [key[2] for key in scope]
-        rows = self._connection.execute(
-            sql,
-            [
-                list(tokens),
-                scope_documents,
-                scope_hashes,
-                scope_segments,
-                required_terms,
-                query.phrase,
-                query.text.strip().casefold(),
-                bool(query.speaker_refs),
-                list(query.speaker_refs),
-                bool(query.languages),
-                list(query.languages),
-                bool(query.document_ids),
-                list(query.document_ids),
-                scope is not None,
-                query.limit,
-            ],
-        ).fetchall()
+        if query.evidence_scope is not None and not query.evidence_scope.keys:
+            return ()
+        with self._scopes.loaded(query.evidence_scope) as scope_id:
+            rows = self._connection.execute(
+                sql,
+                [
+                    list(tokens),
+                    required_terms,
+                    query.phrase,
+                    query.text.strip().casefold(),
+                    bool(query.speaker_refs),
+                    list(query.speaker_refs),
+                    bool(query.languages),
+                    list(query.languages),
+                    bool(query.document_ids),
+                    list(query.document_ids),
+                    scope_id is not None,
+                    scope_id,
+                    query.limit,
+                ],
+            ).fetchall()
         return tuple(self._match(row) for row in rows)
 
     @staticmethod
@@ -364,10 +372,30 @@ class DuckDbTranscriptIndex:
             score=_numeric_cell(row[10], "score"),
         )
 
+    def state_token(self) -> str:
+        """Identify the indexed corpus; any committed change yields a new token.
+
+        The instance ID is random per database file, so a deleted and recreated index
+        never repeats an earlier token even though its generation restarts at zero.
+        """
+        self._require_open()
+        row = self._connection.execute(
+            "SELECT instance_id, generation FROM index_state WHERE singleton = 1"
+        ).fetchone()
+        if row is None:
+            raise RuntimeError("transcript index state is missing")
+        return f"{self.backend_id}:{row[0]}:{row[1]}"
+
     def clear(self) -> None:
         self._require_open()
         with atomic_duckdb_transaction(self._connection):
             self._clear_tables()
+            self._advance_generation()
+
+    def _advance_generation(self) -> None:
+        self._connection.execute(
+            "UPDATE index_state SET generation = generation + 1 WHERE singleton = 1"
+        )
 
     def _clear_tables(self) -> None:
         self._connection.execute("DELETE FROM terms")
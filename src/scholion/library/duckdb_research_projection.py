@@ -2,22 +2,43 @@
 
 from __future__ import annotations
 
+import threading
+from collections import Counter, OrderedDict
 from pathlib import Path
 
 import duckdb
 
 from scholion.core.file_manager_facade import FileManagerFacade
+from scholion.core.metrics import CacheStatistics
 from scholion.library.duckdb_safety import atomic_duckdb_transaction
 from scholion.library.errors import ResearchProjectionError
+from scholion.library.index import EvidenceScope
 from scholion.library.research_projection import (
     EvidenceScopeKey,
     ProjectedEvidenceSummary,
+    RankedNoteMatch,
     ResearchProjectionFilter,
 )
 from scholion.library.research_state import ResearchProjectionRecord
 from scholion.library.text import lexical_tokens
 
-_SCHEMA_VERSION = 1
+_SCHEMA_VERSION = 2
+_FILTER_CACHE_ENTRIES = 64
+_FILTER_CACHE_ROWS = 262_144
+_MAX_RANKED_NOTES = 10_000
+_MAX_PREFIX_EXPANSIONS = 32
+_PROJECTION_TABLES = (
+    "projected_term_stats",
+    "projected_note_terms",
+    "projected_note_collections",
+    "projected_note_tags",
+    "projected_note_segments",
+    "projected_notes",
+    "projection_metadata",
+)
+# Each predicate is evaluated once as a set of note IDs: a grouped semi-join per
+# relationship table keeps notes carrying every requested value, and matched_notes
+# intersects those sets. Inactive predicates receive empty arrays and are skipped.
 _MATCHED_NOTES_CTE = """
 requested_tags AS (
     SELECT UNNEST(?::VARCHAR[]) AS tag_id
@@ -28,40 +49,159 @@ requested_collections AS (
 requested_terms AS (
     SELECT UNNEST(?::VARCHAR[]) AS term
 ),
+tag_matches AS (
+    SELECT nt.note_id
+    FROM projected_note_tags nt
+    SEMI JOIN requested_tags rt USING (tag_id)
+    GROUP BY nt.note_id
+    HAVING COUNT(*) = ?
+),
+collection_matches AS (
+    SELECT nc.note_id
+    FROM projected_note_collections nc
+    SEMI JOIN requested_collections rc USING (collection_id)
+    GROUP BY nc.note_id
+    HAVING COUNT(*) = ?
+),
+term_matches AS (
+    SELECT nt.note_id
+    FROM projected_note_terms nt
+    SEMI JOIN requested_terms rt USING (term)
+    GROUP BY nt.note_id
+    HAVING COUNT(*) = ?
+),
 matched_notes AS (
     SELECT n.note_id, n.document_id, n.canonical_sha256
     FROM projected_notes n
     WHERE (? = FALSE OR list_contains(?::VARCHAR[], n.document_id))
-      AND (
-          ? = FALSE OR (
-              SELECT COUNT(DISTINCT nt.tag_id)
-              FROM projected_note_tags nt
-              JOIN requested_tags rt USING (tag_id)
-              WHERE nt.note_id = n.note_id
-          ) = ?
-      )
-      AND (
-          ? = FALSE OR (
-              SELECT COUNT(DISTINCT nc.collection_id)
-              FROM projected_note_collections nc
-              JOIN requested_collections rc USING (collection_id)
-              WHERE nc.note_id = n.note_id
-          ) = ?
-      )
-      AND (
-          ? = FALSE OR (
-              SELECT COUNT(DISTINCT nt.term)
-              FROM projected_note_terms nt
-              JOIN requested_terms rt USING (term)
-              WHERE nt.note_id = n.note_id
-          ) = ?
-      )
+      AND (? = FALSE OR n.note_id IN (SELECT note_id FROM tag_matches))
+      AND (? = FALSE OR n.note_id IN (SELECT note_id FROM collection_matches))
+      AND (? = FALSE OR n.note_id IN (SELECT note_id FROM term_matches))
 )
 """
+# Same BM25 constants as the transcript index (k1 = 1.2, b = 0.75). Corpus statistics are
+# maintained incrementally beside the rows, so ranking never scans every note. A query
+# term in a prefix slot may match several expansions; each note keeps its best one.
+_RANKED_NOTES_SQL = (
+    "WITH "  # noqa: S608 - module-owned CTEs only; values stay bound.
+    + _MATCHED_NOTES_CTE
+    + """,
+query_terms AS (
+    SELECT UNNEST(?::VARCHAR[]) AS term, UNNEST(?::INTEGER[]) AS slot
+),
+corpus AS (
+    SELECT indexed_note_count::DOUBLE AS note_count,
+           CASE WHEN indexed_note_count = 0 THEN 0
+                ELSE indexed_token_count::DOUBLE / indexed_note_count
+           END AS average_length
+    FROM projection_metadata
+    WHERE singleton = 1
+),
+slot_scores AS (
+    SELECT nt.note_id, q.slot,
+           MAX(
+               ln(1.0 + (
+                   (c.note_count - st.note_frequency + 0.5) /
+                   (st.note_frequency + 0.5)
+               )) * (
+                   (nt.term_frequency * 2.2) /
+                   (nt.term_frequency + 1.2 * (
+                       0.25 + 0.75 * n.token_count / NULLIF(c.average_length, 0)
+                   ))
+               )
+           ) AS score
+    FROM projected_note_terms nt
+    JOIN query_terms q USING (term)
+    JOIN projected_term_stats st USING (term)
+    JOIN projected_notes n USING (note_id)
+    CROSS JOIN corpus c
+    GROUP BY nt.note_id, q.slot
+),
+ranked AS (
+    SELECT note_id, SUM(score) AS score, COUNT(*) AS matched_slots
+    FROM slot_scores
+    GROUP BY note_id
+)
+SELECT r.note_id, r.score
+FROM ranked r
+JOIN matched_notes m USING (note_id)
+WHERE r.matched_slots = ?
+ORDER BY r.score DESC, r.note_id
+LIMIT ?
+"""
+)
+
+
+class _FilterResultCache[V]:
+    """LRU of filter results that are valid for exactly one projection watermark.
+
+    Every projection write advances or resets the watermark, so a result computed at
+    one watermark is exact until the next write. Capacity is bounded by entry count
+    and by the total number of cached rows.
+    """
+
+    def __init__(self, *, max_entries: int, max_rows: int) -> None:
+        self.max_entries = max_entries
+        self.max_rows = max_rows
+        self.hits = 0
+        self.misses = 0
+        self._watermark: int | None = None
+        self._entries: OrderedDict[ResearchProjectionFilter, tuple[V, int]] = (
+            OrderedDict()
+        )
+        self._rows = 0
+        self._lock = threading.Lock()
+
+    def get(self, watermark: int, filters: ResearchProjectionFilter) -> V | None:
+        with self._lock:
+            if watermark != self._watermark:
+                self._clear()
+                self._watermark = watermark
+            entry = self._entries.get(filters)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(filters)
+            self.hits += 1
+            return entry[0]
+
+    def put(
+        self,
+        watermark: int,
+        filters: ResearchProjectionFilter,
+        value: V,
+        *,
+        rows: int,
+    ) -> None:
+        with self._lock:
+            if watermark != self._watermark or rows > self.max_rows:
+                return
+            previous = self._entries.pop(filters, None)
+            if previous is not None:
+                self._rows -= previous[1]
+            self._entries[filters] = (value, rows)
+            self._rows += rows
+            while len(self._entries) > self.max_entries or self._rows > self.max_rows:
+                _, (_, evicted_rows) = self._entries.popitem(last=False)
+                self._rows -= evicted_rows
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._clear()
+
+    def _clear(self) -> None:
+        self._entries.clear()
+        self._rows = 0
+        self._watermark = None
 
 
 class DuckDbResearchProjection:
-    """Disposable note/tag/collection projection for fast corpus filtering."""
+    """Disposable note/tag/collection projection for fast corpus filtering.
+
+    Note bodies are also indexed for ranked text lookup: per-note term frequencies and
+    token counts, per-term note frequencies, and corpus totals are kept current by every
+    ``rebuild`` and ``apply`` inside the same transaction as the watermark.
+    """
 
     def __init__(self, database_path: Path, file_manager: FileManagerFacade) -> None:
         self.database_path = database_path.expanduser().resolve(strict=False)
@@ -72,6 +212,14 @@ class DuckDbResearchProjection:
         try:
             self._connection = duckdb.connect(str(self.database_path))
             self._closed = False
+            self._note_cache: _FilterResultCache[tuple[str, ...]] = _FilterResultCache(
+                max_entries=_FILTER_CACHE_ENTRIES, max_rows=_FILTER_CACHE_ROWS
+            )
+            self._evidence_cache: _FilterResultCache[EvidenceScope] = (
+                _FilterResultCache(
+                    max_entries=_FILTER_CACHE_ENTRIES, max_rows=_FILTER_CACHE_ROWS
+                )
+            )
             self._initialize()
         except duckdb.Error as exc:
             raise ResearchProjectionError(
@@ -82,6 +230,19 @@ class DuckDbResearchProjection:
     def backend_id(self) -> str:
         return "duckdb-research-projection-v1"
 
+    def cache_statistics(self) -> tuple[CacheStatistics, ...]:
+        """Filter-cache hits and misses since this projection was opened."""
+        return (
+            CacheStatistics(
+                "research.notes", self._note_cache.hits, self._note_cache.misses
+            ),
+            CacheStatistics(
+                "research.evidence",
+                self._evidence_cache.hits,
+                self._evidence_cache.misses,
+            ),
+        )
+
     def projected_through_sequence(self) -> int:
         self._require_open()
         try:
@@ -140,6 +301,7 @@ class DuckDbResearchProjection:
                     self._delete_note(note_id)
                 for record in records:
                     self._insert_record(record)
+                self._prune_term_stats()
                 self._set_watermark(through_sequence)
         except ValueError:
             raise
@@ -154,6 +316,10 @@ class DuckDbResearchProjection:
         parameters = self._filter_parameters(filters)
         if parameters is None:
             return ()
+        watermark = self.projected_through_sequence()
+        cached = self._note_cache.get(watermark, filters)
+        if cached is not None:
+            return cached
         try:
             # The only interpolation is this module-owned CTE; user values stay bound.
             query = (
@@ -165,15 +331,70 @@ class DuckDbResearchProjection:
             raise ResearchProjectionError(
                 "Research note filter could not be evaluated", cause=exc
             ) from exc
-        return tuple(str(row[0]) for row in rows)
+        note_ids = tuple(str(row[0]) for row in rows)
+        self._note_cache.put(watermark, filters, note_ids, rows=len(note_ids))
+        return note_ids
+
+    def rank_notes(
+        self,
+        filters: ResearchProjectionFilter,
+        *,
+        limit: int,
+        prefix: bool = False,
+    ) -> tuple[RankedNoteMatch, ...]:
+        """Return notes matching every note-text term, best BM25 score first.
+
+        With ``prefix`` the final term matches any indexed term it starts, so partially
+        typed words find notes. Expansion is bounded to the most common completions.
+        """
+        self._require_open()
+        if filters.note_text is None:
+            raise ValueError("ranked note lookup requires note_text")
+        if limit < 1 or limit > _MAX_RANKED_NOTES:
+            raise ValueError("ranked note limit must be between 1 and 10000")
+        tokens = tuple(dict.fromkeys(lexical_tokens(filters.note_text)))
+        if not tokens:
+            return ()
+        terms = list(tokens)
+        slots = list(range(len(tokens)))
+        try:
+            if prefix:
+                completions = self._prefix_completions(tokens[-1])
+                terms.extend(completions)
+                slots.extend(len(tokens) - 1 for _ in completions)
+            # Text terms are scored by the ranking CTEs, not required by matched_notes.
+            parameters = self._scope_parameters(filters, terms=None)
+            rows = self._connection.execute(
+                _RANKED_NOTES_SQL,
+                [*parameters, terms, slots, len(tokens), limit],
+            ).fetchall()
+        except duckdb.Error as exc:
+            raise ResearchProjectionError(
+                "Research note text could not be ranked", cause=exc
+            ) from exc
+        return tuple(
+            RankedNoteMatch(note_id=str(row[0]), score=float(row[1])) for row in rows
+        )
 
     def matching_evidence(
         self, filters: ResearchProjectionFilter
     ) -> tuple[EvidenceScopeKey, ...]:
+        return self.evidence_scope(filters).keys
+
+    def evidence_scope(self, filters: ResearchProjectionFilter) -> EvidenceScope:
+        """Return the matching evidence as a scope search backends can join against.
+
+        The scope is cached with its digest, so repeated filtered searches at one
+        watermark hand the same ``scope_id`` to the backends and skip reloading keys.
+        """
         self._require_open()
         parameters = self._filter_parameters(filters)
         if parameters is None:
-            return ()
+            return EvidenceScope(())
+        watermark = self.projected_through_sequence()
+        cached = self._evidence_cache.get(watermark, filters)
+        if cached is not None:
+            return cached
         try:
             # The only interpolation is this module-owned CTE; user values stay bound.
             query = (
@@ -188,7 +409,11 @@ class DuckDbResearchProjection:
             raise ResearchProjectionError(
                 "Research evidence filter could not be evaluated", cause=exc
             ) from exc
-        return tuple((str(row[0]), str(row[1]), str(row[2])) for row in rows)
+        scope = EvidenceScope(
+            tuple((str(row[0]), str(row[1]), str(row[2])) for row in rows)
+        )
+        self._evidence_cache.put(watermark, filters, scope, rows=scope.size)
+        return scope
 
     def summaries(
         self, keys: tuple[EvidenceScopeKey, ...]
@@ -259,12 +484,25 @@ class DuckDbResearchProjection:
         self._closed = True
 
     def _initialize(self) -> None:
+        stored_version = self._stored_schema_version()
+        if stored_version is not None and stored_version > _SCHEMA_VERSION:
+            raise ResearchProjectionError(
+                "Research projection schema is unsupported by this Scholion build"
+            )
+        if stored_version is not None and stored_version < _SCHEMA_VERSION:
+            # Derived state from an older build: drop it and let the projector replay
+            # or rebuild from authoritative SQLite history.
+            with atomic_duckdb_transaction(self._connection):
+                for table in _PROJECTION_TABLES:
+                    self._connection.execute(f"DROP TABLE IF EXISTS {table}")
         self._connection.execute(
             """
             CREATE TABLE IF NOT EXISTS projection_metadata (
                 singleton INTEGER PRIMARY KEY,
                 schema_version INTEGER NOT NULL,
-                projected_through_sequence BIGINT NOT NULL
+                projected_through_sequence BIGINT NOT NULL,
+                indexed_note_count BIGINT NOT NULL DEFAULT 0,
+                indexed_token_count BIGINT NOT NULL DEFAULT 0
             );
             CREATE TABLE IF NOT EXISTS projected_notes (
                 note_id VARCHAR PRIMARY KEY,
@@ -273,7 +511,8 @@ class DuckDbResearchProjection:
                 source_sha256 VARCHAR NOT NULL,
                 start_seconds DOUBLE NOT NULL,
                 end_seconds DOUBLE NOT NULL,
-                normalized_body VARCHAR NOT NULL
+                normalized_body VARCHAR NOT NULL,
+                token_count INTEGER NOT NULL
             );
             CREATE TABLE IF NOT EXISTS projected_note_segments (
                 note_id VARCHAR NOT NULL,
@@ -293,8 +532,13 @@ class DuckDbResearchProjection:
             CREATE TABLE IF NOT EXISTS projected_note_terms (
                 note_id VARCHAR NOT NULL,
                 term VARCHAR NOT NULL,
+                term_frequency INTEGER NOT NULL,
                 PRIMARY KEY (note_id, term)
             );
+            CREATE TABLE IF NOT EXISTS projected_term_stats (
+                term VARCHAR PRIMARY KEY,
+                note_frequency BIGINT NOT NULL
+            );
             CREATE INDEX IF NOT EXISTS projected_note_generation_idx
                 ON projected_notes(document_id, canonical_sha256);
             CREATE INDEX IF NOT EXISTS projected_note_segment_idx
@@ -318,17 +562,41 @@ class DuckDbResearchProjection:
             """,
             [_SCHEMA_VERSION],
         )
-        row = self._connection.execute(
-            "SELECT schema_version FROM projection_metadata WHERE singleton = 1"
-        ).fetchone()
-        if row is None or int(row[0]) != _SCHEMA_VERSION:
+        if self._stored_schema_version() != _SCHEMA_VERSION:
             raise ResearchProjectionError(
                 "Research projection schema is unsupported by this Scholion build"
             )
 
+    def _stored_schema_version(self) -> int | None:
+        exists = self._connection.execute(
+            """
+            SELECT 1 FROM information_schema.tables
+            WHERE table_schema = current_schema() AND table_name = 'projection_metadata'
+            """
+        ).fetchone()
+        if exists is None:
+            return None
+        row = self._connection.execute(
+            "SELECT schema_version FROM projection_metadata WHERE singleton = 1"
+        ).fetchone()
+        return None if row is None else int(row[0])
+
+    def _prefix_completions(self, prefix: str) -> list[str]:
+        rows = self._connection.execute(
+            """
+            SELECT term FROM projected_term_stats
+            WHERE starts_with(term, ?) AND term <> ? AND note_frequency > 0
+            ORDER BY note_frequency DESC, term
+            LIMIT ?
+            """,
+            [prefix, prefix, _MAX_PREFIX_EXPANSIONS],
+        ).fetchall()
+        return [str(row[0]) for row in rows]
+
     def _insert_record(self, record: ResearchProjectionRecord) -> None:
+        tokens = lexical_tokens(record.body)
         self._connection.execute(
-            "INSERT INTO projected_notes VALUES (?, ?, ?, ?, ?, ?, ?)",
+            "INSERT INTO projected_notes VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
             [
                 record.note_id,
                 record.anchor.document_id,
@@ -337,6 +605,7 @@ class DuckDbResearchProjection:
                 record.anchor.start_seconds,
                 record.anchor.end_seconds,
                 record.body.casefold(),
+                len(tokens),
             ],
         )
         segment_rows = [
@@ -347,7 +616,8 @@ class DuckDbResearchProjection:
             (record.note_id, collection_id) for collection_id in record.collection_ids
         ]
         term_rows = [
-            (record.note_id, term) for term in sorted(set(lexical_tokens(record.body)))
+            (record.note_id, term, frequency)
+            for term, frequency in sorted(Counter(tokens).items())
         ]
         if segment_rows:
             self._connection.executemany(
@@ -363,8 +633,17 @@ class DuckDbResearchProjection:
             )
         if term_rows:
             self._connection.executemany(
-                "INSERT INTO projected_note_terms VALUES (?, ?)", term_rows
+                "INSERT INTO projected_note_terms VALUES (?, ?, ?)", term_rows
+            )
+            self._connection.executemany(
+                """
+                INSERT INTO projected_term_stats VALUES (?, 1)
+                ON CONFLICT (term) DO UPDATE
+                SET note_frequency = projected_term_stats.note_frequency + 1
+                """,
+                [(row[1],) for row in term_rows],
             )
+        self._adjust_corpus(notes=1, tokens=len(tokens))
 
     def _filter_parameters(
         self, filters: ResearchProjectionFilter
@@ -372,21 +651,45 @@ class DuckDbResearchProjection:
         terms = tuple(dict.fromkeys(lexical_tokens(filters.note_text or "")))
         if filters.note_text is not None and not terms:
             return None
+        return self._scope_parameters(
+            filters, terms=None if filters.note_text is None else terms
+        )
+
+    @staticmethod
+    def _scope_parameters(
+        filters: ResearchProjectionFilter, *, terms: tuple[str, ...] | None
+    ) -> list[object]:
+        required_terms = terms or ()
         return [
             list(filters.tag_ids),
             list(filters.collection_ids),
-            list(terms),
+            list(required_terms),
+            len(filters.tag_ids),
+            len(filters.collection_ids),
+            len(required_terms),
             bool(filters.document_ids),
             list(filters.document_ids),
             bool(filters.tag_ids),
-            len(filters.tag_ids),
             bool(filters.collection_ids),
-            len(filters.collection_ids),
-            filters.note_text is not None,
-            len(terms),
+            terms is not None,
         ]
 
     def _delete_note(self, note_id: str) -> None:
+        row = self._connection.execute(
+            "SELECT token_count FROM projected_notes WHERE note_id = ?", [note_id]
+        ).fetchone()
+        if row is not None:
+            self._connection.execute(
+                """
+                UPDATE projected_term_stats
+                SET note_frequency = note_frequency - 1
+                WHERE term IN (
+                    SELECT term FROM projected_note_terms WHERE note_id = ?
+                )
+                """,
+                [note_id],
+            )
+            self._adjust_corpus(notes=-1, tokens=-int(row[0]))
         self._connection.execute(
             "DELETE FROM projected_note_terms WHERE note_id = ?", [note_id]
         )
@@ -403,14 +706,45 @@ class DuckDbResearchProjection:
             "DELETE FROM projected_notes WHERE note_id = ?", [note_id]
         )
 
+    def _adjust_corpus(self, *, notes: int, tokens: int) -> None:
+        self._connection.execute(
+            """
+            UPDATE projection_metadata
+            SET indexed_note_count = indexed_note_count + ?,
+                indexed_token_count = indexed_token_count + ?
+            WHERE singleton = 1
+            """,
+            [notes, tokens],
+        )
+
+    def _prune_term_stats(self) -> None:
+        self._connection.execute(
+            "DELETE FROM projected_term_stats WHERE note_frequency <= 0"
+        )
+
     def _clear_rows(self) -> None:
+        self._connection.execute("DELETE FROM projected_term_stats")
+        self._reset_corpus()
         self._connection.execute("DELETE FROM projected_note_terms")
         self._connection.execute("DELETE FROM projected_note_collections")
         self._connection.execute("DELETE FROM projected_note_tags")
         self._connection.execute("DELETE FROM projected_note_segments")
         self._connection.execute("DELETE FROM projected_notes")
 
+    def _reset_corpus(self) -> None:
+        self._connection.execute(
+            """
+            UPDATE projection_metadata
+            SET indexed_note_count = 0, indexed_token_count = 0
+            WHERE singleton = 1
+            """
+        )
+
     def _set_watermark(self, sequence_id: int) -> None:
+        # A rebuild may rewrite rows without moving the watermark, so every write drops
+        # cached filter results rather than relying on the sequence alone.
+        self._note_cache.invalidate()
+        self._evidence_cache.invalidate()
         self._connection.execute(
             """
             UPDATE projection_metadata
@@ -0,0 +1,96 @@
+"""Session-local evidence scope tables shared by the DuckDB search backends.
+
+Research filters restrict search to a set of canonical evidence keys that can run to tens
+of thousands of rows. Sending that set as parameter arrays on every query and checking it
+with a correlated ``EXISTS`` costs a full transfer per search. Instead, each backend
+connection keeps a temporary table of scopes. A scope is loaded once under its
+content-derived ``scope_id``, and queries then semi-join against the rows for that ID.
+A few recently used scopes stay loaded, so filtered searches at one projection state
+repeat without resending keys.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import duckdb
+
+from scholion.library.index import EvidenceScope
+
+_LOADED_SCOPES = 8
+_SCOPE_TABLE = "scholion_evidence_scope"
+
+
+class DuckDbEvidenceScopes:
+    """Load evidence scopes into one connection's temporary table and keep a few.
+
+    Backend queries join ``scholion_evidence_scope`` on the yielded ``scope_id``.
+    """
+
+    def __init__(
+        self,
+        connection: duckdb.DuckDBPyConnection,
+        *,
+        max_loaded: int = _LOADED_SCOPES,
+    ) -> None:
+        if max_loaded < 1:
+            raise ValueError("max_loaded must be positive")
+        self.connection = connection
+        self.max_loaded = max_loaded
+        self.loads = 0
+        self._loaded: OrderedDict[str, None] = OrderedDict()
+        self._lock = threading.RLock()
+        self.connection.execute(
+            f"""
+            CREATE TEMP TABLE IF NOT EXISTS {_SCOPE_TABLE} (
+                scope_id VARCHAR NOT NULL,
+                document_id VARCHAR NOT NULL,
+                canonical_sha256 VARCHAR NOT NULL,
+                segment_id VARCHAR NOT NULL
+            )
+            """
+        )
+
+    @contextmanager
+    def loaded(self, scope: EvidenceScope | None) -> Iterator[str | None]:
+        """Yield the ID to join on while ``scope`` is guaranteed to stay loaded.
+
+        ``None`` means the search is unscoped. The lock is held for the duration so a
+        concurrent search cannot evict the rows a running query depends on.
+        """
+        if scope is None:
+            yield None
+            return
+        with self._lock:
+            if scope.scope_id in self._loaded:
+                self._loaded.move_to_end(scope.scope_id)
+            else:
+                self._load(scope)
+            yield scope.scope_id
+
+    def _load(self, scope: EvidenceScope) -> None:
+        while len(self._loaded) >= self.max_loaded:
+            evicted, _ = self._loaded.popitem(last=False)
+            self.connection.execute(
+                f"DELETE FROM {_SCOPE_TABLE} WHERE scope_id = ?",  # noqa: S608
+                [evicted],
+            )
+        if scope.keys:
+            self.connection.execute(
+                f"""
+                INSERT INTO {_SCOPE_TABLE}
+                SELECT ?, UNNEST(?::VARCHAR[]), UNNEST(?::VARCHAR[]),
+                       UNNEST(?::VARCHAR[])
+                """,  # noqa: S608
+                [
+                    scope.scope_id,
+                    [key[0] for key in scope.keys],
+                    [key[1] for key in scope.keys],
+                    [key[2] for key in scope.keys],
+                ],
+            )
+        self._loaded[scope.scope_id] = None
+        self.loads += 1
@@ -6,6 +6,7 @@ import duckdb
 
 from scholion.core.file_manager_facade import FileManagerFacade
 from scholion.library.duckdb_safety import atomic_duckdb_transaction
+from scholion.library.duckdb_scope import DuckDbEvidenceScopes
 from scholion.library.index import SearchOperator, SearchQuery
 from scholion.library.semantic import (
     EmbeddingProfile,
@@ -30,6 +31,7 @@ class DuckDbSemanticIndex:
         self._connection = duckdb.connect(str(self.database_path))
         self._closed = False
         self._initialize()
+        self._scopes = DuckDbEvidenceScopes(self._connection)
 
     @property
     def backend_id(self) -> str:
@@ -158,6 +160,78 @@ class DuckDbSemanticIndex:
                     [chunk.chunk_id, state.profile.profile_id, list(vector)],
                 )
 
+    def apply_delta(
+        self,
+        *,
+        corpus_fingerprint: str,
+        upserts: tuple[SearchChunk, ...],
+        vectors: tuple[EmbeddingVector, ...],
+        removals: tuple[str, ...],
+    ) -> None:
+        """Atomically replace per-document chunks without re-embedding the corpus.
+
+        ``removals`` names every document whose previous chunks must go, including the
+        documents being re-inserted. Upserts must belong to one of those documents so
+        an incremental write can never duplicate an unchanged document's windows.
+        """
+        self._require_open()
+        state = self.state()
+        if state is None:
+            raise ValueError("semantic delta requires an existing semantic generation")
+        if len(corpus_fingerprint) != 64 or any(
+            character not in "0123456789abcdef" for character in corpus_fingerprint
+        ):
+            raise ValueError(
+                "corpus_fingerprint must be a lowercase 64-character digest"
+            )
+        if len(upserts) != len(vectors):
+            raise ValueError("semantic chunk and vector counts must match")
+        if len(removals) != len(set(removals)):
+            raise ValueError("semantic removals cannot contain duplicates")
+        if any(chunk.document_id not in removals for chunk in upserts):
+            raise ValueError("upserted chunks must replace a named document")
+        if any(
+            chunk.chunking_profile_id != state.profile.chunking_profile_id
+            for chunk in upserts
+        ):
+            raise ValueError("chunking profile does not match embedding profile")
+        for vector in vectors:
+            self._validate_vector(vector, state.profile.dimensions)
+
+        with atomic_duckdb_transaction(self._connection):
+            for document_id in removals:
+                self._delete_document(document_id)
+            for chunk, vector in zip(upserts, vectors, strict=True):
+                self._insert_chunk(chunk)
+                self._connection.execute(
+                    "INSERT INTO embeddings VALUES (?, ?, ?)",
+                    [chunk.chunk_id, state.profile.profile_id, list(vector)],
+                )
+            self._connection.execute(
+                """
+                UPDATE semantic_state
+                SET corpus_fingerprint = ?,
+                    chunk_count = (SELECT COUNT(*) FROM chunks)
+                WHERE singleton = 1
+                """,
+                [corpus_fingerprint],
+            )
+
+    def _delete_document(self, document_id: str) -> None:
+        self._connection.execute(
+            """
+            DELETE FROM embeddings
+            WHERE chunk_id IN (SELECT chunk_id FROM chunks WHERE document_id = ?)
+            """,
+            [document_id],
+        )
+        self._connection.execute(
+            "DELETE FROM chunk_segments WHERE document_id = ?", [document_id]
+        )
+        self._connection.execute(
+            "DELETE FROM chunks WHERE document_id = ?", [document_id]
+        )
+
     def _insert_profile(self, profile: EmbeddingProfile) -> None:
         self._connection.execute(
             "INSERT INTO embedding_profiles VALUES "
@@ -246,46 +320,34 @@ class DuckDbSemanticIndex:
         if state is None:
             return ()
         self._validate_vector(query_vector, state.profile.dimensions)
-        scope = query.evidence_scope
-        scope_documents = [] if scope is None else [key[0] for key in scope]
-        scope_hashes = [] if scope is None else [key[1] for key in scope]
-        scope_segments = [] if scope is None else [key[2] for key in scope]
-        rows = self._connection.execute(
-            """
-            WITH evidence_scope AS (
-                SELECT UNNEST(?::VARCHAR[]) AS document_id,
-                       UNNEST(?::VARCHAR[]) AS canonical_sha256,
-                       UNNEST(?::VARCHAR[]) AS segment_id
-            )
-            SELECT c.chunk_id, c.document_id, c.source_sha256, c.canonical_sha256,
-                   c.canonical_path, c.source_path, c.segment_ids_json,
-                   c.first_segment_id, c.last_segment_id, c.start_seconds,
-                   c.end_seconds, c.text, c.content_sha256,
-                   c.chunking_profile_id, c.languages_json, c.speaker_refs_json,
-                   e.vector
-            FROM chunks c
-            JOIN embeddings e USING (chunk_id)
-            WHERE e.profile_id = ?
-              AND (
-                  ? = FALSE OR EXISTS (
-                      SELECT 1
-                      FROM chunk_segments cs
-                      JOIN evidence_scope requested
-                        ON requested.document_id = cs.document_id
-                       AND requested.canonical_sha256 = cs.canonical_sha256
-                       AND requested.segment_id = cs.segment_id
-                      WHERE cs.chunk_id = c.chunk_id
+        if query.evidence_scope is not None and not query.evidence_scope.keys:
+            return ()
+        with self._scopes.loaded(query.evidence_scope) as scope_id:
+            rows = self._connection.execute(
+                """
+                SELECT c.chunk_id, c.document_id, c.source_sha256, c.canonical_sha256,
+                       c.canonical_path, c.source_path, c.segment_ids_json,
+                       c.first_segment_id, c.last_segment_id, c.start_seconds,
+                       c.end_seconds, c.text, c.content_sha256,
+                       c.chunking_profile_id, c.languages_json, c.speaker_refs_json,
+                       e.vector
+                FROM chunks c
+                JOIN embeddings e USING (chunk_id)
+                WHERE e.profile_id = ?
+                  AND (
+                      ? = FALSE OR c.chunk_id IN (
+                          SELECT cs.chunk_id
+                          FROM chunk_segments cs
+                          JOIN scholion_evidence_scope requested
+                            ON requested.document_id = cs.document_id
+                           AND requested.canonical_sha256 = cs.canonical_sha256
+                           AND requested.segment_id = cs.segment_id
+                          WHERE requested.scope_id = ?
+                      )
                   )
-              )
-            """,
-            [
-                scope_documents,
-                scope_hashes,
-                scope_segments,
-                state.profile.profile_id,
-                scope is not None,
-            ],
-        ).fetchall()
+                """,
+                [state.profile.profile_id, scope_id is not None, scope_id],
+            ).fetchall()
 
         candidates: list[SemanticCandidate] = []
         for row in rows:
@@ -163,6 +163,52 @@ class EvidenceAnchor:
             )
 
 
+@dataclass(frozen=True, slots=True)
+class _PageQuery:
+    tokens: tuple[str, ...]
+    phrase: bool
+    context_segments: int
+
+
+_RenderedSegment = tuple[EvidenceContextSegment, tuple[EvidenceWord, ...]]
+
+
+class _DocumentEvidence:
+    """Lookup tables for one verified canonical generation, shared across a page.
+
+    The segment-id map is built once per document. Word-token positions and rendered
+    context segments are memoized per segment, so passages with overlapping context
+    reuse work instead of re-scanning the canonical segment and word lists.
+    """
+
+    def __init__(self, canonical_sha256: str, canonical: _CanonicalTranscript) -> None:
+        self.canonical_sha256 = canonical_sha256
+        self.canonical = canonical
+        self.index_by_id = {
+            segment.segment_id: index
+            for index, segment in enumerate(canonical.segments)
+        }
+        self._token_positions: dict[int, tuple[tuple[str, int], ...]] = {}
+        self._rendered: dict[tuple[int, bool, bool], _RenderedSegment] = {}
+
+    def token_positions(self, index: int) -> tuple[tuple[str, int], ...]:
+        cached = self._token_positions.get(index)
+        if cached is None:
+            cached = tuple(
+                (token, word_index)
+                for word_index, word in enumerate(self.canonical.segments[index].words)
+                for token in lexical_tokens(word.text)
+            )
+            self._token_positions[index] = cached
+        return cached
+
+    def rendered(self, key: tuple[int, bool, bool]) -> _RenderedSegment | None:
+        return self._rendered.get(key)
+
+    def remember(self, key: tuple[int, bool, bool], value: _RenderedSegment) -> None:
+        self._rendered[key] = value
+
+
 class EvidenceLocator:
     """Verify canonical custody, expand context, and resolve justified word highlights."""
 
@@ -242,10 +288,9 @@ class EvidenceLocator:
         context = tuple(
             self._context_segment(
                 segment,
-                result_ids=result_ids,
-                lexical_ids=set(),
-                query_tokens=(),
-                phrase=False,
+                is_result=segment.segment_id in result_ids,
+                lexical_match=False,
+                highlighted_indices=set(),
             )[0]
             for segment in canonical.segments[context_start:context_end]
         )
@@ -279,17 +324,31 @@ class EvidenceLocator:
         *,
         context_segments: int = 0,
     ) -> tuple[EvidenceLocation, ...]:
+        """Locate a whole result page, loading and indexing each generation once.
+
+        Passages are grouped by canonical generation and each group is resolved against
+        one shared segment-id map and token-position map; results keep ranked order.
+        """
         self._validate_context_segments(context_segments)
-        cache: dict[tuple[str, str], _CanonicalTranscript] = {}
-        return tuple(
-            self._locate(
-                passage,
-                response=response,
-                context_segments=context_segments,
-                cache=cache,
-            )
-            for passage in response.results
+        query = _PageQuery(
+            tokens=lexical_tokens(response.query.text),
+            phrase=response.query.phrase,
+            context_segments=context_segments,
         )
+        groups: dict[tuple[str, str], list[int]] = {}
+        for position, passage in enumerate(response.results):
+            groups.setdefault(self._generation_key(passage), []).append(position)
+        located: dict[int, EvidenceLocation] = {}
+        for (_, canonical_sha256), positions in groups.items():
+            document = _DocumentEvidence(
+                canonical_sha256,
+                self._load_canonical(response.results[positions[0]], canonical_sha256),
+            )
+            for position in positions:
+                located[position] = self._locate(
+                    response.results[position], document=document, query=query
+                )
+        return tuple(located[position] for position in range(len(response.results)))
 
     @staticmethod
     def _validate_context_segments(context_segments: int) -> None:
@@ -343,20 +402,19 @@ class EvidenceLocator:
         self,
         passage: SearchPassage,
         *,
-        response: SearchResponse,
-        context_segments: int,
-        cache: dict[tuple[str, str], _CanonicalTranscript],
+        document: _DocumentEvidence,
+        query: _PageQuery,
     ) -> EvidenceLocation:
-        canonical_sha256, canonical = self._canonical_for_passage(passage, cache)
-        result_indices = self._result_indices(passage, canonical)
+        result_indices = self._result_indices(passage, document)
         context, matched_words = self._context_for_passage(
             passage,
-            canonical=canonical,
+            document=document,
             result_indices=result_indices,
-            response=response,
-            context_segments=context_segments,
+            query=query,
+        )
+        result_segments = tuple(
+            document.canonical.segments[index] for index in result_indices
         )
-        result_segments = tuple(canonical.segments[index] for index in result_indices)
         self._validate_result_timing(passage, result_segments)
         result_speakers = self._result_speakers(passage, result_segments)
         seek_seconds = (
@@ -366,7 +424,7 @@ class EvidenceLocator:
         return EvidenceLocation(
             document_id=passage.document_id,
             source_sha256=passage.source_sha256,
-            canonical_sha256=canonical_sha256,
+            canonical_sha256=document.canonical_sha256,
             canonical_path=passage.canonical_path,
             source_path=passage.source_path,
             result_segment_ids=passage.segment_ids,
@@ -378,34 +436,23 @@ class EvidenceLocator:
             context_segments=context,
         )
 
-    def _canonical_for_passage(
-        self,
-        passage: SearchPassage,
-        cache: dict[tuple[str, str], _CanonicalTranscript],
-    ) -> tuple[str, _CanonicalTranscript]:
-        canonical_sha256 = passage.canonical_sha256
-        if canonical_sha256 is None:
+    @staticmethod
+    def _generation_key(passage: SearchPassage) -> tuple[str, str]:
+        if passage.canonical_sha256 is None:
             raise EvidenceNavigationError(
                 "Transcript index predates canonical hashing; rebuild the library before navigating evidence"
             )
-        cache_key = (passage.canonical_path, canonical_sha256)
-        canonical = cache.get(cache_key)
-        if canonical is None:
-            canonical = self._load_canonical(passage, canonical_sha256)
-            cache[cache_key] = canonical
-        return canonical_sha256, canonical
+        return passage.canonical_path, passage.canonical_sha256
 
     @staticmethod
     def _result_indices(
         passage: SearchPassage,
-        canonical: _CanonicalTranscript,
+        document: _DocumentEvidence,
     ) -> tuple[int, ...]:
-        by_id = {
-            segment.segment_id: index
-            for index, segment in enumerate(canonical.segments)
-        }
         try:
-            result_indices = tuple(by_id[item] for item in passage.segment_ids)
+            result_indices = tuple(
+                document.index_by_id[item] for item in passage.segment_ids
+            )
         except KeyError as exc:
             raise EvidenceNavigationError(
                 "Search result references canonical evidence that no longer exists"
@@ -420,29 +467,42 @@ class EvidenceLocator:
         self,
         passage: SearchPassage,
         *,
-        canonical: _CanonicalTranscript,
+        document: _DocumentEvidence,
         result_indices: tuple[int, ...],
-        response: SearchResponse,
-        context_segments: int,
+        query: _PageQuery,
     ) -> tuple[tuple[EvidenceContextSegment, ...], tuple[EvidenceWord, ...]]:
-        first_result = min(result_indices)
-        last_result = max(result_indices)
-        context_start = max(0, first_result - context_segments)
-        context_end = min(len(canonical.segments), last_result + context_segments + 1)
+        segments = document.canonical.segments
+        context_start = max(0, min(result_indices) - query.context_segments)
+        context_end = min(
+            len(segments), max(result_indices) + query.context_segments + 1
+        )
         result_ids = set(passage.segment_ids)
         lexical_ids = set(passage.matched_segment_ids)
-        query_tokens = lexical_tokens(response.query.text)
         context: list[EvidenceContextSegment] = []
         matched_words: list[EvidenceWord] = []
 
-        for segment in canonical.segments[context_start:context_end]:
-            rendered, highlighted = self._context_segment(
-                segment,
-                result_ids=result_ids,
-                lexical_ids=lexical_ids,
-                query_tokens=query_tokens,
-                phrase=response.query.phrase,
-            )
+        for index in range(context_start, context_end):
+            segment_id = segments[index].segment_id
+            key = (index, segment_id in result_ids, segment_id in lexical_ids)
+            cached = document.rendered(key)
+            if cached is None:
+                highlighted_indices = (
+                    self._highlighted_word_indices(
+                        document.token_positions(index),
+                        query_tokens=query.tokens,
+                        phrase=query.phrase,
+                    )
+                    if key[2]
+                    else set()
+                )
+                cached = self._context_segment(
+                    segments[index],
+                    is_result=key[1],
+                    lexical_match=key[2],
+                    highlighted_indices=highlighted_indices,
+                )
+                document.remember(key, cached)
+            rendered, highlighted = cached
             context.append(rendered)
             matched_words.extend(highlighted)
         return tuple(context), tuple(matched_words)
@@ -451,21 +511,10 @@ class EvidenceLocator:
         self,
         segment: _CanonicalSegment,
         *,
-        result_ids: set[str],
-        lexical_ids: set[str],
-        query_tokens: tuple[str, ...],
-        phrase: bool,
-    ) -> tuple[EvidenceContextSegment, tuple[EvidenceWord, ...]]:
-        should_highlight = segment.segment_id in lexical_ids
-        highlighted_indices = (
-            self._highlighted_word_indices(
-                segment.words,
-                query_tokens=query_tokens,
-                phrase=phrase,
-            )
-            if should_highlight
-            else set()
-        )
+        is_result: bool,
+        lexical_match: bool,
+        highlighted_indices: set[int],
+    ) -> _RenderedSegment:
         words = tuple(
             EvidenceWord(
                 segment_id=segment.segment_id,
@@ -487,8 +536,8 @@ class EvidenceLocator:
                 text=segment.text,
                 speaker_refs=self._segment_speakers(segment),
                 words=words,
-                is_result_segment=segment.segment_id in result_ids,
-                lexical_match=should_highlight,
+                is_result_segment=is_result,
+                lexical_match=lexical_match,
             ),
             highlighted,
         )
@@ -595,17 +644,12 @@ class EvidenceLocator:
 
     @staticmethod
     def _highlighted_word_indices(
-        words: list[_CanonicalWord],
+        flattened: tuple[tuple[str, int], ...],
         *,
         query_tokens: tuple[str, ...],
         phrase: bool,
     ) -> set[int]:
-        if not words or not query_tokens:
-            return set()
-        flattened: list[tuple[str, int]] = []
-        for index, word in enumerate(words):
-            flattened.extend((token, index) for token in lexical_tokens(word.text))
-        if not flattened:
+        if not flattened or not query_tokens:
             return set()
         if not phrase:
             requested = set(query_tokens)
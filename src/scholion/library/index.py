@@ -1,4 +1,5 @@
-from dataclasses import dataclass
+import hashlib
+from dataclasses import dataclass, field
 from enum import StrEnum
 from typing import Protocol, runtime_checkable
 
@@ -108,6 +109,35 @@ class IndexedDocument:
     canonical_modified_ns: int | None = None
 
 
+@dataclass(frozen=True, slots=True)
+class EvidenceScope:
+    """Validated set of canonical evidence keys that a search is restricted to.
+
+    Keys are ``(document_id, canonical_sha256, segment_id)``. ``scope_id`` is a digest of
+    the keys, so equal scopes compare in constant time. Search backends load a scope's
+    keys into a session table once under that ID and join against it on later searches,
+    rather than resending every key with each query.
+    """
+
+    keys: tuple[tuple[str, str, str], ...] = field(compare=False, repr=False)
+    scope_id: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        if len(self.keys) != len(set(self.keys)):
+            raise ValueError("evidence_scope cannot contain duplicates")
+        digest = hashlib.sha256()
+        for document_id, canonical_sha256, segment_id in self.keys:
+            if not document_id.strip() or not segment_id.strip():
+                raise ValueError("evidence_scope identities cannot be empty")
+            _validate_sha256("evidence_scope canonical_sha256", canonical_sha256)
+            digest.update(f"{document_id}\0{canonical_sha256}\0{segment_id}\n".encode())
+        object.__setattr__(self, "scope_id", digest.hexdigest())
+
+    @property
+    def size(self) -> int:
+        return len(self.keys)
+
+
 @dataclass(frozen=True, slots=True)
 class SearchQuery:
     """Stable application query contract shared by CLI, UI, and index adapters."""
@@ -120,7 +150,7 @@ class SearchQuery:
     document_ids: tuple[str, ...] = ()
     sort: SearchSort = SearchSort.RELEVANCE
     limit: int = 100
-    evidence_scope: tuple[tuple[str, str, str], ...] | None = None
+    evidence_scope: EvidenceScope | None = None
 
     def __post_init__(self) -> None:
         if not self.text.strip():
@@ -136,17 +166,10 @@ class SearchQuery:
                 raise ValueError(f"{name} cannot contain empty values")
             if len(values) != len(set(values)):
                 raise ValueError(f"{name} cannot contain duplicates")
-        self._validate_evidence_scope()
-
-    def _validate_evidence_scope(self) -> None:
-        if self.evidence_scope is None:
-            return
-        if len(self.evidence_scope) != len(set(self.evidence_scope)):
-            raise ValueError("evidence_scope cannot contain duplicates")
-        for document_id, canonical_sha256, segment_id in self.evidence_scope:
-            if not document_id.strip() or not segment_id.strip():
-                raise ValueError("evidence_scope identities cannot be empty")
-            _validate_sha256("evidence_scope canonical_sha256", canonical_sha256)
+        if self.evidence_scope is not None and not isinstance(
+            self.evidence_scope, EvidenceScope
+        ):
+            raise ValueError("evidence_scope must be an EvidenceScope")
 
 
 @dataclass(frozen=True, slots=True)
@@ -206,6 +229,10 @@ class TranscriptIndex(Protocol):
 
     def search(self, query: SearchQuery) -> tuple[TranscriptMatch, ...]: ...
 
+    def state_token(self) -> str:
+        """Return an opaque token that changes whenever indexed content changes."""
+        ...
+
     def clear(self) -> None: ...
 
     def close(self) -> None: ...
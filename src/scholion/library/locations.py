@@ -9,6 +9,7 @@ by a higher-level application adapter, not an action performed by this service.
 from __future__ import annotations
 
 import json
+from collections.abc import Iterator
 from dataclasses import dataclass, replace
 from datetime import UTC, datetime
 from enum import StrEnum
@@ -20,12 +21,18 @@ from pydantic import BaseModel, ConfigDict, ValidationError
 
 from scholion.core.file_manager_facade import FileManagerFacade
 from scholion.library.errors import LibraryLocationError
+from scholion.library.recording_discovery import (
+    ConcurrentRecordingWalker,
+    RecordingCursorEntry,
+    RecordingDiscoveryCursor,
+)
 from scholion.library.service import LibraryRefreshReport, TranscriptLibraryService
 from scholion.workspace.models import WorkspacePaths
 
 _STATE_SCHEMA_VERSION = 1
 _MAX_LOCATIONS = 1_000
 _MAX_DISCOVERED_RECORDINGS = 10_000
+_DEFAULT_DISCOVERY_PAGE_SIZE = 500
 _RECORDING_EXTENSIONS = frozenset(
     {
         ".aac",
@@ -110,6 +117,7 @@ class DiscoveredRecording:
     size_bytes: int
     location_ids: tuple[str, ...]
     automatic_processing_requested: bool
+    modified_ns: int | None = None
 
     def __post_init__(self) -> None:
         if not self.path.strip() or not Path(self.path).is_absolute():
@@ -124,6 +132,7 @@ class DiscoveredRecording:
 class RecordingDiscoveryReport:
     recordings: tuple[DiscoveredRecording, ...]
     unavailable_location_ids: tuple[str, ...]
+    unreadable_directories: int = 0
 
     @property
     def automatic_candidates(self) -> tuple[DiscoveredRecording, ...]:
@@ -132,6 +141,28 @@ class RecordingDiscoveryReport:
         )
 
 
+@dataclass(frozen=True, slots=True)
+class RecordingDiscoveryPage:
+    """One streamed batch of discovered recordings; ``final`` marks the end of a walk."""
+
+    recordings: tuple[DiscoveredRecording, ...]
+    unavailable_location_ids: tuple[str, ...]
+    final: bool
+    unreadable_directories: int = 0
+
+    @property
+    def automatic_candidates(self) -> tuple[DiscoveredRecording, ...]:
+        return tuple(
+            item for item in self.recordings if item.automatic_processing_requested
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class _RecordingSource:
+    root: Path
+    location: LibraryLocation
+
+
 @dataclass(frozen=True, slots=True)
 class ManagedTranscriptRefreshReport:
     refresh: LibraryRefreshReport
@@ -257,11 +288,15 @@ class LibraryLocationService:
         transcript_library: TranscriptLibraryService,
         file_manager: FileManagerFacade,
         paths: WorkspacePaths,
+        discovery_cursor: RecordingDiscoveryCursor | None = None,
+        walker: ConcurrentRecordingWalker | None = None,
     ) -> None:
         self.store = store
         self.transcript_library = transcript_library
         self.file_manager = file_manager
         self.paths = paths
+        self.discovery_cursor = discovery_cursor
+        self.walker = walker or ConcurrentRecordingWalker(_RECORDING_EXTENSIONS)
 
     def locations(self) -> tuple[LibraryLocation, ...]:
         return self.store.locations()
@@ -336,6 +371,15 @@ class LibraryLocationService:
     def refresh_transcript_locations(
         self, *, verify: bool = False
     ) -> ManagedTranscriptRefreshReport:
+        roots, unavailable = self.transcript_roots()
+        report = self.transcript_library.refresh(roots, verify=verify)
+        return ManagedTranscriptRefreshReport(
+            refresh=report,
+            unavailable_location_ids=unavailable,
+        )
+
+    def transcript_roots(self) -> tuple[tuple[Path, ...], tuple[str, ...]]:
+        """Return enabled transcript-library roots and the ids of unavailable ones."""
         roots: list[Path] = []
         unavailable: list[str] = []
         for location in self.store.locations():
@@ -349,62 +393,161 @@ class LibraryLocationService:
                 unavailable.append(location.location_id)
                 continue
             roots.append(root)
-        report = self.transcript_library.refresh(tuple(roots), verify=verify)
-        return ManagedTranscriptRefreshReport(
-            refresh=report,
-            unavailable_location_ids=tuple(sorted(unavailable)),
+        return tuple(roots), tuple(sorted(unavailable))
+
+    def discover_recordings(
+        self, *, changes_only: bool = False
+    ) -> RecordingDiscoveryReport:
+        """Materialize one discovery walk; large trees should use ``iter_recording_pages``."""
+        recordings: list[DiscoveredRecording] = []
+        unavailable: tuple[str, ...] = ()
+        unreadable = 0
+        for page in self.iter_recording_pages(changes_only=changes_only):
+            recordings.extend(page.recordings)
+            if len(recordings) > _MAX_DISCOVERED_RECORDINGS:
+                raise LibraryLocationError(
+                    "Recording discovery exceeded the safe candidate limit; "
+                    "use paged discovery for large recording sources"
+                )
+            unavailable = page.unavailable_location_ids
+            unreadable = page.unreadable_directories
+        return RecordingDiscoveryReport(
+            recordings=tuple(sorted(recordings, key=lambda item: item.path)),
+            unavailable_location_ids=unavailable,
+            unreadable_directories=unreadable,
         )
 
-    def discover_recordings(self) -> RecordingDiscoveryReport:
-        discovered: dict[Path, tuple[int, set[str], bool]] = {}
-        unavailable: list[str] = []
+    def iter_recording_pages(
+        self,
+        *,
+        changes_only: bool = False,
+        page_size: int = _DEFAULT_DISCOVERY_PAGE_SIZE,
+    ) -> Iterator[RecordingDiscoveryPage]:
+        """Stream recordings under enabled recording sources, recursively, in pages.
+
+        With ``changes_only``, recordings whose signature and provenance match the
+        persisted cursor are omitted. The cursor advances only when the consumer asks
+        for the page after the final one, so a walk abandoned or failed on any page,
+        including the last, is reported again rather than lost. A recording reached
+        through several symlinks is reported once, with the first provenance seen.
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be positive")
+        cursor = self._require_cursor() if changes_only else None
+        sources, unavailable = self._recording_sources()
+        unavailable_ids = tuple(
+            sorted(item.location.location_id for item in unavailable)
+        )
+        previous = {} if cursor is None else cursor.load()
+        observed: list[RecordingCursorEntry] = []
+        reported: set[Path] = set()
+        unreadable: list[Path] = []
+        page: list[DiscoveredRecording] = []
+        for scanned in self.walker.walk(self._walk_roots(sources)):
+            if not scanned.readable:
+                unreadable.append(scanned.path)
+                continue
+            location_ids, automatic = self._provenance(scanned.path, sources)
+            for found in scanned.recordings:
+                if found.path in reported:
+                    continue
+                reported.add(found.path)
+                entry = RecordingCursorEntry(
+                    path=str(found.path),
+                    size_bytes=found.size_bytes,
+                    modified_ns=found.modified_ns,
+                    location_ids=location_ids,
+                    automatic_processing_requested=automatic,
+                )
+                if cursor is not None:
+                    observed.append(entry)
+                    if previous.get(entry.path) == entry:
+                        continue
+                page.append(
+                    DiscoveredRecording(
+                        path=entry.path,
+                        size_bytes=entry.size_bytes,
+                        location_ids=location_ids,
+                        automatic_processing_requested=automatic,
+                        modified_ns=entry.modified_ns,
+                    )
+                )
+                if len(page) >= page_size:
+                    yield RecordingDiscoveryPage(tuple(page), unavailable_ids, False)
+                    page = []
+        yield RecordingDiscoveryPage(
+            tuple(page),
+            unavailable_ids,
+            True,
+            unreadable_directories=len(unreadable),
+        )
+        if cursor is not None:
+            unscanned = (*(item.root for item in unavailable), *unreadable)
+            cursor.save(self._retained_cursor(previous, observed, unscanned))
+
+    def _recording_sources(
+        self,
+    ) -> tuple[tuple[_RecordingSource, ...], tuple[_RecordingSource, ...]]:
+        available: list[_RecordingSource] = []
+        unavailable: list[_RecordingSource] = []
         for location in self.store.locations():
             if (
                 not location.enabled
                 or location.kind is not LibraryLocationKind.RECORDING_SOURCE
             ):
                 continue
-            root = self._resolved(location.path)
-            if not root.is_dir():
-                unavailable.append(location.location_id)
-                continue
-            for candidate in self.file_manager.list_files(root):
-                resolved = candidate.resolve(strict=False)
-                if (
-                    resolved.name.startswith(".")
-                    or resolved.suffix.lower() not in _RECORDING_EXTENSIONS
-                ):
-                    continue
-                metadata = self.file_manager.get_file_metadata(resolved)
-                size = int(metadata["size"])
-                if size < 1:
-                    continue
-                previous = discovered.get(resolved)
-                ids = set() if previous is None else set(previous[1])
-                ids.add(location.location_id)
-                automatic = (
-                    location.processing_policy is RecordingProcessingPolicy.AUTOMATIC
-                    or (False if previous is None else previous[2])
-                )
-                discovered[resolved] = (size, ids, automatic)
-                if len(discovered) > _MAX_DISCOVERED_RECORDINGS:
-                    raise LibraryLocationError(
-                        "Recording discovery exceeded the safe candidate limit"
-                    )
-        recordings = tuple(
-            DiscoveredRecording(
-                path=str(path),
-                size_bytes=value[0],
-                location_ids=tuple(sorted(value[1])),
-                automatic_processing_requested=value[2],
-            )
-            for path, value in sorted(discovered.items(), key=lambda item: str(item[0]))
+            source = _RecordingSource(self._resolved(location.path), location)
+            (available if source.root.is_dir() else unavailable).append(source)
+        return tuple(available), tuple(unavailable)
+
+    @staticmethod
+    def _walk_roots(sources: tuple[_RecordingSource, ...]) -> tuple[Path, ...]:
+        roots = sorted({source.root for source in sources})
+        return tuple(
+            root for root in roots if not any(other in root.parents for other in roots)
         )
-        return RecordingDiscoveryReport(
-            recordings=recordings,
-            unavailable_location_ids=tuple(sorted(unavailable)),
+
+    @staticmethod
+    def _provenance(
+        directory: Path,
+        sources: tuple[_RecordingSource, ...],
+    ) -> tuple[tuple[str, ...], bool]:
+        granting = [
+            source.location
+            for source in sources
+            if source.root == directory or source.root in directory.parents
+        ]
+        return (
+            tuple(sorted(location.location_id for location in granting)),
+            any(
+                location.processing_policy is RecordingProcessingPolicy.AUTOMATIC
+                for location in granting
+            ),
         )
 
+    @staticmethod
+    def _retained_cursor(
+        previous: dict[str, RecordingCursorEntry],
+        observed: list[RecordingCursorEntry],
+        unscanned: tuple[Path, ...],
+    ) -> list[RecordingCursorEntry]:
+        """Keep prior entries under roots this walk could not see, drop vanished ones."""
+        retained = {entry.path: entry for entry in observed}
+        for path, entry in previous.items():
+            if path in retained:
+                continue
+            parents = Path(path).parents
+            if any(directory in parents for directory in unscanned):
+                retained[path] = entry
+        return list(retained.values())
+
+    def _require_cursor(self) -> RecordingDiscoveryCursor:
+        if self.discovery_cursor is None:
+            raise LibraryLocationError(
+                "Incremental recording discovery is not configured in this installation"
+            )
+        return self.discovery_cursor
+
     def _replace_location(
         self,
         location_id: str,
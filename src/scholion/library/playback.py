@@ -5,6 +5,8 @@ from __future__ import annotations
 import hashlib
 import json
 import math
+import time
+from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Protocol
@@ -15,9 +17,15 @@ from scholion.core.errors import ScholionError
 from scholion.core.file_manager_facade import FileManagerFacade
 from scholion.library.errors import PlaybackAuthorizationError
 from scholion.library.index import IndexedDocument, TranscriptIndex
+from scholion.library.playback_leases import (
+    PlaybackVerificationLease,
+    PlaybackVerificationLeaseStore,
+    SourceFileIdentity,
+)
 from scholion.media.models import MediaInfo, StreamKind
 
 _MAX_CANONICAL_BYTES = 256 * 1024 * 1024
+_DEFAULT_LEASE_SECONDS = 600.0
 
 
 class _CanonicalSource(BaseModel):
@@ -70,8 +78,22 @@ class PlaybackGrant:
             raise ValueError("seek_seconds must remain inside source duration")
 
 
+@dataclass(frozen=True, slots=True)
+class _VerifiedSource:
+    path: str
+    size_bytes: int
+    modified_ns: int
+    audio_stream_indices: tuple[int, ...]
+    has_video: bool
+
+
 class PlaybackAuthorizationService:
-    """Authorize playback only when canonical generation and source bytes still agree."""
+    """Authorize playback only when canonical generation and source bytes still agree.
+
+    With a lease store, a successful source proof is reused for ``lease_seconds`` while
+    the file's identity and verified digest are unchanged; ``verify=True`` always
+    re-hashes.
+    """
 
     def __init__(
         self,
@@ -79,10 +101,18 @@ class PlaybackAuthorizationService:
         index: TranscriptIndex,
         file_manager: FileManagerFacade,
         media_probe: MediaProbe,
+        lease_store: PlaybackVerificationLeaseStore | None = None,
+        lease_seconds: float = _DEFAULT_LEASE_SECONDS,
+        clock: Callable[[], float] = time.time,
     ) -> None:
+        if not math.isfinite(lease_seconds) or lease_seconds < 0:
+            raise ValueError("lease_seconds must be finite and non-negative")
         self.index = index
         self.file_manager = file_manager
         self.media_probe = media_probe
+        self.lease_store = lease_store
+        self.lease_seconds = lease_seconds
+        self.clock = clock
 
     def authorize(
         self,
@@ -90,27 +120,25 @@ class PlaybackAuthorizationService:
         *,
         expected_canonical_sha256: str,
         seek_seconds: float,
+        verify: bool = False,
     ) -> PlaybackGrant:
         self._validate_seek_shape(seek_seconds)
         document = self._require_generation(document_id, expected_canonical_sha256)
         projection = self._verified_projection(document, expected_canonical_sha256)
         source_path = self._require_source_path(document)
-        media = self._verified_source(source_path, projection, document)
+        source = self._verified_source(source_path, projection, document, verify=verify)
 
         if seek_seconds > projection.source.duration_seconds:
             raise PlaybackAuthorizationError(
                 "Playback position is outside the verified recording duration"
             )
 
-        audio_streams = tuple(
-            stream for stream in media.streams if stream.kind is StreamKind.AUDIO
-        )
-        if len(audio_streams) != 1:
+        if len(source.audio_stream_indices) != 1:
             raise PlaybackAuthorizationError(
                 "Playback for recordings with multiple audio streams is not enabled yet; "
                 "Scholion will not guess which track matches this transcript"
             )
-        if audio_streams[0].index != projection.source.audio_stream_index:
+        if source.audio_stream_indices[0] != projection.source.audio_stream_index:
             raise PlaybackAuthorizationError(
                 "The verified source audio stream no longer matches this transcript"
             )
@@ -119,17 +147,13 @@ class PlaybackAuthorizationService:
             document_id=document.document_id,
             canonical_sha256=expected_canonical_sha256,
             source_sha256=projection.source.sha256,
-            source_path=str(media.input.path),
-            source_size_bytes=media.input.size_bytes,
-            source_modified_ns=media.input.modified_ns,
+            source_path=source.path,
+            source_size_bytes=source.size_bytes,
+            source_modified_ns=source.modified_ns,
             duration_seconds=projection.source.duration_seconds,
             seek_seconds=seek_seconds,
             audio_stream_index=projection.source.audio_stream_index,
-            media_kind=(
-                "video"
-                if any(stream.kind is StreamKind.VIDEO for stream in media.streams)
-                else "audio"
-            ),
+            media_kind="video" if source.has_video else "audio",
             container_format=projection.source.container_format,
         )
 
@@ -240,6 +264,103 @@ class PlaybackAuthorizationService:
         source_path: Path,
         projection: _CanonicalPlaybackProjection,
         document: IndexedDocument,
+        *,
+        verify: bool,
+    ) -> _VerifiedSource:
+        identity = self._source_identity(source_path)
+        if not verify and identity is not None:
+            leased = self._leased_source(source_path, identity, projection, document)
+            if leased is not None:
+                return leased
+        try:
+            media = self._probed_source(source_path, projection, document)
+        except PlaybackAuthorizationError:
+            self._discard_lease(source_path)
+            raise
+        audio_stream_indices = tuple(
+            stream.index for stream in media.streams if stream.kind is StreamKind.AUDIO
+        )
+        has_video = any(stream.kind is StreamKind.VIDEO for stream in media.streams)
+        if identity is not None and identity == self._source_identity(source_path):
+            self._record_lease(
+                PlaybackVerificationLease(
+                    source_path=str(source_path),
+                    identity=identity,
+                    source_sha256=media.input.sha256,
+                    audio_stream_indices=audio_stream_indices,
+                    has_video=has_video,
+                    verified_at=self.clock(),
+                )
+            )
+        return _VerifiedSource(
+            path=str(media.input.path),
+            size_bytes=media.input.size_bytes,
+            modified_ns=media.input.modified_ns,
+            audio_stream_indices=audio_stream_indices,
+            has_video=has_video,
+        )
+
+    def _leased_source(
+        self,
+        source_path: Path,
+        identity: SourceFileIdentity,
+        projection: _CanonicalPlaybackProjection,
+        document: IndexedDocument,
+    ) -> _VerifiedSource | None:
+        if self.lease_store is None:
+            return None
+        if (
+            projection.source.sha256 != document.source_sha256
+            or identity.size_bytes != projection.source.size_bytes
+        ):
+            return None
+        lease = self.lease_store.get(str(source_path))
+        if lease is None or not lease.covers(
+            identity,
+            source_sha256=projection.source.sha256,
+            now=self.clock(),
+            lease_seconds=self.lease_seconds,
+        ):
+            return None
+        return _VerifiedSource(
+            path=lease.source_path,
+            size_bytes=identity.size_bytes,
+            modified_ns=identity.modified_ns,
+            audio_stream_indices=lease.audio_stream_indices,
+            has_video=lease.has_video,
+        )
+
+    def _record_lease(self, lease: PlaybackVerificationLease) -> None:
+        # Leases only save work; failing to persist one must never fail playback.
+        if self.lease_store is None:
+            return
+        try:
+            self.lease_store.put(
+                lease, oldest_allowed=lease.verified_at - self.lease_seconds
+            )
+        except (OSError, ScholionError):
+            return
+
+    def _discard_lease(self, source_path: Path) -> None:
+        if self.lease_store is None:
+            return
+        try:
+            self.lease_store.discard(str(source_path))
+        except (OSError, ScholionError):
+            return
+
+    @staticmethod
+    def _source_identity(source_path: Path) -> SourceFileIdentity | None:
+        try:
+            return SourceFileIdentity.of(source_path)
+        except OSError:
+            return None
+
+    def _probed_source(
+        self,
+        source_path: Path,
+        projection: _CanonicalPlaybackProjection,
+        document: IndexedDocument,
     ) -> MediaInfo:
         try:
             media = self.media_probe.probe(source_path)
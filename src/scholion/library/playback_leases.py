@@ -0,0 +1,202 @@
+"""Short-lived verification leases for repeat playback of one verified source.
+
+Playback authorization proves that the original recording still hashes to the digest the
+canonical transcript recorded. For a multi-gigabyte video that proof is a full SHA-256
+plus FFprobe, which is too slow to repeat for every seek while a user clicks through
+results in the same recording.
+
+A lease remembers one successful proof, bound to the file's identity as the operating
+system reports it (device, inode, size, modification and status-change times) and to the
+digest that was verified. Any change to that identity, a different expected digest, or
+expiry sends authorization back through the full proof. Leases are private, disposable
+state: a missing or invalid lease file only costs one re-hash.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+
+from scholion.core.file_manager_facade import FileManagerFacade
+
+_LEASE_SCHEMA_VERSION = 1
+_MAX_LEASE_FILE_BYTES = 1024 * 1024
+_MAX_LEASES = 64
+
+
+@dataclass(frozen=True, slots=True)
+class SourceFileIdentity:
+    """Operating-system identity of one source file, read without opening it."""
+
+    device: int
+    inode: int
+    size_bytes: int
+    modified_ns: int
+    changed_ns: int
+
+    @classmethod
+    def of(cls, path: Path) -> SourceFileIdentity:
+        stat = os.stat(path)
+        return cls(
+            device=stat.st_dev,
+            inode=stat.st_ino,
+            size_bytes=stat.st_size,
+            modified_ns=stat.st_mtime_ns,
+            changed_ns=stat.st_ctime_ns,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class PlaybackVerificationLease:
+    """One successful source proof and the facts playback needs from it."""
+
+    source_path: str
+    identity: SourceFileIdentity
+    source_sha256: str
+    audio_stream_indices: tuple[int, ...]
+    has_video: bool
+    verified_at: float
+
+    def __post_init__(self) -> None:
+        if not self.source_path.strip() or not Path(self.source_path).is_absolute():
+            raise ValueError("lease source path must be absolute")
+        if len(self.source_sha256) != 64 or any(
+            character not in "0123456789abcdef" for character in self.source_sha256
+        ):
+            raise ValueError("lease digest must be a lowercase 64-character digest")
+        if not math.isfinite(self.verified_at):
+            raise ValueError("lease verification time must be finite")
+
+    def covers(
+        self,
+        identity: SourceFileIdentity,
+        *,
+        source_sha256: str,
+        now: float,
+        lease_seconds: float,
+    ) -> bool:
+        return (
+            self.identity == identity
+            and self.source_sha256 == source_sha256
+            and self.verified_at <= now < self.verified_at + lease_seconds
+        )
+
+
+class _StoredLease(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    source_path: str
+    device: int
+    inode: int
+    size_bytes: int
+    modified_ns: int
+    changed_ns: int
+    source_sha256: str
+    audio_stream_indices: list[int] = Field(max_length=256)
+    has_video: bool
+    verified_at: float
+
+
+class _StoredLeases(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    schema_version: int
+    leases: list[_StoredLease] = Field(max_length=_MAX_LEASES)
+
+
+class PlaybackVerificationLeaseStore:
+    """Private JSON store of recent source proofs, bounded to a few recordings."""
+
+    def __init__(self, path: Path, file_manager: FileManagerFacade) -> None:
+        self.path = path.expanduser().resolve(strict=False)
+        self.file_manager = file_manager
+
+    def get(self, source_path: str) -> PlaybackVerificationLease | None:
+        return self._load().get(source_path)
+
+    def put(self, lease: PlaybackVerificationLease, *, oldest_allowed: float) -> None:
+        """Record ``lease`` and drop leases verified before ``oldest_allowed``."""
+        leases = {
+            path: item
+            for path, item in self._load().items()
+            if item.verified_at >= oldest_allowed
+        }
+        leases[lease.source_path] = lease
+        newest = sorted(leases.values(), key=lambda item: item.verified_at)[
+            -_MAX_LEASES:
+        ]
+        self._save(newest)
+
+    def discard(self, source_path: str) -> None:
+        leases = self._load()
+        if leases.pop(source_path, None) is not None:
+            self._save(list(leases.values()))
+
+    def _load(self) -> dict[str, PlaybackVerificationLease]:
+        if not self.file_manager.file_exists(self.path):
+            return {}
+        try:
+            metadata = self.file_manager.get_file_metadata(self.path)
+            if metadata["size"] > _MAX_LEASE_FILE_BYTES:
+                return {}
+            stored = _StoredLeases.model_validate(
+                json.loads(self.file_manager.read_file(self.path))
+            )
+            if stored.schema_version != _LEASE_SCHEMA_VERSION:
+                return {}
+            return {
+                item.source_path: PlaybackVerificationLease(
+                    source_path=item.source_path,
+                    identity=SourceFileIdentity(
+                        device=item.device,
+                        inode=item.inode,
+                        size_bytes=item.size_bytes,
+                        modified_ns=item.modified_ns,
+                        changed_ns=item.changed_ns,
+                    ),
+                    source_sha256=item.source_sha256,
+                    audio_stream_indices=tuple(item.audio_stream_indices),
+                    has_video=item.has_video,
+                    verified_at=item.verified_at,
+                )
+                for item in stored.leases
+            }
+        except (
+            OSError,
+            UnicodeDecodeError,
+            json.JSONDecodeError,
+            ValidationError,
+            ValueError,
+        ):
+            return {}
+
+    def _save(self, leases: list[PlaybackVerificationLease]) -> None:
+        self.file_manager.ensure_directory_exists(self.path.parent, private=True)
+        payload = json.dumps(
+            {
+                "schema_version": _LEASE_SCHEMA_VERSION,
+                "leases": [
+                    {
+                        "source_path": item.source_path,
+                        "device": item.identity.device,
+                        "inode": item.identity.inode,
+                        "size_bytes": item.identity.size_bytes,
+                        "modified_ns": item.identity.modified_ns,
+                        "changed_ns": item.identity.changed_ns,
+                        "source_sha256": item.source_sha256,
+                        "audio_stream_indices": list(item.audio_stream_indices),
+                        "has_video": item.has_video,
+                        "verified_at": item.verified_at,
+                    }
+                    for item in sorted(leases, key=lambda lease: lease.source_path)
+                ],
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+        ).encode("utf-8")
+        self.file_manager.save_file(payload + b"\n", self.path, private=True)
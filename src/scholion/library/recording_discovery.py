@@ -0,0 +1,260 @@
+"""Recursive recording-source traversal and the persisted incremental-discovery cursor.
+
+Recording sources are often deep, date-partitioned trees on network mounts where each
+directory listing is a round trip. The walker therefore scans several directories
+concurrently with ``os.scandir`` and reuses each ``DirEntry`` for type checks, so a file
+costs at most one ``stat``. Results stream back one scanned directory at a time; callers
+never wait for, or hold, the whole tree.
+
+Traversal policy is explicit: hidden entries are skipped, directory symlinks are not
+followed (so link cycles and links out of the granted root cannot widen discovery), and
+depth is bounded. A file symlink is reported at its resolved target, named and filtered
+by that target, as flat discovery always did. An unreadable directory is reported, not
+fatal.
+
+The cursor records the path/size/mtime/provenance signature of every recording the last
+incremental discovery reported. It is private, rebuildable state: losing it only means
+the next incremental discovery reports every recording again.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+
+from pydantic import BaseModel, ConfigDict, ValidationError
+
+from scholion.core.file_manager_facade import FileManagerFacade
+
+_CURSOR_SCHEMA_VERSION = 1
+_MAX_CURSOR_BYTES = 256 * 1024 * 1024
+_DEFAULT_WALK_WORKERS = 8
+_DEFAULT_MAX_DEPTH = 64
+
+
+@dataclass(frozen=True, slots=True)
+class FoundRecording:
+    """One candidate file observed by the walker, with its cached stat fields."""
+
+    path: Path
+    size_bytes: int
+    modified_ns: int
+
+
+@dataclass(frozen=True, slots=True)
+class ScannedDirectory:
+    """Candidates directly inside one directory, or a record that it was unreadable."""
+
+    path: Path
+    recordings: tuple[FoundRecording, ...]
+    readable: bool
+
+
+@dataclass(frozen=True, slots=True)
+class _DirectoryScan:
+    scanned: ScannedDirectory
+    subdirectories: tuple[Path, ...]
+    depth: int
+
+
+class ConcurrentRecordingWalker:
+    """Bounded-concurrency recursive ``os.scandir`` walker for recording roots."""
+
+    def __init__(
+        self,
+        extensions: frozenset[str],
+        *,
+        max_workers: int = _DEFAULT_WALK_WORKERS,
+        max_depth: int = _DEFAULT_MAX_DEPTH,
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be positive")
+        if max_depth < 0:
+            raise ValueError("max_depth cannot be negative")
+        self.extensions = frozenset(item.lower() for item in extensions)
+        self.max_workers = max_workers
+        self.max_depth = max_depth
+
+    def walk(self, roots: Iterable[Path]) -> Iterator[ScannedDirectory]:
+        """Yield scanned directories as they complete; order is not deterministic.
+
+        At most ``2 * max_workers`` directory scans are in flight, so the backlog of
+        discovered-but-unscanned directories is the only state that grows with tree
+        breadth, and it holds paths rather than listings.
+        """
+        backlog: deque[tuple[Path, int]] = deque((root, 0) for root in roots)
+        in_flight: set[Future[_DirectoryScan]] = set()
+        pool = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="scholion-discovery",
+        )
+        try:
+            while backlog or in_flight:
+                while backlog and len(in_flight) < 2 * self.max_workers:
+                    directory, depth = backlog.popleft()
+                    in_flight.add(pool.submit(self._scan, directory, depth))
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    scan = future.result()
+                    if scan.depth < self.max_depth:
+                        backlog.extend(
+                            (child, scan.depth + 1) for child in scan.subdirectories
+                        )
+                    yield scan.scanned
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _scan(self, directory: Path, depth: int) -> _DirectoryScan:
+        recordings: list[FoundRecording] = []
+        subdirectories: list[Path] = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.startswith("."):
+                        continue
+                    self._classify(entry, recordings, subdirectories)
+        except OSError:
+            return _DirectoryScan(ScannedDirectory(directory, (), False), (), depth)
+        recordings.sort(key=lambda item: str(item.path))
+        return _DirectoryScan(
+            ScannedDirectory(directory, tuple(recordings), True),
+            tuple(sorted(subdirectories)),
+            depth,
+        )
+
+    def _classify(
+        self,
+        entry: os.DirEntry[str],
+        recordings: list[FoundRecording],
+        subdirectories: list[Path],
+    ) -> None:
+        path = Path(entry.path)
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                subdirectories.append(path)
+                return
+            if entry.is_symlink():
+                if not entry.is_file():
+                    return
+                path = path.resolve(strict=True)
+                if path.name.startswith("."):
+                    return
+            if os.path.splitext(path.name)[1].lower() not in self.extensions:
+                return
+            if not entry.is_file():
+                return
+            stat = entry.stat()
+        except (OSError, RuntimeError):
+            return
+        if stat.st_size < 1:
+            return
+        recordings.append(FoundRecording(path, stat.st_size, stat.st_mtime_ns))
+
+
+@dataclass(frozen=True, slots=True)
+class RecordingCursorEntry:
+    """Signature of one recording as last reported by incremental discovery."""
+
+    path: str
+    size_bytes: int
+    modified_ns: int
+    location_ids: tuple[str, ...]
+    automatic_processing_requested: bool
+
+    def __post_init__(self) -> None:
+        if not self.path.strip() or not Path(self.path).is_absolute():
+            raise ValueError("cursor recording path must be absolute")
+        if self.size_bytes < 1:
+            raise ValueError("cursor recording size must be positive")
+
+
+class _StoredEntry(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    path: str
+    size_bytes: int
+    modified_ns: int
+    location_ids: list[str]
+    automatic_processing_requested: bool
+
+
+class _StoredCursor(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    schema_version: int
+    recordings: list[_StoredEntry]
+
+
+class RecordingDiscoveryCursor:
+    """Private JSON cursor of recordings already reported by incremental discovery."""
+
+    def __init__(self, path: Path, file_manager: FileManagerFacade) -> None:
+        self.path = path.expanduser().resolve(strict=False)
+        self.file_manager = file_manager
+
+    def load(self) -> dict[str, RecordingCursorEntry]:
+        """Load the cursor; a missing or invalid cursor means nothing was reported yet."""
+        if not self.file_manager.file_exists(self.path):
+            return {}
+        try:
+            metadata = self.file_manager.get_file_metadata(self.path)
+            if metadata["size"] > _MAX_CURSOR_BYTES:
+                return {}
+            stored = _StoredCursor.model_validate(
+                json.loads(self.file_manager.read_file(self.path))
+            )
+            if stored.schema_version != _CURSOR_SCHEMA_VERSION:
+                return {}
+            return {
+                item.path: RecordingCursorEntry(
+                    path=item.path,
+                    size_bytes=item.size_bytes,
+                    modified_ns=item.modified_ns,
+                    location_ids=tuple(item.location_ids),
+                    automatic_processing_requested=item.automatic_processing_requested,
+                )
+                for item in stored.recordings
+            }
+        except (
+            UnicodeDecodeError,
+            json.JSONDecodeError,
+            ValidationError,
+            ValueError,
+        ):
+            return {}
+
+    def save(self, entries: Iterable[RecordingCursorEntry]) -> None:
+        self.file_manager.ensure_directory_exists(self.path.parent, private=True)
+        payload = json.dumps(
+            {
+                "schema_version": _CURSOR_SCHEMA_VERSION,
+                "recordings": [
+                    {
+                        "path": item.path,
+                        "size_bytes": item.size_bytes,
+                        "modified_ns": item.modified_ns,
+                        "location_ids": list(item.location_ids),
+                        "automatic_processing_requested": (
+                            item.automatic_processing_requested
+                        ),
+                    }
+                    for item in sorted(entries, key=lambda entry: entry.path)
+                ],
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+        ).encode("utf-8")
+        if len(payload) > _MAX_CURSOR_BYTES:
+            self.reset()
+            return
+        self.file_manager.save_file(payload + b"\n", self.path, private=True)
+
+    def reset(self) -> None:
+        """Forget reported recordings so the next incremental discovery reports all."""
+        if self.file_manager.file_exists(self.path):
+            self.file_manager.delete_file(self.path)
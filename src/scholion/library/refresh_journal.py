@@ -0,0 +1,268 @@
+"""Persistent directory journal that lets an unchanged library refresh stop early.
+
+The journal is private, rebuildable derived state. It records the modification time of
+every directory a normal refresh depends on, the size/mtime signature of each candidate
+JSON file directly inside it, a digest of the completed jobs the lifecycle registry
+knows, and the document identities the lexical index held when that state was observed.
+
+A later refresh compares that record with one ``scandir`` per watched directory, a
+``stat`` per candidate JSON file in it, and one indexed registry query. It does not
+query the lexical index, list lifecycle records, or read canonical files, but the cost
+still grows with the number of watched directories and files. Every refresh scans them
+all; watch mode uses its own change feed only to decide when to refresh.
+
+Scholion's own state is not a watched file. Job progress rewrites the lifecycle
+registry constantly, so the registry contributes only its completed-artifact digest.
+
+Directory mtimes are a change detector, not evidence. A file rewritten in place without
+touching its directory is reconciled the next time the directory changes or by
+``refresh(verify=True)``, which never consults the journal.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Iterable
+from dataclasses import dataclass, replace
+from pathlib import Path
+
+from pydantic import BaseModel, ConfigDict, ValidationError
+
+from scholion.core.file_manager_facade import FileManagerFacade
+
+_JOURNAL_SCHEMA_VERSION = 2
+_MAX_JOURNAL_BYTES = 64 * 1024 * 1024
+_JOURNALED_SUFFIXES = (".json",)
+
+
+@dataclass(frozen=True, slots=True)
+class FileSignature:
+    """Cheap change detector for one candidate file inside a watched directory."""
+
+    name: str
+    size_bytes: int
+    modified_ns: int
+
+
+@dataclass(frozen=True, slots=True)
+class DirectorySignature:
+    """Observed state of one watched directory; ``modified_ns`` is None when absent.
+
+    ``readable`` is False when the directory exists but could not be listed. Such a
+    signature never matches a recorded one and is never written to the journal.
+    """
+
+    path: str
+    modified_ns: int | None
+    files: tuple[FileSignature, ...] = ()
+    readable: bool = True
+
+
+@dataclass(frozen=True, slots=True)
+class RefreshJournalEntry:
+    """The library state a completed refresh observed and produced."""
+
+    backend_id: str
+    scope: tuple[str, ...]
+    directories: tuple[DirectorySignature, ...]
+    document_ids: tuple[str, ...]
+    skipped_files: int
+    lifecycle_digest: str
+
+    def __post_init__(self) -> None:
+        if not self.backend_id.strip():
+            raise ValueError("journal backend_id cannot be empty")
+        if self.skipped_files < 0:
+            raise ValueError("journal skipped file count cannot be negative")
+        paths = tuple(item.path for item in self.directories)
+        if len(paths) != len(set(paths)):
+            raise ValueError("journal directories must be unique")
+
+
+class _StoredFile(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    name: str
+    size_bytes: int
+    modified_ns: int
+
+
+class _StoredDirectory(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    path: str
+    modified_ns: int | None
+    files: list[_StoredFile]
+
+
+class _StoredJournal(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    schema_version: int
+    backend_id: str
+    scope: list[str]
+    directories: list[_StoredDirectory]
+    document_ids: list[str]
+    skipped_files: int
+    lifecycle_digest: str
+
+
+def capture_directory(path: Path) -> DirectorySignature:
+    """Stat one directory and the candidate files directly inside it."""
+    resolved = path.expanduser().resolve(strict=False)
+    try:
+        modified_ns = resolved.stat().st_mtime_ns
+        if not resolved.is_dir():
+            return DirectorySignature(str(resolved), None)
+        files: list[FileSignature] = []
+        with os.scandir(resolved) as entries:
+            for entry in entries:
+                if not entry.name.lower().endswith(_JOURNALED_SUFFIXES):
+                    continue
+                if not entry.is_file():
+                    continue
+                stat = entry.stat()
+                files.append(FileSignature(entry.name, stat.st_size, stat.st_mtime_ns))
+    except FileNotFoundError:
+        return DirectorySignature(str(resolved), None)
+    except OSError:
+        # Leave permission and I/O failures to the full refresh, which reports them.
+        return DirectorySignature(str(resolved), None, readable=False)
+    return DirectorySignature(
+        str(resolved),
+        modified_ns,
+        tuple(sorted(files, key=lambda item: item.name)),
+    )
+
+
+class LibraryRefreshJournal:
+    """Private JSON journal of watched directories for near-instant no-op refresh."""
+
+    def __init__(self, path: Path, file_manager: FileManagerFacade) -> None:
+        self.path = path.expanduser().resolve(strict=False)
+        self.file_manager = file_manager
+
+    def capture(self, directories: Iterable[Path]) -> tuple[DirectorySignature, ...]:
+        unique = {
+            directory.expanduser().resolve(strict=False) for directory in directories
+        }
+        return tuple(capture_directory(directory) for directory in sorted(unique))
+
+    def unchanged_entry(
+        self,
+        *,
+        backend_id: str,
+        scope: tuple[str, ...],
+        lifecycle_digest: str,
+    ) -> RefreshJournalEntry | None:
+        """Return the recorded entry when no watched directory changed since it."""
+        entry = self.load()
+        if (
+            entry is None
+            or entry.backend_id != backend_id
+            or entry.scope != scope
+            or entry.lifecycle_digest != lifecycle_digest
+        ):
+            return None
+        current: list[DirectorySignature] = []
+        moved = False
+        for recorded in entry.directories:
+            observed = capture_directory(Path(recorded.path))
+            if (
+                not observed.readable
+                or observed.files != recorded.files
+                or ((observed.modified_ns is None) != (recorded.modified_ns is None))
+            ):
+                return None
+            moved = moved or observed.modified_ns != recorded.modified_ns
+            current.append(observed)
+        if moved:
+            entry = replace(entry, directories=tuple(current))
+            self.record(entry)
+        return entry
+
+    def record(self, entry: RefreshJournalEntry) -> None:
+        if not all(item.readable for item in entry.directories):
+            self.invalidate()
+            return
+        self.file_manager.ensure_directory_exists(self.path.parent, private=True)
+        payload = json.dumps(
+            {
+                "schema_version": _JOURNAL_SCHEMA_VERSION,
+                "backend_id": entry.backend_id,
+                "scope": list(entry.scope),
+                "directories": [
+                    {
+                        "path": item.path,
+                        "modified_ns": item.modified_ns,
+                        "files": [
+                            {
+                                "name": signature.name,
+                                "size_bytes": signature.size_bytes,
+                                "modified_ns": signature.modified_ns,
+                            }
+                            for signature in item.files
+                        ],
+                    }
+                    for item in entry.directories
+                ],
+                "document_ids": list(entry.document_ids),
+                "skipped_files": entry.skipped_files,
+                "lifecycle_digest": entry.lifecycle_digest,
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+        ).encode("utf-8")
+        if len(payload) > _MAX_JOURNAL_BYTES:
+            self.invalidate()
+            return
+        self.file_manager.save_file(payload + b"\n", self.path, private=True)
+
+    def load(self) -> RefreshJournalEntry | None:
+        """Load the journal; any missing or invalid journal simply disables the fast path."""
+        if not self.file_manager.file_exists(self.path):
+            return None
+        try:
+            metadata = self.file_manager.get_file_metadata(self.path)
+            if metadata["size"] > _MAX_JOURNAL_BYTES:
+                return None
+            stored = _StoredJournal.model_validate(
+                json.loads(self.file_manager.read_file(self.path))
+            )
+            if stored.schema_version != _JOURNAL_SCHEMA_VERSION:
+                return None
+            return RefreshJournalEntry(
+                backend_id=stored.backend_id,
+                scope=tuple(stored.scope),
+                directories=tuple(
+                    DirectorySignature(
+                        path=item.path,
+                        modified_ns=item.modified_ns,
+                        files=tuple(
+                            FileSignature(
+                                signature.name,
+                                signature.size_bytes,
+                                signature.modified_ns,
+                            )
+                            for signature in item.files
+                        ),
+                    )
+                    for item in stored.directories
+                ),
+                document_ids=tuple(stored.document_ids),
+                skipped_files=stored.skipped_files,
+                lifecycle_digest=stored.lifecycle_digest,
+            )
+        except (
+            UnicodeDecodeError,
+            json.JSONDecodeError,
+            ValidationError,
+            ValueError,
+        ):
+            return None
+
+    def invalidate(self) -> None:
+        """Forget the recorded state so the next refresh takes the full path."""
+        if self.file_manager.file_exists(self.path):
+            self.file_manager.delete_file(self.path)
@@ -3,6 +3,7 @@
 from dataclasses import dataclass  # noqa: I001
 from typing import Protocol, runtime_checkable
 
+from scholion.library.index import EvidenceScope
 from scholion.library.research_state import ResearchProjectionRecord
 
 
@@ -56,6 +57,20 @@ class ProjectedEvidenceSummary:
         return len(self.note_ids)
 
 
+@dataclass(frozen=True, slots=True)
+class RankedNoteMatch:
+    """One note matched by note text, scored with BM25 over projected note terms."""
+
+    note_id: str
+    score: float
+
+    def __post_init__(self) -> None:
+        if not self.note_id.strip():
+            raise ValueError("ranked note_id cannot be empty")
+        if self.score < 0:
+            raise ValueError("ranked note score cannot be negative")
+
+
 @dataclass(frozen=True, slots=True)
 class ResearchProjectionStatus:
     authoritative_sequence: int
@@ -98,10 +113,20 @@ class ResearchProjectionIndex(Protocol):
         self, filters: ResearchProjectionFilter
     ) -> tuple[str, ...]: ...
 
+    def rank_notes(
+        self,
+        filters: ResearchProjectionFilter,
+        *,
+        limit: int,
+        prefix: bool = False,
+    ) -> tuple[RankedNoteMatch, ...]: ...
+
     def matching_evidence(
         self, filters: ResearchProjectionFilter
     ) -> tuple[EvidenceScopeKey, ...]: ...
 
+    def evidence_scope(self, filters: ResearchProjectionFilter) -> EvidenceScope: ...
+
     def summaries(
         self, keys: tuple[EvidenceScopeKey, ...]
     ) -> dict[EvidenceScopeKey, ProjectedEvidenceSummary]: ...
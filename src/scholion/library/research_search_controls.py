@@ -7,6 +7,7 @@ module keeps that composition in Python and gives adapters one typed object to r
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass, field
 
 from scholion.library.errors import ResearchStateError
@@ -17,6 +18,7 @@ from scholion.library.research_workspace import (
     WorkspaceSearchResponse,
 )
 from scholion.library.retrieval import RetrievalMode
+from scholion.library.saved_search_results import SavedSearchResultCache
 from scholion.library.workspace_metadata import SavedSearch, SavedSearchIntent
 
 
@@ -67,8 +69,13 @@ class ResearchSearchIntent:
 class ResearchSearchControlService:
     """Execute and persist typed search intent without moving semantics into adapters."""
 
-    def __init__(self, workspace: ResearchWorkspaceService) -> None:
+    def __init__(
+        self,
+        workspace: ResearchWorkspaceService,
+        result_cache: SavedSearchResultCache | None = None,
+    ) -> None:
         self.workspace = workspace
+        self.result_cache = result_cache
 
     def search(self, intent: ResearchSearchIntent) -> WorkspaceSearchResponse:
         return self.workspace.search(
@@ -150,6 +157,37 @@ class ResearchSearchControlService:
         saved = self.inspect_saved_search(identifier)
         return saved, self.workspace.run_saved_search(saved.saved_search_id)
 
+    def run_saved_search_page(
+        self,
+        identifier: str,
+        *,
+        render: Callable[[SavedSearch, WorkspaceSearchResponse], dict[str, object]],
+        page_format: str,
+    ) -> dict[str, object]:
+        """Run a saved search and render it, reusing a page rendered at the same state.
+
+        Without a result cache this is ``render(*run_saved_search(identifier))``. With
+        one, the generation is captured before and after the run, and a page is kept
+        only if nothing changed in between, so a concurrent write never gets cached
+        under the generation that preceded it.
+        """
+        if self.result_cache is None:
+            return render(*self.run_saved_search(identifier))
+        saved = self.inspect_saved_search(identifier)
+        generation = self.workspace.saved_search_generation(saved.saved_search_id)
+        cached = self.result_cache.lookup(generation, page_format=page_format)
+        if cached is not None:
+            if self.workspace.logger is not None:
+                self.workspace.logger.info(
+                    "research_saved_search_page_reused",
+                    saved_search_id=saved.saved_search_id,
+                )
+            return cached
+        page = render(saved, self.workspace.run_saved_search(saved.saved_search_id))
+        if self.workspace.saved_search_generation(saved.saved_search_id) == generation:
+            self.result_cache.record(generation, page, page_format=page_format)
+        return page
+
     def delete_saved_search(
         self,
         identifier: str,
@@ -157,7 +195,15 @@ class ResearchSearchControlService:
         expected_updated_at: str,
     ) -> None:
         """Delete durable saved intent with optimistic concurrency."""
+        if self.result_cache is None:
+            self.workspace.delete_saved_search(
+                identifier,
+                expected_updated_at=expected_updated_at,
+            )
+            return
+        saved = self.inspect_saved_search(identifier)
         self.workspace.delete_saved_search(
-            identifier,
+            saved.saved_search_id,
             expected_updated_at=expected_updated_at,
         )
+        self.result_cache.forget(saved.saved_search_id)
@@ -7,7 +7,7 @@ from dataclasses import dataclass, replace
 from scholion.core.ilogger import ILogger
 from scholion.library.errors import ResearchStateError
 from scholion.library.evidence import EvidenceLocator
-from scholion.library.index import IndexedDocument, SearchQuery
+from scholion.library.index import EvidenceScope, IndexedDocument, SearchQuery
 from scholion.library.research import (
     LocatedCanonicalEvidence,
     LocatedSearchPassage,
@@ -32,6 +32,7 @@ from scholion.library.research_state import (
     ResearchTag,
 )
 from scholion.library.retrieval import RetrievalMode
+from scholion.library.saved_search_results import SavedSearchGeneration
 from scholion.library.service import TranscriptLibraryService
 from scholion.library.text import lexical_tokens
 from scholion.library.workspace_metadata import (
@@ -196,7 +197,9 @@ class ResearchWorkspaceService:
                 document_ids=query.document_ids,
             )
             scope = (
-                () if resolved is None else self.projection.matching_evidence(resolved)
+                EvidenceScope(())
+                if resolved is None
+                else self.projection.evidence_scope(resolved)
             )
             scoped_query = replace(query, evidence_scope=scope)
         navigation = self.navigation.search(
@@ -249,9 +252,10 @@ class ResearchWorkspaceService:
             mode=mode,
             context_segments=context_segments,
         )
-        notes = self.notes(
-            filters=ResearchQueryFilters(note_text=query_text),
+        notes = self._ranked_notes(
+            ResearchQueryFilters(note_text=query_text),
             limit=limit,
+            prefix=True,
         )
         tags = self._matching_tags(query_text, limit=limit)
         collections = self._matching_collections(query_text, limit=limit)
@@ -377,6 +381,31 @@ class ResearchWorkspaceService:
         )
         return result
 
+    def saved_search_generation(self, identifier: str) -> SavedSearchGeneration:
+        """Capture every state ``run_saved_search`` would read, after syncing research.
+
+        Semantic state only participates for semantic and hybrid searches, so rebuilding
+        embeddings leaves lexical saved searches' materialized pages valid.
+        """
+        saved = self._require_saved_search(identifier)
+        self.projector.sync()
+        semantic_state: str | None = None
+        if saved.intent.mode is not RetrievalMode.LEXICAL:
+            state = self.transcript_library.semantic_state()
+            if state is not None:
+                semantic_state = (
+                    f"{state.profile.profile_id}@{state.profile.resolved_revision}:"
+                    f"{state.corpus_fingerprint}:{state.chunk_count}"
+                )
+        return SavedSearchGeneration(
+            saved_search_id=saved.saved_search_id,
+            saved_updated_at=saved.updated_at,
+            lexical_state=self.transcript_library.index_state_token(),
+            semantic_state=semantic_state,
+            projected_through_sequence=self.projection.projected_through_sequence(),
+            speaker_label_revision=self.navigation.speaker_labels.revision(),
+        )
+
     def workspace_navigation(self, *, limit: int = 10) -> WorkspaceNavigation:
         """Return disposable frequent/recent views over current research relationships."""
         return self._metadata_store().navigation(limit=limit)
@@ -513,6 +542,11 @@ class ResearchWorkspaceService:
             notes = self.state.notes(document_id=document_id, limit=limit)
             return self._note_views(notes)
 
+        if resolved_filters.note_text is not None:
+            return self._ranked_notes(
+                resolved_filters, document_id=document_id, limit=limit
+            )
+
         self.projector.sync()
         document_ids = () if document_id is None else (document_id,)
         resolved = self._resolve_projection_filter(
@@ -539,6 +573,26 @@ class ResearchWorkspaceService:
     def rebuild_projection(self) -> ResearchProjectionSyncReport:
         return self.projector.rebuild()
 
+    def _ranked_notes(
+        self,
+        filters: ResearchQueryFilters,
+        *,
+        limit: int,
+        document_id: str | None = None,
+        prefix: bool = False,
+    ) -> tuple[ResearchNoteView, ...]:
+        """Return text-matched notes in BM25 order; ``prefix`` completes the last word."""
+        self.projector.sync()
+        resolved = self._resolve_projection_filter(
+            filters,
+            document_ids=() if document_id is None else (document_id,),
+        )
+        if resolved is None:
+            return ()
+        ranked = self.projection.rank_notes(resolved, limit=limit, prefix=prefix)
+        note_ids = tuple(item.note_id for item in ranked)
+        return self._note_views(self.state.notes_by_ids(note_ids))
+
     def _resolve_projection_filter(
         self,
         filters: ResearchQueryFilters,
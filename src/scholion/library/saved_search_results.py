@@ -0,0 +1,172 @@
+"""Opt-in materialized result pages for saved searches.
+
+Running a saved search re-resolves research filters, queries the search backends, and
+verifies every passage against its canonical transcript. When nothing those steps read has
+changed, the rendered page is the same. This cache stores the last rendered page for each
+saved search, keyed by a ``SavedSearchGeneration`` that names every input the results
+depend on:
+
+- the saved search's own version (its intent and ``updated_at``);
+- the lexical index state token, which changes on every committed index write;
+- for semantic and hybrid searches, the embedding profile and ``corpus_fingerprint``;
+- the research projection watermark after syncing with authoritative state; and
+- the revision of the speaker display labels shown with each passage.
+
+A page is served only when the stored generation equals the current one, so a stale page
+is never returned; a mismatch is an ordinary miss. The cache is private and disposable:
+each saved search has one file, and losing any of them only costs a re-run.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+
+from scholion.core.errors import StorageError
+from scholion.core.file_manager_facade import FileManagerFacade
+
+_RESULTS_SCHEMA_VERSION = 1
+_MAX_PAGE_FILE_BYTES = 16 * 1024 * 1024
+_DEFAULT_MAX_ENTRIES = 256
+
+
+@dataclass(frozen=True, slots=True)
+class SavedSearchGeneration:
+    """Every state a saved search's results depend on, captured at one moment."""
+
+    saved_search_id: str
+    saved_updated_at: str
+    lexical_state: str
+    semantic_state: str | None
+    projected_through_sequence: int
+    speaker_label_revision: str
+
+    def __post_init__(self) -> None:
+        if not self.saved_search_id.strip():
+            raise ValueError("saved_search_id cannot be empty")
+        if not self.lexical_state.strip():
+            raise ValueError("lexical_state cannot be empty")
+        if self.projected_through_sequence < 0:
+            raise ValueError("projected_through_sequence cannot be negative")
+
+    @property
+    def digest(self) -> str:
+        encoded = json.dumps(
+            [
+                self.saved_search_id,
+                self.saved_updated_at,
+                self.lexical_state,
+                self.semantic_state,
+                self.projected_through_sequence,
+                self.speaker_label_revision,
+            ],
+            separators=(",", ":"),
+        ).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+
+class _StoredPage(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    schema_version: int
+    saved_search_id: str
+    page_format: str
+    generation: str = Field(min_length=64, max_length=64)
+    page: dict[str, object]
+
+
+class SavedSearchResultCache:
+    """Private per-saved-search files holding the last rendered result page."""
+
+    def __init__(
+        self,
+        directory: Path,
+        file_manager: FileManagerFacade,
+        *,
+        max_entries: int = _DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be positive")
+        self.directory = directory.expanduser().resolve(strict=False)
+        self.file_manager = file_manager
+        self.max_entries = max_entries
+
+    def lookup(
+        self, generation: SavedSearchGeneration, *, page_format: str
+    ) -> dict[str, object] | None:
+        """Return the stored page only if it was rendered at exactly ``generation``."""
+        path = self._path(generation.saved_search_id)
+        if not self.file_manager.file_exists(path):
+            return None
+        try:
+            if self.file_manager.get_file_metadata(path)["size"] > _MAX_PAGE_FILE_BYTES:
+                return None
+            stored = _StoredPage.model_validate(
+                json.loads(self.file_manager.read_file(path))
+            )
+        except (
+            StorageError,
+            UnicodeDecodeError,
+            json.JSONDecodeError,
+            ValidationError,
+        ):
+            return None
+        if (
+            stored.schema_version != _RESULTS_SCHEMA_VERSION
+            or stored.saved_search_id != generation.saved_search_id
+            or stored.page_format != page_format
+            or stored.generation != generation.digest
+        ):
+            return None
+        return stored.page
+
+    def record(
+        self,
+        generation: SavedSearchGeneration,
+        page: Mapping[str, object],
+        *,
+        page_format: str,
+    ) -> None:
+        """Replace the saved search's page; pages above the size limit are not kept."""
+        payload = json.dumps(
+            {
+                "schema_version": _RESULTS_SCHEMA_VERSION,
+                "saved_search_id": generation.saved_search_id,
+                "page_format": page_format,
+                "generation": generation.digest,
+                "page": page,
+            },
+            separators=(",", ":"),
+        ).encode("utf-8")
+        if len(payload) + 1 > _MAX_PAGE_FILE_BYTES:
+            self.forget(generation.saved_search_id)
+            return
+        path = self._path(generation.saved_search_id)
+        self.file_manager.ensure_directory_exists(self.directory, private=True)
+        self.file_manager.save_file(payload + b"\n", path, private=True)
+        self._prune(keep=path)
+
+    def forget(self, saved_search_id: str) -> None:
+        path = self._path(saved_search_id)
+        if self.file_manager.file_exists(path):
+            self.file_manager.delete_file(path)
+
+    def _prune(self, *, keep: Path) -> None:
+        pages = self.file_manager.list_files(self.directory, (".json",))
+        if len(pages) <= self.max_entries:
+            return
+        aged = sorted(
+            (page for page in pages if page != keep),
+            key=lambda page: self.file_manager.get_file_metadata(page)["last_modified"],
+        )
+        for page in aged[: len(pages) - self.max_entries]:
+            self.file_manager.delete_file(page)
+
+    def _path(self, saved_search_id: str) -> Path:
+        name = hashlib.sha256(saved_search_id.encode("utf-8")).hexdigest()[:32]
+        return self.directory / f"{name}.json"
@@ -222,6 +222,17 @@ class SemanticIndex(Protocol):
         vectors: tuple[EmbeddingVector, ...],
     ) -> None: ...
 
+    def apply_delta(
+        self,
+        *,
+        corpus_fingerprint: str,
+        upserts: tuple[SearchChunk, ...],
+        vectors: tuple[EmbeddingVector, ...],
+        removals: tuple[str, ...],
+    ) -> None:
+        """Replace the chunks of the named documents within the current profile."""
+        ...
+
     def state(self) -> SemanticState | None: ...
 
     def search(
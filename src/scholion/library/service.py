@@ -1,10 +1,12 @@
 import hashlib
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, replace
 from enum import StrEnum
 from pathlib import Path
 
 from scholion.core.file_manager_facade import FileManagerFacade
+from scholion.core.measurements import ExecutionObserver, NoOpExecutionObserver
 from scholion.library.errors import (
     SemanticSearchUnavailableError,
     TranscriptLibraryBuildError,
@@ -18,21 +20,31 @@ from scholion.library.index import (
     TranscriptIndex,
     TranscriptMatch,
 )
+from scholion.library.playback_leases import SourceFileIdentity
 from scholion.library.projection import load_indexed_transcript
+from scholion.library.refresh_journal import (
+    DirectorySignature,
+    LibraryRefreshJournal,
+    RefreshJournalEntry,
+)
 from scholion.library.retrieval import RetrievalMode, SearchResponse, TranscriptSearch
 from scholion.library.semantic import (
     ChunkingProfile,
     EmbeddingProfile,
     EmbeddingProvider,
+    EmbeddingVector,
+    SearchChunk,
     SemanticIndex,
     SemanticState,
     build_search_chunks,
     corpus_fingerprint,
 )
+from scholion.library.source_fingerprints import SourceFingerprintCache
 from scholion.workspace.lifecycle import JobLifecycleStore, JobStatus
 from scholion.workspace.models import WorkspacePaths
 
 _HASH_BLOCK_SIZE = 1024 * 1024
+_SOURCE_HASH_WORKERS = 4
 type EmbeddingProviderFactory = Callable[[EmbeddingProfile], EmbeddingProvider]
 
 
@@ -41,6 +53,7 @@ class SourceIntegrity(StrEnum):
     CHANGED = "changed-since-transcription"
     MISSING = "source-file-missing"
     UNKNOWN = "source-path-unavailable"
+    NOT_CHECKED = "not-checked"
 
 
 @dataclass(frozen=True, slots=True)
@@ -61,6 +74,7 @@ class LibraryRefreshReport:
     skipped_files: int
     semantic_invalidated: bool
     verified_all_tracked: bool
+    semantic_updated: bool = False
 
     @property
     def changed(self) -> bool:
@@ -115,6 +129,20 @@ class _RefreshDelta:
     removed: tuple[str, ...]
     unchanged: tuple[str, ...]
     semantic_dirty: bool
+    semantic_upserts: tuple[IndexedTranscript, ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class _SemanticDelta:
+    chunks: tuple[SearchChunk, ...]
+    vectors: tuple[EmbeddingVector, ...]
+    removals: tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class _AppliedRefresh:
+    semantic_invalidated: bool
+    semantic_updated: bool
 
 
 class TranscriptLibraryService:
@@ -128,6 +156,9 @@ class TranscriptLibraryService:
         file_manager: FileManagerFacade,
         semantic_index: SemanticIndex | None = None,
         embedding_provider_factory: EmbeddingProviderFactory | None = None,
+        refresh_journal: LibraryRefreshJournal | None = None,
+        fingerprint_cache: SourceFingerprintCache | None = None,
+        observer: ExecutionObserver | None = None,
     ) -> None:
         self.index = index
         self.lifecycle_store = lifecycle_store
@@ -135,9 +166,14 @@ class TranscriptLibraryService:
         self.file_manager = file_manager
         self.semantic_index = semantic_index
         self.embedding_provider_factory = embedding_provider_factory
+        self.refresh_journal = refresh_journal
+        self.fingerprint_cache = fingerprint_cache
+        self.observer = observer or NoOpExecutionObserver()
+        self._semantic_provider: EmbeddingProvider | None = None
 
     def rebuild(self, additional_paths: tuple[Path, ...] = ()) -> LibraryRebuildReport:
         ordered, skipped = self._load_transcripts(additional_paths)
+        self.invalidate_refresh_journal()
         self.index.rebuild(ordered)
         return LibraryRebuildReport(
             backend_id=self.index.backend_id,
@@ -150,8 +186,15 @@ class TranscriptLibraryService:
         additional_paths: tuple[Path, ...] = (),
         *,
         verify: bool = False,
+        incremental_semantic: bool = False,
     ) -> LibraryRefreshReport:
         """Reconcile changed canonical generations without rebuilding unchanged documents."""
+        scope = self._journal_scope(additional_paths)
+        lifecycle_digest = self._lifecycle_digest()
+        if not verify and lifecycle_digest is not None:
+            journaled = self._journaled_noop(scope, lifecycle_digest)
+            if journaled is not None:
+                return journaled
         existing = {
             document.document_id: document for document in self.index.documents()
         }
@@ -159,6 +202,9 @@ class TranscriptLibraryService:
             self._resolved_path(document.canonical_path): document
             for document in existing.values()
         }
+        observed = self._observe_journal_directories(
+            existing.values(), additional_paths
+        )
         candidates = self._refresh_candidates(existing, additional_paths)
         loaded, unchanged, skipped = self._load_refresh_candidates(
             candidates,
@@ -166,20 +212,78 @@ class TranscriptLibraryService:
             existing_by_path,
             verify=verify,
         )
-        delta = self._plan_refresh_delta(existing, loaded, unchanged)
-        semantic_invalidated = self._apply_refresh_delta(delta)
-        return LibraryRefreshReport(
-            backend_id=self.index.backend_id,
+        delta = self._plan_refresh_delta(existing, loaded, unchanged, existing)
+        applied = self._apply_refresh_delta(
+            delta, incremental_semantic=incremental_semantic
+        )
+        documents = self.index.documents()
+        if lifecycle_digest is not None:
+            self._record_refresh_journal(
+                scope, lifecycle_digest, observed, documents, skipped
+            )
+        return self._refresh_report(
+            delta,
+            applied,
+            indexed_documents=len(documents),
+            skipped=skipped,
+            verify=verify,
+        )
+
+    def refresh_directories(
+        self,
+        directories: tuple[Path, ...],
+        *,
+        incremental_semantic: bool = False,
+    ) -> LibraryRefreshReport:
+        """Reconcile only canonical JSON directly inside the given directories.
+
+        Tracked documents elsewhere are neither inspected nor reported. This is the
+        narrow path for change notifications; ``refresh`` remains the whole-library
+        reconciliation.
+        """
+        scope = {self._resolved_path(directory) for directory in directories}
+        if not scope:
+            raise ValueError("at least one directory is required for a scoped refresh")
+        existing = {
+            document.document_id: document for document in self.index.documents()
+        }
+        existing_by_path = {
+            self._resolved_path(document.canonical_path): document
+            for document in existing.values()
+        }
+        in_scope = {
+            document_id: document
+            for document_id, document in existing.items()
+            if self._resolved_path(document.canonical_path).parent in scope
+        }
+        candidates: dict[Path, _Candidate] = {}
+        self._add_lifecycle_artifacts(candidates, within=scope)
+        for directory in sorted(scope):
+            self._add_directory(directory, candidates, strict=False)
+        loaded, unchanged, skipped = self._load_refresh_candidates(
+            self._with_tracked_documents(candidates, in_scope.values()),
+            existing,
+            existing_by_path,
+            verify=False,
+        )
+        delta = self._plan_refresh_delta(existing, loaded, unchanged, in_scope)
+        self.invalidate_refresh_journal()
+        applied = self._apply_refresh_delta(
+            delta, incremental_semantic=incremental_semantic
+        )
+        return self._refresh_report(
+            delta,
+            applied,
             indexed_documents=len(self.index.documents()),
-            added_document_ids=delta.added,
-            updated_document_ids=delta.updated,
-            removed_document_ids=delta.removed,
-            unchanged_document_ids=delta.unchanged,
-            skipped_files=skipped,
-            semantic_invalidated=semantic_invalidated,
-            verified_all_tracked=verify,
+            skipped=skipped,
+            verify=False,
         )
 
+    def invalidate_refresh_journal(self) -> None:
+        """Force the next refresh to reconcile fully after an out-of-band index change."""
+        if self.refresh_journal is not None:
+            self.refresh_journal.invalidate()
+
     def rebuild_semantic(
         self,
         provider: EmbeddingProvider,
@@ -208,6 +312,7 @@ class TranscriptLibraryService:
             chunk_count=len(chunks),
         )
         try:
+            self.invalidate_refresh_journal()
             self.index.rebuild(transcripts)
             semantic_index.rebuild(state=state, chunks=chunks, vectors=vectors)
         except (KeyboardInterrupt, SystemExit):
@@ -234,6 +339,9 @@ class TranscriptLibraryService:
             return None
         return self.semantic_index.state()
 
+    def index_state_token(self) -> str:
+        return self.index.state_token()
+
     def documents(self) -> tuple[IndexedDocument, ...]:
         return self.index.documents()
 
@@ -247,6 +355,10 @@ class TranscriptLibraryService:
         *,
         mode: RetrievalMode = RetrievalMode.LEXICAL,
     ) -> SearchResponse:
+        with self.observer.span(f"library.query.{mode.value}"):
+            return self._retrieve(query, mode)
+
+    def _retrieve(self, query: SearchQuery, mode: RetrievalMode) -> SearchResponse:
         if mode is RetrievalMode.LEXICAL:
             return TranscriptSearch(lexical=self.index).search(query, mode=mode)
 
@@ -288,23 +400,44 @@ class TranscriptLibraryService:
             ) from exc
 
     def inspect(self, document_id: str) -> LibraryEvidenceReceipt:
-        document = next(
-            (
-                item
-                for item in self.index.documents()
-                if item.document_id == document_id
-            ),
-            None,
+        return self.inspect_many((document_id,))[0]
+
+    def inspect_many(
+        self,
+        document_ids: tuple[str, ...],
+        *,
+        verify_source: bool = True,
+    ) -> tuple[LibraryEvidenceReceipt, ...]:
+        """Inspect several transcripts with one index read and shared source hashing.
+
+        Source fingerprints are reused from the fingerprint cache while a recording's
+        file identity is unchanged; the rest are hashed with bounded parallelism. With
+        ``verify_source=False`` no recording is read and integrity is NOT_CHECKED.
+        """
+        indexed = {item.document_id: item for item in self.index.documents()}
+        documents: list[IndexedDocument] = []
+        for document_id in document_ids:
+            document = indexed.get(document_id)
+            if document is None:
+                raise TranscriptLibraryError(
+                    "Transcript is not present in the local library"
+                )
+            documents.append(document)
+        integrities = (
+            self._source_integrities(documents)
+            if verify_source
+            else {
+                document.document_id: (SourceIntegrity.NOT_CHECKED, None)
+                for document in documents
+            }
         )
-        if document is None:
-            raise TranscriptLibraryError(
-                "Transcript is not present in the local library"
+        return tuple(
+            LibraryEvidenceReceipt(
+                document=document,
+                source_integrity=integrities[document.document_id][0],
+                current_source_sha256=integrities[document.document_id][1],
             )
-        integrity, digest = self._source_integrity(document)
-        return LibraryEvidenceReceipt(
-            document=document,
-            source_integrity=integrity,
-            current_source_sha256=digest,
+            for document in documents
         )
 
     def _load_transcripts(
@@ -437,44 +570,45 @@ class TranscriptLibraryService:
         existing: dict[str, IndexedDocument],
         loaded: dict[str, IndexedTranscript],
         unchanged: set[str],
+        removable: dict[str, IndexedDocument],
     ) -> _RefreshDelta:
         upserts: list[IndexedTranscript] = []
+        semantic_upserts: list[IndexedTranscript] = []
         added: list[str] = []
         updated: list[str] = []
-        semantic_dirty = False
         for document_id in sorted(loaded):
             transcript = loaded[document_id]
             previous = existing.get(document_id)
             if previous is None:
                 added.append(document_id)
                 upserts.append(transcript)
-                semantic_dirty = True
+                semantic_upserts.append(transcript)
             elif self._same_indexed_projection(previous, transcript):
                 unchanged.add(document_id)
             else:
                 updated.append(document_id)
                 upserts.append(transcript)
-                semantic_dirty = semantic_dirty or self._semantic_projection_changed(
-                    previous, transcript
-                )
-        removed = self._removed_documents(existing, loaded, unchanged)
+                if self._semantic_projection_changed(previous, transcript):
+                    semantic_upserts.append(transcript)
+        removed = self._removed_documents(removable, loaded, unchanged)
         return _RefreshDelta(
             upserts=tuple(upserts),
             added=tuple(added),
             updated=tuple(updated),
             removed=removed,
             unchanged=tuple(sorted(unchanged)),
-            semantic_dirty=semantic_dirty or bool(removed),
+            semantic_dirty=bool(semantic_upserts) or bool(removed),
+            semantic_upserts=tuple(semantic_upserts),
         )
 
     def _removed_documents(
         self,
-        existing: dict[str, IndexedDocument],
+        removable: dict[str, IndexedDocument],
         loaded: dict[str, IndexedTranscript],
         unchanged: set[str],
     ) -> tuple[str, ...]:
         removed: list[str] = []
-        for document_id, document in sorted(existing.items()):
+        for document_id, document in sorted(removable.items()):
             if document_id in loaded or document_id in unchanged:
                 continue
             canonical = self._resolved_path(document.canonical_path)
@@ -486,8 +620,22 @@ class TranscriptLibraryService:
             removed.append(document_id)
         return tuple(removed)
 
-    def _apply_refresh_delta(self, delta: _RefreshDelta) -> bool:
-        semantic_invalidated = self._invalidate_semantic_if_needed(delta.semantic_dirty)
+    def _apply_refresh_delta(
+        self,
+        delta: _RefreshDelta,
+        *,
+        incremental_semantic: bool,
+    ) -> _AppliedRefresh:
+        semantic_delta = (
+            self._prepare_semantic_delta(delta)
+            if incremental_semantic and (delta.upserts or delta.removed)
+            else None
+        )
+        semantic_invalidated = (
+            False
+            if semantic_delta is not None
+            else self._invalidate_semantic_if_needed(delta.semantic_dirty)
+        )
         try:
             self.index.apply_delta(
                 upserts=delta.upserts,
@@ -506,7 +654,194 @@ class TranscriptLibraryService:
                 + detail,
                 cause=exc,
             ) from exc
-        return semantic_invalidated
+        if semantic_delta is None:
+            return _AppliedRefresh(semantic_invalidated, semantic_updated=False)
+        return self._apply_semantic_delta(semantic_delta)
+
+    def _prepare_semantic_delta(self, delta: _RefreshDelta) -> _SemanticDelta | None:
+        """Embed changed documents up front, or return None to fall back to invalidation."""
+        semantic_index = self.semantic_index
+        if semantic_index is None or self.embedding_provider_factory is None:
+            return None
+        try:
+            state = semantic_index.state()
+            if (
+                state is None
+                or state.corpus_fingerprint != self._current_index_fingerprint()
+            ):
+                return None
+            provider = self._incremental_provider(state.profile)
+            chunking = ChunkingProfile()
+            if provider.profile.chunking_profile_id != chunking.profile_id:
+                return None
+            chunks = build_search_chunks(delta.semantic_upserts, profile=chunking)
+            vectors = (
+                provider.embed_passages(tuple(chunk.text for chunk in chunks))
+                if chunks
+                else ()
+            )
+        except (KeyboardInterrupt, SystemExit):
+            raise
+        except Exception:
+            return None
+        removals = {
+            *delta.removed,
+            *(transcript.document_id for transcript in delta.semantic_upserts),
+        }
+        return _SemanticDelta(
+            chunks=chunks,
+            vectors=tuple(vectors),
+            removals=tuple(sorted(removals)),
+        )
+
+    def _apply_semantic_delta(self, semantic_delta: _SemanticDelta) -> _AppliedRefresh:
+        semantic_index = self._require_semantic_index()
+        try:
+            semantic_index.apply_delta(
+                corpus_fingerprint=self._current_index_fingerprint(),
+                upserts=semantic_delta.chunks,
+                vectors=semantic_delta.vectors,
+                removals=semantic_delta.removals,
+            )
+        except (KeyboardInterrupt, SystemExit):
+            raise
+        except Exception:
+            return _AppliedRefresh(
+                semantic_invalidated=self._invalidate_semantic_if_needed(True),
+                semantic_updated=False,
+            )
+        return _AppliedRefresh(semantic_invalidated=False, semantic_updated=True)
+
+    def _incremental_provider(self, profile: EmbeddingProfile) -> EmbeddingProvider:
+        cached = self._semantic_provider
+        if cached is not None and cached.profile == profile:
+            return cached
+        if self.embedding_provider_factory is None:
+            raise SemanticSearchUnavailableError(
+                "Semantic embedding runtime is not configured"
+            )
+        provider = self.embedding_provider_factory(profile)
+        self._semantic_provider = provider
+        return provider
+
+    def _refresh_report(
+        self,
+        delta: _RefreshDelta,
+        applied: _AppliedRefresh,
+        *,
+        indexed_documents: int,
+        skipped: int,
+        verify: bool,
+    ) -> LibraryRefreshReport:
+        return LibraryRefreshReport(
+            backend_id=self.index.backend_id,
+            indexed_documents=indexed_documents,
+            added_document_ids=delta.added,
+            updated_document_ids=delta.updated,
+            removed_document_ids=delta.removed,
+            unchanged_document_ids=delta.unchanged,
+            skipped_files=skipped,
+            semantic_invalidated=applied.semantic_invalidated,
+            verified_all_tracked=verify,
+            semantic_updated=applied.semantic_updated,
+        )
+
+    def _lifecycle_digest(self) -> str | None:
+        """Fingerprint discovery's lifecycle inputs before anything else is observed."""
+        if self.refresh_journal is None:
+            return None
+        return self.lifecycle_store.completed_artifacts_digest()
+
+    def _journaled_noop(
+        self, scope: tuple[str, ...], lifecycle_digest: str
+    ) -> LibraryRefreshReport | None:
+        if self.refresh_journal is None:
+            return None
+        entry = self.refresh_journal.unchanged_entry(
+            backend_id=self.index.backend_id,
+            scope=scope,
+            lifecycle_digest=lifecycle_digest,
+        )
+        if entry is None:
+            return None
+        return LibraryRefreshReport(
+            backend_id=entry.backend_id,
+            indexed_documents=len(entry.document_ids),
+            added_document_ids=(),
+            updated_document_ids=(),
+            removed_document_ids=(),
+            unchanged_document_ids=entry.document_ids,
+            skipped_files=entry.skipped_files,
+            semantic_invalidated=False,
+            verified_all_tracked=False,
+        )
+
+    def _observe_journal_directories(
+        self,
+        documents: Iterable[IndexedDocument],
+        additional_paths: tuple[Path, ...],
+    ) -> dict[Path, DirectorySignature]:
+        if self.refresh_journal is None:
+            return {}
+        directories = {
+            self.paths.output_dir,
+            *(
+                self._resolved_path(document.canonical_path).parent
+                for document in documents
+            ),
+        }
+        for path in additional_paths:
+            resolved = self._resolved_path(path)
+            directories.add(resolved if resolved.is_dir() else resolved.parent)
+        return {
+            Path(signature.path): signature
+            for signature in self.refresh_journal.capture(directories)
+        }
+
+    def _record_refresh_journal(
+        self,
+        scope: tuple[str, ...],
+        lifecycle_digest: str,
+        observed: dict[Path, DirectorySignature],
+        documents: tuple[IndexedDocument, ...],
+        skipped: int,
+    ) -> None:
+        if self.refresh_journal is None:
+            return
+        late = self.refresh_journal.capture(
+            {
+                self._resolved_path(document.canonical_path).parent
+                for document in documents
+            }
+            - observed.keys()
+        )
+        directories = {
+            **observed,
+            **{Path(signature.path): signature for signature in late},
+        }
+        self.refresh_journal.record(
+            RefreshJournalEntry(
+                backend_id=self.index.backend_id,
+                scope=scope,
+                directories=tuple(directories[path] for path in sorted(directories)),
+                document_ids=tuple(
+                    sorted(document.document_id for document in documents)
+                ),
+                skipped_files=skipped,
+                lifecycle_digest=lifecycle_digest,
+            )
+        )
+
+    @staticmethod
+    def _journal_scope(additional_paths: tuple[Path, ...]) -> tuple[str, ...]:
+        return tuple(
+            sorted(
+                {
+                    str(TranscriptLibraryService._resolved_path(path))
+                    for path in additional_paths
+                }
+            )
+        )
 
     def _refresh_candidates(
         self,
@@ -517,7 +852,14 @@ class TranscriptLibraryService:
             candidate.canonical_path: candidate
             for candidate in self._discover(additional_paths)
         }
-        for document in existing.values():
+        return self._with_tracked_documents(candidates, existing.values())
+
+    def _with_tracked_documents(
+        self,
+        candidates: dict[Path, _Candidate],
+        documents: Iterable[IndexedDocument],
+    ) -> tuple[_Candidate, ...]:
+        for document in documents:
             canonical = self._resolved_path(document.canonical_path)
             if not canonical.is_file():
                 continue
@@ -670,13 +1012,7 @@ class TranscriptLibraryService:
 
     def _discover(self, additional_paths: tuple[Path, ...]) -> tuple[_Candidate, ...]:
         candidates: dict[Path, _Candidate] = {}
-        for record in self.lifecycle_store.list_records():
-            if record.status is not JobStatus.COMPLETED or record.artifact_path is None:
-                continue
-            artifact = record.artifact_path.resolve(strict=False)
-            if artifact.suffix.lower() != ".json" or not artifact.is_file():
-                continue
-            candidates[artifact] = _Candidate(artifact, record.input_path, True)
+        self._add_lifecycle_artifacts(candidates)
         self._add_directory(self.paths.output_dir, candidates, strict=False)
         for path in additional_paths:
             resolved = path.expanduser().resolve(strict=False)
@@ -690,6 +1026,24 @@ class TranscriptLibraryService:
                 )
         return tuple(candidates[path] for path in sorted(candidates))
 
+    def _add_lifecycle_artifacts(
+        self,
+        candidates: dict[Path, _Candidate],
+        *,
+        within: set[Path] | None = None,
+    ) -> None:
+        for record in self.lifecycle_store.list_records(
+            statuses=(JobStatus.COMPLETED,), with_artifact=True
+        ):
+            if record.artifact_path is None:
+                continue
+            artifact = record.artifact_path.resolve(strict=False)
+            if within is not None and artifact.parent not in within:
+                continue
+            if artifact.suffix.lower() != ".json" or not artifact.is_file():
+                continue
+            candidates[artifact] = _Candidate(artifact, record.input_path, True)
+
     def _add_directory(
         self,
         directory: Path,
@@ -703,40 +1057,77 @@ class TranscriptLibraryService:
             resolved = path.resolve(strict=False)
             candidates.setdefault(resolved, _Candidate(resolved, None, strict))
 
-    def _source_integrity(
-        self, document: IndexedDocument
-    ) -> tuple[SourceIntegrity, str | None]:
-        if document.source_path is None:
-            return SourceIntegrity.UNKNOWN, None
-        source = Path(document.source_path)
-        if not source.is_file():
-            return SourceIntegrity.MISSING, None
+    def _source_integrities(
+        self, documents: Iterable[IndexedDocument]
+    ) -> dict[str, tuple[SourceIntegrity, str | None]]:
+        results: dict[str, tuple[SourceIntegrity, str | None]] = {}
+        digests: dict[str, str] = {}
+        pending: dict[str, SourceFileIdentity] = {}
+        waiting: list[tuple[IndexedDocument, str]] = []
+        for document in documents:
+            if document.source_path is None:
+                results[document.document_id] = SourceIntegrity.UNKNOWN, None
+                continue
+            source = Path(document.source_path)
+            if not source.is_file():
+                results[document.document_id] = SourceIntegrity.MISSING, None
+                continue
+            try:
+                identity = SourceFileIdentity.of(source)
+            except OSError as exc:
+                raise TranscriptLibraryError(
+                    "Source integrity could not be verified", cause=exc
+                ) from exc
+            cached = (
+                None
+                if self.fingerprint_cache is None
+                else self.fingerprint_cache.lookup(document.source_path, identity)
+            )
+            if cached is not None:
+                digests[document.source_path] = cached
+            else:
+                pending[document.source_path] = identity
+            waiting.append((document, document.source_path))
+        if pending:
+            with ThreadPoolExecutor(
+                max_workers=min(_SOURCE_HASH_WORKERS, len(pending)),
+                thread_name_prefix="scholion-source-hash",
+            ) as pool:
+                hashed = dict(
+                    zip(
+                        pending,
+                        pool.map(self._hash_source, pending.items()),
+                        strict=True,
+                    )
+                )
+            digests.update(hashed)
+            if self.fingerprint_cache is not None:
+                self.fingerprint_cache.record(
+                    {path: (pending[path], digest) for path, digest in hashed.items()}
+                )
+        for document, source_path in waiting:
+            digest = digests[source_path]
+            status = (
+                SourceIntegrity.MATCHES
+                if digest == document.source_sha256
+                else SourceIntegrity.CHANGED
+            )
+            results[document.document_id] = status, digest
+        return results
+
+    def _hash_source(self, item: tuple[str, SourceFileIdentity]) -> str:
+        source_path, before = item
+        source = Path(source_path)
         try:
-            before = source.stat()
             digest = self._fingerprint(source)
-            after = source.stat()
+            after = SourceFileIdentity.of(source)
         except OSError as exc:
             raise TranscriptLibraryError(
                 "Source integrity could not be verified", cause=exc
             ) from exc
-        if (
-            before.st_size,
-            before.st_mtime_ns,
-            before.st_dev,
-            before.st_ino,
-        ) != (
-            after.st_size,
-            after.st_mtime_ns,
-            after.st_dev,
-            after.st_ino,
-        ):
+        if before != after:
             raise TranscriptLibraryError("Source changed during integrity verification")
-        status = (
-            SourceIntegrity.MATCHES
-            if digest == document.source_sha256
-            else SourceIntegrity.CHANGED
-        )
-        return status, digest
+        return digest
 
     @staticmethod
     def _fingerprint(path: Path) -> str:
@@ -0,0 +1,151 @@
+"""Cached SHA-256 fingerprints of source recordings, bound to file identity.
+
+Custody checks prove a source recording still matches the digest recorded at
+transcription time. Hashing a long recording is expensive, and a deletion is planned and
+then executed, often in separate processes, so the same recordings would be hashed
+again and again. This cache remembers the digest a full read produced, bound to the
+file's operating-system identity (device, inode, size, modification and status-change
+times). Any change to that identity forces a fresh hash.
+
+Entries live in a small SQLite file and are upserted row by row, so processes that hash
+different recordings at the same time never overwrite each other's results. The cache
+is private, disposable state: a missing, locked, or invalid database only costs a
+re-hash.
+"""
+
+from __future__ import annotations
+
+import re
+import sqlite3
+from collections.abc import Iterator, Mapping
+from contextlib import closing, contextmanager, suppress
+from pathlib import Path
+
+from scholion.core.errors import StorageError
+from scholion.core.file_manager_facade import FileManagerFacade
+from scholion.library.playback_leases import SourceFileIdentity
+
+_FINGERPRINT_SCHEMA_VERSION = 1
+_MAX_FINGERPRINTS = 4096
+_SHA256 = re.compile("^[0-9a-f]{64}$")
+
+
+class SourceFingerprintCache:
+    """Private SQLite map of source path to its last verified identity and digest."""
+
+    def __init__(self, path: Path, file_manager: FileManagerFacade) -> None:
+        self.path = path.expanduser().resolve(strict=False)
+        self.file_manager = file_manager
+        self._initialized = False
+
+    def lookup(self, source_path: str, identity: SourceFileIdentity) -> str | None:
+        """Return the cached digest only when the file identity is unchanged."""
+        if not self._initialized and not self.file_manager.file_exists(self.path):
+            return None
+        try:
+            with self._connection() as connection:
+                row = connection.execute(
+                    """
+                    SELECT device, inode, size_bytes, modified_ns, changed_ns, sha256
+                    FROM source_fingerprints WHERE source_path = ?
+                    """,
+                    (source_path,),
+                ).fetchone()
+        except StorageError:
+            return None
+        if row is None or not _SHA256.match(str(row[5])):
+            return None
+        stored = SourceFileIdentity(
+            device=int(row[0]),
+            inode=int(row[1]),
+            size_bytes=int(row[2]),
+            modified_ns=int(row[3]),
+            changed_ns=int(row[4]),
+        )
+        return None if stored != identity else str(row[5])
+
+    def record(
+        self, fingerprints: Mapping[str, tuple[SourceFileIdentity, str]]
+    ) -> None:
+        """Upsert freshly computed digests in one transaction for the whole batch.
+
+        A cache that cannot be written is skipped; the digests are simply recomputed
+        the next time they are needed.
+        """
+        if not fingerprints:
+            return
+        with suppress(StorageError), self._connection() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            connection.executemany(
+                """
+                INSERT OR REPLACE INTO source_fingerprints (
+                    source_path, device, inode, size_bytes, modified_ns, changed_ns,
+                    sha256
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    (
+                        source_path,
+                        identity.device,
+                        identity.inode,
+                        identity.size_bytes,
+                        identity.modified_ns,
+                        identity.changed_ns,
+                        digest,
+                    )
+                    for source_path, (identity, digest) in fingerprints.items()
+                ),
+            )
+            # A replaced row takes a new rowid, so rowid order tracks recency and
+            # overflow evicts the oldest proofs.
+            connection.execute(
+                """
+                DELETE FROM source_fingerprints WHERE rowid NOT IN (
+                    SELECT rowid FROM source_fingerprints ORDER BY rowid DESC LIMIT ?
+                )
+                """,
+                (_MAX_FINGERPRINTS,),
+            )
+            connection.commit()
+
+    def _initialize(self, connection: sqlite3.Connection) -> None:
+        connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS source_fingerprints (
+                source_path TEXT PRIMARY KEY,
+                device INTEGER NOT NULL,
+                inode INTEGER NOT NULL,
+                size_bytes INTEGER NOT NULL,
+                modified_ns INTEGER NOT NULL,
+                changed_ns INTEGER NOT NULL,
+                sha256 TEXT NOT NULL
+            );
+            """
+        )
+        version = connection.execute("PRAGMA user_version").fetchone()[0]
+        if version == 0:
+            connection.execute(f"PRAGMA user_version = {_FINGERPRINT_SCHEMA_VERSION}")
+        elif version != _FINGERPRINT_SCHEMA_VERSION:
+            raise sqlite3.DatabaseError("source fingerprint schema is unsupported")
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        try:
+            if not self._initialized:
+                self.file_manager.ensure_directory_exists(
+                    self.path.parent, private=True
+                )
+            with closing(sqlite3.connect(self.path, timeout=5.0)) as connection:
+                connection.execute("PRAGMA busy_timeout = 5000")
+                if not self._initialized:
+                    self._initialize(connection)
+                    self._initialized = True
+                try:
+                    yield connection
+                finally:
+                    if connection.in_transaction:
+                        connection.rollback()
+        except sqlite3.Error as exc:
+            raise StorageError(
+                "access source fingerprint cache", self.path, cause=exc
+            ) from exc
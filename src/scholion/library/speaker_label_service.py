@@ -116,6 +116,9 @@ class SpeakerLabelService:
             if item.speaker_ref in requested
         }
 
+    def revision(self) -> str:
+        return self.store.revision()
+
     def _document(
         self,
         document_id: str,
@@ -217,6 +217,13 @@ class SpeakerLabelStore:
             if item.document_id == document.document_id
         )
 
+    def revision(self) -> str:
+        """Digest of every current binding; any label change yields a new value."""
+        encoded = json.dumps(
+            [item.to_dict() for item in self._load()], separators=(",", ":")
+        ).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
     def resolve(
         self,
         *,
@@ -0,0 +1,291 @@
+"""Per-process, per-thread SQLite connection reuse for authoritative research state.
+
+Research, saved-search, and re-anchoring stores share one SQLite file, and desktop screens
+call many store methods per render. Opening a connection per call re-runs every PRAGMA and
+throws away SQLite's prepared-statement cache. The manager instead keeps one connection per
+thread for each database file and hands it out for the duration of one operation.
+
+Each operation declares its class. Authoritative writes commit with ``synchronous = FULL``.
+Read-mostly paths, and writes that only touch rebuildable bookkeeping, use ``NORMAL``,
+which in WAL mode still never corrupts the database but may lose the last commit on
+power loss. The setting is changed only when the class differs from the connection's
+previous operation.
+
+SQLite's automatic checkpoint runs inside whichever commit crosses the WAL threshold,
+where its cost is invisible. Connections here disable it. After a write, the manager
+runs a timed ``PASSIVE`` checkpoint once the WAL has grown by the threshold since the
+previous checkpoint, keeping the checkpoint count, duration, and frame counts for
+diagnostics. SQLite reuses a checkpointed WAL without shrinking it, so connections set
+``journal_size_limit = 0``: the first commit after the log restarts truncates it, and
+the size the manager measures is again only what was written since.
+
+A connection is never shared between threads, never survives ``fork``, and is replaced
+when the database file at the path is no longer the file it opened.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import weakref
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass
+from enum import StrEnum
+from pathlib import Path
+from time import perf_counter
+
+_CACHED_STATEMENTS = 256
+_WAL_CHECKPOINT_BYTES = 4 * 1024 * 1024
+_SYNCHRONOUS_LEVELS = frozenset({"NORMAL", "FULL", "EXTRA"})
+
+
+class SqliteOperation(StrEnum):
+    """Durability class of one store operation."""
+
+    AUTHORITATIVE_WRITE = "authoritative-write"
+    READ_MOSTLY = "read-mostly"
+
+
+_DEFAULT_SYNCHRONOUS: Mapping[SqliteOperation, str] = {
+    SqliteOperation.AUTHORITATIVE_WRITE: "FULL",
+    SqliteOperation.READ_MOSTLY: "NORMAL",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class SqliteCheckpoint:
+    """Outcome and cost of one WAL checkpoint."""
+
+    mode: str
+    busy: bool
+    wal_frames: int
+    checkpointed_frames: int
+    duration_seconds: float
+
+
+@dataclass(frozen=True, slots=True)
+class SqliteCheckpointStats:
+    checkpoints: int
+    total_seconds: float
+    max_seconds: float
+    last: SqliteCheckpoint | None
+
+
+@dataclass(slots=True)
+class _PooledConnection:
+    connection: sqlite3.Connection
+    identity: tuple[int, int]
+    synchronous: str | None = None
+    in_use: bool = False
+
+
+class SqliteConnectionManager:
+    """Hand out one reusable connection per thread for a single database file."""
+
+    _shared: weakref.WeakValueDictionary[Path, SqliteConnectionManager] = (
+        weakref.WeakValueDictionary()
+    )
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        database_path: Path,
+        *,
+        synchronous: Mapping[SqliteOperation, str] | None = None,
+        cached_statements: int = _CACHED_STATEMENTS,
+        checkpoint_bytes: int = _WAL_CHECKPOINT_BYTES,
+        clock: Callable[[], float] = perf_counter,
+    ) -> None:
+        levels = {**_DEFAULT_SYNCHRONOUS, **(synchronous or {})}
+        if any(level not in _SYNCHRONOUS_LEVELS for level in levels.values()):
+            raise ValueError("synchronous must be NORMAL, FULL, or EXTRA")
+        if cached_statements < 0:
+            raise ValueError("cached_statements cannot be negative")
+        if checkpoint_bytes < 1:
+            raise ValueError("checkpoint_bytes must be positive")
+        self.database_path = database_path.expanduser().resolve(strict=False)
+        self.synchronous = levels
+        self.cached_statements = cached_statements
+        self.checkpoint_bytes = checkpoint_bytes
+        self.clock = clock
+        self._local = threading.local()
+        self._pid = os.getpid()
+        self._stats_lock = threading.Lock()
+        self._stats = SqliteCheckpointStats(0, 0.0, 0.0, None)
+        self._wal_bytes_at_checkpoint = 0
+
+    @classmethod
+    def shared(cls, database_path: Path) -> SqliteConnectionManager:
+        """Return the process-wide manager for ``database_path``.
+
+        Stores opened on the same file share connections. The manager lives as long as
+        any store holds it, and its connections close once the last store is gone.
+        """
+        resolved = database_path.expanduser().resolve(strict=False)
+        with cls._shared_lock:
+            manager = cls._shared.get(resolved)
+            if manager is None:
+                manager = cls(resolved)
+                cls._shared[resolved] = manager
+            return manager
+
+    @property
+    def checkpoint_stats(self) -> SqliteCheckpointStats:
+        with self._stats_lock:
+            return self._stats
+
+    @contextmanager
+    def connection(
+        self, operation: SqliteOperation = SqliteOperation.AUTHORITATIVE_WRITE
+    ) -> Iterator[sqlite3.Connection]:
+        """Yield this thread's connection configured for ``operation``.
+
+        A transaction left open by the caller is rolled back on exit, matching the
+        previous close-per-call behavior. A connection that raised a SQLite error is
+        discarded rather than reused. Nested use on one thread gets a private
+        connection so it can never commit or roll back the outer operation.
+        """
+        level = self.synchronous[operation]
+        pooled = self._checkout()
+        if pooled.in_use:
+            nested = self._open()
+            try:
+                nested.execute(f"PRAGMA synchronous = {level}")
+                yield nested
+            finally:
+                nested.close()
+            return
+        connection = pooled.connection
+        changes_before = connection.total_changes
+        pooled.in_use = True
+        try:
+            if pooled.synchronous != level:
+                connection.execute(f"PRAGMA synchronous = {level}")
+                pooled.synchronous = level
+            yield connection
+        except sqlite3.Error:
+            self._discard()
+            raise
+        except BaseException:
+            self._release(connection)
+            raise
+        finally:
+            pooled.in_use = False
+        self._release(connection)
+        if connection.total_changes != changes_before:
+            self._checkpoint_if_needed(connection)
+
+    def checkpoint(self, mode: str = "PASSIVE") -> SqliteCheckpoint:
+        """Run and record one checkpoint on this thread's connection."""
+        if mode not in {"PASSIVE", "FULL", "RESTART", "TRUNCATE"}:
+            raise ValueError("unsupported checkpoint mode")
+        return self._run_checkpoint(self._checkout().connection, mode)
+
+    def close(self) -> None:
+        """Close this thread's connection; other threads keep theirs."""
+        pooled: _PooledConnection | None = getattr(self._local, "pooled", None)
+        self._local.pooled = None
+        if pooled is not None:
+            pooled.connection.close()
+
+    def _checkout(self) -> _PooledConnection:
+        if os.getpid() != self._pid:
+            # Connections must not cross fork; the child starts with fresh state.
+            self._local = threading.local()
+            self._pid = os.getpid()
+        pooled: _PooledConnection | None = getattr(self._local, "pooled", None)
+        if pooled is not None and (
+            pooled.in_use or pooled.identity == self._file_identity()
+        ):
+            return pooled
+        if pooled is not None:
+            self._discard()
+        pooled = _PooledConnection(self._open(), self._file_identity())
+        self._local.pooled = pooled
+        return pooled
+
+    def _open(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            self.database_path,
+            timeout=5.0,
+            cached_statements=self.cached_statements,
+        )
+        try:
+            connection.execute("PRAGMA foreign_keys = ON")
+            connection.execute("PRAGMA busy_timeout = 5000")
+            connection.execute("PRAGMA wal_autocheckpoint = 0")
+            connection.execute("PRAGMA journal_size_limit = 0")
+        except sqlite3.Error:
+            connection.close()
+            raise
+        return connection
+
+    def _file_identity(self) -> tuple[int, int]:
+        try:
+            stat = os.stat(self.database_path)
+        except OSError:
+            return (-1, -1)
+        return (stat.st_dev, stat.st_ino)
+
+    def _release(self, connection: sqlite3.Connection) -> None:
+        if not connection.in_transaction:
+            return
+        try:
+            connection.rollback()
+        except sqlite3.Error:
+            self._discard()
+
+    def _discard(self) -> None:
+        pooled: _PooledConnection | None = getattr(self._local, "pooled", None)
+        self._local.pooled = None
+        if pooled is None:
+            return
+        with suppress(sqlite3.Error):
+            pooled.connection.close()
+
+    def _checkpoint_if_needed(self, connection: sqlite3.Connection) -> None:
+        try:
+            wal_bytes = os.stat(f"{self.database_path}-wal").st_size
+        except OSError:
+            return
+        with self._stats_lock:
+            if wal_bytes < self._wal_bytes_at_checkpoint:
+                # The log restarted and was truncated; growth counts from empty again.
+                self._wal_bytes_at_checkpoint = 0
+            if wal_bytes - self._wal_bytes_at_checkpoint < self.checkpoint_bytes:
+                return
+            # A reader can pin the log so it keeps growing after a complete checkpoint;
+            # wait for another threshold of growth rather than checkpointing every write.
+            self._wal_bytes_at_checkpoint = wal_bytes
+        try:
+            self._run_checkpoint(connection, "PASSIVE")
+        except sqlite3.Error:
+            # The write already committed; a failed checkpoint is retried next time.
+            with self._stats_lock:
+                self._wal_bytes_at_checkpoint = 0
+            self._discard()
+
+    def _run_checkpoint(
+        self, connection: sqlite3.Connection, mode: str
+    ) -> SqliteCheckpoint:
+        started = self.clock()
+        row = connection.execute(f"PRAGMA wal_checkpoint({mode})").fetchone()
+        elapsed = self.clock() - started
+        busy, wal_frames, checkpointed = (int(value) for value in row or (0, -1, -1))
+        checkpoint = SqliteCheckpoint(
+            mode=mode,
+            busy=bool(busy),
+            wal_frames=wal_frames,
+            checkpointed_frames=checkpointed,
+            duration_seconds=elapsed,
+        )
+        with self._stats_lock:
+            self._stats = SqliteCheckpointStats(
+                checkpoints=self._stats.checkpoints + 1,
+                total_seconds=self._stats.total_seconds + elapsed,
+                max_seconds=max(self._stats.max_seconds, elapsed),
+                last=checkpoint,
+            )
+        return checkpoint
@@ -12,6 +12,7 @@ from typing import cast
 from scholion.library.errors import ResearchStateError
 from scholion.library.evidence import EvidenceAnchor
 from scholion.library.research_state import ResearchAnchorHistoryEntry
+from scholion.library.sqlite_connections import SqliteConnectionManager, SqliteOperation
 
 _EXTENSION_SCHEMA_VERSION = 1
 _MAX_ID_CHARS = 200
@@ -25,8 +26,16 @@ class SqliteResearchAnchorStateStore:
     advancing the projection journal therefore commit or roll back together.
     """
 
-    def __init__(self, database_path: Path) -> None:
+    def __init__(
+        self,
+        database_path: Path,
+        *,
+        connections: SqliteConnectionManager | None = None,
+    ) -> None:
         self.database_path = database_path.expanduser().resolve(strict=False)
+        self.connections = connections or SqliteConnectionManager.shared(
+            self.database_path
+        )
         self._initialize_extension()
 
     def reanchor_note(
@@ -156,7 +165,7 @@ class SqliteResearchAnchorStateStore:
         self, note_id: str
     ) -> tuple[ResearchAnchorHistoryEntry, ...]:
         resolved_id = self._validate_id(note_id, "note_id")
-        with self._connection() as connection:
+        with self._connection(SqliteOperation.READ_MOSTLY) as connection:
             exists = connection.execute(
                 "SELECT 1 FROM notes WHERE note_id = ?", (resolved_id,)
             ).fetchone()
@@ -311,23 +320,17 @@ class SqliteResearchAnchorStateStore:
         return sequence_id
 
     @contextmanager
-    def _connection(self) -> Iterator[sqlite3.Connection]:
-        connection: sqlite3.Connection | None = None
+    def _connection(
+        self, operation: SqliteOperation = SqliteOperation.AUTHORITATIVE_WRITE
+    ) -> Iterator[sqlite3.Connection]:
         try:
-            connection = sqlite3.connect(self.database_path, timeout=5.0)
-            connection.execute("PRAGMA foreign_keys = ON")
-            connection.execute("PRAGMA busy_timeout = 5000")
-            connection.execute("PRAGMA synchronous = FULL")
-            yield connection
+            with self.connections.connection(operation) as connection:
+                yield connection
         except sqlite3.Error as exc:
-            if connection is not None:
-                connection.rollback()
             raise ResearchStateError(
-                "Research anchor database operation failed", cause=exc
+                "Research anchor database operation failed",
+                cause=exc,
             ) from exc
-        finally:
-            if connection is not None:
-                connection.close()
 
     @staticmethod
     def _validate_id(value: str, name: str) -> str:
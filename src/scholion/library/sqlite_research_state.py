@@ -21,6 +21,7 @@ from scholion.library.research_state import (
     ResearchStateChange,
     ResearchTag,
 )
+from scholion.library.sqlite_connections import SqliteConnectionManager, SqliteOperation
 
 _SCHEMA_VERSION = 1
 _MAX_BODY_CHARS = 1_000_000
@@ -32,12 +33,21 @@ _MAX_BATCH_NOTES = 10_000
 class SqliteResearchStateStore:
     """Durable transactional research state with a monotonic projection outbox."""
 
-    def __init__(self, database_path: Path, file_manager: FileManagerFacade) -> None:
+    def __init__(
+        self,
+        database_path: Path,
+        file_manager: FileManagerFacade,
+        *,
+        connections: SqliteConnectionManager | None = None,
+    ) -> None:
         self.database_path = database_path.expanduser().resolve(strict=False)
         self.file_manager = file_manager
         self.file_manager.ensure_directory_exists(
             self.database_path.parent, private=True
         )
+        self.connections = connections or SqliteConnectionManager.shared(
+            self.database_path
+        )
         self._initialize()
 
     def create_note(
@@ -194,7 +204,7 @@ class SqliteResearchStateStore:
 
     def note(self, note_id: str) -> ResearchNote | None:
         resolved_id = self._validate_id(note_id, "note_id")
-        with self._connection() as connection:
+        with self._connection(SqliteOperation.READ_MOSTLY) as connection:
             return self._note(connection, resolved_id)
 
     def notes(
@@ -204,7 +214,7 @@ class SqliteResearchStateStore:
             raise ValueError("note list limit must be between 1 and 10000")
         if document_id is not None and not document_id.strip():
             raise ValueError("document_id cannot be blank")
-        with self._connection() as connection:
+        with self._connection(SqliteOperation.READ_MOSTLY) as connection:
             if document_id is None:
                 rows = connection.execute(
                     "SELECT note_id FROM notes ORDER BY updated_at DESC, note_id LIMIT ?",
@@ -230,7 +240,7 @@ class SqliteResearchStateStore:
             raise ValueError("note batch cannot contain duplicate IDs")
         for note_id in note_ids:
             self._validate_id(note_id, "note_id")
-        with self._connection() as connection:
+        with self._connection(SqliteOperation.READ_MOSTLY) as connection:
             return self._notes_by_ids(connection, note_ids)
 
     def set_note_tags(self, note_id: str, names: tuple[str, ...]) -> ResearchNote:
@@ -288,14 +298,14 @@ class SqliteResearchStateStore:
         return note
 
     def tags(self) -> tuple[ResearchTag, ...]:
-        with self._connection() as connection:
+        with self._connection(SqliteOperation.READ_MOSTLY) as connection:
             rows = connection.execute(
                 "SELECT tag_id, name FROM tags ORDER BY normalized_name, tag_id"
             ).fetchall()
         return tuple(ResearchTag(tag_id=str(row[0]), name=str(row[1])) for row in rows)
 
     def collections(self) -> tuple[ResearchCollection, ...]:
-        with self._connection() as connection:
+        with self._connection(SqliteOperation.READ_MOSTLY) as connection:
             rows = connection.execute(
                 """
                 SELECT collection_id, name FROM collections
@@ -311,7 +321,7 @@ class SqliteResearchStateStore:
         normalized = self._normalized_names(names)
         if not normalized:
             return ()
-        with self._connection() as connection:
+        with self._connection(SqliteOperation.READ_MOSTLY) as connection:
             resolved: list[str] = []
             for name in normalized:
                 row = connection.execute(
@@ -327,7 +337,7 @@ class SqliteResearchStateStore:
         normalized = self._normalized_names(names)
         if not normalized:
             return ()
-        with self._connection() as connection:
+        with self._connection(SqliteOperation.READ_MOSTLY) as connection:
             resolved: list[str] = []
             for name in normalized:
                 row = connection.execute(
@@ -340,7 +350,7 @@ class SqliteResearchStateStore:
         return tuple(sorted(resolved))
 
     def current_sequence(self) -> int:
-        with self._connection() as connection:
+        with self._connection(SqliteOperation.READ_MOSTLY) as connection:
             row = connection.execute(
                 "SELECT current_sequence FROM metadata WHERE singleton = 1"
             ).fetchone()
@@ -349,7 +359,7 @@ class SqliteResearchStateStore:
         return int(row[0])
 
     def oldest_change_sequence(self) -> int | None:
-        with self._connection() as connection:
+        with self._connection(SqliteOperation.READ_MOSTLY) as connection:
             row = connection.execute("SELECT MIN(sequence_id) FROM changes").fetchone()
         if row is None or row[0] is None:
             return None
@@ -362,7 +372,7 @@ class SqliteResearchStateStore:
             raise ValueError("sequence_id cannot be negative")
         if limit < 1 or limit > _MAX_BATCH_NOTES:
             raise ValueError("change batch limit must be between 1 and 10000")
-        with self._connection() as connection:
+        with self._connection(SqliteOperation.READ_MOSTLY) as connection:
             rows = connection.execute(
                 """
                 SELECT sequence_id, note_id FROM changes
@@ -386,12 +396,12 @@ class SqliteResearchStateStore:
             raise ValueError("projection note IDs cannot contain duplicates")
         for note_id in note_ids:
             self._validate_id(note_id, "note_id")
-        with self._connection() as connection:
+        with self._connection(SqliteOperation.READ_MOSTLY) as connection:
             notes = self._notes_by_ids(connection, note_ids)
         return tuple(self._projection_record(note) for note in notes)
 
     def projection_snapshot(self) -> ResearchProjectionSnapshot:
-        with self._connection() as connection:
+        with self._connection(SqliteOperation.READ_MOSTLY) as connection:
             connection.execute("BEGIN")
             sequence_row = connection.execute(
                 "SELECT current_sequence FROM metadata WHERE singleton = 1"
@@ -417,7 +427,7 @@ class SqliteResearchStateStore:
         threshold = max(0, through_sequence - retain)
         if threshold == 0:
             return
-        with self._connection() as connection:
+        with self._connection(SqliteOperation.READ_MOSTLY) as connection:
             connection.execute("BEGIN IMMEDIATE")
             current_row = connection.execute(
                 "SELECT current_sequence FROM metadata WHERE singleton = 1"
@@ -516,23 +526,17 @@ class SqliteResearchStateStore:
             connection.commit()
 
     @contextmanager
-    def _connection(self) -> Iterator[sqlite3.Connection]:
-        connection: sqlite3.Connection | None = None
+    def _connection(
+        self, operation: SqliteOperation = SqliteOperation.AUTHORITATIVE_WRITE
+    ) -> Iterator[sqlite3.Connection]:
         try:
-            connection = sqlite3.connect(self.database_path, timeout=5.0)
-            connection.execute("PRAGMA foreign_keys = ON")
-            connection.execute("PRAGMA busy_timeout = 5000")
-            connection.execute("PRAGMA synchronous = FULL")
-            yield connection
+            with self.connections.connection(operation) as connection:
+                yield connection
         except sqlite3.Error as exc:
-            if connection is not None:
-                connection.rollback()
             raise ResearchStateError(
-                "Research state database operation failed", cause=exc
+                "Research state database operation failed",
+                cause=exc,
             ) from exc
-        finally:
-            if connection is not None:
-                connection.close()
 
     def _note(
         self, connection: sqlite3.Connection, note_id: str
@@ -1,5 +1,6 @@
 import hashlib
 import shutil
+from dataclasses import replace
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from unittest.mock import Mock
@@ -18,7 +19,12 @@ from scholion.library.index import IndexedDocument, SearchQuery
 from scholion.library.research_state import ResearchNote
 from scholion.library.service import LibraryEvidenceReceipt, SourceIntegrity
 from scholion.library.workspace_metadata import SavedSearch, SavedSearchIntent
-from scholion.workspace.lifecycle import JobLifecycleRecord, JobStatus
+from scholion.library.workspace_usage import WorkspaceUsageMeter
+from scholion.workspace.lifecycle import (
+    JobLifecyclePage,
+    JobLifecycleRecord,
+    JobStatus,
+)
 from scholion.workspace.models import JobId, WorkspacePaths
 
 
@@ -120,6 +126,10 @@ def _record(
     )
 
 
+def _page(*records: JobLifecycleRecord) -> JobLifecyclePage:
+    return JobLifecyclePage(records, None)
+
+
 def _service(
     tmp_path: Path,
     *,
@@ -164,6 +174,17 @@ def _service(
         _saved("search-scoped", ("job-1",)),
         _saved("search-global", ()),
     )
+    metadata.saved_search_ids_by_document.side_effect = lambda document_ids: {
+        document_id: ids
+        for document_id in document_ids
+        if (
+            ids := tuple(
+                saved.saved_search_id
+                for saved in metadata.saved_searches.return_value
+                if document_id in saved.intent.query.document_ids
+            )
+        )
+    }
     service = LibraryCustodyService(
         transcript_library=library,
         lexical_index=lexical,
@@ -341,6 +362,7 @@ def test_library_view_only_removes_indexes_and_never_files(tmp_path: Path) -> No
     )
 
     lexical.remove.assert_called_once_with("job-1")
+    service.transcript_library.invalidate_refresh_journal.assert_called_once_with()
     semantic.clear.assert_called_once_with()
     research.delete_note.assert_not_called()
     assert canonical.exists()
@@ -363,7 +385,7 @@ def test_retention_defaults_to_old_completed_private_workspaces_only(
         path.mkdir(parents=True)
         (path / "private.bin").write_bytes(b"x")
 
-    lifecycle.list_records.return_value = (
+    lifecycle.list_page.return_value = _page(
         _record(
             "completed-old",
             status=JobStatus.COMPLETED,
@@ -413,7 +435,7 @@ def test_retention_incomplete_cleanup_is_explicit_and_plan_bound(
     now = datetime(2026, 8, 19, tzinfo=UTC)
     failed = service.paths.jobs_dir / "failed-old"
     failed.mkdir(parents=True)
-    service.lifecycle_store.list_records.return_value = (
+    service.lifecycle_store.list_page.return_value = _page(
         _record(
             "failed-old",
             status=JobStatus.INTERRUPTED,
@@ -450,7 +472,7 @@ def test_retention_rejects_naive_clock_and_malformed_lifecycle_time(
 
     workspace = service.paths.jobs_dir / "bad-time"
     workspace.mkdir(parents=True)
-    service.lifecycle_store.list_records.return_value = (
+    service.lifecycle_store.list_page.return_value = _page(
         _record(
             "bad-time",
             status=JobStatus.COMPLETED,
@@ -601,3 +623,165 @@ def test_retention_policy_and_value_objects_reject_invalid_state() -> None:
             (),
             "token",
         )
+
+
+def _batch_service(tmp_path: Path):
+    service, lexical, semantic, research, document, canonical, source, workspace = (
+        _service(tmp_path)
+    )
+    second_root = tmp_path / "second"
+    second_root.mkdir()
+    second, second_receipt, second_canonical, _ = _document(second_root)
+    second = replace(second, document_id="job-2")
+    second_receipt = replace(second_receipt, document=second)
+    first_receipt = service.transcript_library.inspect.return_value
+    service.transcript_library.inspect_many.return_value = (
+        first_receipt,
+        second_receipt,
+    )
+    service.workspace_metadata.saved_searches.return_value = (
+        _saved("search-scoped", ("job-1",)),
+        _saved("search-shared", ("job-1", "job-2")),
+        _saved("search-global", ()),
+    )
+    return service, lexical, semantic, research, canonical, second_canonical, workspace
+
+
+def test_batch_deletion_shares_lookups_and_confirms_once(tmp_path: Path) -> None:
+    service, lexical, semantic, research, canonical, second_canonical, workspace = (
+        _batch_service(tmp_path)
+    )
+    scopes = (DeletionScope.CANONICAL_TRANSCRIPT, DeletionScope.SAVED_SEARCHES)
+
+    batch = service.plan_batch_deletion(("job-1", "job-2"), scopes)
+
+    service.transcript_library.inspect_many.assert_called_once_with(
+        ("job-1", "job-2"), verify_source=False
+    )
+    service.transcript_library.inspect.assert_not_called()
+    research.notes.assert_called_once()
+    service.workspace_metadata.saved_search_ids_by_document.assert_called_once_with(
+        ("job-1", "job-2")
+    )
+    assert batch.confirmation_token.startswith("delete-batch:2:")
+    assert [plan.preserved_note_ids for plan in batch.plans] == [
+        ("note-current",),
+        (),
+    ]
+    assert [plan.affected_saved_search_ids for plan in batch.plans] == [
+        ("search-scoped", "search-shared"),
+        ("search-shared",),
+    ]
+
+    with pytest.raises(CustodyOperationError, match="confirmation token"):
+        service.execute_batch_deletion(
+            ("job-1", "job-2"),
+            scopes,
+            confirmation_token=batch.plans[0].confirmation_token,
+        )
+    lexical.remove.assert_not_called()
+
+    receipt = service.execute_batch_deletion(
+        ("job-1", "job-2"),
+        scopes,
+        confirmation_token=batch.confirmation_token,
+        max_workers=2,
+    )
+
+    assert [item.document_id for item in receipt.receipts] == ["job-1", "job-2"]
+    assert lexical.remove.call_count == 2
+    service.transcript_library.invalidate_refresh_journal.assert_called_once_with()
+    semantic.clear.assert_called_once_with()
+    deleted = [
+        call.args[0]
+        for call in service.workspace_metadata.delete_saved_search.mock_calls
+    ]
+    assert deleted == ["search-scoped", "search-shared"]
+    research.delete_note.assert_not_called()
+    assert not canonical.exists()
+    assert not second_canonical.exists()
+    assert not workspace.exists()
+
+
+def test_batch_deletion_rechecks_every_document_before_mutation(
+    tmp_path: Path,
+) -> None:
+    service, lexical, semantic, _, canonical, second_canonical, _ = _batch_service(
+        tmp_path
+    )
+    scopes = (DeletionScope.CANONICAL_TRANSCRIPT,)
+    batch = service.plan_batch_deletion(("job-1", "job-2"), scopes)
+    second_canonical.write_text('{"changed":true}\n')
+
+    with pytest.raises(CustodyOperationError, match="changed after indexing"):
+        service.execute_batch_deletion(
+            ("job-1", "job-2"),
+            scopes,
+            confirmation_token=batch.confirmation_token,
+        )
+
+    lexical.remove.assert_not_called()
+    semantic.clear.assert_not_called()
+    assert canonical.exists()
+    with pytest.raises(ValueError, match="unique"):
+        service.plan_batch_deletion(("job-1", "job-1"), scopes)
+    with pytest.raises(ValueError, match="at least one"):
+        service.plan_batch_deletion((), scopes)
+
+
+def test_retention_reports_measured_bytes_and_stops_at_byte_budget(
+    tmp_path: Path,
+) -> None:
+    service, *_ = _service(tmp_path)
+    now = datetime(2026, 8, 19, tzinfo=UTC)
+    sizes = {"oldest": 300, "older": 500, "old": 700}
+    records = []
+    for offset, (job_id, size) in enumerate(sizes.items()):
+        workspace = service.paths.jobs_dir / job_id / "checkpoints"
+        workspace.mkdir(parents=True)
+        (workspace / "chunk.bin").write_bytes(b"x" * size)
+        records.append(
+            _record(
+                job_id,
+                status=JobStatus.COMPLETED,
+                updated_at=(now - timedelta(days=60 - offset)).isoformat(),
+            )
+        )
+    service.lifecycle_store.list_page.return_value = _page(*records)
+    cache = Mock()
+    cache.lookup.return_value = None
+    service.workspace_usage = WorkspaceUsageMeter(cache, max_workers=2)
+
+    full = service.plan_retention(RetentionPolicy(), now=now)
+    assert [item.reclaimable_bytes for item in full.candidates] == [300, 500, 700]
+    assert full.reclaimable_bytes == 1_500
+    recorded = cache.record.call_args.args[0]
+    assert sorted(usage[2] for usage in recorded.values()) == [300, 500, 700]
+    service.lifecycle_store.list_page.assert_called_with(
+        statuses=(JobStatus.COMPLETED,),
+        updated_before=now - timedelta(days=30),
+        after=None,
+        limit=256,
+        oldest_first=True,
+    )
+
+    budget = RetentionPolicy(reclaim_bytes=600)
+    plan = service.plan_retention(budget, now=now)
+    assert [item.job_id for item in plan.candidates] == ["oldest", "older"]
+    assert plan.confirmation_token != full.confirmation_token
+
+    receipt = service.execute_retention(
+        budget,
+        confirmation_token=plan.confirmation_token,
+        now=now,
+        max_workers=2,
+    )
+
+    assert receipt.discarded_job_ids == ("oldest", "older")
+    assert receipt.reclaimed_bytes == 800
+    assert (service.paths.jobs_dir / "old").is_dir()
+    assert not (service.paths.jobs_dir / "oldest").exists()
+    forgotten = list(cache.forget.call_args.args[0])
+    assert [path.name for path in forgotten] == ["oldest", "older"]
+    with pytest.raises(ValueError, match="byte budget"):
+        RetentionPolicy(reclaim_bytes=0)
@@ -1,3 +1,4 @@
+from dataclasses import replace
 from pathlib import Path
 
 import pytest
@@ -199,3 +200,45 @@ def test_invalid_rebuild_is_rejected_before_destroying_previous_state(
 
     assert index.state() == state
     index.close()
+
+
+def test_apply_delta_replaces_named_documents_and_advances_fingerprint(
+    tmp_path: Path,
+) -> None:
+    profile = _profile(tmp_path)
+    chunking = ChunkingProfile("tiny-test", target_words=10, max_words=10)
+    original = _transcript(tmp_path)
+    added = replace(
+        original,
+        document_id="job-2",
+        canonical_path=str(tmp_path / "job-2.json"),
+        segments=(IndexedSegment("s1", 0, 1, "tenant union", "en", None),),
+    )
+    index = _index(tmp_path)
+    index.rebuild(
+        state=SemanticState(profile, "a" * 64, 1),
+        chunks=build_search_chunks((original,), profile=chunking),
+        vectors=(_vector(0),),
+    )
+    upserts = build_search_chunks((added,), profile=chunking)
+
+    with pytest.raises(ValueError, match="replace a named document"):
+        index.apply_delta(
+            corpus_fingerprint="b" * 64,
+            upserts=upserts,
+            vectors=(_vector(1),),
+            removals=(),
+        )
+    assert index.state() == SemanticState(profile, "a" * 64, 1)
+
+    index.apply_delta(
+        corpus_fingerprint="b" * 64,
+        upserts=upserts,
+        vectors=(_vector(1),),
+        removals=("job-1", "job-2"),
+    )
+
+    assert index.state() == SemanticState(profile, "b" * 64, 1)
+    matches = index.search(SearchQuery("concept", limit=5), _vector(1))
+    assert [candidate.chunk.document_id for candidate in matches] == ["job-2"]
+    index.close()
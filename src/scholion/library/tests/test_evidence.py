@@ -1,5 +1,6 @@
 import hashlib
 import json
+from dataclasses import replace
 from pathlib import Path
 
 import pytest
@@ -253,3 +254,45 @@ def test_context_expansion_is_bounded(tmp_path: Path, context_segments: int) ->
 
     with pytest.raises(ValueError, match="between 0 and 10"):
         _locator().locate_response(response, context_segments=context_segments)
+
+
+def test_result_page_reads_each_canonical_generation_once_and_keeps_rank_order(
+    tmp_path: Path,
+) -> None:
+    canonical = tmp_path / "transcript.json"
+    digest = _canonical(canonical)
+    reads: list[Path] = []
+
+    class CountingFileManager(LocalFileManager):
+        def read_file(self, path: Path) -> bytes:  # type: ignore[override]
+            reads.append(Path(path))
+            return super().read_file(path)
+
+    lexical = _passage(canonical, digest)
+    neighbor = replace(
+        lexical,
+        segment_ids=("segment-000000",),
+        matched_segment_ids=("segment-000000",),
+        start_seconds=0.0,
+        end_seconds=1.0,
+        text="Before the answer.",
+        speaker_refs=("speaker-01",),
+    )
+    response = replace(
+        _response(lexical, query=SearchQuery("housing answer")),
+        results=(lexical, neighbor, lexical),
+    )
+
+    locations = EvidenceLocator(CountingFileManager()).locate_response(  # type: ignore[arg-type]
+        response, context_segments=1
+    )
+
+    assert reads == [canonical]
+    assert [location.result_segment_ids for location in locations] == [
+        ("segment-000001",),
+        ("segment-000000",),
+        ("segment-000001",),
+    ]
+    assert [word.text.strip() for word in locations[0].matched_words] == ["Housing"]
+    assert [word.text.strip() for word in locations[1].matched_words] == ["answer."]
+    assert locations[2] == locations[0]
@@ -11,6 +11,7 @@ from scholion.library.locations import (
     LibraryLocationService,
     RecordingProcessingPolicy,
 )
+from scholion.library.recording_discovery import RecordingDiscoveryCursor
 from scholion.library.service import LibraryRefreshReport
 from scholion.workspace.models import WorkspacePaths
 
@@ -325,3 +326,151 @@ def test_unsupported_location_schema_fails_closed(tmp_path):
 
     with pytest.raises(LibraryLocationError, match="unsupported Scholion schema"):
         service.locations()
+
+
+def _service_with_cursor(tmp_path: Path) -> LibraryLocationService:
+    service, _ = _service(tmp_path)
+    service.discovery_cursor = RecordingDiscoveryCursor(
+        _paths(tmp_path).state_dir / "library" / "recording-discovery-cursor.json",
+        LocalFileManager(),  # type: ignore[arg-type]
+    )
+    return service
+
+
+def test_recording_discovery_walks_nested_trees_without_following_links(tmp_path):
+    root = tmp_path / "share"
+    (root / "2026" / "08" / "19").mkdir(parents=True)
+    (root / ".snapshots").mkdir()
+    (root / "2026" / "08" / "19" / "focus-group.flac").write_bytes(b"audio")
+    (root / "2026" / "top.mp3").write_bytes(b"audio")
+    (root / ".snapshots" / "old.mp3").write_bytes(b"audio")
+    (root / "2026" / "loop").symlink_to(root, target_is_directory=True)
+    service, _ = _service(tmp_path)
+    service.add(root, kind=LibraryLocationKind.RECORDING_SOURCE, location_id="share")
+    service.add(
+        root / "2026" / "08",
+        kind=LibraryLocationKind.RECORDING_SOURCE,
+        processing_policy=RecordingProcessingPolicy.AUTOMATIC,
+        location_id="august",
+    )
+
+    report = service.discover_recordings()
+
+    assert [Path(item.path).name for item in report.recordings] == [
+        "focus-group.flac",
+        "top.mp3",
+    ]
+    nested, top = report.recordings
+    assert nested.location_ids == ("august", "share")
+    assert nested.automatic_processing_requested is True
+    assert nested.modified_ns is not None
+    assert top.location_ids == ("share",)
+    assert top.automatic_processing_requested is False
+
+
+def test_recording_discovery_streams_pages_and_reports_only_changes(tmp_path):
+    root = tmp_path / "recordings"
+    for day in range(3):
+        (root / f"day-{day}").mkdir(parents=True)
+        (root / f"day-{day}" / "a.wav").write_bytes(b"audio")
+        (root / f"day-{day}" / "b.wav").write_bytes(b"audio")
+    service = _service_with_cursor(tmp_path)
+    service.add(root, kind=LibraryLocationKind.RECORDING_SOURCE, location_id="source")
+
+    pages = list(service.iter_recording_pages(changes_only=True, page_size=4))
+
+    assert [len(page.recordings) for page in pages] == [4, 2]
+    assert [page.final for page in pages] == [False, True]
+    assert service.discover_recordings(changes_only=True).recordings == ()
+
+    (root / "day-1" / "a.wav").write_bytes(b"longer audio")
+    (root / "day-2" / "c.wav").write_bytes(b"audio")
+    (root / "day-0" / "b.wav").unlink()
+
+    changed = service.discover_recordings(changes_only=True)
+
+    assert [Path(item.path).relative_to(root) for item in changed.recordings] == [
+        Path("day-1/a.wav"),
+        Path("day-2/c.wav"),
+    ]
+    assert len(service.discover_recordings().recordings) == 6
+
+
+def test_abandoned_incremental_discovery_does_not_advance_the_cursor(tmp_path):
+    root = tmp_path / "recordings"
+    root.mkdir()
+    (root / "a.wav").write_bytes(b"audio")
+    (root / "b.wav").write_bytes(b"audio")
+    service = _service_with_cursor(tmp_path)
+    service.add(root, kind=LibraryLocationKind.RECORDING_SOURCE, location_id="source")
+
+    pages = service.iter_recording_pages(changes_only=True, page_size=1)
+    next(pages)
+    pages.close()
+
+    assert len(service.discover_recordings(changes_only=True).recordings) == 2
+
+
+def test_incremental_discovery_keeps_the_final_page_until_it_is_consumed(tmp_path):
+    root = tmp_path / "recordings"
+    root.mkdir()
+    (root / "a.wav").write_bytes(b"audio")
+    (root / "b.wav").write_bytes(b"audio")
+    service = _service_with_cursor(tmp_path)
+    service.add(root, kind=LibraryLocationKind.RECORDING_SOURCE, location_id="source")
+
+    pages = service.iter_recording_pages(changes_only=True, page_size=5)
+    final = next(pages)
+    assert final.final is True
+    assert len(final.recordings) == 2
+    pages.close()
+
+    assert len(service.discover_recordings(changes_only=True).recordings) == 2
+
+
+def test_recording_discovery_reports_file_symlinks_at_their_target(tmp_path):
+    elsewhere = tmp_path / "elsewhere"
+    elsewhere.mkdir()
+    (elsewhere / "interview.wav").write_bytes(b"audio")
+    (elsewhere / ".hidden.wav").write_bytes(b"audio")
+    (elsewhere / "notes.txt").write_bytes(b"text")
+    root = tmp_path / "recordings"
+    root.mkdir()
+    (root / "link.wav").symlink_to(elsewhere / "interview.wav")
+    (root / "again.mp3").symlink_to(elsewhere / "interview.wav")
+    (root / "visible.wav").symlink_to(elsewhere / ".hidden.wav")
+    (root / "renamed.wav").symlink_to(elsewhere / "notes.txt")
+    (root / "dangling.wav").symlink_to(elsewhere / "missing.wav")
+    service, _ = _service(tmp_path)
+    service.add(root, kind=LibraryLocationKind.RECORDING_SOURCE, location_id="source")
+
+    report = service.discover_recordings()
+
+    assert [item.path for item in report.recordings] == [
+        str((elsewhere / "interview.wav").resolve())
+    ]
+    assert report.recordings[0].location_ids == ("source",)
+
+
+def test_incremental_discovery_keeps_cursor_for_offline_roots(tmp_path):
+    root = tmp_path / "usb"
+    root.mkdir()
+    (root / "interview.wav").write_bytes(b"audio")
+    service = _service_with_cursor(tmp_path)
+    service.add(root, kind=LibraryLocationKind.RECORDING_SOURCE, location_id="usb")
+    assert len(service.discover_recordings(changes_only=True).recordings) == 1
+
+    offline = root.rename(tmp_path / "unplugged")
+    assert service.discover_recordings(changes_only=True).unavailable_location_ids == (
+        "usb",
+    )
+    offline.rename(root)
+
+    assert service.discover_recordings(changes_only=True).recordings == ()
+
+
+def test_incremental_discovery_requires_a_configured_cursor(tmp_path):
+    service, _ = _service(tmp_path)
+
+    with pytest.raises(LibraryLocationError, match="not configured"):
+        service.discover_recordings(changes_only=True)
@@ -1,6 +1,8 @@
 import hashlib
 import json
 import math
+import os
+from dataclasses import replace
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
@@ -12,6 +14,7 @@ from scholion.interfaces.local_file_manager import LocalFileManager
 from scholion.library.errors import PlaybackAuthorizationError
 from scholion.library.index import IndexedDocument
 from scholion.library.playback import PlaybackAuthorizationService
+from scholion.library.playback_leases import PlaybackVerificationLeaseStore
 from scholion.media.models import InputIdentity, MediaInfo, MediaStream, StreamKind
 
 
@@ -271,3 +274,73 @@ def test_all_finite_seeks_inside_verified_duration_are_preserved(seek: float) ->
         )
 
         assert grant.seek_seconds == seek
+
+
+def _leased(
+    tmp_path: Path,
+) -> tuple[PlaybackAuthorizationService, StaticMediaProbe, str, Path, list[float]]:
+    service, probe, digest, source, _ = _service(tmp_path)
+    now = [1_000.0]
+    service.lease_store = PlaybackVerificationLeaseStore(
+        tmp_path / "state" / "playback-leases.json",
+        LocalFileManager(),  # type: ignore[arg-type]
+    )
+    service.clock = lambda: now[0]
+    return service, probe, digest, source, now
+
+
+def test_repeat_authorization_reuses_verification_lease_until_expiry(
+    tmp_path: Path,
+) -> None:
+    service, probe, digest, _, now = _leased(tmp_path)
+
+    first = service.authorize("job-1", expected_canonical_sha256=digest, seek_seconds=1)
+    now[0] += 60
+    second = service.authorize(
+        "job-1", expected_canonical_sha256=digest, seek_seconds=7
+    )
+
+    assert len(probe.paths) == 1
+    assert second.seek_seconds == 7
+    assert second.source_path == first.source_path
+    assert second.source_sha256 == first.source_sha256
+    assert second.audio_stream_index == first.audio_stream_index
+
+    service.authorize(
+        "job-1", expected_canonical_sha256=digest, seek_seconds=2, verify=True
+    )
+    assert len(probe.paths) == 2
+
+    now[0] += service.lease_seconds + 1
+    service.authorize("job-1", expected_canonical_sha256=digest, seek_seconds=2)
+    assert len(probe.paths) == 3
+
+
+def test_changed_source_identity_invalidates_verification_lease(
+    tmp_path: Path,
+) -> None:
+    service, probe, digest, source, _ = _leased(tmp_path)
+    service.authorize("job-1", expected_canonical_sha256=digest, seek_seconds=1)
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    service.authorize("job-1", expected_canonical_sha256=digest, seek_seconds=1)
+
+    assert len(probe.paths) == 2
+
+
+def test_failed_forced_verification_discards_lease(tmp_path: Path) -> None:
+    service, probe, digest, _, _ = _leased(tmp_path)
+    service.authorize("job-1", expected_canonical_sha256=digest, seek_seconds=1)
+    probe.media = replace(
+        probe.media,  # type: ignore[type-var]
+        input=replace(probe.media.input, sha256="c" * 64),  # type: ignore[union-attr]
+    )
+
+    with pytest.raises(PlaybackAuthorizationError, match="no longer matches"):
+        service.authorize(
+            "job-1", expected_canonical_sha256=digest, seek_seconds=1, verify=True
+        )
+    with pytest.raises(PlaybackAuthorizationError, match="no longer matches"):
+        service.authorize("job-1", expected_canonical_sha256=digest, seek_seconds=1)
+    assert len(probe.paths) == 3
@@ -46,8 +46,18 @@ class LifecycleStore:
     def __init__(self, records: tuple[JobLifecycleRecord, ...]) -> None:
         self.records = records
 
-    def list_records(self) -> tuple[JobLifecycleRecord, ...]:
-        return self.records
+    def list_records(
+        self,
+        *,
+        statuses: tuple[JobStatus, ...] = (),
+        with_artifact: bool = False,
+    ) -> tuple[JobLifecycleRecord, ...]:
+        return tuple(
+            record
+            for record in self.records
+            if (not statuses or record.status in statuses)
+            and (not with_artifact or record.artifact_path is not None)
+        )
 
 
 class SemanticStub:
@@ -430,3 +440,34 @@ def test_refresh_skips_untracked_invalid_json_but_tracked_invalid_json_is_strict
     canonical.write_text('{"broken": true}')
     with pytest.raises(TranscriptLibraryBuildError, match="tracked canonical"):
         service.refresh()
+
+
+def test_directory_refresh_reconciles_only_the_named_directories(
+    tmp_path: Path,
+) -> None:
+    source = tmp_path / "audio.wav"
+    source.write_bytes(b"audio")
+    output = _paths(tmp_path).output_dir
+    external = tmp_path / "external"
+    _write_canonical(output / "kept.json", job_id="kept", source=source, text="one")
+    _write_canonical(external / "gone.json", job_id="gone", source=source, text="two")
+    store = CountingStore()
+    service = _service(tmp_path, store)
+    service.refresh((external,))
+    (external / "gone.json").unlink()
+    _write_canonical(output / "new.json", job_id="new", source=source, text="three")
+    store.reads.clear()
+
+    scoped = service.refresh_directories((output,))
+
+    assert scoped.added_document_ids == ("new",)
+    assert scoped.removed_document_ids == ()
+    assert scoped.unchanged_document_ids == ("kept",)
+    assert store.reads == [(output / "new.json").resolve()]
+    assert {document.document_id for document in service.documents()} == {
+        "gone",
+        "kept",
+        "new",
+    }
+
+    assert service.refresh_directories((external,)).removed_document_ids == ("gone",)
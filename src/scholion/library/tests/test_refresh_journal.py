@@ -0,0 +1,293 @@
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from scholion.interfaces.local_file_manager import LocalFileManager
+from scholion.library import refresh_journal
+from scholion.library.change_feed import InotifyChangeFeed
+from scholion.library.duckdb_index import DuckDbTranscriptIndex
+from scholion.library.refresh_journal import LibraryRefreshJournal
+from scholion.library.service import TranscriptLibraryService
+from scholion.workspace.lifecycle import JobLifecycleRecord
+from scholion.workspace.models import WorkspacePaths
+
+
+class CountingFiles(LocalFileManager):
+    def __init__(self) -> None:
+        super().__init__()
+        self.reads: list[Path] = []
+
+    def read_file(self, file_path: str | Path) -> bytes:
+        self.reads.append(Path(file_path).resolve(strict=False))
+        return super().read_file(file_path)
+
+
+class LifecycleStore:
+    def __init__(self, registry_dir: Path) -> None:
+        self.registry_dir = registry_dir
+        self.list_calls = 0
+        self.digest = "completed-v1"
+
+    def list_records(self, **_: object) -> tuple[JobLifecycleRecord, ...]:
+        self.list_calls += 1
+        self.registry_dir.mkdir(parents=True, exist_ok=True)
+        return ()
+
+    def completed_artifacts_digest(self) -> str:
+        return self.digest
+
+
+class CountingIndex(DuckDbTranscriptIndex):
+    document_calls = 0
+
+    def documents(self):  # type: ignore[no-untyped-def]
+        self.document_calls += 1
+        return super().documents()
+
+
+def _paths(tmp_path: Path) -> WorkspacePaths:
+    return WorkspacePaths(
+        state_dir=tmp_path / "state",
+        cache_dir=tmp_path / "cache",
+        model_dir=tmp_path / "cache" / "models",
+        output_dir=tmp_path / "output",
+    )
+
+
+def _write_canonical(path: Path, *, job_id: str, source: Path, text: str) -> None:
+    source_bytes = source.read_bytes()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = json.dumps(
+        {
+            "schema_version": 1,
+            "job_id": job_id,
+            "source": {
+                "sha256": hashlib.sha256(source_bytes).hexdigest(),
+                "size_bytes": len(source_bytes),
+                "modified_ns": source.stat().st_mtime_ns,
+            },
+            "detected_language": "en",
+            "segments": [
+                {
+                    "segment_id": "segment-000000",
+                    "start_seconds": 0.0,
+                    "end_seconds": 1.0,
+                    "text": text,
+                    "language": "en",
+                }
+            ],
+        },
+        sort_keys=True,
+    )
+    temporary = path.with_suffix(".tmp")
+    temporary.write_text(payload)
+    os.replace(temporary, path)
+
+
+def _service(
+    tmp_path: Path,
+) -> tuple[TranscriptLibraryService, CountingFiles, LifecycleStore, CountingIndex]:
+    paths = _paths(tmp_path)
+    paths.output_dir.mkdir(parents=True, exist_ok=True)
+    files = CountingFiles()
+    lifecycle = LifecycleStore(paths.state_dir / "job-lifecycle")
+    index = CountingIndex(
+        paths.state_dir / "library" / "transcripts.duckdb",
+        files,  # type: ignore[arg-type]
+    )
+    journal = LibraryRefreshJournal(
+        paths.state_dir / "library" / "refresh-journal.json",
+        files,  # type: ignore[arg-type]
+    )
+    service = TranscriptLibraryService(
+        index=index,
+        lifecycle_store=lifecycle,  # type: ignore[arg-type]
+        paths=paths,
+        file_manager=files,  # type: ignore[arg-type]
+        refresh_journal=journal,
+    )
+    return service, files, lifecycle, index
+
+
+def _seed(tmp_path: Path, count: int = 3) -> Path:
+    source = tmp_path / "audio.wav"
+    source.write_bytes(b"audio")
+    for position in range(count):
+        _write_canonical(
+            _paths(tmp_path).output_dir / f"transcript-{position}.json",
+            job_id=f"job-{position}",
+            source=source,
+            text=f"evidence {position}",
+        )
+    return source
+
+
+def test_noop_refresh_answers_from_journal_without_index_or_lifecycle_reads(
+    tmp_path: Path,
+) -> None:
+    _seed(tmp_path)
+    service, files, lifecycle, index = _service(tmp_path)
+    first = service.refresh()
+    assert first.added_document_ids == ("job-0", "job-1", "job-2")
+    files.reads.clear()
+    lifecycle.list_calls = 0
+    index.document_calls = 0
+
+    second = service.refresh()
+
+    assert second.unchanged_document_ids == ("job-0", "job-1", "job-2")
+    assert second.indexed_documents == 3
+    assert second.changed is False
+    assert lifecycle.list_calls == 0
+    assert index.document_calls == 0
+    assert files.reads == [service.refresh_journal.path]  # type: ignore[union-attr]
+
+
+def test_new_canonical_in_watched_directory_triggers_full_reconciliation(
+    tmp_path: Path,
+) -> None:
+    source = _seed(tmp_path, count=1)
+    service, _, lifecycle, _ = _service(tmp_path)
+    service.refresh()
+    lifecycle.list_calls = 0
+
+    _write_canonical(
+        _paths(tmp_path).output_dir / "late.json",
+        job_id="late",
+        source=source,
+        text="late evidence",
+    )
+    report = service.refresh()
+
+    assert report.added_document_ids == ("late",)
+    assert lifecycle.list_calls == 1
+    assert service.refresh().unchanged_document_ids == ("job-0", "late")
+
+
+def test_unrelated_directory_churn_keeps_fast_path_and_updates_journal(
+    tmp_path: Path,
+) -> None:
+    _seed(tmp_path, count=1)
+    service, _, lifecycle, _ = _service(tmp_path)
+    service.refresh()
+    output = _paths(tmp_path).output_dir
+    before = output.stat().st_mtime_ns
+    (output / "notes.txt").write_text("publication export")
+    os.utime(output, ns=(before + 5_000_000, before + 5_000_000))
+    lifecycle.list_calls = 0
+
+    report = service.refresh()
+
+    assert report.unchanged_document_ids == ("job-0",)
+    assert lifecycle.list_calls == 0
+    journal = service.refresh_journal.load()  # type: ignore[union-attr]
+    assert journal is not None
+    recorded = {item.path: item.modified_ns for item in journal.directories}
+    assert recorded[str(output.resolve())] == before + 5_000_000
+
+
+def test_unreadable_watched_directory_takes_the_full_refresh_path(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _seed(tmp_path, count=1)
+    service, _, lifecycle, _ = _service(tmp_path)
+    service.refresh()
+    output = _paths(tmp_path).output_dir.resolve()
+    scandir = os.scandir
+
+    def denied(path):  # type: ignore[no-untyped-def]
+        if Path(path) == output:
+            raise PermissionError(13, "Permission denied", str(path))
+        return scandir(path)
+
+    monkeypatch.setattr(os, "scandir", denied)
+    lifecycle.list_calls = 0
+
+    report = service.refresh()
+
+    assert report.unchanged_document_ids == ("job-0",)
+    assert lifecycle.list_calls == 1
+    assert service.refresh_journal.load() is None  # type: ignore[union-attr]
+    assert not refresh_journal.capture_directory(output).readable
+
+
+def test_lifecycle_registry_writes_only_invalidate_when_completed_jobs_change(
+    tmp_path: Path,
+) -> None:
+    _seed(tmp_path, count=1)
+    service, _, lifecycle, _ = _service(tmp_path)
+    service.refresh()
+    registry = lifecycle.registry_dir / "registry.sqlite3"
+    registry.write_bytes(b"progress checkpoint")
+    lifecycle.list_calls = 0
+
+    assert service.refresh().unchanged_document_ids == ("job-0",)
+    assert lifecycle.list_calls == 0
+
+    lifecycle.digest = "completed-v2"
+    service.refresh()
+    assert lifecycle.list_calls == 1
+
+
+def test_verify_rebuild_and_scope_changes_bypass_the_journal(tmp_path: Path) -> None:
+    _seed(tmp_path, count=2)
+    external = tmp_path / "external"
+    external.mkdir()
+    service, _, lifecycle, _ = _service(tmp_path)
+    service.refresh()
+
+    lifecycle.list_calls = 0
+    assert service.refresh(verify=True).verified_all_tracked is True
+    assert lifecycle.list_calls == 1
+
+    service.refresh((external,))
+    assert lifecycle.list_calls == 2
+
+    service.rebuild()
+    assert service.refresh_journal.load() is None  # type: ignore[union-attr]
+    service.refresh()
+    assert lifecycle.list_calls == 4
+
+
+def test_corrupt_or_foreign_journal_disables_only_the_fast_path(
+    tmp_path: Path,
+) -> None:
+    _seed(tmp_path, count=1)
+    service, _, lifecycle, _ = _service(tmp_path)
+    service.refresh()
+    journal_path = service.refresh_journal.path  # type: ignore[union-attr]
+    journal_path.write_text('{"schema_version": 99}')
+    lifecycle.list_calls = 0
+
+    report = service.refresh()
+
+    assert report.unchanged_document_ids == ("job-0",)
+    assert lifecycle.list_calls == 1
+    assert service.refresh_journal.load() is not None  # type: ignore[union-attr]
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux")
+def test_inotify_feed_reports_touched_directories(tmp_path: Path) -> None:
+    feed = InotifyChangeFeed.create()
+    if feed is None:
+        pytest.skip("inotify is unavailable in this environment")
+    watched = tmp_path / "watched"
+    quiet = tmp_path / "quiet"
+    watched.mkdir()
+    quiet.mkdir()
+    try:
+        feed.watch((watched, quiet))
+        assert feed.watched() == {watched.resolve(), quiet.resolve()}
+        assert feed.drain() == frozenset()
+
+        (watched / "transcript.json").write_text("{}")
+
+        assert feed.drain() == {watched.resolve()}
+        assert feed.drain() == frozenset()
+    finally:
+        feed.close()
@@ -0,0 +1,274 @@
+from pathlib import Path
+from unittest.mock import Mock
+
+import duckdb
+import pytest
+
+from scholion.library.duckdb_research_projection import DuckDbResearchProjection
+from scholion.library.errors import ResearchProjectionError
+from scholion.library.evidence import EvidenceAnchor
+from scholion.library.index import IndexedDocument
+from scholion.library.research_projection import ResearchProjectionFilter
+from scholion.library.research_projector import ResearchStateProjector
+from scholion.library.research_workspace import (
+    ResearchQueryFilters,
+    ResearchWorkspaceService,
+)
+from scholion.library.sqlite_research_state import SqliteResearchStateStore
+
+
+class PrivateDirectoryStore:
+    def ensure_directory_exists(
+        self, directory_path: str | Path, *, private: bool = False
+    ) -> None:
+        assert private
+        Path(directory_path).mkdir(parents=True, exist_ok=True)
+
+
+def _anchor(*, segment_id: str = "segment-000042") -> EvidenceAnchor:
+    return EvidenceAnchor(
+        document_id="job-1",
+        source_sha256="0" * 64,
+        canonical_sha256="1" * 64,
+        canonical_path="/private/job-1.json",
+        source_path="/private/job-1.wav",
+        segment_ids=(segment_id,),
+        start_seconds=42.0,
+        end_seconds=45.0,
+    )
+
+
+def _state(tmp_path: Path) -> SqliteResearchStateStore:
+    return SqliteResearchStateStore(
+        tmp_path / "state" / "research.sqlite3",
+        PrivateDirectoryStore(),  # type: ignore[arg-type]
+    )
+
+
+def _projection(tmp_path: Path, name: str = "research") -> DuckDbResearchProjection:
+    return DuckDbResearchProjection(
+        tmp_path / "projection" / f"{name}.duckdb",
+        PrivateDirectoryStore(),  # type: ignore[arg-type]
+    )
+
+
+def _index_state(projection: DuckDbResearchProjection) -> tuple[object, ...]:
+    connection = projection._connection
+    return (
+        connection.execute(
+            "SELECT indexed_note_count, indexed_token_count FROM projection_metadata"
+        ).fetchall(),
+        connection.execute(
+            "SELECT term, note_frequency FROM projected_term_stats ORDER BY term"
+        ).fetchall(),
+        connection.execute(
+            "SELECT note_id, term, term_frequency FROM projected_note_terms "
+            "ORDER BY note_id, term"
+        ).fetchall(),
+    )
+
+
+def test_note_text_is_bm25_ranked_scoped_and_completes_typed_prefixes(
+    tmp_path: Path,
+) -> None:
+    state = _state(tmp_path)
+    projection = _projection(tmp_path)
+    state.create_note(
+        _anchor(),
+        "Housing housing housing affordability",
+        tags=("housing",),
+        note_id="note-dense",
+    )
+    state.create_note(
+        _anchor(segment_id="segment-000043"),
+        "Housing affordability appears once in a much longer methodology memo",
+        note_id="note-sparse",
+    )
+    state.create_note(
+        _anchor(segment_id="segment-000044"),
+        "Household budget interview",
+        note_id="note-household",
+    )
+    ResearchStateProjector(state, projection).sync()
+    housing = state.resolve_tag_ids(("housing",))
+    assert housing is not None
+
+    ranked = projection.rank_notes(
+        ResearchProjectionFilter(note_text="housing affordability"), limit=10
+    )
+    assert tuple(item.note_id for item in ranked) == ("note-dense", "note-sparse")
+    assert ranked[0].score > ranked[1].score > 0
+
+    assert tuple(
+        item.note_id
+        for item in projection.rank_notes(
+            ResearchProjectionFilter(note_text="housing methodology"), limit=10
+        )
+    ) == ("note-sparse",)
+    assert tuple(
+        item.note_id
+        for item in projection.rank_notes(
+            ResearchProjectionFilter(tag_ids=housing, note_text="affordability"),
+            limit=10,
+        )
+    ) == ("note-dense",)
+    assert (
+        projection.rank_notes(ResearchProjectionFilter(note_text="hous"), limit=10)
+        == ()
+    )
+
+    typed = projection.rank_notes(
+        ResearchProjectionFilter(note_text="hous"), limit=10, prefix=True
+    )
+    assert {item.note_id for item in typed} == {
+        "note-dense",
+        "note-sparse",
+        "note-household",
+    }
+    assert tuple(
+        item.note_id
+        for item in projection.rank_notes(
+            ResearchProjectionFilter(note_text="affordability meth"),
+            limit=10,
+            prefix=True,
+        )
+    ) == ("note-sparse",)
+    assert (
+        len(
+            projection.rank_notes(
+                ResearchProjectionFilter(note_text="hous"), limit=1, prefix=True
+            )
+        )
+        == 1
+    )
+    assert (
+        projection.rank_notes(ResearchProjectionFilter(note_text="!!!"), limit=5) == ()
+    )
+
+    with pytest.raises(ValueError, match="note_text"):
+        projection.rank_notes(ResearchProjectionFilter(require_notes=True), limit=5)
+    with pytest.raises(ValueError, match="limit"):
+        projection.rank_notes(ResearchProjectionFilter(note_text="housing"), limit=0)
+
+
+def test_incremental_sync_keeps_term_statistics_identical_to_a_rebuild(
+    tmp_path: Path,
+) -> None:
+    state = _state(tmp_path)
+    incremental = _projection(tmp_path, "incremental")
+    projector = ResearchStateProjector(state, incremental, batch_size=1)
+    state.create_note(_anchor(), "alpha beta beta", note_id="note-1")
+    state.create_note(
+        _anchor(segment_id="segment-000043"), "beta gamma", note_id="note-2"
+    )
+    projector.sync()
+    state.update_note("note-1", "gamma delta delta delta")
+    state.delete_note("note-2")
+    state.create_note(_anchor(segment_id="segment-000044"), "epsilon", note_id="note-3")
+    projector.sync()
+
+    rebuilt = _projection(tmp_path, "rebuilt")
+    snapshot = state.projection_snapshot()
+    rebuilt.rebuild(snapshot.records, through_sequence=snapshot.sequence_id)
+
+    assert _index_state(incremental) == _index_state(rebuilt)
+    counts, stats, _ = _index_state(incremental)
+    assert counts == [(2, 5)]
+    assert stats == [("delta", 1), ("epsilon", 1), ("gamma", 1)]
+    assert (
+        incremental.rank_notes(ResearchProjectionFilter(note_text="beta"), limit=5)
+        == ()
+    )
+
+    incremental.clear()
+    assert _index_state(incremental) == ([(0, 0)], [], [])
+
+
+def test_older_projection_schema_is_discarded_and_rebuilt_from_authority(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "projection" / "research.duckdb"
+    path.parent.mkdir(parents=True)
+    with duckdb.connect(str(path)) as connection:
+        connection.execute(
+            """
+            CREATE TABLE projection_metadata (
+                singleton INTEGER PRIMARY KEY,
+                schema_version INTEGER NOT NULL,
+                projected_through_sequence BIGINT NOT NULL
+            );
+            CREATE TABLE projected_note_terms (
+                note_id VARCHAR NOT NULL,
+                term VARCHAR NOT NULL,
+                PRIMARY KEY (note_id, term)
+            );
+            INSERT INTO projection_metadata VALUES (1, 1, 7);
+            """
+        )
+    state = _state(tmp_path)
+    state.create_note(_anchor(), "upgraded housing note", note_id="note-1")
+
+    projection = _projection(tmp_path)
+    assert projection.projected_through_sequence() == 0
+    ResearchStateProjector(state, projection).sync()
+
+    assert tuple(
+        item.note_id
+        for item in projection.rank_notes(
+            ResearchProjectionFilter(note_text="housing"), limit=5
+        )
+    ) == ("note-1",)
+    projection.close()
+    with duckdb.connect(str(path)) as connection:
+        connection.execute(
+            "UPDATE projection_metadata SET schema_version = 999 WHERE singleton = 1"
+        )
+    with pytest.raises(ResearchProjectionError, match="schema is unsupported"):
+        _projection(tmp_path)
+
+
+def test_workspace_note_text_queries_use_ranked_order_and_discovery_completes_words(
+    tmp_path: Path,
+) -> None:
+    state = _state(tmp_path)
+    projection = _projection(tmp_path)
+    transcript_library = Mock()
+    transcript_library.documents.return_value = (
+        IndexedDocument(
+            document_id="job-1",
+            source_sha256="0" * 64,
+            canonical_sha256="1" * 64,
+            detected_language="en",
+            canonical_path="/private/job-1.json",
+            source_path="/private/job-1.wav",
+            segment_count=100,
+        ),
+    )
+    workspace = ResearchWorkspaceService(
+        transcript_library,
+        Mock(),
+        Mock(),
+        state,
+        projection,
+        ResearchStateProjector(state, projection),
+    )
+    state.create_note(
+        _anchor(),
+        "Rent mentioned in passing during a long interview about transport",
+        note_id="note-a",
+    )
+    state.create_note(
+        _anchor(segment_id="segment-000043"), "Rent rent rent", note_id="note-b"
+    )
+
+    ranked = workspace.notes(filters=ResearchQueryFilters(note_text="rent"), limit=5)
+    assert tuple(view.note.note_id for view in ranked) == ("note-b", "note-a")
+    assert (
+        workspace.notes(filters=ResearchQueryFilters(note_text="tran"), limit=5) == ()
+    )
+    assert tuple(
+        view.note.note_id
+        for view in workspace._ranked_notes(
+            ResearchQueryFilters(note_text="interview tran"), limit=5, prefix=True
+        )
+    ) == ("note-a",)
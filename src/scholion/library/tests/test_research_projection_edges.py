@@ -5,6 +5,7 @@ from unittest.mock import Mock
 import pytest
 
 import scholion.library.research_projector as projector_module
+from scholion.core.metrics import CacheStatistics
 from scholion.library.duckdb_research_projection import DuckDbResearchProjection
 from scholion.library.errors import ResearchProjectionError, ResearchStateError
 from scholion.library.evidence import EvidenceAnchor
@@ -97,6 +98,89 @@ def test_projection_returns_generation_aware_evidence_and_empty_relationship_sum
     assert summaries[all_scope[1]].collection_ids == ()
 
 
+def test_set_based_filters_intersect_predicates_like_a_brute_force_scan(
+    tmp_path: Path,
+) -> None:
+    state = _state(tmp_path)
+    projection = _projection(tmp_path)
+    tag_names = ("a", "b", "c")
+    collection_names = ("x", "y")
+    words = ("rent", "wage", "tram")
+    for index in range(24):
+        state.create_note(
+            _anchor(segment_id=f"segment-{index:06d}"),
+            " ".join(word for bit, word in enumerate(words) if index >> bit & 1)
+            or "empty",
+            tags=tuple(name for bit, name in enumerate(tag_names) if index % (bit + 2)),
+            collections=tuple(
+                name for bit, name in enumerate(collection_names) if index % (bit + 3)
+            ),
+            note_id=f"note-{index:02d}",
+        )
+    ResearchStateProjector(state, projection).sync()
+    notes = {note.note_id: note for note in state.notes(limit=100)}
+    tag_ids = state.resolve_tag_ids(("a", "c"))
+    collection_ids = state.resolve_collection_ids(("x", "y"))
+    assert tag_ids is not None and collection_ids is not None
+
+    for filters in (
+        ResearchProjectionFilter(tag_ids=tag_ids),
+        ResearchProjectionFilter(tag_ids=tag_ids, collection_ids=collection_ids),
+        ResearchProjectionFilter(collection_ids=collection_ids, note_text="rent tram"),
+        ResearchProjectionFilter(tag_ids=tag_ids[:1], note_text="wage"),
+    ):
+        expected = tuple(
+            note_id
+            for note_id, note in sorted(notes.items())
+            if set(filters.tag_ids) <= set(note.tag_ids)
+            and set(filters.collection_ids) <= set(note.collection_ids)
+            and set((filters.note_text or "").split()) <= set(note.body.split())
+        )
+        assert expected
+        assert projection.matching_note_ids(filters) == expected
+
+
+def test_filter_results_are_cached_until_the_projection_changes(
+    tmp_path: Path,
+) -> None:
+    state = _state(tmp_path)
+    projection = _projection(tmp_path)
+    state.create_note(_anchor(), "housing", tags=("housing",), note_id="note-1")
+    projector = ResearchStateProjector(state, projection)
+    projector.sync()
+    housing = state.resolve_tag_ids(("housing",))
+    assert housing is not None
+    filters = ResearchProjectionFilter(tag_ids=housing)
+
+    assert projection.matching_note_ids(filters) == ("note-1",)
+    assert projection.matching_evidence(filters) == (
+        ("job-1", "1" * 64, "segment-000042"),
+    )
+    assert projection.matching_note_ids(filters) == ("note-1",)
+    assert projection.matching_evidence(filters) == (
+        ("job-1", "1" * 64, "segment-000042"),
+    )
+    assert projection.cache_statistics() == (
+        CacheStatistics("research.notes", hits=1, misses=1),
+        CacheStatistics("research.evidence", hits=1, misses=1),
+    )
+
+    state.create_note(
+        _anchor(segment_id="segment-000043"),
+        "more housing",
+        tags=("housing",),
+        note_id="note-2",
+    )
+    projector.sync()
+    assert projection.matching_note_ids(filters) == ("note-1", "note-2")
+    assert len(projection.matching_evidence(filters)) == 2
+
+    snapshot = state.projection_snapshot()
+    projection.rebuild(snapshot.records[:1], through_sequence=snapshot.sequence_id)
+    assert projection.matching_note_ids(filters) == ("note-1",)
+    assert projection._note_cache.hits == 1
+
+
 def test_projector_rejects_invalid_budget_configuration(tmp_path: Path) -> None:
     state = _state(tmp_path)
     projection = _projection(tmp_path)
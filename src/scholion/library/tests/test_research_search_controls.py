@@ -4,7 +4,12 @@ from unittest.mock import Mock
 import pytest
 
 from scholion.library.errors import ResearchStateError
-from scholion.library.index import SearchOperator, SearchQuery, SearchSort
+from scholion.library.index import (
+    EvidenceScope,
+    SearchOperator,
+    SearchQuery,
+    SearchSort,
+)
 from scholion.library.research_search_controls import (
     ResearchSearchControlService,
     ResearchSearchIntent,
@@ -55,7 +60,7 @@ def _saved(intent: SavedSearchIntent | None = None) -> SavedSearch:
 def test_intent_rejects_runtime_evidence_scope_and_invalid_context() -> None:
     scoped = SearchQuery(
         "governance",
-        evidence_scope=(("job-1", "a" * 64, "segment-1"),),
+        evidence_scope=EvidenceScope((("job-1", "a" * 64, "segment-1"),)),
     )
     with pytest.raises(ValueError, match="derived evidence scope"):
         ResearchSearchIntent(query=scoped)
@@ -1,8 +1,15 @@
 from pathlib import Path
 
+import pytest
+
 from scholion.library.duckdb_index import DuckDbTranscriptIndex
 from scholion.library.duckdb_semantic import DuckDbSemanticIndex
-from scholion.library.index import IndexedSegment, IndexedTranscript, SearchQuery
+from scholion.library.index import (
+    EvidenceScope,
+    IndexedSegment,
+    IndexedTranscript,
+    SearchQuery,
+)
 from scholion.library.semantic import EmbeddingProfile, SearchChunk, SemanticState
 
 
@@ -88,10 +95,10 @@ def test_lexical_scope_filters_before_ranking_and_empty_scope_matches_nothing(
     scoped = index.search(
         SearchQuery(
             "housing",
-            evidence_scope=(("job-2", "2" * 64, "segment-000001"),),
+            evidence_scope=EvidenceScope((("job-2", "2" * 64, "segment-000001"),)),
         )
     )
-    empty = index.search(SearchQuery("housing", evidence_scope=()))
+    empty = index.search(SearchQuery("housing", evidence_scope=EvidenceScope(())))
 
     assert {item.document_id for item in unrestricted} == {"job-1", "job-2"}
     assert [item.document_id for item in scoped] == ["job-2"]
@@ -116,12 +123,12 @@ def test_semantic_scope_filters_before_vector_scoring_and_chunk_lookup_is_target
     scoped = index.search(
         SearchQuery(
             "housing",
-            evidence_scope=(("job-2", "2" * 64, "segment-000001"),),
+            evidence_scope=EvidenceScope((("job-2", "2" * 64, "segment-000001"),)),
         ),
         (1.0, 0.0),
     )
     empty = index.search(
-        SearchQuery("housing", evidence_scope=()),
+        SearchQuery("housing", evidence_scope=EvidenceScope(())),
         (1.0, 0.0),
     )
     located = index.chunks_for_segments((("job-2", "segment-000001"),))
@@ -129,3 +136,43 @@ def test_semantic_scope_filters_before_vector_scoring_and_chunk_lookup_is_target
     assert [candidate.chunk.document_id for candidate in scoped] == ["job-2"]
     assert empty == ()
     assert located[("job-2", "segment-000001")].chunk_id == "chunk-job-2"
+
+
+def test_scopes_load_once_per_identity_and_evict_least_recently_used(
+    tmp_path: Path,
+) -> None:
+    index = DuckDbTranscriptIndex(
+        tmp_path / "lexical.duckdb",
+        PrivateDirectoryStore(),  # type: ignore[arg-type]
+    )
+    index.rebuild((_transcript("job-1", "1"), _transcript("job-2", "2")))
+    index._scopes.max_loaded = 2
+    job_1 = (("job-1", "1" * 64, "segment-000001"),)
+    job_2 = (("job-2", "2" * 64, "segment-000001"),)
+    stale = (("job-2", "9" * 64, "segment-000001"),)
+
+    for _ in range(3):
+        results = index.search(
+            SearchQuery("housing", evidence_scope=EvidenceScope(job_1))
+        )
+        assert [item.document_id for item in results] == ["job-1"]
+    assert index._scopes.loads == 1
+    assert EvidenceScope(job_1) == EvidenceScope(job_1)
+    assert EvidenceScope(job_1).scope_id != EvidenceScope(job_2).scope_id
+    with pytest.raises(ValueError, match="duplicates"):
+        EvidenceScope(job_1 + job_1)
+    with pytest.raises(ValueError, match="digest"):
+        EvidenceScope((("job-1", "not-a-digest", "segment-000001"),))
+
+    assert (
+        index.search(SearchQuery("housing", evidence_scope=EvidenceScope(stale))) == ()
+    )
+    both = index.search(
+        SearchQuery("housing", evidence_scope=EvidenceScope(job_1 + job_2))
+    )
+    assert {item.document_id for item in both} == {"job-1", "job-2"}
+    assert index._scopes.loads == 3
+    loaded_rows = index._connection.execute(
+        "SELECT COUNT(*) FROM scholion_evidence_scope"
+    ).fetchone()
+    assert loaded_rows == (3,)
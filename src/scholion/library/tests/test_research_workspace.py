@@ -7,7 +7,7 @@ import pytest
 from scholion.library.duckdb_research_projection import DuckDbResearchProjection
 from scholion.library.errors import ResearchStateError
 from scholion.library.evidence import EvidenceAnchor
-from scholion.library.index import IndexedDocument, SearchQuery
+from scholion.library.index import EvidenceScope, IndexedDocument, SearchQuery
 from scholion.library.research_projector import ResearchStateProjector
 from scholion.library.research_workspace import (
     ResearchEvidenceView,
@@ -131,7 +131,7 @@ def test_workspace_search_compiles_human_filters_before_navigation_and_decorates
     scoped_query = navigation.search.call_args.args[0]
     assert scoped_query.text == "housing"
     assert scoped_query.document_ids == ("job-1",)
-    assert scoped_query.evidence_scope == (
+    assert scoped_query.evidence_scope.keys == (
         ("job-1", "1" * 64, "segment-000041"),
         ("job-1", "1" * 64, "segment-000042"),
     )
@@ -164,7 +164,7 @@ def test_workspace_unknown_research_label_compiles_to_empty_evidence_scope(
     )
 
     scoped_query = navigation.search.call_args.args[0]
-    assert scoped_query.evidence_scope == ()
+    assert scoped_query.evidence_scope == EvidenceScope(())
     assert response.results == ()
 
 
@@ -183,3 +183,67 @@ def test_navigation_private_dispatch_rejects_unknown_closed_fragments(
                 order="unknown",
                 limit=1,
             )
+
+
+def test_document_reverse_index_follows_create_update_and_delete(
+    tmp_path: Path,
+) -> None:
+    store = _store(tmp_path)
+    first = store.create_saved_search(
+        "First",
+        SavedSearchIntent(query=SearchQuery("rent", document_ids=("job-1", "job-2"))),
+        saved_search_id="search-1",
+    )
+    store.create_saved_search(
+        "Second",
+        SavedSearchIntent(query=SearchQuery("rent", document_ids=("job-2",))),
+        saved_search_id="search-2",
+    )
+    store.create_saved_search("Unscoped", SavedSearchIntent(query=SearchQuery("rent")))
+
+    assert store.saved_search_ids_by_document(("job-1", "job-2", "job-9")) == {
+        "job-1": ("search-1",),
+        "job-2": ("search-2", "search-1"),
+    }
+
+    updated = store.update_saved_search(
+        first.saved_search_id,
+        name=first.name,
+        description=None,
+        intent=SavedSearchIntent(query=SearchQuery("rent", document_ids=("job-3",))),
+    )
+    assert store.saved_search_ids_by_document(("job-1", "job-2", "job-3")) == {
+        "job-2": ("search-2",),
+        "job-3": ("search-1",),
+    }
+
+    store.delete_saved_search(
+        updated.saved_search_id, expected_updated_at=updated.updated_at
+    )
+    assert store.saved_search_ids_by_document(("job-3",)) == {}
+    many = tuple(f"job-{number}" for number in range(1_200))
+    assert store.saved_search_ids_by_document(many) == {"job-2": ("search-2",)}
+
+
+def test_version_one_metadata_is_upgraded_with_a_backfilled_document_index(
+    tmp_path: Path,
+) -> None:
+    store = _store(tmp_path)
+    store.create_saved_search(
+        "Scoped",
+        SavedSearchIntent(query=SearchQuery("rent", document_ids=("job-1",))),
+        saved_search_id="search-1",
+    )
+    with sqlite3.connect(store.database_path) as connection:
+        connection.execute("DROP TABLE saved_search_documents")
+        connection.execute("UPDATE workspace_metadata SET schema_version = 1")
+        connection.commit()
+    store.connections.close()
+
+    upgraded = _store(tmp_path)
+
+    assert upgraded.saved_search_ids_by_document(("job-1",)) == {"job-1": ("search-1",)}
+    with sqlite3.connect(upgraded.database_path) as connection:
+        assert connection.execute(
+            "SELECT schema_version FROM workspace_metadata"
+        ).fetchone() == (2,)
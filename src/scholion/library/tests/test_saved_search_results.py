@@ -0,0 +1,229 @@
+from dataclasses import replace
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from scholion.core.file_manager_facade import FileManagerFacade
+from scholion.core.performance_tracker import PerformanceTracker
+from scholion.interfaces.local_file_manager import LocalFileManager
+from scholion.library.duckdb_index import DuckDbTranscriptIndex
+from scholion.library.duckdb_research_projection import DuckDbResearchProjection
+from scholion.library.evidence import EvidenceAnchor
+from scholion.library.index import SearchQuery
+from scholion.library.research_projector import ResearchStateProjector
+from scholion.library.research_search_controls import (
+    ResearchSearchControlService,
+    ResearchSearchIntent,
+)
+from scholion.library.research_workspace import (
+    ResearchQueryFilters,
+    ResearchWorkspaceService,
+    WorkspaceSearchResponse,
+)
+from scholion.library.retrieval import RetrievalMode
+from scholion.library.saved_search_results import (
+    SavedSearchGeneration,
+    SavedSearchResultCache,
+)
+from scholion.library.sqlite_research_state import SqliteResearchStateStore
+from scholion.library.workspace_metadata import (
+    SavedSearch,
+    SqliteWorkspaceMetadataStore,
+)
+
+
+def _facade() -> FileManagerFacade:
+    return FileManagerFacade(LocalFileManager(), Mock(), PerformanceTracker())
+
+
+def _anchor(segment_id: str) -> EvidenceAnchor:
+    return EvidenceAnchor(
+        document_id="job-1",
+        source_sha256="0" * 64,
+        canonical_sha256="1" * 64,
+        canonical_path="/private/job-1.json",
+        source_path="/private/job-1.wav",
+        segment_ids=(segment_id,),
+        start_seconds=1.0,
+        end_seconds=2.0,
+    )
+
+
+def _controls(tmp_path: Path, *, cached: bool = True):
+    facade = _facade()
+    state_path = tmp_path / "state" / "research.sqlite3"
+    state = SqliteResearchStateStore(state_path, facade)
+    projection = DuckDbResearchProjection(
+        tmp_path / "projection" / "research.duckdb", facade
+    )
+    transcript_library = Mock()
+    transcript_library.documents.return_value = ()
+    transcript_library.index_state_token.return_value = "lexical:a:1"
+    transcript_library.semantic_state.return_value = None
+    navigation = Mock()
+    navigation.search.return_value = SimpleNamespace(results=())
+    navigation.speaker_labels.revision.return_value = "0" * 64
+    workspace = ResearchWorkspaceService(
+        transcript_library,
+        Mock(),
+        navigation,
+        state,
+        projection,
+        ResearchStateProjector(state, projection),
+        SqliteWorkspaceMetadataStore(state_path, facade),
+    )
+    cache = (
+        SavedSearchResultCache(tmp_path / "cache" / "pages", facade) if cached else None
+    )
+    return ResearchSearchControlService(workspace, cache), state, transcript_library
+
+
+def test_index_state_token_changes_on_every_committed_write(tmp_path: Path) -> None:
+    path = tmp_path / "library" / "transcripts.duckdb"
+    index = DuckDbTranscriptIndex(path, _facade())
+    tokens = [index.state_token()]
+    index.rebuild(())
+    tokens.append(index.state_token())
+    index.apply_delta(upserts=(), removals=("job-1",))
+    tokens.append(index.state_token())
+    index.clear()
+    tokens.append(index.state_token())
+    assert len(set(tokens)) == 4
+    index.close()
+
+    reopened = DuckDbTranscriptIndex(path, _facade())
+    assert reopened.state_token() == tokens[-1]
+    reopened.close()
+    path.unlink()
+    recreated = DuckDbTranscriptIndex(path, _facade())
+    assert recreated.state_token() not in tokens
+
+
+def test_saved_search_pages_are_reused_only_at_an_identical_generation(
+    tmp_path: Path,
+) -> None:
+    controls, state, transcript_library = _controls(tmp_path)
+    state.create_note(_anchor("segment-000001"), "one", tags=("housing",))
+    saved = controls.workspace.save_search(
+        "Housing",
+        SearchQuery("rent"),
+        filters=ResearchQueryFilters(tags=("housing",)),
+        saved_search_id="search-housing",
+    )
+    renders: list[str] = []
+
+    def render(
+        current: SavedSearch, response: WorkspaceSearchResponse
+    ) -> dict[str, object]:
+        renders.append(current.saved_search_id)
+        return {"run": len(renders), "evidence": []}
+
+    def run(page_format: str = "page-v1") -> dict[str, object]:
+        return controls.run_saved_search_page(
+            "Housing", render=render, page_format=page_format
+        )
+
+    assert run() == {"run": 1, "evidence": []}
+    assert run() == {"run": 1, "evidence": []}
+    assert len(renders) == 1
+
+    state.create_note(_anchor("segment-000002"), "two", tags=("housing",))
+    assert run()["run"] == 2
+    transcript_library.index_state_token.return_value = "lexical:a:2"
+    assert run()["run"] == 3
+    controls.workspace.navigation.speaker_labels.revision.return_value = "1" * 64
+    assert run()["run"] == 4
+    assert run("page-v2")["run"] == 5
+    assert run("page-v2")["run"] == 5
+
+    transcript_library.semantic_state.return_value = SimpleNamespace(
+        profile=SimpleNamespace(profile_id="e5", resolved_revision="r1"),
+        corpus_fingerprint="f" * 64,
+        chunk_count=3,
+    )
+    assert run("page-v2")["run"] == 5
+    controls.replace_saved_search(
+        saved.saved_search_id,
+        name=saved.name,
+        description=saved.description,
+        intent=replace(
+            ResearchSearchIntent.from_saved_intent(saved.intent),
+            mode=RetrievalMode.HYBRID,
+        ),
+        expected_updated_at=saved.updated_at,
+    )
+    assert run("page-v2")["run"] == 6
+    assert run("page-v2")["run"] == 6
+    transcript_library.semantic_state.return_value.chunk_count = 4
+    assert run("page-v2")["run"] == 7
+
+    replaced = controls.inspect_saved_search("Housing")
+    controls.delete_saved_search("Housing", expected_updated_at=replaced.updated_at)
+    assert not any((tmp_path / "cache" / "pages").iterdir())
+
+
+def test_pages_are_not_kept_when_state_moves_during_the_run(tmp_path: Path) -> None:
+    controls, state, _ = _controls(tmp_path)
+    controls.workspace.save_search("Everything", SearchQuery("rent"))
+    notes = iter(("segment-000001", "segment-000002"))
+
+    def render(
+        current: SavedSearch, response: WorkspaceSearchResponse
+    ) -> dict[str, object]:
+        segment = next(notes, None)
+        if segment is not None:
+            state.create_note(_anchor(segment), "written concurrently")
+        return {"segment": segment}
+
+    for expected in ("segment-000001", "segment-000002", None, None):
+        page = controls.run_saved_search_page(
+            "Everything", render=render, page_format="page-v1"
+        )
+        assert page == {"segment": expected}
+
+    uncached, _, _ = _controls(tmp_path / "uncached", cached=False)
+    uncached.workspace.save_search("Everything", SearchQuery("rent"))
+    runs = [
+        uncached.run_saved_search_page(
+            "Everything", render=lambda *_: {"ok": True}, page_format="page-v1"
+        )
+        for _ in range(2)
+    ]
+    assert runs == [{"ok": True}, {"ok": True}]
+    assert uncached.workspace.navigation.search.call_count == 2
+
+
+def test_corrupt_or_foreign_pages_are_misses_and_old_pages_are_pruned(
+    tmp_path: Path,
+) -> None:
+    cache = SavedSearchResultCache(tmp_path / "pages", _facade(), max_entries=2)
+    generations = [
+        SavedSearchGeneration(
+            saved_search_id=f"search-{number}",
+            saved_updated_at="2026-10-01T00:00:00+00:00",
+            lexical_state="lexical:a:1",
+            semantic_state=None,
+            projected_through_sequence=number,
+            speaker_label_revision="0" * 64,
+        )
+        for number in range(3)
+    ]
+    cache.record(generations[0], {"n": 0}, page_format="v1")
+    assert cache.lookup(generations[0], page_format="v1") == {"n": 0}
+    path = next((tmp_path / "pages").iterdir())
+    path.write_text("{not json", encoding="utf-8")
+    assert cache.lookup(generations[0], page_format="v1") is None
+
+    for generation in generations:
+        cache.record(
+            generation, {"n": generation.projected_through_sequence}, page_format="v1"
+        )
+    assert len(list((tmp_path / "pages").iterdir())) == 2
+    assert cache.lookup(generations[2], page_format="v1") == {"n": 2}
+
+    with pytest.raises(ValueError, match="projected_through_sequence"):
+        SavedSearchGeneration("s", "t", "lexical", None, -1, "0" * 64)
+    with pytest.raises(ValueError, match="max_entries"):
+        SavedSearchResultCache(tmp_path / "pages", _facade(), max_entries=0)
@@ -106,7 +106,7 @@ def test_saved_search_replays_typed_intent_against_current_research_scope(
 
     workspace.run_saved_search("Housing evidence")
     first_runtime_query = navigation.search.call_args.args[0]
-    assert first_runtime_query.evidence_scope == (
+    assert first_runtime_query.evidence_scope.keys == (
         ("job-1", "1" * 64, "segment-000001"),
     )
     assert navigation.search.call_args.kwargs == {
@@ -124,7 +124,7 @@ def test_saved_search_replays_typed_intent_against_current_research_scope(
     second_runtime_query = navigation.search.call_args.args[0]
 
     assert saved.intent.query.evidence_scope is None
-    assert second_runtime_query.evidence_scope == (
+    assert second_runtime_query.evidence_scope.keys == (
         ("job-1", "1" * 64, "segment-000001"),
         ("job-1", "1" * 64, "segment-000002"),
     )
@@ -1,13 +1,16 @@
 import hashlib
 import json
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
+from scholion.interfaces.local_file_manager import LocalFileManager
 from scholion.library.duckdb_index import DuckDbTranscriptIndex
 from scholion.library.errors import TranscriptLibraryBuildError, TranscriptLibraryError
 from scholion.library.index import SearchQuery
 from scholion.library.service import SourceIntegrity, TranscriptLibraryService
+from scholion.library.source_fingerprints import SourceFingerprintCache
 from scholion.workspace.lifecycle import JobLifecycleRecord, JobStatus
 from scholion.workspace.models import JobId, WorkspacePaths
 
@@ -39,8 +42,18 @@ class LifecycleStore:
     def __init__(self, records: tuple[JobLifecycleRecord, ...]) -> None:
         self.records = records
 
-    def list_records(self) -> tuple[JobLifecycleRecord, ...]:
-        return self.records
+    def list_records(
+        self,
+        *,
+        statuses: tuple[JobStatus, ...] = (),
+        with_artifact: bool = False,
+    ) -> tuple[JobLifecycleRecord, ...]:
+        return tuple(
+            record
+            for record in self.records
+            if (not statuses or record.status in statuses)
+            and (not with_artifact or record.artifact_path is not None)
+        )
 
 
 def _paths(tmp_path: Path) -> WorkspacePaths:
@@ -247,3 +260,35 @@ def test_source_mutation_during_hash_fails_closed(
     monkeypatch.setattr(service, "_fingerprint", mutate)
     with pytest.raises(TranscriptLibraryError, match="changed during"):
         service.inspect("job-1")
+
+
+def test_inspect_many_reuses_cached_source_fingerprints(tmp_path: Path) -> None:
+    source = tmp_path / "audio.wav"
+    source.write_bytes(b"original audio")
+    canonical = _paths(tmp_path).output_dir / "interview.json"
+    _write_canonical(canonical, job_id="job-1", source=source)
+    service = _service(tmp_path, (_record(source, canonical),))
+    cache_path = tmp_path / "state" / "library" / "source-fingerprints.sqlite3"
+    service.fingerprint_cache = SourceFingerprintCache(
+        cache_path,
+        LocalFileManager(),  # type: ignore[arg-type]
+    )
+    service.rebuild()
+
+    (unchecked,) = service.inspect_many(("job-1",), verify_source=False)
+    assert unchecked.source_integrity is SourceIntegrity.NOT_CHECKED
+    assert not cache_path.exists()
+
+    (first,) = service.inspect_many(("job-1",))
+    assert first.source_integrity is SourceIntegrity.MATCHES
+    assert cache_path.is_file()
+    with patch.object(TranscriptLibraryService, "_fingerprint") as fingerprint:
+        (cached,) = service.inspect_many(("job-1",))
+    fingerprint.assert_not_called()
+    assert cached.current_source_sha256 == first.current_source_sha256
+
+    source.write_bytes(b"changed audio!")
+    (changed,) = service.inspect_many(("job-1",))
+    assert changed.source_integrity is SourceIntegrity.CHANGED
+    with pytest.raises(TranscriptLibraryError, match="not present"):
+        service.inspect_many(("job-1", "missing"))
@@ -4,6 +4,7 @@ from pathlib import Path
 
 import pytest
 
+from scholion.core.measurements import MeasurementRecorder
 from scholion.library.duckdb_index import DuckDbTranscriptIndex
 from scholion.library.duckdb_semantic import DuckDbSemanticIndex
 from scholion.library.errors import SemanticSearchUnavailableError
@@ -38,7 +39,7 @@ class LocalStore:
 
 
 class EmptyLifecycle:
-    def list_records(self) -> tuple[object, ...]:
+    def list_records(self, **_: object) -> tuple[object, ...]:
         return ()
 
 
@@ -218,9 +219,52 @@ def test_lexical_retrieval_remains_available_without_semantic_runtime(
     tmp_path: Path,
 ) -> None:
     service, _, _ = _service(tmp_path)
+    service.observer = recorder = MeasurementRecorder()
     service.rebuild()
 
     response = service.retrieve(SearchQuery("housing"))
 
     assert response.mode is RetrievalMode.LEXICAL
     assert response.results[0].matched_segment_ids == ("s1",)
+    assert [(stage.name, stage.count) for stage in recorder.stages()] == [
+        ("library.query.lexical", 1)
+    ]
+
+
+def test_incremental_refresh_updates_semantic_generation_in_place(
+    tmp_path: Path,
+) -> None:
+    service, provider, canonical = _service(tmp_path)
+    service.rebuild_semantic(provider)
+    before = service.semantic_state()
+    assert before is not None
+
+    _write_canonical(canonical, tmp_path / "audio.wav", "rent burden pressure")
+    report = service.refresh(incremental_semantic=True)
+
+    assert report.updated_document_ids == ("job-1",)
+    assert report.semantic_updated is True
+    assert report.semantic_invalidated is False
+    after = service.semantic_state()
+    assert after is not None
+    assert after.profile == before.profile
+    assert after.corpus_fingerprint != before.corpus_fingerprint
+    response = service.retrieve(SearchQuery("rent"), mode=RetrievalMode.HYBRID)
+    assert response.results[0].semantic_rank == 1
+
+
+def test_incremental_refresh_falls_back_to_invalidation_when_embedding_fails(
+    tmp_path: Path,
+) -> None:
+    service, provider, canonical = _service(tmp_path)
+    service.rebuild_semantic(provider)
+    service.embedding_provider_factory = lambda profile: FailingEmbeddingProvider(
+        tmp_path
+    )
+
+    _write_canonical(canonical, tmp_path / "audio.wav", "rent burden pressure")
+    report = service.refresh(incremental_semantic=True)
+
+    assert report.semantic_updated is False
+    assert report.semantic_invalidated is True
+    assert service.semantic_state() is None
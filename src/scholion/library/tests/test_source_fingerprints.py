@@ -0,0 +1,42 @@
+from pathlib import Path
+
+from scholion.interfaces.local_file_manager import LocalFileManager
+from scholion.library.playback_leases import SourceFileIdentity
+from scholion.library.source_fingerprints import SourceFingerprintCache
+
+
+def _cache(path: Path) -> SourceFingerprintCache:
+    return SourceFingerprintCache(path, LocalFileManager())  # type: ignore[arg-type]
+
+
+def _identity(inode: int) -> SourceFileIdentity:
+    return SourceFileIdentity(
+        device=1, inode=inode, size_bytes=10, modified_ns=20, changed_ns=30
+    )
+
+
+def test_concurrent_caches_keep_each_others_entries(tmp_path: Path) -> None:
+    path = tmp_path / "state" / "source-fingerprints.sqlite3"
+    planner = _cache(path)
+    executor = _cache(path)
+    assert planner.lookup("/a.wav", _identity(1)) is None
+
+    planner.record({"/a.wav": (_identity(1), "a" * 64)})
+    executor.record({"/b.wav": (_identity(2), "b" * 64)})
+    planner.record({"/c.wav": (_identity(3), "c" * 64)})
+
+    reader = _cache(path)
+    assert reader.lookup("/a.wav", _identity(1)) == "a" * 64
+    assert reader.lookup("/b.wav", _identity(2)) == "b" * 64
+    assert reader.lookup("/c.wav", _identity(3)) == "c" * 64
+    assert reader.lookup("/a.wav", _identity(9)) is None
+
+
+def test_unreadable_cache_only_costs_a_rehash(tmp_path: Path) -> None:
+    path = tmp_path / "source-fingerprints.sqlite3"
+    path.write_bytes(b"not a database at all, just some bytes" * 4)
+    cache = _cache(path)
+
+    cache.record({"/a.wav": (_identity(1), "a" * 64)})
+
+    assert cache.lookup("/a.wav", _identity(1)) is None
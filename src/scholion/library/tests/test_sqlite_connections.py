@@ -0,0 +1,171 @@
+import sqlite3
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from scholion.library.sqlite_connections import (
+    SqliteConnectionManager,
+    SqliteOperation,
+)
+from scholion.library.sqlite_research_state import SqliteResearchStateStore
+
+
+class PrivateDirectoryStore:
+    def ensure_directory_exists(
+        self, directory_path: str | Path, *, private: bool = False
+    ) -> None:
+        assert private
+        Path(directory_path).mkdir(parents=True, exist_ok=True)
+
+
+def _manager(tmp_path: Path, **kwargs: object) -> SqliteConnectionManager:
+    manager = SqliteConnectionManager(tmp_path / "state.sqlite3", **kwargs)  # type: ignore[arg-type]
+    with manager.connection() as connection:
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.execute("CREATE TABLE items (value TEXT NOT NULL)")
+    return manager
+
+
+def test_connections_are_reused_per_thread_with_per_operation_durability(
+    tmp_path: Path,
+) -> None:
+    manager = _manager(tmp_path)
+    with manager.connection() as first:
+        assert first.execute("PRAGMA synchronous").fetchone() == (2,)
+    with manager.connection(SqliteOperation.READ_MOSTLY) as second:
+        assert second.execute("PRAGMA synchronous").fetchone() == (1,)
+        assert second.execute("PRAGMA foreign_keys").fetchone() == (1,)
+        assert second.execute("PRAGMA wal_autocheckpoint").fetchone() == (0,)
+    assert first is second
+
+    other: list[sqlite3.Connection] = []
+
+    def use_from_thread() -> None:
+        with manager.connection(SqliteOperation.READ_MOSTLY) as connection:
+            other.append(connection)
+
+    thread = threading.Thread(target=use_from_thread)
+    thread.start()
+    thread.join()
+    assert other and other[0] is not first
+    with pytest.raises(ValueError, match="synchronous"):
+        SqliteConnectionManager(
+            tmp_path / "x.sqlite3", synchronous={SqliteOperation.READ_MOSTLY: "OFF"}
+        )
+
+
+def test_open_transactions_roll_back_and_nested_use_is_isolated(
+    tmp_path: Path,
+) -> None:
+    manager = _manager(tmp_path)
+    with manager.connection() as outer:
+        outer.execute("BEGIN IMMEDIATE")
+        outer.execute("INSERT INTO items (value) VALUES ('kept')")
+        with manager.connection(SqliteOperation.READ_MOSTLY) as nested:
+            assert nested is not outer
+            assert nested.execute("SELECT COUNT(*) FROM items").fetchone() == (0,)
+        assert outer.in_transaction
+        outer.commit()
+    with manager.connection() as connection:
+        connection.execute("INSERT INTO items (value) VALUES ('uncommitted')")
+    with manager.connection() as connection:
+        assert not connection.in_transaction
+        values = connection.execute("SELECT value FROM items").fetchall()
+    assert values == [("kept",)]
+
+    with pytest.raises(sqlite3.OperationalError), manager.connection() as broken:
+        broken.execute("SELECT missing FROM items")
+    with manager.connection() as replacement:
+        assert replacement is not broken
+
+
+def test_replaced_database_file_gets_a_fresh_connection(tmp_path: Path) -> None:
+    manager = _manager(tmp_path)
+    with manager.connection() as before:
+        pass
+    for suffix in ("", "-wal", "-shm"):
+        Path(f"{manager.database_path}{suffix}").unlink(missing_ok=True)
+
+    with manager.connection() as after:
+        tables = after.execute("SELECT name FROM sqlite_master").fetchall()
+
+    assert after is not before
+    assert tables == []
+
+
+def test_checkpoints_are_triggered_by_wal_size_and_measured(tmp_path: Path) -> None:
+    ticks = iter([10.0, 10.25, 20.0, 20.5])
+    manager = _manager(tmp_path, checkpoint_bytes=1, clock=lambda: next(ticks))
+
+    with manager.connection() as connection:
+        connection.execute("INSERT INTO items (value) VALUES ('row')")
+        connection.commit()
+    with manager.connection(SqliteOperation.READ_MOSTLY) as connection:
+        connection.execute("SELECT COUNT(*) FROM items").fetchone()
+
+    stats = manager.checkpoint_stats
+    assert stats.checkpoints == 1
+    assert stats.total_seconds == pytest.approx(0.25)
+    assert stats.last is not None
+    assert stats.last.mode == "PASSIVE"
+    assert not stats.last.busy
+
+    explicit = manager.checkpoint("TRUNCATE")
+    assert explicit.duration_seconds == pytest.approx(0.5)
+    assert manager.checkpoint_stats.max_seconds == pytest.approx(0.5)
+    assert Path(f"{manager.database_path}-wal").stat().st_size == 0
+
+
+def test_checkpoints_count_wal_growth_since_the_previous_checkpoint(
+    tmp_path: Path,
+) -> None:
+    manager = _manager(tmp_path, checkpoint_bytes=1024 * 1024)
+    with manager.connection() as connection:
+        connection.execute("INSERT INTO items (value) VALUES (?)", ("x" * 1_200_000,))
+        connection.commit()
+    assert manager.checkpoint_stats.checkpoints == 1
+
+    for position in range(20):
+        with manager.connection() as connection:
+            connection.execute("INSERT INTO items (value) VALUES (?)", (str(position),))
+            connection.commit()
+
+    assert manager.checkpoint_stats.checkpoints == 1
+    assert Path(f"{manager.database_path}-wal").stat().st_size < 1024 * 1024
+
+
+def test_pinned_wal_is_checkpointed_once_per_threshold_of_growth(
+    tmp_path: Path,
+) -> None:
+    manager = _manager(tmp_path, checkpoint_bytes=256 * 1024)
+    reader = sqlite3.connect(manager.database_path)
+    reader.execute("BEGIN")
+    reader.execute("SELECT COUNT(*) FROM items").fetchone()
+    try:
+        for _ in range(8):
+            with manager.connection() as connection:
+                connection.execute(
+                    "INSERT INTO items (value) VALUES (?)", ("x" * 50_000,)
+                )
+                connection.commit()
+    finally:
+        reader.close()
+
+    assert manager.checkpoint_stats.checkpoints == 1
+
+
+def test_research_stores_share_one_connection_per_thread(tmp_path: Path) -> None:
+    path = tmp_path / "research.sqlite3"
+    store = SqliteResearchStateStore(path, PrivateDirectoryStore())  # type: ignore[arg-type]
+    again = SqliteResearchStateStore(path, PrivateDirectoryStore())  # type: ignore[arg-type]
+    assert again.connections is store.connections
+
+    with patch(
+        "scholion.library.sqlite_connections.sqlite3.connect",
+        side_effect=AssertionError("connection was not reused"),
+    ):
+        for _ in range(5):
+            assert store.notes() == ()
+            assert again.current_sequence() == 0
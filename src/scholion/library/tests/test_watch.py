@@ -0,0 +1,234 @@
+from pathlib import Path
+
+from scholion.library.change_feed import PollingChangeFeed
+from scholion.library.errors import TranscriptLibraryBuildError
+from scholion.library.service import LibraryRefreshReport
+from scholion.library.watch import LibraryWatchService
+from scholion.workspace.models import WorkspacePaths
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeFeed:
+    def __init__(self) -> None:
+        self.directories: set[Path] = set()
+        self.touched: set[Path] = set()
+        self.overflowed = False
+        self.closed = False
+
+    def watch(self, directories: tuple[Path, ...]) -> None:
+        self.directories.update(directories)
+
+    def watched(self) -> frozenset[Path]:
+        return frozenset(self.directories)
+
+    def drain(self) -> frozenset[Path] | None:
+        touched = frozenset(self.touched)
+        self.touched.clear()
+        if self.overflowed:
+            self.overflowed = False
+            return None
+        return touched
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class Locations:
+    def __init__(self, roots: tuple[Path, ...]) -> None:
+        self.roots = roots
+
+    def transcript_roots(self) -> tuple[tuple[Path, ...], tuple[str, ...]]:
+        return self.roots, ("missing-location",)
+
+
+class Library:
+    def __init__(self, paths: WorkspacePaths) -> None:
+        self.paths = paths
+        self.full_refreshes: list[tuple[Path, ...]] = []
+        self.scoped_refreshes: list[tuple[Path, ...]] = []
+        self.failures = 0
+
+    def refresh(
+        self, additional_paths: tuple[Path, ...], *, incremental_semantic: bool
+    ) -> LibraryRefreshReport:
+        assert incremental_semantic
+        self.full_refreshes.append(additional_paths)
+        return _report()
+
+    def refresh_directories(
+        self, directories: tuple[Path, ...], *, incremental_semantic: bool
+    ) -> LibraryRefreshReport:
+        assert incremental_semantic
+        if self.failures:
+            self.failures -= 1
+            raise TranscriptLibraryBuildError("retry the refresh")
+        self.scoped_refreshes.append(directories)
+        return _report()
+
+
+def _report() -> LibraryRefreshReport:
+    return LibraryRefreshReport(
+        backend_id="duckdb-bm25-v1",
+        indexed_documents=0,
+        added_document_ids=(),
+        updated_document_ids=(),
+        removed_document_ids=(),
+        unchanged_document_ids=(),
+        skipped_files=0,
+        semantic_invalidated=False,
+        verified_all_tracked=False,
+    )
+
+
+def _watcher(
+    tmp_path: Path,
+    *,
+    max_pending_directories: int = 8,
+) -> tuple[LibraryWatchService, FakeFeed, Library, Clock, tuple[Path, ...]]:
+    roots = tuple((tmp_path / name).resolve() for name in ("alpha", "beta", "gamma"))
+    paths = WorkspacePaths(
+        state_dir=tmp_path / "state",
+        cache_dir=tmp_path / "cache",
+        model_dir=tmp_path / "cache" / "models",
+        output_dir=tmp_path / "output",
+    )
+    feed = FakeFeed()
+    library = Library(paths)
+    clock = Clock()
+    watcher = LibraryWatchService(
+        Locations(roots),  # type: ignore[arg-type]
+        library,  # type: ignore[arg-type]
+        feed,
+        debounce_seconds=2.0,
+        max_delay_seconds=5.0,
+        max_pending_directories=max_pending_directories,
+        batch_directories=2,
+        clock=clock,
+    )
+    return watcher, feed, library, clock, roots
+
+
+def test_watch_catches_up_then_debounces_bursts_into_scoped_batches(
+    tmp_path: Path,
+) -> None:
+    watcher, feed, library, clock, roots = _watcher(tmp_path)
+
+    initial = watcher.start()
+
+    assert initial.full_refresh is True
+    assert initial.unavailable_location_ids == ("missing-location",)
+    assert library.full_refreshes == [roots]
+    assert feed.watched() == {*roots, (tmp_path / "output").resolve()}
+
+    feed.touched.update({roots[0], roots[1], tmp_path / "unwatched"})
+    assert watcher.poll() == ()
+    clock.now = 1.5
+    feed.touched.add(roots[2])
+    assert watcher.poll() == ()
+    clock.now = 3.6
+
+    batches = watcher.poll()
+
+    assert [batch.full_refresh for batch in batches] == [False, False]
+    assert library.scoped_refreshes == [(roots[0], roots[1]), (roots[2],)]
+    assert watcher.poll() == ()
+
+
+def test_watch_flushes_continuous_churn_after_max_delay(tmp_path: Path) -> None:
+    watcher, feed, library, clock, roots = _watcher(tmp_path)
+    watcher.start()
+
+    for step in range(6):
+        clock.now = float(step)
+        feed.touched.add(roots[0])
+        batches = watcher.poll()
+
+    assert len(batches) == 1
+    assert library.scoped_refreshes == [(roots[0],)]
+
+
+def test_watch_queue_overflow_and_feed_overflow_collapse_to_full_refresh(
+    tmp_path: Path,
+) -> None:
+    watcher, feed, library, clock, roots = _watcher(tmp_path, max_pending_directories=2)
+    watcher.start()
+
+    feed.touched.update(roots)
+    watcher.poll()
+    clock.now = 2.0
+    (batch,) = watcher.poll()
+    assert batch.full_refresh is True
+    assert library.scoped_refreshes == []
+
+    feed.overflowed = True
+    clock.now = 3.0
+    watcher.poll()
+    clock.now = 5.0
+    (batch,) = watcher.poll()
+    assert batch.full_refresh is True
+    assert len(library.full_refreshes) == 3
+
+
+def test_watch_reports_failed_batch_and_retries_after_quiet_period(
+    tmp_path: Path,
+) -> None:
+    watcher, feed, library, clock, roots = _watcher(tmp_path)
+    watcher.start()
+    library.failures = 1
+
+    feed.touched.add(roots[0])
+    watcher.poll()
+    clock.now = 2.0
+    (failed,) = watcher.poll()
+    assert failed.error == "retry the refresh"
+    assert failed.refresh is None
+
+    clock.now = 4.0
+    (retried,) = watcher.poll()
+    assert retried.full_refresh is False
+    assert retried.directories == (str(roots[0]),)
+    assert retried.error is None
+
+
+def test_watch_stops_at_first_failed_batch_and_requeues_the_rest(
+    tmp_path: Path,
+) -> None:
+    watcher, feed, library, clock, roots = _watcher(tmp_path)
+    watcher.start()
+    library.failures = 1
+
+    feed.touched.update(roots)
+    watcher.poll()
+    clock.now = 2.0
+    (failed,) = watcher.poll()
+    assert failed.directories == (str(roots[0]), str(roots[1]))
+    assert library.scoped_refreshes == []
+
+    clock.now = 4.0
+    retried = watcher.poll()
+    assert [batch.error for batch in retried] == [None, None]
+    assert library.scoped_refreshes == [(roots[0], roots[1]), (roots[2],)]
+
+
+def test_polling_feed_reports_directories_whose_candidates_changed(
+    tmp_path: Path,
+) -> None:
+    watched = tmp_path / "watched"
+    quiet = tmp_path / "quiet"
+    watched.mkdir()
+    quiet.mkdir()
+    feed = PollingChangeFeed()
+    feed.watch((watched, quiet))
+    assert feed.drain() == frozenset()
+
+    (watched / "transcript.json").write_text("{}")
+
+    assert feed.drain() == {watched.resolve()}
+    assert feed.drain() == frozenset()
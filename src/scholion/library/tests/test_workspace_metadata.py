@@ -5,7 +5,12 @@ import pytest
 
 from scholion.library.errors import ResearchStateError
 from scholion.library.evidence import EvidenceAnchor
-from scholion.library.index import SearchOperator, SearchQuery, SearchSort
+from scholion.library.index import (
+    EvidenceScope,
+    SearchOperator,
+    SearchQuery,
+    SearchSort,
+)
 from scholion.library.retrieval import RetrievalMode
 from scholion.library.sqlite_research_state import SqliteResearchStateStore
 from scholion.library.workspace_metadata import (
@@ -114,7 +119,7 @@ def test_saved_search_rejects_derived_evidence_scope() -> None:
         SavedSearchIntent(
             query=SearchQuery(
                 "housing",
-                evidence_scope=(("job-1", "1" * 64, "segment-000001"),),
+                evidence_scope=EvidenceScope((("job-1", "1" * 64, "segment-000001"),)),
             )
         )
 
@@ -0,0 +1,66 @@
+import os
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from scholion.core.file_manager_facade import FileManagerFacade
+from scholion.core.performance_tracker import PerformanceTracker
+from scholion.interfaces.local_file_manager import LocalFileManager
+from scholion.library.workspace_usage import (
+    WorkspaceUsageCache,
+    WorkspaceUsageMeter,
+    tree_size_bytes,
+)
+
+
+def _workspace(root: Path) -> Path:
+    checkpoints = root / "checkpoints"
+    checkpoints.mkdir(parents=True)
+    (checkpoints / "chunk-0.bin").write_bytes(b"a" * 40)
+    (root / "intermediate.wav").write_bytes(b"b" * 2)
+    return root
+
+
+def test_tree_size_counts_nested_files_without_following_symlinks(
+    tmp_path: Path,
+) -> None:
+    workspace = _workspace(tmp_path / "job-1")
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (outside / "huge.bin").write_bytes(b"c" * 10_000)
+    os.symlink(outside, workspace / "linked", target_is_directory=True)
+
+    size = tree_size_bytes(workspace)
+
+    assert 42 <= size < 10_000
+    assert tree_size_bytes(tmp_path / "missing") == 0
+
+
+def test_meter_reuses_cached_size_until_workspace_identity_changes(
+    tmp_path: Path,
+) -> None:
+    workspace = _workspace(tmp_path / "jobs" / "job-1")
+    facade = FileManagerFacade(LocalFileManager(), Mock(), PerformanceTracker())
+    cache_path = tmp_path / "state" / "workspace-usage.json"
+    meter = WorkspaceUsageMeter(WorkspaceUsageCache(cache_path, facade))
+
+    assert meter.measure({workspace: "2026-08-01T00:00:00+00:00"}) == {workspace: 42}
+    reloaded = WorkspaceUsageMeter(WorkspaceUsageCache(cache_path, facade))
+    with patch("scholion.library.workspace_usage.tree_size_bytes") as walk:
+        cached = reloaded.measure({workspace: "2026-08-01T00:00:00+00:00"})
+    walk.assert_not_called()
+    assert cached == {workspace: 42}
+
+    resumed = reloaded.measure({workspace: "2026-08-02T00:00:00+00:00"})
+    assert resumed == {workspace: 42}
+    reloaded.forget((workspace,))
+    assert (
+        WorkspaceUsageCache(cache_path, facade).lookup(
+            workspace,
+            updated_at="2026-08-02T00:00:00+00:00",
+            modified_ns=workspace.stat().st_mtime_ns,
+        )
+        is None
+    )
+    assert reloaded.measure({tmp_path / "gone": "2026-08-01T00:00:00+00:00"}) == {
+        tmp_path / "gone": 0
+    }
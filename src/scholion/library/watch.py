@@ -0,0 +1,230 @@
+"""Long-running library watch mode built on scoped incremental refresh.
+
+Watch mode keeps the transcript library current while a user works. It listens for
+directory changes in enabled transcript-library locations and the workspace output
+directory, waits for writers to go quiet, then reconciles only the touched directories
+as small ``apply_delta`` batches. Semantic state is updated in place when the stored
+embedding profile can be restored locally and otherwise invalidated exactly as a manual
+refresh would.
+
+Pending work is bounded. When more directories are pending than the queue allows, or
+the change feed reports an overflow, the pending set collapses into one whole-library
+refresh instead of growing without limit.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Protocol
+
+from scholion.library.errors import TranscriptLibraryError
+from scholion.library.locations import LibraryLocationService
+from scholion.library.service import LibraryRefreshReport, TranscriptLibraryService
+
+
+class LibraryChangeFeed(Protocol):
+    """Directory-level change source consumed by watch mode."""
+
+    def watch(self, directories: tuple[Path, ...]) -> None: ...
+
+    def watched(self) -> frozenset[Path]: ...
+
+    def drain(self) -> frozenset[Path] | None:
+        """Return directories touched since the last drain, or None after overflow."""
+        ...
+
+    def close(self) -> None: ...
+
+
+@dataclass(frozen=True, slots=True)
+class LibraryWatchBatch:
+    """Outcome of one debounced reconciliation performed by watch mode."""
+
+    directories: tuple[str, ...]
+    full_refresh: bool
+    refresh: LibraryRefreshReport | None
+    unavailable_location_ids: tuple[str, ...]
+    error: str | None = None
+
+    def __post_init__(self) -> None:
+        if (self.refresh is None) == (self.error is None):
+            raise ValueError("watch batch needs exactly one of refresh or error")
+
+
+class LibraryWatchService:
+    """Debounce directory changes into bounded scoped library refreshes."""
+
+    def __init__(
+        self,
+        locations: LibraryLocationService,
+        transcript_library: TranscriptLibraryService,
+        change_feed: LibraryChangeFeed,
+        *,
+        debounce_seconds: float = 2.0,
+        max_delay_seconds: float = 10.0,
+        max_pending_directories: int = 256,
+        batch_directories: int = 16,
+        roots_interval_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if debounce_seconds < 0 or max_delay_seconds < debounce_seconds:
+            raise ValueError("watch delays must satisfy 0 <= debounce <= max delay")
+        if max_pending_directories < 1 or batch_directories < 1:
+            raise ValueError("watch queue bounds must be positive")
+        if roots_interval_seconds <= 0:
+            raise ValueError("roots_interval_seconds must be positive")
+        self.locations = locations
+        self.transcript_library = transcript_library
+        self.change_feed = change_feed
+        self.debounce_seconds = debounce_seconds
+        self.max_delay_seconds = max_delay_seconds
+        self.max_pending_directories = max_pending_directories
+        self.batch_directories = batch_directories
+        self.roots_interval_seconds = roots_interval_seconds
+        self.clock = clock
+        self._roots: tuple[Path, ...] = ()
+        self._unavailable: tuple[str, ...] = ()
+        self._roots_checked_at: float | None = None
+        self._pending: set[Path] = set()
+        self._full_refresh_pending = False
+        self._first_change_at: float | None = None
+        self._last_change_at: float | None = None
+
+    def start(self) -> LibraryWatchBatch:
+        """Register watches and run the catch-up refresh for changes made while idle."""
+        self._refresh_roots(self.clock())
+        self._full_refresh_pending = True
+        return self._flush()[0]
+
+    def poll(self) -> tuple[LibraryWatchBatch, ...]:
+        """Collect pending changes and reconcile them once writers have gone quiet."""
+        now = self.clock()
+        if (
+            self._roots_checked_at is None
+            or now - self._roots_checked_at >= self.roots_interval_seconds
+        ):
+            self._enqueue(self._refresh_roots(now), now)
+        touched = self.change_feed.drain()
+        if touched is None:
+            self._full_refresh_pending = True
+            self._note_change(now)
+        else:
+            self._enqueue(frozenset(touched) & self.change_feed.watched(), now)
+        if not self._due(now):
+            return ()
+        return self._flush()
+
+    def run(
+        self,
+        should_stop: Callable[[], bool],
+        on_batch: Callable[[LibraryWatchBatch], None],
+        *,
+        poll_interval_seconds: float = 0.5,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        on_batch(self.start())
+        while not should_stop():
+            for batch in self.poll():
+                on_batch(batch)
+            sleep(poll_interval_seconds)
+
+    def close(self) -> None:
+        self.change_feed.close()
+
+    def _refresh_roots(self, now: float) -> frozenset[Path]:
+        roots, unavailable = self.locations.transcript_roots()
+        directories = (
+            *roots,
+            self.transcript_library.paths.output_dir.expanduser().resolve(strict=False),
+        )
+        known = self.change_feed.watched()
+        self.change_feed.watch(directories)
+        self._roots = roots
+        self._unavailable = unavailable
+        self._roots_checked_at = now
+        return frozenset(self.change_feed.watched() - known)
+
+    def _enqueue(self, directories: frozenset[Path], now: float) -> None:
+        if not directories:
+            return
+        self._note_change(now)
+        if self._full_refresh_pending:
+            return
+        self._pending.update(directories)
+        if len(self._pending) > self.max_pending_directories:
+            self._pending.clear()
+            self._full_refresh_pending = True
+
+    def _note_change(self, now: float) -> None:
+        if self._first_change_at is None:
+            self._first_change_at = now
+        self._last_change_at = now
+
+    def _due(self, now: float) -> bool:
+        if self._first_change_at is None or self._last_change_at is None:
+            return False
+        return (
+            now - self._last_change_at >= self.debounce_seconds
+            or now - self._first_change_at >= self.max_delay_seconds
+        )
+
+    def _flush(self) -> tuple[LibraryWatchBatch, ...]:
+        full_refresh = self._full_refresh_pending
+        pending = tuple(sorted(self._pending))
+        self._pending.clear()
+        self._full_refresh_pending = False
+        self._first_change_at = None
+        self._last_change_at = None
+        if full_refresh:
+            return (self._run_batch((), full_refresh=True),)
+        batches: list[LibraryWatchBatch] = []
+        for offset in range(0, len(pending), self.batch_directories):
+            batch = self._run_batch(
+                pending[offset : offset + self.batch_directories],
+                full_refresh=False,
+            )
+            batches.append(batch)
+            if batch.error is not None:
+                # Later batches must not apply on top of one that did not; retry the
+                # failed directories and everything after them together.
+                self._enqueue(frozenset(pending[offset:]), self.clock())
+                break
+        return tuple(batches)
+
+    def _run_batch(
+        self,
+        directories: tuple[Path, ...],
+        *,
+        full_refresh: bool,
+    ) -> LibraryWatchBatch:
+        try:
+            if full_refresh:
+                report = self.transcript_library.refresh(
+                    self._roots, incremental_semantic=True
+                )
+            else:
+                report = self.transcript_library.refresh_directories(
+                    directories, incremental_semantic=True
+                )
+        except TranscriptLibraryError as exc:
+            # A writer may still be mid-rename; a failed whole-library refresh is
+            # retried after the next quiet period, and _flush re-queues scoped ones.
+            if full_refresh:
+                self._full_refresh_pending = True
+                self._note_change(self.clock())
+            return LibraryWatchBatch(
+                directories=tuple(str(item) for item in directories),
+                full_refresh=full_refresh,
+                refresh=None,
+                unavailable_location_ids=self._unavailable,
+                error=exc.public_message,
+            )
+        return LibraryWatchBatch(
+            directories=tuple(str(item) for item in directories),
+            full_refresh=full_refresh,
+            refresh=report,
+            unavailable_location_ids=self._unavailable,
+        )
@@ -22,13 +22,15 @@ from scholion.core.file_manager_facade import FileManagerFacade
 from scholion.library.errors import ResearchStateError
 from scholion.library.index import SearchOperator, SearchQuery, SearchSort
 from scholion.library.retrieval import RetrievalMode
+from scholion.library.sqlite_connections import SqliteConnectionManager, SqliteOperation
 
-_METADATA_SCHEMA_VERSION = 1
+_METADATA_SCHEMA_VERSION = 2
 _MAX_ID_CHARS = 200
 _MAX_NAME_CHARS = 200
 _MAX_DESCRIPTION_CHARS = 4_000
 _MAX_LIST_RESULTS = 10_000
 _MAX_NAVIGATION_RESULTS = 100
+_DOCUMENT_LOOKUP_BATCH = 500
 
 
 @dataclass(frozen=True, slots=True)
@@ -142,19 +144,34 @@ class WorkspaceMetadataStore(Protocol):
 
     def saved_searches(self, *, limit: int = 1_000) -> tuple[SavedSearch, ...]: ...
 
+    def saved_search_ids_by_document(
+        self, document_ids: tuple[str, ...]
+    ) -> dict[str, tuple[str, ...]]:
+        """Map each document to the saved searches whose intent names it."""
+        ...
+
     def navigation(self, *, limit: int = 10) -> WorkspaceNavigation: ...
 
 
 class SqliteWorkspaceMetadataStore:
     """SQLite adapter sharing the authoritative research-state database file."""
 
-    def __init__(self, database_path: Path, file_manager: FileManagerFacade) -> None:
+    def __init__(
+        self,
+        database_path: Path,
+        file_manager: FileManagerFacade,
+        *,
+        connections: SqliteConnectionManager | None = None,
+    ) -> None:
         self.database_path = database_path.expanduser().resolve(strict=False)
         self.file_manager = file_manager
         self.file_manager.ensure_directory_exists(
             self.database_path.parent,
             private=True,
         )
+        self.connections = connections or SqliteConnectionManager.shared(
+            self.database_path
+        )
         self._initialize()
 
     def create_saved_search(
@@ -194,6 +211,7 @@ class SqliteWorkspaceMetadataStore:
                     updated_at=now,
                 ),
             )
+            self._index_documents(connection, resolved_id, intent.query.document_ids)
             saved = self._saved_search_by_id(connection, resolved_id)
             connection.commit()
         if saved is None:
@@ -246,6 +264,11 @@ class SqliteWorkspaceMetadataStore:
             ).rowcount
             if changed != 1:
                 raise ResearchStateError("Saved search does not exist")
+            connection.execute(
+                "DELETE FROM saved_search_documents WHERE saved_search_id = ?",
+                (resolved_id,),
+            )
+            self._index_documents(connection, resolved_id, intent.query.document_ids)
             saved = self._saved_search_by_id(connection, resolved_id)
             connection.commit()
         if saved is None:
@@ -275,7 +298,7 @@ class SqliteWorkspaceMetadataStore:
 
     def saved_search(self, identifier: str) -> SavedSearch | None:
         resolved = self._validate_identifier(identifier, "saved search identifier")
-        with self._connection() as connection:
+        with self._connection(SqliteOperation.READ_MOSTLY) as connection:
             exact = self._saved_search_by_id(connection, resolved)
             if exact is not None:
                 return exact
@@ -293,7 +316,7 @@ class SqliteWorkspaceMetadataStore:
     def saved_searches(self, *, limit: int = 1_000) -> tuple[SavedSearch, ...]:
         if limit < 1 or limit > _MAX_LIST_RESULTS:
             raise ValueError("saved search list limit must be between 1 and 10000")
-        with self._connection() as connection:
+        with self._connection(SqliteOperation.READ_MOSTLY) as connection:
             rows = connection.execute(
                 """
                 SELECT saved_search_id FROM saved_searches
@@ -309,10 +332,39 @@ class SqliteWorkspaceMetadataStore:
                 is not None
             )
 
+    def saved_search_ids_by_document(
+        self, document_ids: tuple[str, ...]
+    ) -> dict[str, tuple[str, ...]]:
+        """Answer "which saved searches name these documents" from the reverse index.
+
+        IDs per document follow ``saved_searches`` order; unused documents are omitted.
+        """
+        wanted = tuple(dict.fromkeys(document_ids))
+        affected: dict[str, list[str]] = {}
+        with self._connection(SqliteOperation.READ_MOSTLY) as connection:
+            for start in range(0, len(wanted), _DOCUMENT_LOOKUP_BATCH):
+                batch = wanted[start : start + _DOCUMENT_LOOKUP_BATCH]
+                placeholders = ", ".join("?" for _ in batch)
+                rows = connection.execute(
+                    f"""
+                    SELECT d.document_id, s.saved_search_id
+                    FROM saved_search_documents d
+                    JOIN saved_searches s ON s.saved_search_id = d.saved_search_id
+                    WHERE d.document_id IN ({placeholders})
+                    ORDER BY s.updated_at DESC, s.normalized_name, s.saved_search_id
+                    """,  # noqa: S608 - placeholders only; values stay bound.
+                    batch,
+                ).fetchall()
+                for document_id, saved_search_id in rows:
+                    affected.setdefault(str(document_id), []).append(
+                        str(saved_search_id)
+                    )
+        return {document_id: tuple(ids) for document_id, ids in affected.items()}
+
     def navigation(self, *, limit: int = 10) -> WorkspaceNavigation:
         if limit < 1 or limit > _MAX_NAVIGATION_RESULTS:
             raise ValueError("navigation limit must be between 1 and 100")
-        with self._connection() as connection:
+        with self._connection(SqliteOperation.READ_MOSTLY) as connection:
             frequent_tags = self._navigation_rows(
                 connection,
                 kind="tag",
@@ -377,6 +429,14 @@ class SqliteWorkspaceMetadataStore:
                 );
                 CREATE INDEX IF NOT EXISTS saved_searches_updated_idx
                     ON saved_searches(updated_at DESC, saved_search_id);
+                CREATE TABLE IF NOT EXISTS saved_search_documents (
+                    document_id TEXT NOT NULL,
+                    saved_search_id TEXT NOT NULL
+                        REFERENCES saved_searches(saved_search_id) ON DELETE CASCADE,
+                    PRIMARY KEY (document_id, saved_search_id)
+                ) WITHOUT ROWID;
+                CREATE INDEX IF NOT EXISTS saved_search_documents_search_idx
+                    ON saved_search_documents(saved_search_id);
                 """
             )
             connection.execute(
@@ -389,6 +449,9 @@ class SqliteWorkspaceMetadataStore:
             row = connection.execute(
                 "SELECT schema_version FROM workspace_metadata WHERE singleton = 1"
             ).fetchone()
+            if row is not None and int(row[0]) == 1:
+                self._backfill_document_index(connection)
+                row = (_METADATA_SCHEMA_VERSION,)
             if row is None or int(row[0]) != _METADATA_SCHEMA_VERSION:
                 raise ResearchStateError(
                     "Workspace metadata schema is unsupported by this Scholion build"
@@ -396,24 +459,17 @@ class SqliteWorkspaceMetadataStore:
             connection.commit()
 
     @contextmanager
-    def _connection(self) -> Iterator[sqlite3.Connection]:
-        connection: sqlite3.Connection | None = None
+    def _connection(
+        self, operation: SqliteOperation = SqliteOperation.AUTHORITATIVE_WRITE
+    ) -> Iterator[sqlite3.Connection]:
         try:
-            connection = sqlite3.connect(self.database_path, timeout=5.0)
-            connection.execute("PRAGMA foreign_keys = ON")
-            connection.execute("PRAGMA busy_timeout = 5000")
-            connection.execute("PRAGMA synchronous = FULL")
-            yield connection
+            with self.connections.connection(operation) as connection:
+                yield connection
         except sqlite3.Error as exc:
-            if connection is not None:
-                connection.rollback()
             raise ResearchStateError(
                 "Workspace metadata database operation failed",
                 cause=exc,
             ) from exc
-        finally:
-            if connection is not None:
-                connection.close()
 
     @staticmethod
     def _row_values(
@@ -500,6 +556,41 @@ class SqliteWorkspaceMetadataStore:
                 "Saved search state is corrupt", cause=exc
             ) from exc
 
+    @staticmethod
+    def _index_documents(
+        connection: sqlite3.Connection,
+        saved_search_id: str,
+        document_ids: tuple[str, ...],
+    ) -> None:
+        connection.executemany(
+            """
+            INSERT OR IGNORE INTO saved_search_documents (document_id, saved_search_id)
+            VALUES (?, ?)
+            """,
+            ((document_id, saved_search_id) for document_id in document_ids),
+        )
+
+    def _backfill_document_index(self, connection: sqlite3.Connection) -> None:
+        """Upgrade version 1 state, which stored document IDs only as JSON."""
+        rows = connection.execute(
+            "SELECT saved_search_id, document_ids_json FROM saved_searches"
+        ).fetchall()
+        try:
+            for saved_search_id, document_ids_json in rows:
+                self._index_documents(
+                    connection,
+                    str(saved_search_id),
+                    self._decode_tuple(document_ids_json, "document_ids"),
+                )
+        except (TypeError, ValueError, json.JSONDecodeError) as exc:
+            raise ResearchStateError(
+                "Saved search state is corrupt", cause=exc
+            ) from exc
+        connection.execute(
+            "UPDATE workspace_metadata SET schema_version = ? WHERE singleton = 1",
+            (_METADATA_SCHEMA_VERSION,),
+        )
+
     @staticmethod
     def _require_current_version(
         saved: SavedSearch,
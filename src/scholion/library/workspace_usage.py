@@ -0,0 +1,214 @@
+"""Measured, cached disk usage of private job workspaces for retention sweeps.
+
+Retention reports how many bytes each candidate workspace would free, so an operator can
+ask for "free 200 GB of stale checkpoints" rather than guessing from ages. Measuring means
+walking every checkpoint and intermediate file. Candidate workspaces are measured
+concurrently, and each tree is walked with ``os.scandir`` so a file costs one ``stat``.
+
+Sizes are apparent file sizes: symlinks are counted as links and never followed, so a
+workspace can never claim bytes that live outside it. Results are cached per workspace and
+bound to the lifecycle timestamp plus the workspace directory's modification time. A
+terminal job's workspace only changes when the job is resumed, which also moves its
+lifecycle timestamp. The cache is private, disposable state: losing it only costs a re-walk.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+
+from scholion.core.errors import StorageError
+from scholion.core.file_manager_facade import FileManagerFacade
+
+_USAGE_SCHEMA_VERSION = 1
+_MAX_USAGE_FILE_BYTES = 8 * 1024 * 1024
+_MAX_USAGE_ENTRIES = 16_384
+_DEFAULT_MEASURE_WORKERS = 8
+
+
+class _StoredUsage(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    workspace_path: str
+    updated_at: str
+    modified_ns: int
+    size_bytes: int = Field(ge=0)
+
+
+class _StoredUsages(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    schema_version: int
+    workspaces: list[_StoredUsage] = Field(max_length=_MAX_USAGE_ENTRIES)
+
+
+def tree_size_bytes(root: Path) -> int:
+    """Sum apparent file sizes below ``root`` without following symlinks."""
+    total = 0
+    pending = [root]
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(Path(entry.path))
+                        else:
+                            total += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return total
+
+
+class WorkspaceUsageCache:
+    """Private JSON map of workspace path to its last measured size and identity."""
+
+    def __init__(self, path: Path, file_manager: FileManagerFacade) -> None:
+        self.path = path.expanduser().resolve(strict=False)
+        self.file_manager = file_manager
+        self._entries: dict[str, tuple[str, int, int]] | None = None
+
+    def lookup(
+        self, workspace: Path, *, updated_at: str, modified_ns: int
+    ) -> int | None:
+        """Return the cached size only while the workspace identity is unchanged."""
+        entry = self._load().get(str(workspace))
+        if entry is None or entry[:2] != (updated_at, modified_ns):
+            return None
+        return entry[2]
+
+    def record(self, usages: Mapping[Path, tuple[str, int, int]]) -> None:
+        """Remember ``(updated_at, modified_ns, size_bytes)`` per workspace in one write."""
+        if not usages:
+            return
+        entries = self._load()
+        for workspace, usage in usages.items():
+            entries.pop(str(workspace), None)
+            entries[str(workspace)] = usage
+        while len(entries) > _MAX_USAGE_ENTRIES:
+            del entries[next(iter(entries))]
+        self._save(entries)
+
+    def forget(self, workspaces: Iterable[Path]) -> None:
+        entries = self._load()
+        removed = [entries.pop(str(item), None) for item in workspaces]
+        if any(item is not None for item in removed):
+            self._save(entries)
+
+    def _load(self) -> dict[str, tuple[str, int, int]]:
+        if self._entries is None:
+            self._entries = self._read()
+        return self._entries
+
+    def _read(self) -> dict[str, tuple[str, int, int]]:
+        if not self.file_manager.file_exists(self.path):
+            return {}
+        try:
+            metadata = self.file_manager.get_file_metadata(self.path)
+            if metadata["size"] > _MAX_USAGE_FILE_BYTES:
+                return {}
+            stored = _StoredUsages.model_validate(
+                json.loads(self.file_manager.read_file(self.path))
+            )
+        except (
+            StorageError,
+            UnicodeDecodeError,
+            json.JSONDecodeError,
+            ValidationError,
+        ):
+            return {}
+        if stored.schema_version != _USAGE_SCHEMA_VERSION:
+            return {}
+        return {
+            item.workspace_path: (item.updated_at, item.modified_ns, item.size_bytes)
+            for item in stored.workspaces
+        }
+
+    def _save(self, entries: dict[str, tuple[str, int, int]]) -> None:
+        self.file_manager.ensure_directory_exists(self.path.parent, private=True)
+        payload = json.dumps(
+            {
+                "schema_version": _USAGE_SCHEMA_VERSION,
+                "workspaces": [
+                    {
+                        "workspace_path": workspace,
+                        "updated_at": updated_at,
+                        "modified_ns": modified_ns,
+                        "size_bytes": size_bytes,
+                    }
+                    for workspace, (updated_at, modified_ns, size_bytes) in (
+                        entries.items()
+                    )
+                ],
+            },
+            separators=(",", ":"),
+        ).encode("utf-8")
+        self.file_manager.save_file(payload + b"\n", self.path, private=True)
+
+
+class WorkspaceUsageMeter:
+    """Measure many workspaces concurrently, reusing cached sizes where still valid."""
+
+    def __init__(
+        self,
+        cache: WorkspaceUsageCache | None = None,
+        *,
+        max_workers: int = _DEFAULT_MEASURE_WORKERS,
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be positive")
+        self.cache = cache
+        self.max_workers = max_workers
+
+    def measure(self, workspaces: Mapping[Path, str]) -> dict[Path, int]:
+        """Return reclaimable bytes for each ``workspace -> lifecycle updated_at``.
+
+        Workspaces that vanished before measurement report zero bytes.
+        """
+        sizes: dict[Path, int] = {}
+        misses: dict[Path, tuple[str, int]] = {}
+        for workspace, updated_at in workspaces.items():
+            try:
+                modified_ns = workspace.stat().st_mtime_ns
+            except OSError:
+                sizes[workspace] = 0
+                continue
+            cached = (
+                None
+                if self.cache is None
+                else self.cache.lookup(
+                    workspace, updated_at=updated_at, modified_ns=modified_ns
+                )
+            )
+            if cached is None:
+                misses[workspace] = (updated_at, modified_ns)
+            else:
+                sizes[workspace] = cached
+        if not misses:
+            return sizes
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(misses)),
+            thread_name_prefix="scholion-usage",
+        ) as pool:
+            measured = dict(zip(misses, pool.map(tree_size_bytes, misses), strict=True))
+        sizes.update(measured)
+        if self.cache is not None:
+            self.cache.record(
+                {
+                    workspace: (*misses[workspace], size)
+                    for workspace, size in measured.items()
+                }
+            )
+        return sizes
+
+    def forget(self, workspaces: Iterable[Path]) -> None:
+        if self.cache is not None:
+            self.cache.forget(workspaces)
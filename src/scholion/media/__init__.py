@@ -13,18 +13,23 @@ formatting is presentation-only; canonical evidence remains numeric source-relat
 seconds.
 """
 
-from scholion.media.models import (
-    InputIdentity,
-    MediaInfo,
-    MediaStream,
-    MediaTemporalTag,
-    StreamKind,
-    TemporalTagKind,
-    TemporalTagSource,
-)
-from scholion.media.probe import FfprobeMediaProbe
-from scholion.media.selection import AudioStreamSelector
-from scholion.media.time_coordinates import format_elapsed_timestamp
+from typing import TYPE_CHECKING
+
+from scholion.core.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from scholion.media.models import (
+        InputIdentity,
+        MediaInfo,
+        MediaStream,
+        MediaTemporalTag,
+        StreamKind,
+        TemporalTagKind,
+        TemporalTagSource,
+    )
+    from scholion.media.probe import FfprobeMediaProbe
+    from scholion.media.selection import AudioStreamSelector
+    from scholion.media.time_coordinates import format_elapsed_timestamp
 
 __all__ = [
     "AudioStreamSelector",
@@ -38,3 +43,21 @@ __all__ = [
     "TemporalTagSource",
     "format_elapsed_timestamp",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "scholion.media.models": (
+            "InputIdentity",
+            "MediaInfo",
+            "MediaStream",
+            "MediaTemporalTag",
+            "StreamKind",
+            "TemporalTagKind",
+            "TemporalTagSource",
+        ),
+        "scholion.media.probe": ("FfprobeMediaProbe",),
+        "scholion.media.selection": ("AudioStreamSelector",),
+        "scholion.media.time_coordinates": ("format_elapsed_timestamp",),
+    },
+)
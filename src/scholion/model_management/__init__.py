@@ -1,12 +1,23 @@
-from scholion.model_management.catalog import ModelCatalog, faster_whisper_model_catalog
-from scholion.model_management.models import (
-    InstalledSnapshot,
-    ManagedModelManifest,
-    ModelInventoryItem,
-    ModelSpec,
-)
-from scholion.model_management.provider import HuggingFaceModelProvider, ModelProvider
-from scholion.model_management.service import ModelManager
+from typing import TYPE_CHECKING
+
+from scholion.core.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from scholion.model_management.catalog import (
+        ModelCatalog,
+        faster_whisper_model_catalog,
+    )
+    from scholion.model_management.models import (
+        InstalledSnapshot,
+        ManagedModelManifest,
+        ModelInventoryItem,
+        ModelSpec,
+    )
+    from scholion.model_management.provider import (
+        HuggingFaceModelProvider,
+        ModelProvider,
+    )
+    from scholion.model_management.service import ModelManager
 
 __all__ = [
     "HuggingFaceModelProvider",
@@ -19,3 +30,24 @@ __all__ = [
     "ModelSpec",
     "faster_whisper_model_catalog",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "scholion.model_management.catalog": (
+            "ModelCatalog",
+            "faster_whisper_model_catalog",
+        ),
+        "scholion.model_management.models": (
+            "InstalledSnapshot",
+            "ManagedModelManifest",
+            "ModelInventoryItem",
+            "ModelSpec",
+        ),
+        "scholion.model_management.provider": (
+            "HuggingFaceModelProvider",
+            "ModelProvider",
+        ),
+        "scholion.model_management.service": ("ModelManager",),
+    },
+)
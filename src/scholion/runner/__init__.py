@@ -7,9 +7,18 @@ and a user processing profile into the CPU-thread and memory budget that downstr
 engine strategy selection must respect.
 """
 
-from scholion.runner.inspector import RunnerInspector
-from scholion.runner.models import ExecutionPolicy, ProcessingProfile, RunnerResources
-from scholion.runner.policy import RunnerPolicyPlanner
+from typing import TYPE_CHECKING
+
+from scholion.core.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from scholion.runner.inspector import RunnerInspector
+    from scholion.runner.models import (
+        ExecutionPolicy,
+        ProcessingProfile,
+        RunnerResources,
+    )
+    from scholion.runner.policy import RunnerPolicyPlanner
 
 __all__ = [
     "ExecutionPolicy",
@@ -18,3 +27,16 @@ __all__ = [
     "RunnerPolicyPlanner",
     "RunnerResources",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "scholion.runner.inspector": ("RunnerInspector",),
+        "scholion.runner.models": (
+            "ExecutionPolicy",
+            "ProcessingProfile",
+            "RunnerResources",
+        ),
+        "scholion.runner.policy": ("RunnerPolicyPlanner",),
+    },
+)
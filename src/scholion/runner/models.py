@@ -1,3 +1,5 @@
+import hashlib
+import json
 from dataclasses import asdict, dataclass
 from enum import StrEnum
 
@@ -26,10 +28,37 @@ class RunnerResources:
     constraints: tuple[str, ...] = ()
     processor_name: str | None = None
 
+    @property
+    def fingerprint(self) -> str:
+        return machine_fingerprint(
+            platform=self.platform,
+            machine=self.machine,
+            processor_name=self.processor_name,
+            logical_cpus=self.logical_cpus,
+            memory_total_bytes=self.memory_total_bytes,
+        )
+
     def to_dict(self) -> dict[str, object]:
         return asdict(self)
 
 
+def machine_fingerprint(
+    *,
+    platform: str,
+    machine: str,
+    processor_name: str | None,
+    logical_cpus: int,
+    memory_total_bytes: int,
+) -> str:
+    """Identify a machine by stable hardware facts, not by its current load."""
+
+    encoded = json.dumps(
+        [platform, machine, processor_name, logical_cpus, memory_total_bytes],
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:16]
+
+
 @dataclass(frozen=True, slots=True)
 class ExecutionPolicy:
     """Engine-neutral resource budget derived from process-visible capacity."""
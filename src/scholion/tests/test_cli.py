@@ -6,6 +6,7 @@ from typer.testing import CliRunner
 
 from scholion.cli import app
 from scholion.core.config import AppConfig
+from scholion.core.errors import ConfigurationError
 from scholion.core.health_check import (
     CheckResult,
     CheckStatus,
@@ -124,6 +125,8 @@ class FakeContainer:
         )
         self.transcription_executor = Provider(transcription_executor)
         self.job_lifecycle_store = Provider(Mock())
+        self.metrics_exporter = Provider(None)
+        self.execution_metrics = Provider(None)
 
 
 def transcription_plan() -> TranscriptionJobPlan:
@@ -200,13 +203,13 @@ def transcription_result(plan: TranscriptionJobPlan) -> TranscriptionExecutionRe
 
 def invoke_doctor(status: OverallStatus, *arguments: str):
     container = FakeContainer(report(status))
-    with patch("scholion.cli.AppContainer", return_value=container):
+    with patch("scholion.app.app_container.AppContainer", return_value=container):
         result = runner.invoke(app, ["doctor", *arguments])
     return result, container
 
 
 def test_bare_command_shows_help_without_constructing_application():
-    with patch("scholion.cli.AppContainer") as container:
+    with patch("scholion.app.app_container.AppContainer") as container:
         result = runner.invoke(app, [])
     assert result.exit_code == 0
     assert "doctor" in result.output
@@ -222,6 +225,35 @@ def test_healthy_doctor_exits_zero_and_renders_each_check_once():
     assert result.output.count("workspace result") == 1
 
 
+def test_configured_metrics_exporter_runs_for_the_command_lifetime():
+    container = FakeContainer(report(OverallStatus.HEALTHY))
+    exporter = Mock()
+    container.metrics_exporter.override(exporter)
+    with patch("scholion.app.app_container.AppContainer", return_value=container):
+        result = runner.invoke(app, ["doctor"])
+    assert result.exit_code == 0
+    exporter.start.assert_called_once_with()
+    exporter.stop.assert_called_once_with()
+
+
+def test_metrics_exporter_failures_are_logged_and_never_fail_the_command():
+    container = FakeContainer(report(OverallStatus.HEALTHY))
+    exporter = Mock()
+    exporter.start.side_effect = ConfigurationError(
+        "Metrics endpoint could not be opened"
+    )
+    logger = Mock()
+    container.metrics_exporter.override(exporter)
+    container.logger = Provider(logger)
+    with patch("scholion.app.app_container.AppContainer", return_value=container):
+        result = runner.invoke(app, ["doctor"])
+    assert result.exit_code == 0
+    exporter.stop.assert_not_called()
+    logger.warning.assert_called_once_with(
+        "metrics_export_unavailable", phase="start", error_code="configuration_error"
+    )
+
+
 def test_degraded_exit_code_depends_on_strict_mode():
     ordinary, _ = invoke_doctor(OverallStatus.DEGRADED)
     strict, _ = invoke_doctor(OverallStatus.DEGRADED, "--strict")
@@ -251,7 +283,7 @@ def test_workspace_option_reaches_config_as_a_path(tmp_path):
 
 def test_init_is_human_readable_and_initializes_once():
     container = FakeContainer(report(OverallStatus.HEALTHY))
-    with patch("scholion.cli.AppContainer", return_value=container):
+    with patch("scholion.app.app_container.AppContainer", return_value=container):
         result = runner.invoke(app, ["init"])
     assert result.exit_code == 0
     assert "directories initialized" in result.output
@@ -261,7 +293,7 @@ def test_init_is_human_readable_and_initializes_once():
 
 def test_init_json_is_parseable_and_output_override_reaches_config(tmp_path):
     container = FakeContainer(report(OverallStatus.HEALTHY))
-    with patch("scholion.cli.AppContainer", return_value=container):
+    with patch("scholion.app.app_container.AppContainer", return_value=container):
         result = runner.invoke(app, ["init", "--output-dir", str(tmp_path), "--json"])
     payload = json.loads(result.stdout)
     assert set(payload) == {"state_dir", "cache_dir", "model_dir", "output_dir"}
@@ -274,7 +306,7 @@ def test_init_contract_failure_uses_typed_public_exit_code():
     container.workspace_service().initialize.side_effect = UnsafePathError(
         "Output overlaps private state"
     )
-    with patch("scholion.cli.AppContainer", return_value=container):
+    with patch("scholion.app.app_container.AppContainer", return_value=container):
         result = runner.invoke(app, ["init"])
     assert result.exit_code == 2
     assert "Output overlaps private state" in result.stderr
@@ -285,7 +317,7 @@ def test_init_internal_failure_hides_private_details():
     container.workspace_service().initialize.side_effect = RuntimeError(
         "private detail"
     )
-    with patch("scholion.cli.AppContainer", return_value=container):
+    with patch("scholion.app.app_container.AppContainer", return_value=container):
         result = runner.invoke(app, ["init"])
     assert result.exit_code == 3
     assert "RuntimeError" in result.stderr
@@ -298,7 +330,10 @@ def test_unknown_option_uses_click_usage_exit_code():
 
 
 def test_unexpected_internal_failure_uses_reserved_internal_exit_code():
-    with patch("scholion.cli.AppContainer", side_effect=RuntimeError("private detail")):
+    with patch(
+        "scholion.app.app_container.AppContainer",
+        side_effect=RuntimeError("private detail"),
+    ):
         result = runner.invoke(app, ["doctor"])
     assert result.exit_code == 3
     assert "RuntimeError" in result.stderr
@@ -307,7 +342,7 @@ def test_unexpected_internal_failure_uses_reserved_internal_exit_code():
 
 def test_runner_json_reports_effective_limits_and_screening_semantics():
     container = FakeContainer(report(OverallStatus.HEALTHY))
-    with patch("scholion.cli.AppContainer", return_value=container):
+    with patch("scholion.app.app_container.AppContainer", return_value=container):
         result = runner.invoke(app, ["runner", "--profile", "screening", "--json"])
     payload = json.loads(result.stdout)
     assert result.exit_code == 0
@@ -320,7 +355,7 @@ def test_runner_json_reports_effective_limits_and_screening_semantics():
 
 def test_runner_human_output_explains_policy():
     container = FakeContainer(report(OverallStatus.HEALTHY))
-    with patch("scholion.cli.AppContainer", return_value=container):
+    with patch("scholion.app.app_container.AppContainer", return_value=container):
         result = runner.invoke(app, ["runner"])
     assert result.exit_code == 0
     assert "Scholion runner policy" in result.output
@@ -332,7 +367,7 @@ def test_explicit_configuration_file_is_loaded_only_when_selected(tmp_path):
     config_file = tmp_path / "research.env"
     config_file.write_text("SCHOLION_PROCESSING_PROFILE=screening\n")
     container = FakeContainer(report(OverallStatus.HEALTHY))
-    with patch("scholion.cli.AppContainer", return_value=container):
+    with patch("scholion.app.app_container.AppContainer", return_value=container):
         result = runner.invoke(app, ["--config", str(config_file), "runner", "--json"])
     assert result.exit_code == 0
     assert container.config().PROCESSING_PROFILE is ProcessingProfile.SCREENING
@@ -341,7 +376,7 @@ def test_explicit_configuration_file_is_loaded_only_when_selected(tmp_path):
 
 def test_transcribe_executes_planned_job_with_strict_local_defaults():
     container = FakeContainer(report(OverallStatus.HEALTHY))
-    with patch("scholion.cli.AppContainer", return_value=container):
+    with patch("scholion.app.app_container.AppContainer", return_value=container):
         result = runner.invoke(app, ["transcribe", "recording.wav"])
     assert result.exit_code == 0
     assert "transcription complete" in result.output
@@ -355,7 +390,7 @@ def test_transcribe_executes_planned_job_with_strict_local_defaults():
 
 def test_transcribe_json_emits_execution_result_without_asr_download_seam():
     container = FakeContainer(report(OverallStatus.HEALTHY))
-    with patch("scholion.cli.AppContainer", return_value=container):
+    with patch("scholion.app.app_container.AppContainer", return_value=container):
         result = runner.invoke(
             app,
             ["transcribe", "recording.mp4", "--json"],
@@ -375,7 +410,7 @@ def test_transcribe_json_emits_execution_result_without_asr_download_seam():
 
 def test_transcribe_rejects_removed_asr_download_flag():
     container = FakeContainer(report(OverallStatus.HEALTHY))
-    with patch("scholion.cli.AppContainer", return_value=container):
+    with patch("scholion.app.app_container.AppContainer", return_value=container):
         result = runner.invoke(
             app,
             ["transcribe", "recording.mp4", "--allow-model-download"],
@@ -387,7 +422,7 @@ def test_transcribe_rejects_removed_asr_download_flag():
 
 def test_transcribe_dry_run_json_emits_complete_machine_readable_plan():
     container = FakeContainer(report(OverallStatus.HEALTHY))
-    with patch("scholion.cli.AppContainer", return_value=container):
+    with patch("scholion.app.app_container.AppContainer", return_value=container):
         result = runner.invoke(
             app, ["transcribe", "recording.wav", "--dry-run", "--json"]
         )
@@ -406,7 +441,7 @@ def test_transcribe_dry_run_json_emits_complete_machine_readable_plan():
 
 def test_transcribe_dry_run_human_output_explains_unreserved_plan():
     container = FakeContainer(report(OverallStatus.HEALTHY))
-    with patch("scholion.cli.AppContainer", return_value=container):
+    with patch("scholion.app.app_container.AppContainer", return_value=container):
         result = runner.invoke(app, ["transcribe", "recording.wav", "--dry-run"])
     assert result.exit_code == 0
     assert "Scholion transcription dry run" in result.output
@@ -417,7 +452,7 @@ def test_transcribe_dry_run_human_output_explains_unreserved_plan():
 
 def test_transcribe_overrides_profile_and_output_for_planner(tmp_path):
     container = FakeContainer(report(OverallStatus.HEALTHY))
-    with patch("scholion.cli.AppContainer", return_value=container):
+    with patch("scholion.app.app_container.AppContainer", return_value=container):
         result = runner.invoke(
             app,
             [
@@ -443,7 +478,7 @@ def test_transcribe_overrides_profile_and_output_for_planner(tmp_path):
 
 def test_transcribe_enhancement_reaches_planner():
     container = FakeContainer(report(OverallStatus.HEALTHY))
-    with patch("scholion.cli.AppContainer", return_value=container):
+    with patch("scholion.app.app_container.AppContainer", return_value=container):
         result = runner.invoke(
             app,
             ["transcribe", "recording.wav", "--dry-run", "--enhance", "--json"],
@@ -464,7 +499,7 @@ def test_transcribe_typed_failure_uses_public_message_and_exit_code():
     container.transcription_planner().plan.side_effect = UnsupportedMediaError(
         "Input contains no audio stream"
     )
-    with patch("scholion.cli.AppContainer", return_value=container):
+    with patch("scholion.app.app_container.AppContainer", return_value=container):
         result = runner.invoke(app, ["transcribe", "video.mp4", "--dry-run"])
     assert result.exit_code == 2
     assert result.stderr.strip() == "Input contains no audio stream"
@@ -474,7 +509,7 @@ def test_transcribe_missing_input_does_not_echo_sensitive_path(tmp_path):
     container = FakeContainer(report(OverallStatus.HEALTHY))
     sensitive = tmp_path / "participant-001-interview.wav"
     container.transcription_planner().plan.side_effect = InvalidInputError(sensitive)
-    with patch("scholion.cli.AppContainer", return_value=container):
+    with patch("scholion.app.app_container.AppContainer", return_value=container):
         result = runner.invoke(app, ["transcribe", str(sensitive), "--dry-run"])
     assert result.exit_code == 2
     assert result.stderr.strip() == "Input is not a readable local file"
@@ -486,7 +521,7 @@ def test_transcribe_internal_failure_hides_private_detail():
     container.transcription_planner().plan.side_effect = RuntimeError(
         "private participant path"
     )
-    with patch("scholion.cli.AppContainer", return_value=container):
+    with patch("scholion.app.app_container.AppContainer", return_value=container):
         result = runner.invoke(app, ["transcribe", "audio.wav", "--dry-run"])
     assert result.exit_code == 3
     assert "RuntimeError" in result.stderr
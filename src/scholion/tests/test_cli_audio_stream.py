@@ -9,7 +9,7 @@ from scholion.tests.test_cli import FakeContainer, report, runner
 def test_dry_run_passes_explicit_audio_stream_to_fresh_planner() -> None:
     container = FakeContainer(report(OverallStatus.HEALTHY))
 
-    with patch("scholion.cli.AppContainer", return_value=container):
+    with patch("scholion.app.app_container.AppContainer", return_value=container):
         result = runner.invoke(
             app,
             [
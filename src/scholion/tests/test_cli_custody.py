@@ -68,6 +68,7 @@ def _retention_plan() -> RetentionPlan:
                 updated_at="2026-07-01T00:00:00+00:00",
                 workspace_path="/private/jobs/job-1",
                 resume_capability_lost=True,
+                reclaimable_bytes=2_048,
             ),
         ),
         confirmation_token="retention:token",
@@ -228,9 +229,28 @@ def test_retention_human_plan_states_the_custody_boundary() -> None:
     assert result.exit_code == 0
     assert "deletes only private job workspaces" in result.output
     assert "lifecycle manifests are preserved" in result.output
+    assert "Reclaimable: 2,048 bytes." in result.output
     assert "Resume lost?" in result.output
 
 
+def test_retention_byte_budget_is_part_of_the_reviewed_policy() -> None:
+    service = Mock()
+    service.plan_retention.return_value = _retention_plan()
+
+    result = CliRunner().invoke(
+        _app(service),
+        ["library", "retention", "--reclaim-bytes", "2048", "--json"],
+    )
+
+    assert result.exit_code == 0
+    service.plan_retention.assert_called_once_with(
+        RetentionPolicy(execution_days=30, reclaim_bytes=2_048)
+    )
+    payload = json.loads(result.stdout)
+    assert payload["reclaimable_bytes"] == 2_048
+    assert payload["candidates"][0]["reclaimable_bytes"] == 2_048
+
+
 def test_custody_cli_reports_public_errors_and_masks_internal_details() -> None:
     runner = CliRunner()
 
@@ -36,7 +36,7 @@ def _container_with_exporter() -> tuple[FakeContainer, Mock]:
 
 def test_transcribe_can_publish_repeatable_derived_exports():
     container, exporter = _container_with_exporter()
-    with patch("scholion.cli.AppContainer", return_value=container):
+    with patch("scholion.app.app_container.AppContainer", return_value=container):
         result = runner.invoke(
             app,
             [
@@ -63,7 +63,7 @@ def test_transcribe_can_publish_repeatable_derived_exports():
 
 def test_transcribe_json_includes_derived_artifact_metadata():
     container, _ = _container_with_exporter()
-    with patch("scholion.cli.AppContainer", return_value=container):
+    with patch("scholion.app.app_container.AppContainer", return_value=container):
         result = runner.invoke(
             app,
             ["transcribe", "recording.wav", "--export", "txt", "--json"],
@@ -76,7 +76,7 @@ def test_transcribe_json_includes_derived_artifact_metadata():
 
 
 def test_export_is_refused_for_dry_run_before_application_construction():
-    with patch("scholion.cli.AppContainer") as container:
+    with patch("scholion.app.app_container.AppContainer") as container:
         result = runner.invoke(
             app,
             ["transcribe", "recording.wav", "--dry-run", "--export", "srt"],
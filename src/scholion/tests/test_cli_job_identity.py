@@ -9,7 +9,7 @@ from scholion.tests.test_cli import FakeContainer, report, runner
 def test_fresh_execution_surfaces_resume_job_id_before_completion():
     container = FakeContainer(report(OverallStatus.HEALTHY))
 
-    with patch("scholion.cli.AppContainer", return_value=container):
+    with patch("scholion.app.app_container.AppContainer", return_value=container):
         result = runner.invoke(app, ["transcribe", "recording.wav"])
 
     assert result.exit_code == 0
@@ -20,7 +20,7 @@ def test_fresh_execution_surfaces_resume_job_id_before_completion():
 def test_job_id_notice_does_not_contaminate_json_stdout():
     container = FakeContainer(report(OverallStatus.HEALTHY))
 
-    with patch("scholion.cli.AppContainer", return_value=container):
+    with patch("scholion.app.app_container.AppContainer", return_value=container):
         result = runner.invoke(app, ["transcribe", "recording.wav", "--json"])
 
     payload = json.loads(result.stdout)
@@ -56,6 +56,17 @@ def test_jobs_list_and_show_have_machine_readable_contracts():
     assert json.loads(shown.stdout)["status"] == "completed"
 
 
+def test_empty_jobs_listing_still_renders_the_table():
+    store = Mock()
+    store.list_records.return_value = ()
+
+    listed = CliRunner().invoke(_app_with_store(store), ["jobs"])
+
+    assert listed.exit_code == 0
+    assert "Scholion jobs" in listed.output
+    assert "Job ID" in listed.output
+
+
 def test_jobs_human_views_include_progress_and_resume_state():
     store = Mock()
     record = _record(JobStatus.INTERRUPTED)
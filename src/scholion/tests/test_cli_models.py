@@ -41,6 +41,7 @@ class FakeContainer:
         )
         self.model_manager = Provider(Mock())
         self.transcription_planner = Provider(Mock())
+        self.metrics_exporter = Provider(None)
 
 
 def _spec() -> ModelSpec:
@@ -69,7 +70,7 @@ def _manifest() -> ManagedModelManifest:
 
 
 def _invoke(container: FakeContainer, *arguments: str):
-    with patch("scholion.cli.AppContainer", return_value=container):
+    with patch("scholion.app.app_container.AppContainer", return_value=container):
         return runner.invoke(app, ["models", *arguments])
 
 
@@ -8,6 +8,7 @@ from typer.testing import CliRunner
 from scholion.cli_library import register_library_commands
 from scholion.library.errors import TranscriptLibraryBuildError
 from scholion.library.service import LibraryRefreshReport
+from scholion.library.watch import LibraryWatchBatch
 
 
 def _app(service: Mock) -> typer.Typer:
@@ -113,3 +114,40 @@ def test_refresh_cli_reports_public_errors_and_masks_internal_details() -> None:
     assert internal_result.exit_code == 3
     assert "failed internally (RuntimeError)" in internal_result.output
     assert "/private/library.duckdb" not in internal_result.output
+
+
+def test_watch_cli_streams_json_batches_and_stops_cleanly_on_interrupt() -> None:
+    watcher = Mock()
+
+    def run(should_stop, on_batch):  # type: ignore[no-untyped-def]
+        assert should_stop() is False
+        on_batch(
+            LibraryWatchBatch(
+                directories=("/library/inbox",),
+                full_refresh=False,
+                refresh=_report(),
+                unavailable_location_ids=("offline",),
+            )
+        )
+        raise KeyboardInterrupt
+
+    watcher.run.side_effect = run
+    app = typer.Typer()
+    container = Mock()
+    container.library_watch.return_value = watcher
+    register_library_commands(app, lambda context: container)
+
+    result = CliRunner().invoke(
+        app, ["library", "watch", "--debounce", "0.5", "--json"]
+    )
+
+    assert result.exit_code == 0
+    assert container.library_watch.call_args.kwargs == {
+        "debounce_seconds": 0.5,
+        "max_delay_seconds": 10.0,
+    }
+    payload = json.loads(result.stdout)
+    assert payload["directories"] == ["/library/inbox"]
+    assert payload["refresh"]["added_document_ids"] == ["new"]
+    assert payload["unavailable_location_ids"] == ["offline"]
+    watcher.close.assert_called_once()
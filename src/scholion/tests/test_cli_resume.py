@@ -14,7 +14,7 @@ def test_resume_restores_plan_by_job_id_and_explicitly_resumes_execution():
     planner = container.transcription_planner()
     planner.plan_resume.return_value = planner.plan.return_value
 
-    with patch("scholion.cli.AppContainer", return_value=container):
+    with patch("scholion.app.app_container.AppContainer", return_value=container):
         result = runner.invoke(
             app,
             ["transcribe", "recording.wav", "--resume", "job-1"],
@@ -47,7 +47,7 @@ def test_resume_restores_plan_by_job_id_and_explicitly_resumes_execution():
 def test_resume_refuses_execution_contract_override(override):
     container = FakeContainer(report(OverallStatus.HEALTHY))
 
-    with patch("scholion.cli.AppContainer", return_value=container):
+    with patch("scholion.app.app_container.AppContainer", return_value=container):
         result = runner.invoke(
             app,
             ["transcribe", "recording.wav", "--resume", "job-1", *override],
@@ -63,7 +63,7 @@ def test_resume_refuses_execution_contract_override(override):
 def test_resume_cannot_be_combined_with_dry_run():
     container = FakeContainer(report(OverallStatus.HEALTHY))
 
-    with patch("scholion.cli.AppContainer", return_value=container):
+    with patch("scholion.app.app_container.AppContainer", return_value=container):
         result = runner.invoke(
             app,
             ["transcribe", "recording.wav", "--resume", "job-1", "--dry-run"],
@@ -78,7 +78,7 @@ def test_resume_cannot_be_combined_with_dry_run():
 def test_invalid_resume_job_id_fails_before_planning_without_echoing_input_path():
     container = FakeContainer(report(OverallStatus.HEALTHY))
 
-    with patch("scholion.cli.AppContainer", return_value=container):
+    with patch("scholion.app.app_container.AppContainer", return_value=container):
         result = runner.invoke(
             app,
             ["transcribe", "participant-secret.wav", "--resume", "../unsafe"],
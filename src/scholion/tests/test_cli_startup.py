@@ -0,0 +1,107 @@
+import json
+import subprocess
+import sys
+
+import pytest
+from typer.testing import CliRunner
+
+from scholion import cli
+from scholion.cli_lazy import _load
+
+HEAVY_MODULES = frozenset(
+    {
+        "ctranslate2",
+        "dependency_injector",
+        "duckdb",
+        "faster_whisper",
+        "numpy",
+        "scholion.app.app_container",
+        "scholion.library.service",
+        "scholion.transcription.executor",
+    }
+)
+
+JOBS_UNLOADED_MODULES = frozenset(
+    {
+        "dependency_injector",
+        "psutil",
+        "scholion.app.app_container",
+        "scholion.core.metrics",
+        "scholion.core.metrics_exporter",
+        "scholion.core.profiling",
+        "structlog",
+    }
+)
+
+_LOADED_MODULES = """
+import contextlib, io, json, sys
+from scholion.cli import app
+with contextlib.redirect_stdout(io.StringIO()):
+    try:
+        app(sys.argv[1:])
+    except SystemExit:
+        pass
+print(json.dumps(sorted(sys.modules)))
+"""
+
+
+def loaded_modules(*arguments: str) -> set[str]:
+    result = subprocess.run(
+        [sys.executable, "-c", _LOADED_MODULES, *arguments],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return set(json.loads(result.stdout))
+
+
+@pytest.mark.parametrize(
+    "arguments",
+    [("--help",), ("jobs", "--help"), ("models", "--help"), ("runner", "--help")],
+)
+def test_common_commands_start_without_heavy_dependencies(
+    arguments: tuple[str, ...],
+) -> None:
+    modules = loaded_modules(*arguments)
+
+    assert "scholion.cli" in modules
+    assert not modules & HEAVY_MODULES
+
+
+def test_root_help_does_not_import_command_group_modules() -> None:
+    modules = loaded_modules("--help")
+
+    assert not {"scholion.cli_jobs", "scholion.cli_library", "scholion.cli_models"} & (
+        modules
+    )
+    assert "scholion.cli_jobs" in loaded_modules("jobs", "--help")
+
+
+def test_jobs_listing_skips_the_container(tmp_path) -> None:
+    # The logger is built only for a message the level lets through; at WARNING a
+    # clean listing writes none.
+    config = tmp_path / "scholion.env"
+    config.write_text(
+        f"SCHOLION_STATE_DIR={tmp_path / 'state'}\n"
+        f"SCHOLION_CACHE_DIR={tmp_path / 'cache'}\n"
+        f"SCHOLION_OUTPUT_DIR={tmp_path / 'output'}\n"
+        "SCHOLION_LOG_LEVEL=WARNING\n"
+    )
+    arguments = ("--config", str(config), "jobs")
+
+    modules = loaded_modules(*arguments)
+
+    assert "scholion.cli_jobs" in modules
+    assert not modules & JOBS_UNLOADED_MODULES
+
+
+def test_lazy_group_help_matches_the_registered_group() -> None:
+    for command in cli._COMMAND_GROUPS:
+        assert _load(command, cli._container).help == command.help
+
+
+def test_unknown_commands_suggest_lazy_groups() -> None:
+    result = CliRunner().invoke(cli.app, ["libary"])
+
+    assert result.exit_code == 2
+    assert "Did you mean 'library'?" in result.output
@@ -73,7 +73,7 @@ def configured_container():
 
 def test_strategies_json_exposes_feasible_recommended_and_rejected_choices():
     container = configured_container()
-    with patch("scholion.cli.AppContainer", return_value=container):
+    with patch("scholion.app.app_container.AppContainer", return_value=container):
         result = runner.invoke(app, ["strategies", "--json"])
 
     payload = json.loads(result.stdout)
@@ -93,7 +93,7 @@ def test_strategies_json_exposes_feasible_recommended_and_rejected_choices():
 
 def test_strategies_rich_output_marks_recommendation_and_capacity_state():
     container = configured_container()
-    with patch("scholion.cli.AppContainer", return_value=container):
+    with patch("scholion.app.app_container.AppContainer", return_value=container):
         result = runner.invoke(app, ["strategies"])
 
     assert result.exit_code == 0
@@ -105,7 +105,7 @@ def test_strategies_rich_output_marks_recommendation_and_capacity_state():
 
 def test_strategies_profile_override_reaches_ranker():
     container = configured_container()
-    with patch("scholion.cli.AppContainer", return_value=container):
+    with patch("scholion.app.app_container.AppContainer", return_value=container):
         result = runner.invoke(app, ["strategies", "--profile", "accuracy", "--json"])
 
     assert result.exit_code == 0
@@ -116,7 +116,7 @@ def test_strategies_profile_override_reaches_ranker():
 
 def test_transcribe_explicit_strategy_reaches_planner_without_silent_substitution():
     container = configured_container()
-    with patch("scholion.cli.AppContainer", return_value=container):
+    with patch("scholion.app.app_container.AppContainer", return_value=container):
         result = runner.invoke(
             app,
             [
@@ -147,7 +147,7 @@ def test_accelerated_dry_run_renders_actual_device_and_compute_type():
         engine=replace(plan.engine, device="cuda", compute_type="float16"),
     )
 
-    with patch("scholion.cli.AppContainer", return_value=container):
+    with patch("scholion.app.app_container.AppContainer", return_value=container):
         result = runner.invoke(app, ["transcribe", "recording.wav", "--dry-run"])
 
     assert result.exit_code == 0
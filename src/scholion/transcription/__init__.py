@@ -1,37 +1,42 @@
 """Resource-aware local transcription capability."""
 
-from scholion.transcription.alignment import (
-    AlignedRecognizedSegment,
-    AlignedWord,
-    aligned_words,
-)
-from scholion.transcription.audio import DecodedAudio, FfmpegAudioDecoder
-from scholion.transcription.backend import FasterWhisperTranscriber
-from scholion.transcription.enhancement import FfmpegAfftdnEnhancer
-from scholion.transcription.enhancement_models import (
-    EnhancedAudio,
-    EnhancementConfiguration,
-    EnhancementMode,
-    EnhancementProvenance,
-)
-from scholion.transcription.executor import TranscriptionExecutor
-from scholion.transcription.language import LinguaLanguageAttributor
-from scholion.transcription.models import (
-    CanonicalTranscript,
-    CpuEngineConfiguration,
-    DecodeConfiguration,
-    DecodeStrategy,
-    EngineProvenance,
-    EngineTranscript,
-    LanguageAttributionProvenance,
-    LanguageSpan,
-    RecognizedSegment,
-    ResourceEstimate,
-    TranscriptionExecutionResult,
-    TranscriptionJobPlan,
-    TranscriptSource,
-)
-from scholion.transcription.planner import TranscriptionJobPlanner
+from typing import TYPE_CHECKING
+
+from scholion.core.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from scholion.transcription.alignment import (
+        AlignedRecognizedSegment,
+        AlignedWord,
+        aligned_words,
+    )
+    from scholion.transcription.audio import DecodedAudio, FfmpegAudioDecoder
+    from scholion.transcription.backend import FasterWhisperTranscriber
+    from scholion.transcription.enhancement import FfmpegAfftdnEnhancer
+    from scholion.transcription.enhancement_models import (
+        EnhancedAudio,
+        EnhancementConfiguration,
+        EnhancementMode,
+        EnhancementProvenance,
+    )
+    from scholion.transcription.executor import TranscriptionExecutor
+    from scholion.transcription.language import LinguaLanguageAttributor
+    from scholion.transcription.models import (
+        CanonicalTranscript,
+        CpuEngineConfiguration,
+        DecodeConfiguration,
+        DecodeStrategy,
+        EngineProvenance,
+        EngineTranscript,
+        LanguageAttributionProvenance,
+        LanguageSpan,
+        RecognizedSegment,
+        ResourceEstimate,
+        TranscriptionExecutionResult,
+        TranscriptionJobPlan,
+        TranscriptSource,
+    )
+    from scholion.transcription.planner import TranscriptionJobPlanner
 
 __all__ = [
     "AlignedRecognizedSegment",
@@ -62,3 +67,44 @@ __all__ = [
     "TranscriptionJobPlanner",
     "aligned_words",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "scholion.transcription.alignment": (
+            "AlignedRecognizedSegment",
+            "AlignedWord",
+            "aligned_words",
+        ),
+        "scholion.transcription.audio": (
+            "DecodedAudio",
+            "FfmpegAudioDecoder",
+        ),
+        "scholion.transcription.backend": ("FasterWhisperTranscriber",),
+        "scholion.transcription.enhancement": ("FfmpegAfftdnEnhancer",),
+        "scholion.transcription.enhancement_models": (
+            "EnhancedAudio",
+            "EnhancementConfiguration",
+            "EnhancementMode",
+            "EnhancementProvenance",
+        ),
+        "scholion.transcription.executor": ("TranscriptionExecutor",),
+        "scholion.transcription.language": ("LinguaLanguageAttributor",),
+        "scholion.transcription.models": (
+            "CanonicalTranscript",
+            "CpuEngineConfiguration",
+            "DecodeConfiguration",
+            "DecodeStrategy",
+            "EngineProvenance",
+            "EngineTranscript",
+            "LanguageAttributionProvenance",
+            "LanguageSpan",
+            "RecognizedSegment",
+            "ResourceEstimate",
+            "TranscriptionExecutionResult",
+            "TranscriptionJobPlan",
+            "TranscriptSource",
+        ),
+        "scholion.transcription.planner": ("TranscriptionJobPlanner",),
+    },
+)
@@ -114,6 +114,7 @@ class AdaptiveTranscriptionExecutor(TranscriptionExecutor):
             memory_budget_bytes=plan.resources.memory_budget_bytes,
             accelerators=topology.accelerators,
             capabilities=capabilities,
+            runner=plan.runner,
         )[0]
         if not assessment.feasible:
             raise ResourceAdmissionError(
@@ -0,0 +1,108 @@
+"""Turn measured runs of a strategy on one machine into planning estimates.
+
+Catalog figures are written for the weakest machine we support. They stay in place as
+priors: a strategy with fewer than ``min_runs`` measurements on the current machine is
+planned exactly as before. Once there is evidence, peak memory moves toward the observed
+peak with headroom, weighted against the prior, and never drops below the largest peak
+actually seen. Real-time factor has no prior, so it is the median of the runs.
+"""
+
+from __future__ import annotations
+
+import math
+import statistics
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Protocol
+
+if TYPE_CHECKING:
+    from scholion.transcription.strategy import StrategyDefinition
+
+
+@dataclass(frozen=True, slots=True)
+class StrategyObservation:
+    """One completed run of an engine configuration on one machine."""
+
+    engine: str
+    model: str
+    device: str
+    compute_type: str
+    real_time_factor: float
+    peak_memory_bytes: int
+
+    def __post_init__(self) -> None:
+        for name in ("engine", "model", "device", "compute_type"):
+            if not getattr(self, name).strip():
+                raise ValueError(f"{name} cannot be empty")
+        if not math.isfinite(self.real_time_factor) or self.real_time_factor <= 0:
+            raise ValueError("real_time_factor must be positive")
+        if self.peak_memory_bytes < 1:
+            raise ValueError("peak_memory_bytes must be positive")
+
+    def matches(self, strategy: StrategyDefinition) -> bool:
+        return (
+            self.engine == strategy.engine
+            and self.model == strategy.model
+            and self.device == strategy.device
+            and self.compute_type == strategy.compute_type
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class CalibratedEstimate:
+    """Evidence-adjusted planning figures for one strategy on the current machine."""
+
+    runs: int
+    real_time_factor: float
+    estimated_peak_memory_bytes: int
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "runs": self.runs,
+            "real_time_factor": self.real_time_factor,
+            "estimated_peak_memory_bytes": self.estimated_peak_memory_bytes,
+        }
+
+
+class StrategyObservationSource(Protocol):
+    def strategy_observations(
+        self, machine: str
+    ) -> tuple[StrategyObservation, ...]: ...
+
+
+@dataclass(frozen=True, slots=True)
+class StrategyCalibrator:
+    """Blend catalog priors with observed runs once there are enough of them."""
+
+    min_runs: int = 3
+    prior_weight: float = 3.0
+    memory_headroom: float = 1.15
+
+    def __post_init__(self) -> None:
+        if self.min_runs < 1:
+            raise ValueError("min_runs must be positive")
+        if self.prior_weight < 0:
+            raise ValueError("prior_weight cannot be negative")
+        if self.memory_headroom < 1:
+            raise ValueError("memory_headroom must be at least 1")
+
+    def calibrate(
+        self,
+        strategy: StrategyDefinition,
+        observations: tuple[StrategyObservation, ...],
+    ) -> CalibratedEstimate | None:
+        matching = tuple(item for item in observations if item.matches(strategy))
+        if len(matching) < self.min_runs:
+            return None
+        peaks = [item.peak_memory_bytes for item in matching]
+        observed = statistics.median(peaks) * self.memory_headroom
+        runs = len(matching)
+        blended = (
+            self.prior_weight * strategy.estimated_peak_memory_bytes + runs * observed
+        ) / (self.prior_weight + runs)
+        return CalibratedEstimate(
+            runs=runs,
+            real_time_factor=statistics.median(
+                item.real_time_factor for item in matching
+            ),
+            estimated_peak_memory_bytes=max(math.ceil(blended), max(peaks)),
+        )
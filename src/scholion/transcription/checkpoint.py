@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from hashlib import sha256
 from pathlib import Path
@@ -9,6 +11,14 @@ from typing import cast
 from scholion.core.file_manager_facade import FileManagerFacade
 from scholion.runner.models import ProcessingProfile
 from scholion.transcription.alignment import AlignedRecognizedSegment, AlignedWord
+from scholion.transcription.checkpoint_codec import (
+    BINARY_CHECKPOINT_SUFFIX,
+    MIN_BINARY_CHECKPOINT_BYTES,
+    BinarySegmentRecord,
+    decode_segment_record,
+    encode_segment_record,
+    verify_segment_record,
+)
 from scholion.transcription.enhancement_models import (
     EnhancementConfiguration,
     EnhancementMode,
@@ -16,6 +26,7 @@ from scholion.transcription.enhancement_models import (
 from scholion.transcription.errors import CheckpointError
 from scholion.transcription.models import (
     AudioSegmentWindow,
+    CheckpointEncoding,
     CpuEngineConfiguration,
     DecodeConfiguration,
     DecodeStrategy,
@@ -31,6 +42,11 @@ _JOB_PLAN_SCHEMA_VERSION = 1
 _ALIGNMENT_SCHEMA_VERSION = 1
 _MANIFEST_NAME = "manifest.json"
 _MAX_CHECKPOINT_BYTES = 16 * 1024 * 1024
+_VERIFY_WORKERS = 4
+_SEGMENT_SUFFIXES = {
+    CheckpointEncoding.JSON: ".json",
+    CheckpointEncoding.BINARY: BINARY_CHECKPOINT_SUFFIX,
+}
 
 
 @dataclass(frozen=True, slots=True)
@@ -41,6 +57,13 @@ class RestoredCheckpoint:
     engine_version: str | None
 
 
+@dataclass(frozen=True, slots=True)
+class _StoredManifest:
+    contract_sha256: str
+    contract: dict[str, object]
+    segment_encoding: CheckpointEncoding
+
+
 @dataclass(frozen=True, slots=True)
 class ResumeEngineSettings:
     """Engine semantics persisted without a machine-local model-cache path."""
@@ -92,18 +115,29 @@ class ResumeSettings:
 
 
 class LocalCheckpointStore:
-    """Persist resumable transcript fragments inside one private local job."""
+    """Persist resumable transcript fragments inside one private local job.
+
+    ``encoding`` applies to jobs this store initializes. The manifest records it, so a
+    resumed job keeps the encoding it started with whatever the store is configured for.
+    """
 
     def __init__(
         self,
         file_manager: FileManagerFacade,
         *,
         max_checkpoint_bytes: int = _MAX_CHECKPOINT_BYTES,
+        encoding: CheckpointEncoding = CheckpointEncoding.JSON,
+        verify_workers: int = _VERIFY_WORKERS,
     ):
         if max_checkpoint_bytes < 1:
             raise ValueError("max_checkpoint_bytes must be positive")
+        if verify_workers < 1:
+            raise ValueError("verify_workers must be positive")
         self.file_manager = file_manager
         self.max_checkpoint_bytes = max_checkpoint_bytes
+        self.encoding = encoding
+        self.verify_workers = verify_workers
+        self._segment_encodings: dict[Path, CheckpointEncoding] = {}
 
     def initialize(
         self,
@@ -120,20 +154,24 @@ class LocalCheckpointStore:
             )
 
         contract = self._contract(plan, windows)
-        manifest = {
+        manifest: dict[str, object] = {
             "schema_version": _CHECKPOINT_SCHEMA_VERSION,
             "job_id": job.job_id.value,
             "contract_sha256": self._digest(contract),
             "contract": contract,
         }
+        if self.encoding is not CheckpointEncoding.JSON:
+            manifest["segment_encoding"] = self.encoding.value
         self.file_manager.save_file(
             self._canonical_bytes(manifest), manifest_path, private=True
         )
+        self._segment_encodings[checkpoint_dir] = self.encoding
 
     def resume_settings(self, job: Job) -> ResumeSettings:
         """Read the original immutable execution semantics for a restart."""
-        _, contract = self._validated_stored_manifest(job)
-        return self._settings_from_contract(contract)
+        return self._settings_from_contract(
+            self._validated_stored_manifest(job).contract
+        )
 
     def restore(
         self,
@@ -143,44 +181,37 @@ class LocalCheckpointStore:
     ) -> RestoredCheckpoint:
         expected_contract = self._contract(plan, windows)
         expected_digest = self._digest(expected_contract)
-        stored_digest, stored_contract = self._validated_stored_manifest(job)
-        if stored_digest != expected_digest or stored_contract != expected_contract:
+        manifest = self._validated_stored_manifest(job)
+        if (
+            manifest.contract_sha256 != expected_digest
+            or manifest.contract != expected_contract
+        ):
             raise CheckpointError(
                 "Private checkpoint does not match the current transcription contract"
             )
 
         checkpoint_dir = self._checkpoint_dir(job)
-        expected_by_name = {f"{window.segment_id}.json": window for window in windows}
-        segment_files = []
-        for candidate in self.file_manager.list_files(checkpoint_dir, (".json",)):
-            if candidate.name == _MANIFEST_NAME:
-                continue
-            if candidate.name not in expected_by_name:
-                raise CheckpointError(
-                    "Private checkpoint state contains an unknown segment"
-                )
-            segment_files.append(candidate)
-
-        restored: list[tuple[AudioSegmentWindow, EngineTranscript]] = []
-        for candidate in sorted(segment_files):
-            window = expected_by_name[candidate.name]
-            restored.append(
+        self._segment_encodings[checkpoint_dir] = manifest.segment_encoding
+        completed = self._completed_prefix(
+            checkpoint_dir, windows, manifest.segment_encoding
+        )
+        if manifest.segment_encoding is CheckpointEncoding.BINARY:
+            restored = self._restore_binary_segments(
+                completed, job_id=job.job_id.value, contract_digest=expected_digest
+            )
+        else:
+            restored = [
                 (
                     window,
                     self._restore_segment(
-                        candidate,
+                        path,
                         job_id=job.job_id.value,
                         contract_digest=expected_digest,
                         window=window,
                     ),
                 )
-            )
-
-        indices = tuple(window.index for window, _ in restored)
-        if indices and indices != tuple(range(indices[-1] + 1)):
-            raise CheckpointError(
-                "Completed private checkpoints are not a contiguous prefix"
-            )
+                for path, window in completed
+            ]
 
         versions = {result.engine_version for _, result in restored}
         if len(versions) > 1:
@@ -208,6 +239,19 @@ class LocalCheckpointStore:
             raise CheckpointError("Segment is outside the current checkpoint contract")
 
         contract_digest = self._digest(self._contract(plan, windows))
+        if self._segment_encoding(job) is CheckpointEncoding.BINARY:
+            self._save_new_checkpoint(
+                checkpoint_dir / f"{window.segment_id}{BINARY_CHECKPOINT_SUFFIX}",
+                encode_segment_record(
+                    BinarySegmentRecord(
+                        job_id=job.job_id.value,
+                        contract_sha256=contract_digest,
+                        window=window,
+                        result=result,
+                    )
+                ),
+            )
+            return
         result_document = self._result_to_dict(result)
         envelope = {
             "schema_version": _CHECKPOINT_SCHEMA_VERSION,
@@ -218,12 +262,15 @@ class LocalCheckpointStore:
             "result_sha256": self._digest(result_document),
             "result": result_document,
         }
-        destination = checkpoint_dir / f"{window.segment_id}.json"
+        self._save_new_checkpoint(
+            checkpoint_dir / f"{window.segment_id}.json",
+            self._canonical_bytes(envelope),
+        )
+
+    def _save_new_checkpoint(self, destination: Path, content: bytes) -> None:
         if self.file_manager.file_exists(destination):
             raise CheckpointError("Completed segment checkpoint already exists")
-        self.file_manager.save_file(
-            self._canonical_bytes(envelope), destination, private=True
-        )
+        self.file_manager.save_file(content, destination, private=True)
 
     def clear(self, job: Job) -> None:
         checkpoint_dir = self._checkpoint_dir(job)
@@ -278,7 +325,83 @@ class LocalCheckpointStore:
             "sample_rate_hz": window.sample_rate_hz,
         }
 
-    def _validated_stored_manifest(self, job: Job) -> tuple[str, dict[str, object]]:
+    def _segment_encoding(self, job: Job) -> CheckpointEncoding:
+        checkpoint_dir = self._checkpoint_dir(job)
+        encoding = self._segment_encodings.get(checkpoint_dir)
+        if encoding is None:
+            encoding = self._validated_stored_manifest(job).segment_encoding
+            self._segment_encodings[checkpoint_dir] = encoding
+        return encoding
+
+    def _completed_prefix(
+        self,
+        checkpoint_dir: Path,
+        windows: tuple[AudioSegmentWindow, ...],
+        encoding: CheckpointEncoding,
+    ) -> list[tuple[Path, AudioSegmentWindow]]:
+        """Match segment files to windows and prove they form a prefix.
+
+        Only file names are consulted, so a gap is reported before any payload is read.
+        """
+        suffix = _SEGMENT_SUFFIXES[encoding]
+        expected_by_name = {
+            f"{window.segment_id}{suffix}": window for window in windows
+        }
+        completed = []
+        for candidate in self.file_manager.list_files(
+            checkpoint_dir, tuple(_SEGMENT_SUFFIXES.values())
+        ):
+            if candidate.name == _MANIFEST_NAME:
+                continue
+            if candidate.name not in expected_by_name:
+                raise CheckpointError(
+                    "Private checkpoint state contains an unknown segment"
+                )
+            completed.append((candidate, expected_by_name[candidate.name]))
+        completed.sort(key=lambda item: item[1].index)
+        if [window.index for _, window in completed] != list(range(len(completed))):
+            raise CheckpointError(
+                "Completed private checkpoints are not a contiguous prefix"
+            )
+        return completed
+
+    def _restore_binary_segments(
+        self,
+        completed: Sequence[tuple[Path, AudioSegmentWindow]],
+        *,
+        job_id: str,
+        contract_digest: str,
+    ) -> list[tuple[AudioSegmentWindow, EngineTranscript]]:
+        paths = [path for path, _ in completed]
+        if len(paths) > 1 and self.verify_workers > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(self.verify_workers, len(paths)),
+                thread_name_prefix="scholion-checkpoint-verify",
+            ) as pool:
+                payloads = list(pool.map(self._read_verified_record, paths))
+        else:
+            payloads = [self._read_verified_record(path) for path in paths]
+
+        restored = []
+        for (_, window), payload in zip(completed, payloads, strict=True):
+            record = decode_segment_record(payload)
+            if record.job_id != job_id or record.contract_sha256 != contract_digest:
+                raise CheckpointError(
+                    "Private segment checkpoint contract does not match"
+                )
+            if record.window != window:
+                raise CheckpointError(
+                    "Private segment checkpoint window does not match"
+                )
+            restored.append((window, record.result))
+        return restored
+
+    def _read_verified_record(self, path: Path) -> bytes:
+        payload = self._read_bounded(path, minimum_bytes=MIN_BINARY_CHECKPOINT_BYTES)
+        verify_segment_record(payload)
+        return payload
+
+    def _validated_stored_manifest(self, job: Job) -> _StoredManifest:
         manifest_path = self._checkpoint_dir(job) / _MANIFEST_NAME
         if not self.file_manager.file_exists(manifest_path):
             raise CheckpointError("No private checkpoint state exists for this job")
@@ -288,6 +411,9 @@ class LocalCheckpointStore:
             stored_job_id = str(manifest["job_id"])
             stored_digest = str(manifest["contract_sha256"])
             stored_contract = cast("dict[str, object]", manifest["contract"])
+            segment_encoding = CheckpointEncoding(
+                str(manifest.get("segment_encoding", CheckpointEncoding.JSON))
+            )
         except (KeyError, TypeError, ValueError) as exc:
             raise CheckpointError("Private checkpoint manifest is malformed") from exc
 
@@ -297,7 +423,7 @@ class LocalCheckpointStore:
             raise CheckpointError("Private checkpoint belongs to a different job")
         if self._digest(stored_contract) != stored_digest:
             raise CheckpointError("Private checkpoint manifest integrity check failed")
-        return stored_digest, stored_contract
+        return _StoredManifest(stored_digest, stored_contract, segment_encoding)
 
     @classmethod
     def _settings_from_contract(cls, contract: dict[str, object]) -> ResumeSettings:
@@ -418,12 +544,19 @@ class LocalCheckpointStore:
             raise CheckpointError("Private segment checkpoint integrity check failed")
         return self._result_from_dict(result_document)
 
-    def _read_object(self, path: Path) -> dict[str, object]:
+    def _read_bounded(self, path: Path, *, minimum_bytes: int) -> bytes:
         metadata = self.file_manager.get_file_metadata(path)
-        if metadata["size"] < 2 or metadata["size"] > self.max_checkpoint_bytes:
+        if (
+            metadata["size"] < minimum_bytes
+            or metadata["size"] > self.max_checkpoint_bytes
+        ):
             raise CheckpointError("Private checkpoint file size is outside safe bounds")
+        return self.file_manager.read_file(path)
+
+    def _read_object(self, path: Path) -> dict[str, object]:
+        content = self._read_bounded(path, minimum_bytes=2)
         try:
-            parsed = json.loads(self.file_manager.read_file(path))
+            parsed = json.loads(content)
         except (json.JSONDecodeError, UnicodeDecodeError) as exc:
             raise CheckpointError("Private checkpoint JSON is invalid") from exc
         if not isinstance(parsed, dict):
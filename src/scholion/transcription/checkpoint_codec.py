@@ -0,0 +1,285 @@
+"""Versioned binary encoding for one completed segment checkpoint.
+
+A JSON checkpoint repeats every key for every word and is re-serialized on restore to
+check its digest, which dominates resume time for long jobs with word timing. A binary
+record stores the same values with word fields as packed columns and ends in the
+SHA-256 of everything before it, so integrity is one hash over the raw bytes and can be
+checked on any thread before decoding.
+
+Layout, little-endian throughout::
+
+    b"SCKP"  u16 version  32-byte contract SHA-256  str job_id
+    window:  u32 index  u64 start_frame  u64 end_frame  u32 sample_rate_hz
+    result:  str engine_version  ?str language  ?f64 language_probability  u32 count
+    segment: u32 index  f64 start  f64 end  str text  ?f64 average_log_probability
+             ?f64 no_speech_probability  ?str detected_language
+             ?f64 language_probability  u32 word_count  word columns
+    words:   f64[n] starts  f64[n] ends  ?f64[n] probabilities  str[n] texts
+             ?str[n] speaker_refs
+    32-byte SHA-256 of all preceding bytes
+
+``str`` is a u32 byte length and UTF-8 bytes. ``?`` marks a value preceded by a u8
+presence flag; optional columns carry one presence byte per word and a zero or empty
+placeholder for absent values.
+"""
+
+from __future__ import annotations
+
+import struct
+from collections.abc import Sequence
+from dataclasses import dataclass
+from hashlib import sha256
+from typing import Any
+
+from scholion.transcription.alignment import (
+    AlignedRecognizedSegment,
+    AlignedWord,
+    aligned_words,
+)
+from scholion.transcription.errors import CheckpointError
+from scholion.transcription.models import AudioSegmentWindow, EngineTranscript
+
+BINARY_CHECKPOINT_VERSION = 1
+BINARY_CHECKPOINT_SUFFIX = ".ckpt"
+
+_MAGIC = b"SCKP"
+_HEADER = struct.Struct("<4sH32s")
+_WINDOW = struct.Struct("<IQQI")
+_SEGMENT_TIMES = struct.Struct("<Idd")
+_U32 = struct.Struct("<I")
+_F64 = struct.Struct("<d")
+_DIGEST_BYTES = 32
+MIN_BINARY_CHECKPOINT_BYTES = _HEADER.size + _DIGEST_BYTES
+
+
+@dataclass(frozen=True, slots=True)
+class BinarySegmentRecord:
+    """One completed segment bound to its job, contract, and audio window."""
+
+    job_id: str
+    contract_sha256: str
+    window: AudioSegmentWindow
+    result: EngineTranscript
+
+
+class _Writer:
+    def __init__(self) -> None:
+        self.chunks: list[bytes] = []
+
+    def pack(self, layout: struct.Struct, *values: object) -> None:
+        self.chunks.append(layout.pack(*values))
+
+    def text(self, value: str) -> None:
+        encoded = value.encode("utf-8")
+        self.chunks.append(_U32.pack(len(encoded)))
+        self.chunks.append(encoded)
+
+    def optional_text(self, value: str | None) -> None:
+        self.chunks.append(b"\x00" if value is None else b"\x01")
+        if value is not None:
+            self.text(value)
+
+    def optional_float(self, value: float | None) -> None:
+        self.chunks.append(b"\x00" if value is None else b"\x01")
+        if value is not None:
+            self.chunks.append(_F64.pack(value))
+
+    def floats(self, values: Sequence[float]) -> None:
+        self.chunks.append(struct.pack(f"<{len(values)}d", *values))
+
+    def optional_floats(self, values: Sequence[float | None]) -> None:
+        self.chunks.append(bytes(value is not None for value in values))
+        self.floats([0.0 if value is None else value for value in values])
+
+    def texts(self, values: Sequence[str]) -> None:
+        encoded = [value.encode("utf-8") for value in values]
+        self.chunks.append(
+            struct.pack(f"<{len(encoded)}I", *(len(value) for value in encoded))
+        )
+        self.chunks.extend(encoded)
+
+    def optional_texts(self, values: Sequence[str | None]) -> None:
+        self.chunks.append(bytes(value is not None for value in values))
+        self.texts(["" if value is None else value for value in values])
+
+
+class _Reader:
+    def __init__(self, payload: memoryview) -> None:
+        self.payload = payload
+        self.offset = 0
+
+    def take(self, size: int) -> memoryview:
+        end = self.offset + size
+        if size < 0 or end > len(self.payload):
+            raise CheckpointError("Private segment checkpoint is malformed")
+        chunk = self.payload[self.offset : end]
+        self.offset = end
+        return chunk
+
+    def unpack(self, layout: struct.Struct) -> tuple[Any, ...]:
+        return layout.unpack(self.take(layout.size))
+
+    def count(self) -> int:
+        return int(_U32.unpack(self.take(_U32.size))[0])
+
+    def text(self) -> str:
+        return str(self.take(self.count()), "utf-8")
+
+    def flag(self) -> bool:
+        value = self.take(1)[0]
+        if value > 1:
+            raise CheckpointError("Private segment checkpoint is malformed")
+        return value == 1
+
+    def optional_text(self) -> str | None:
+        return self.text() if self.flag() else None
+
+    def optional_float(self) -> float | None:
+        return float(_F64.unpack(self.take(_F64.size))[0]) if self.flag() else None
+
+    def floats(self, count: int) -> tuple[float, ...]:
+        return struct.unpack(f"<{count}d", self.take(8 * count))
+
+    def presence(self, count: int) -> tuple[bool, ...]:
+        flags = bytes(self.take(count))
+        if flags.translate(None, b"\x00\x01"):
+            raise CheckpointError("Private segment checkpoint is malformed")
+        return tuple(flag == 1 for flag in flags)
+
+    def optional_floats(self, count: int) -> tuple[float | None, ...]:
+        present = self.presence(count)
+        values = self.floats(count)
+        return tuple(
+            value if flag else None for flag, value in zip(present, values, strict=True)
+        )
+
+    def texts(self, count: int) -> tuple[str, ...]:
+        lengths = struct.unpack(f"<{count}I", self.take(4 * count))
+        return tuple(str(self.take(length), "utf-8") for length in lengths)
+
+    def optional_texts(self, count: int) -> tuple[str | None, ...]:
+        present = self.presence(count)
+        values = self.texts(count)
+        return tuple(
+            value if flag else None for flag, value in zip(present, values, strict=True)
+        )
+
+
+def encode_segment_record(record: BinarySegmentRecord) -> bytes:
+    writer = _Writer()
+    writer.pack(
+        _HEADER,
+        _MAGIC,
+        BINARY_CHECKPOINT_VERSION,
+        bytes.fromhex(record.contract_sha256),
+    )
+    writer.text(record.job_id)
+    window = record.window
+    writer.pack(
+        _WINDOW,
+        window.index,
+        window.start_frame,
+        window.end_frame,
+        window.sample_rate_hz,
+    )
+    result = record.result
+    writer.text(result.engine_version)
+    writer.optional_text(result.language)
+    writer.optional_float(result.language_probability)
+    writer.pack(_U32, len(result.segments))
+    for segment in result.segments:
+        writer.pack(
+            _SEGMENT_TIMES, segment.index, segment.start_seconds, segment.end_seconds
+        )
+        writer.text(segment.text)
+        writer.optional_float(segment.average_log_probability)
+        writer.optional_float(segment.no_speech_probability)
+        writer.optional_text(segment.detected_language)
+        writer.optional_float(segment.language_probability)
+        words = aligned_words(segment)
+        writer.pack(_U32, len(words))
+        writer.floats([word.start_seconds for word in words])
+        writer.floats([word.end_seconds for word in words])
+        writer.optional_floats([word.probability for word in words])
+        writer.texts([word.text for word in words])
+        writer.optional_texts([word.speaker_ref for word in words])
+    body = b"".join(writer.chunks)
+    return body + sha256(body).digest()
+
+
+def verify_segment_record(payload: bytes) -> None:
+    """Check framing and the trailing digest without decoding any field.
+
+    Hashing releases the GIL, so callers can verify many records on worker threads.
+    """
+    if len(payload) < MIN_BINARY_CHECKPOINT_BYTES:
+        raise CheckpointError("Private segment checkpoint is malformed")
+    magic, version, _ = _HEADER.unpack_from(payload)
+    if magic != _MAGIC:
+        raise CheckpointError("Private segment checkpoint is malformed")
+    if version != BINARY_CHECKPOINT_VERSION:
+        raise CheckpointError("Private segment checkpoint schema is unsupported")
+    body = memoryview(payload)[:-_DIGEST_BYTES]
+    if sha256(body).digest() != payload[-_DIGEST_BYTES:]:
+        raise CheckpointError("Private segment checkpoint integrity check failed")
+
+
+def decode_segment_record(payload: bytes) -> BinarySegmentRecord:
+    """Decode a record that already passed ``verify_segment_record``."""
+    reader = _Reader(memoryview(payload)[:-_DIGEST_BYTES])
+    try:
+        _, _, contract_digest = reader.unpack(_HEADER)
+        job_id = reader.text()
+        index, start_frame, end_frame, sample_rate_hz = reader.unpack(_WINDOW)
+        window = AudioSegmentWindow(index, start_frame, end_frame, sample_rate_hz)
+        engine_version = reader.text()
+        language = reader.optional_text()
+        language_probability = reader.optional_float()
+        segments = tuple(_read_segment(reader) for _ in range(reader.count()))
+        if reader.offset != len(reader.payload):
+            raise CheckpointError("Private segment checkpoint is malformed")
+        result = EngineTranscript(
+            segments=segments,
+            language=language,
+            language_probability=language_probability,
+            engine_version=engine_version,
+        )
+    except (UnicodeDecodeError, ValueError) as exc:
+        raise CheckpointError("Private segment result is malformed") from exc
+    return BinarySegmentRecord(
+        job_id=job_id,
+        contract_sha256=contract_digest.hex(),
+        window=window,
+        result=result,
+    )
+
+
+def _read_segment(reader: _Reader) -> AlignedRecognizedSegment:
+    index, start_seconds, end_seconds = reader.unpack(_SEGMENT_TIMES)
+    text = reader.text()
+    average_log_probability = reader.optional_float()
+    no_speech_probability = reader.optional_float()
+    detected_language = reader.optional_text()
+    language_probability = reader.optional_float()
+    count = reader.count()
+    starts = reader.floats(count)
+    ends = reader.floats(count)
+    probabilities = reader.optional_floats(count)
+    texts = reader.texts(count)
+    speaker_refs = reader.optional_texts(count)
+    return AlignedRecognizedSegment(
+        index=index,
+        start_seconds=start_seconds,
+        end_seconds=end_seconds,
+        text=text,
+        average_log_probability=average_log_probability,
+        no_speech_probability=no_speech_probability,
+        detected_language=detected_language,
+        language_probability=language_probability,
+        words=tuple(
+            AlignedWord(start, end, word, probability, speaker_ref)
+            for start, end, probability, word, speaker_ref in zip(
+                starts, ends, probabilities, texts, speaker_refs, strict=True
+            )
+        ),
+    )
@@ -1,4 +1,3 @@
-import json
 from contextlib import suppress
 from dataclasses import replace
 from pathlib import Path
@@ -309,14 +308,12 @@ class TranscriptionExecutor:
                     speaker_result,
                     enhancement=None if enhanced is None else enhanced.provenance,
                 )
-                document = json.dumps(
-                    transcript.to_dict(),
-                    ensure_ascii=False,
-                    sort_keys=True,
-                    separators=(",", ":"),
-                )
+            # Segments are encoded and hashed while the artifact is written, so
+            # serialization never holds the whole document and nothing reads it back.
             with self.observer.span("artifact.write"):
-                self.file_manager.save_file(f"{document}\n".encode(), artifact.path)
+                canonical_sha256 = self.file_manager.save_stream(
+                    transcript.canonical_json_chunks(), artifact.path
+                )
             with self.observer.span("checkpoint.cleanup"):
                 self._clear_completed_checkpoints(job)
         except BaseException:
@@ -328,7 +325,9 @@ class TranscriptionExecutor:
             if decoded is not None:
                 with self.observer.span("decode.cleanup"):
                     self.audio_decoder.cleanup(decoded)
-        return TranscriptionExecutionResult(job, artifact, transcript)
+        return TranscriptionExecutionResult(
+            job, artifact, transcript, canonical_sha256=canonical_sha256
+        )
 
     def _cleanup_enhanced(self, enhanced: EnhancedAudio) -> None:
         if self.audio_enhancer is None:
@@ -492,7 +491,8 @@ class TranscriptionExecutor:
         speaker_result: SpeakerDiarizationResult | None = None,
         enhancement: EnhancementProvenance | None = None,
     ) -> CanonicalTranscript:
-        segments, attribution = self._attribute_languages(result.segments)
+        with self.observer.span("transcript.languages"):
+            segments, attribution = self._attribute_languages(result.segments)
         if speaker_result is not None:
             segments = project_speaker_refs(segments, speaker_result.turns)
         detected_languages: list[str] = []
@@ -1,8 +1,10 @@
 import math
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from enum import StrEnum
 from pathlib import Path
 
+from scholion.core.canonical_json import StreamedArray, iter_canonical_json
 from scholion.media.models import MediaInfo, MediaTemporalTag
 from scholion.runner.models import ExecutionPolicy, ProcessingProfile, RunnerResources
 from scholion.transcription.enhancement_models import (
@@ -21,6 +23,11 @@ class DecodeStrategy(StrEnum):
     FFMPEG_NORMALIZE = "ffmpeg_normalize"
 
 
+class CheckpointEncoding(StrEnum):
+    JSON = "json"
+    BINARY = "binary"
+
+
 @dataclass(frozen=True, slots=True)
 class DecodeConfiguration:
     strategy: DecodeStrategy
@@ -638,6 +645,28 @@ class CanonicalTranscript:
         return " ".join(segment.text.strip() for segment in self.segments)
 
     def to_dict(self) -> dict[str, object]:
+        return self._document(
+            segments=[segment.to_dict() for segment in self.segments],
+            speaker_turns=[turn.to_dict() for turn in self.speaker_turns],
+        )
+
+    def canonical_json_chunks(self) -> Iterator[bytes]:
+        """Yield the canonical artifact bytes, encoding one segment at a time.
+
+        The bytes equal the canonical ``json.dumps`` of ``to_dict()`` plus a newline.
+        """
+        return iter_canonical_json(
+            self._document(
+                segments=StreamedArray(segment.to_dict() for segment in self.segments),
+                speaker_turns=StreamedArray(
+                    turn.to_dict() for turn in self.speaker_turns
+                ),
+            )
+        )
+
+    def _document(
+        self, *, segments: object, speaker_turns: object
+    ) -> dict[str, object]:
         return {
             "schema_version": self.schema_version,
             "job_id": self.job_id,
@@ -655,9 +684,9 @@ class CanonicalTranscript:
                 else self.language_attribution.to_dict()
             ),
             "text": self.text,
-            "segments": [segment.to_dict() for segment in self.segments],
+            "segments": segments,
             "diarization": self.diarization.to_dict() if self.diarization else None,
-            "speaker_turns": [turn.to_dict() for turn in self.speaker_turns],
+            "speaker_turns": speaker_turns,
             "enhancement": (
                 self.enhancement.to_dict() if self.enhancement is not None else None
             ),
@@ -669,12 +698,22 @@ class TranscriptionExecutionResult:
     job: Job
     artifact: Artifact
     transcript: CanonicalTranscript
+    canonical_sha256: str | None = None
+    """SHA-256 of the artifact bytes, computed while they were written."""
 
     def __post_init__(self) -> None:
         if self.job.job_id != self.artifact.job_id:
             raise ValueError("job and artifact IDs must match")
         if self.job.job_id.value != self.transcript.job_id:
             raise ValueError("job and transcript IDs must match")
+        if self.canonical_sha256 is not None and (
+            len(self.canonical_sha256) != 64
+            or any(
+                character not in "0123456789abcdef"
+                for character in self.canonical_sha256
+            )
+        ):
+            raise ValueError("canonical sha256 must be a lowercase 64-character digest")
 
     def to_dict(self) -> dict[str, object]:
         return {
@@ -682,5 +721,6 @@ class TranscriptionExecutionResult:
             "paths_reserved": True,
             "job": self.job.to_dict(),
             "artifact": self.artifact.to_dict(),
+            "canonical_sha256": self.canonical_sha256,
             "transcript": self.transcript.to_dict(),
         }
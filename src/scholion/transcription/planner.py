@@ -296,6 +296,7 @@ class TranscriptionJobPlanner:
             memory_budget_bytes=policy.memory_budget_bytes,
             accelerators=topology.accelerators,
             capabilities=self._capabilities(topology),
+            runner=topology.resources,
         )
 
     def _admit_resume_accelerator(
@@ -321,6 +322,7 @@ class TranscriptionJobPlanner:
             memory_budget_bytes=policy.memory_budget_bytes,
             accelerators=topology.accelerators,
             capabilities=self._capabilities(topology),
+            runner=topology.resources,
         )[0]
         if not assessment.feasible:
             raise ResourceAdmissionError(
@@ -1,12 +1,17 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import StrEnum
 
-from scholion.runner.models import ProcessingProfile
+from scholion.runner.models import ProcessingProfile, RunnerResources
 from scholion.runner.topology import (
     AcceleratorBackend,
     AcceleratorDevice,
     MemoryTopology,
 )
+from scholion.transcription.calibration import (
+    CalibratedEstimate,
+    StrategyCalibrator,
+    StrategyObservationSource,
+)
 from scholion.transcription.capabilities import EngineCapabilities
 from scholion.transcription.errors import ResourceAdmissionError
 
@@ -111,6 +116,7 @@ class StrategyAssessment:
     effective_peak_memory_bytes: int | None = None
     device_memory_budget_bytes: int | None = None
     accelerator_id: str | None = None
+    calibration: CalibratedEstimate | None = None
 
     def __post_init__(self) -> None:
         if self.memory_budget_bytes < 0:
@@ -144,6 +150,9 @@ class StrategyAssessment:
             "effective_peak_memory_bytes": self.peak_system_memory_bytes,
             "device_memory_budget_bytes": self.device_memory_budget_bytes,
             "accelerator_id": self.accelerator_id,
+            "calibration": (
+                None if self.calibration is None else self.calibration.to_dict()
+            ),
             "feasible": self.feasible,
             "rejection_reasons": [reason.value for reason in self.rejection_reasons],
         }
@@ -192,9 +201,16 @@ class StrategyCatalog:
 
 @dataclass(frozen=True, slots=True)
 class StrategyEvaluator:
-    """Rank strategies without assuming that every visible GPU is executable."""
+    """Rank strategies without assuming that every visible GPU is executable.
+
+    With an observation source, strategies measured often enough on the assessed
+    runner are admitted against their calibrated peak memory and ranked by measured
+    real-time factor; everything else keeps the catalog's static figures.
+    """
 
     device_memory_budget_fraction: float = 0.80
+    observation_source: StrategyObservationSource | None = None
+    calibrator: StrategyCalibrator = field(default_factory=StrategyCalibrator)
 
     def __post_init__(self) -> None:
         if not 0 < self.device_memory_budget_fraction <= 1:
@@ -209,16 +225,23 @@ class StrategyEvaluator:
         memory_budget_bytes: int,
         accelerators: tuple[AcceleratorDevice, ...] = (),
         capabilities: tuple[EngineCapabilities, ...] = (),
+        runner: RunnerResources | None = None,
     ) -> tuple[StrategyAssessment, ...]:
         if memory_budget_bytes < 0:
             raise ValueError("memory_budget_bytes cannot be negative")
         capability_map = {capability.engine: capability for capability in capabilities}
+        observations = (
+            self.observation_source.strategy_observations(runner.fingerprint)
+            if self.observation_source is not None and runner is not None
+            else ()
+        )
         return tuple(
             self._assess_strategy(
                 strategy,
                 memory_budget_bytes=memory_budget_bytes,
                 accelerators=accelerators,
                 capability=capability_map.get(strategy.engine),
+                calibration=self.calibrator.calibrate(strategy, observations),
             )
             for strategy in catalog.strategies
         )
@@ -230,9 +253,14 @@ class StrategyEvaluator:
         memory_budget_bytes: int,
         accelerators: tuple[AcceleratorDevice, ...],
         capability: EngineCapabilities | None,
+        calibration: CalibratedEstimate | None = None,
     ) -> StrategyAssessment:
         reasons: list[RejectionReason] = []
-        effective_memory = strategy.estimated_peak_memory_bytes
+        effective_memory = (
+            strategy.estimated_peak_memory_bytes
+            if calibration is None
+            else calibration.estimated_peak_memory_bytes
+        )
         device_budget: int | None = None
         accelerator: AcceleratorDevice | None = None
 
@@ -263,6 +291,7 @@ class StrategyEvaluator:
             accelerator_id=(
                 None if accelerator is None else accelerator.accelerator_id
             ),
+            calibration=calibration,
         )
 
     @staticmethod
@@ -370,6 +399,16 @@ class StrategyEvaluator:
     def _fastest(
         assessments: tuple[StrategyAssessment, ...],
     ) -> StrategyAssessment:
+        if all(item.calibration is not None for item in assessments):
+            # Measured speed is only comparable when every candidate has been measured.
+            return min(
+                assessments,
+                key=lambda item: (
+                    item.calibration.real_time_factor if item.calibration else 0.0,
+                    -item.strategy.performance_rank,
+                    item.strategy.strategy_id,
+                ),
+            )
         return max(
             assessments,
             key=lambda item: (
@@ -1,3 +1,4 @@
+import json
 from dataclasses import FrozenInstanceError
 from typing import cast
 
@@ -122,6 +123,11 @@ def test_canonical_transcript_serializes_source_relative_word_evidence():
     segments = cast("list[dict[str, object]]", document["segments"])
     words = cast("list[dict[str, object]]", segments[0]["words"])
 
+    assert b"".join(transcript.canonical_json_chunks()) == (
+        json.dumps(document, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+        + "\n"
+    ).encode("utf-8")
+
     assert words == [
         {
             "start_seconds": 12.4,
@@ -0,0 +1,139 @@
+from dataclasses import dataclass
+
+import pytest
+
+from scholion.runner.models import ProcessingProfile, RunnerResources
+from scholion.transcription.calibration import (
+    StrategyCalibrator,
+    StrategyObservation,
+)
+from scholion.transcription.strategy import (
+    RejectionReason,
+    StrategyCatalog,
+    StrategyDefinition,
+    StrategyEvaluator,
+)
+
+MIB = 1024**2
+GIB = 1024**3
+
+RUNNER = RunnerResources(
+    platform="Linux",
+    machine="x86_64",
+    logical_cpus=8,
+    physical_cpus=4,
+    affinity_cpus=None,
+    cpu_quota_cores=None,
+    effective_cpus=8,
+    memory_total_bytes=16 * GIB,
+    memory_available_bytes=12 * GIB,
+    memory_limit_bytes=None,
+    effective_memory_available_bytes=12 * GIB,
+)
+
+
+def _strategy(strategy_id: str, compute_type: str, rank: int) -> StrategyDefinition:
+    return StrategyDefinition(
+        strategy_id=strategy_id,
+        model="small",
+        quality_rank=2,
+        model_cache_bytes=750 * MIB,
+        estimated_peak_memory_bytes=2_304 * MIB,
+        compute_type=compute_type,
+        performance_rank=rank,
+    )
+
+
+CATALOG = StrategyCatalog(
+    (
+        _strategy("small-cpu-int8", "int8", 20),
+        _strategy("small-cpu-float32", "float32", 10),
+    )
+)
+
+
+def _runs(
+    compute_type: str, real_time_factor: float, peak_mib: int, count: int = 3
+) -> tuple[StrategyObservation, ...]:
+    return tuple(
+        StrategyObservation(
+            engine="faster-whisper",
+            model="small",
+            device="cpu",
+            compute_type=compute_type,
+            real_time_factor=real_time_factor,
+            peak_memory_bytes=peak_mib * MIB,
+        )
+        for _ in range(count)
+    )
+
+
+@dataclass
+class FakeSource:
+    observations: tuple[StrategyObservation, ...]
+    machines: list[str]
+
+    def strategy_observations(self, machine: str) -> tuple[StrategyObservation, ...]:
+        self.machines.append(machine)
+        return self.observations
+
+
+def test_catalog_values_remain_priors_until_enough_runs_exist() -> None:
+    calibrator = StrategyCalibrator()
+    strategy = CATALOG.strategies[0]
+
+    assert calibrator.calibrate(strategy, _runs("int8", 0.2, 1_000, count=2)) is None
+    assert calibrator.calibrate(strategy, _runs("float32", 0.2, 1_000)) is None
+
+    lighter = calibrator.calibrate(strategy, _runs("int8", 0.2, 1_000))
+    assert lighter is not None
+    assert lighter.runs == 3
+    assert lighter.real_time_factor == 0.2
+    assert lighter.estimated_peak_memory_bytes == pytest.approx(1_727 * MIB, abs=1)
+
+    heavier = calibrator.calibrate(strategy, _runs("int8", 0.2, 4_000))
+    assert heavier is not None
+    assert heavier.estimated_peak_memory_bytes == 4_000 * MIB
+
+    with pytest.raises(ValueError, match="memory_headroom"):
+        StrategyCalibrator(memory_headroom=0.9)
+
+
+def test_evaluator_admits_and_ranks_with_calibrated_estimates() -> None:
+    source = FakeSource(
+        _runs("int8", 0.4, 3_500) + _runs("float32", 0.25, 1_000), machines=[]
+    )
+    evaluator = StrategyEvaluator(observation_source=source)
+
+    static = evaluator.assess(CATALOG, memory_budget_bytes=3 * GIB)
+    assert source.machines == []
+    assert all(item.calibration is None for item in static)
+    assert (
+        evaluator.select(
+            static, profile=ProcessingProfile.BALANCED
+        ).strategy.strategy_id
+        == "small-cpu-int8"
+    )
+
+    calibrated = evaluator.assess(CATALOG, memory_budget_bytes=3 * GIB, runner=RUNNER)
+    assert source.machines == [RUNNER.fingerprint]
+    int8, float32 = calibrated
+    assert int8.rejection_reasons == (RejectionReason.INSUFFICIENT_MEMORY,)
+    assert int8.to_dict()["calibration"] == {
+        "runs": 3,
+        "real_time_factor": 0.4,
+        "estimated_peak_memory_bytes": int8.peak_system_memory_bytes,
+    }
+    assert float32.feasible
+    assert (
+        evaluator.select(
+            calibrated, profile=ProcessingProfile.BALANCED
+        ).strategy.strategy_id
+        == "small-cpu-float32"
+    )
+
+    roomy = evaluator.assess(CATALOG, memory_budget_bytes=8 * GIB, runner=RUNNER)
+    assert (
+        evaluator.select(roomy, profile=ProcessingProfile.BALANCED).strategy.strategy_id
+        == "small-cpu-float32"
+    )
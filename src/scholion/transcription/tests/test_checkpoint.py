@@ -21,6 +21,7 @@ from scholion.transcription.enhancement_models import EnhancementConfiguration
 from scholion.transcription.errors import CheckpointError
 from scholion.transcription.models import (
     AudioSegmentWindow,
+    CheckpointEncoding,
     CpuEngineConfiguration,
     DecodeConfiguration,
     DecodeStrategy,
@@ -262,3 +263,57 @@ def test_clear_removes_sensitive_checkpoint_payloads_after_completion(tmp_path):
     store.clear(job)
 
     assert list((job.workspace_dir / "checkpoints").iterdir()) == []
+
+
+def test_binary_checkpoints_restore_in_parallel_and_keep_the_manifest_encoding(
+    tmp_path,
+):
+    json_store, job, plan, windows, _ = context(tmp_path)
+    store = LocalCheckpointStore(
+        json_store.file_manager, encoding=CheckpointEncoding.BINARY
+    )
+    store.initialize(job, plan, windows)
+    store.save_segment(job, plan, windows, windows[0], result("first words"))
+    # A store configured for JSON still continues a job that started in binary.
+    json_store.save_segment(job, plan, windows, windows[1], result("second words"))
+
+    restored = json_store.restore(job, plan, windows)
+
+    checkpoints = job.workspace_dir / "checkpoints"
+    manifest = json.loads((checkpoints / "manifest.json").read_text())
+    assert manifest["segment_encoding"] == "binary"
+    assert sorted(path.name for path in checkpoints.iterdir()) == [
+        "audio-000000.ckpt",
+        "audio-000001.ckpt",
+        "manifest.json",
+    ]
+    assert [window for window, _ in restored.completed] == list(windows)
+    assert restored.completed[1][1] == result("second words")
+    assert restored.engine_version == "1.2.1"
+
+
+def test_tampered_binary_checkpoint_fails_integrity_check(tmp_path):
+    store, job, plan, windows, _ = context(tmp_path)
+    store = LocalCheckpointStore(store.file_manager, encoding=CheckpointEncoding.BINARY)
+    store.initialize(job, plan, windows)
+    store.save_segment(job, plan, windows, windows[0], result("original"))
+    checkpoint = job.workspace_dir / "checkpoints" / "audio-000000.ckpt"
+    checkpoint.write_bytes(checkpoint.read_bytes().replace(b"original", b"tampered"))
+
+    with pytest.raises(
+        CheckpointError,
+        match="^Private segment checkpoint integrity check failed$",
+    ):
+        store.restore(job, plan, windows)
+
+
+def test_segment_files_in_the_other_encoding_are_unknown(tmp_path):
+    store, job, plan, windows, _ = context(tmp_path)
+    store.initialize(job, plan, windows)
+    (job.workspace_dir / "checkpoints" / "audio-000000.ckpt").write_bytes(b"x" * 80)
+
+    with pytest.raises(
+        CheckpointError,
+        match="^Private checkpoint state contains an unknown segment$",
+    ):
+        store.restore(job, plan, windows)
@@ -0,0 +1,60 @@
+import pytest
+
+from scholion.transcription.alignment import AlignedRecognizedSegment, AlignedWord
+from scholion.transcription.checkpoint_codec import (
+    BinarySegmentRecord,
+    decode_segment_record,
+    encode_segment_record,
+    verify_segment_record,
+)
+from scholion.transcription.errors import CheckpointError
+from scholion.transcription.models import AudioSegmentWindow, EngineTranscript
+
+
+def record(words):
+    return BinarySegmentRecord(
+        job_id="job-1",
+        contract_sha256="ab" * 32,
+        window=AudioSegmentWindow(3, 48_000, 64_000, 16_000),
+        result=EngineTranscript(
+            (
+                AlignedRecognizedSegment(
+                    0, 0.0, 1.0, "naïve café", words=words, detected_language="fr"
+                ),
+                AlignedRecognizedSegment(1, 1.0, 1.5, "pause", -0.25, 0.5),
+            ),
+            None,
+            None,
+            "1.2.1",
+        ),
+    )
+
+
+def test_record_round_trips_optional_word_columns_exactly():
+    original = record(
+        (
+            AlignedWord(0.0, 0.4, "naïve", 0.1 + 0.2, "SPEAKER_00"),
+            AlignedWord(0.4, 1.0, "café", None, None),
+        )
+    )
+
+    payload = encode_segment_record(original)
+    verify_segment_record(payload)
+
+    assert decode_segment_record(payload) == original
+
+
+@pytest.mark.parametrize(
+    ("damage", "message"),
+    [
+        (lambda payload: payload[:-1] + bytes([payload[-1] ^ 1]), "integrity"),
+        (lambda payload: b"JSON" + payload[4:], "malformed"),
+        (lambda payload: payload[:4] + b"\x09\x00" + payload[6:], "unsupported"),
+        (lambda payload: payload[:20], "malformed"),
+    ],
+)
+def test_damaged_records_are_rejected_before_decoding(damage, message):
+    payload = encode_segment_record(record((AlignedWord(0.0, 1.0, "word"),)))
+
+    with pytest.raises(CheckpointError, match=message):
+        verify_segment_record(damage(payload))
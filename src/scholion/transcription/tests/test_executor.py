@@ -1,4 +1,5 @@
 import json
+from hashlib import sha256
 from unittest.mock import Mock, call
 
 import pytest
@@ -236,6 +237,9 @@ def test_execution_segments_audio_once_loaded_and_writes_private_safe_json(tmp_p
 
     assert result.job.workspace_dir.is_dir()
     assert result.artifact.path.is_file()
+    assert (
+        result.canonical_sha256 == sha256(result.artifact.path.read_bytes()).hexdigest()
+    )
     document = json.loads(result.artifact.path.read_text())
     assert document["schema_version"] == 1
     assert document["job_id"] == "job-1"
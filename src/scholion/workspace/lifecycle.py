@@ -1,21 +1,58 @@
+"""Private job lifecycle state in one indexed, transactional SQLite registry.
+
+Lifecycle listing sits on hot paths (library discovery, retention planning, and the
+Processing Center job list), so its cost must not grow with every historical job that
+ever ran. Records live in ``job-lifecycle/registry.sqlite3``, ordered and indexed by
+``updated_at`` as UTC microseconds, alone and after status, so both paging order and an
+``updated_before`` cutoff are one index range. Only RUNNING rows are probed against the
+operating system to reconcile jobs whose process went away.
+
+Earlier builds kept one JSON manifest per job in the same directory. Those manifests are
+imported once, the first time the registry is opened, and left in place untouched.
+
+Segment progress is too frequent to commit durably. A running job publishes it to a
+small per-job status file under ``job-lifecycle/live/`` that is atomically replaced but
+never fsynced; readers overlay it on the RUNNING record. The registry itself is only
+checkpointed at a bounded cadence, and every state transition folds the latest live
+progress into one durable commit.
+"""
+
 from __future__ import annotations
 
 import json
 import os
+import sqlite3
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass, replace
 from datetime import UTC, datetime
 from enum import StrEnum
+from hashlib import sha256
 from pathlib import Path
 from typing import cast
 
-import psutil
+from pydantic import BaseModel, ConfigDict, ValidationError
 
+from scholion.core.errors import ScholionError, StorageError
 from scholion.core.file_manager_facade import FileManagerFacade
 from scholion.workspace.errors import JobNotFoundError
 from scholion.workspace.models import Artifact, Job, JobId, WorkspacePaths
 
 _JOB_MANIFEST_SUFFIX = ".json"
 _MAX_JOB_MANIFEST_BYTES = 64 * 1024
+_REGISTRY_FILE_NAME = "registry.sqlite3"
+_REGISTRY_SCHEMA_VERSION = 1
+_DEFAULT_PAGE_SIZE = 100
+_MAX_PAGE_SIZE = 1000
+_LIVE_PROGRESS_SCHEMA_VERSION = 1
+# Timestamps that cannot be ordered sort before every real one, so cutoff queries still
+# return them to callers that refuse ambiguous times.
+_UNORDERED_TIMESTAMP_US = -1
+_MAX_LIVE_PROGRESS_BYTES = 4 * 1024
+_RECORD_COLUMNS = """
+    job_id, input_path, output_dir, status, started_at, updated_at, process_id,
+    process_started_at, total_segments, completed_segments, artifact_path, error_code
+"""
 
 
 class JobStatus(StrEnum):
@@ -127,6 +164,53 @@ class JobLifecycleRecord:
             raise ValueError("private job lifecycle manifest is malformed") from exc
 
 
+class _StoredLiveProgress(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    schema_version: int
+    job_id: str
+    process_id: int
+    process_started_at: float
+    completed_segments: int
+    total_segments: int
+
+
+@dataclass(frozen=True, slots=True)
+class JobLifecycleCursor:
+    """Keyset position after the last record of one lifecycle page."""
+
+    updated_at: str
+    job_id: str
+
+
+@dataclass(frozen=True, slots=True)
+class JobLifecyclePage:
+    """One page of lifecycle records in the requested order, and where the next starts."""
+
+    records: tuple[JobLifecycleRecord, ...]
+    next_cursor: JobLifecycleCursor | None
+
+
+@dataclass(frozen=True, slots=True)
+class _RecordFilter:
+    statuses: tuple[JobStatus, ...]
+    with_artifact: bool
+    updated_before: datetime | None
+
+    def where(self) -> tuple[str, list[object]]:
+        clauses: list[str] = []
+        parameters: list[object] = []
+        if self.statuses:
+            clauses.append(f"status IN ({', '.join('?' for _ in self.statuses)})")
+            parameters.extend(status.value for status in self.statuses)
+        if self.with_artifact:
+            clauses.append("artifact_path IS NOT NULL")
+        if self.updated_before is not None:
+            clauses.append("updated_at_us <= ?")
+            parameters.append(_timestamp_micros(self.updated_before))
+        return " AND ".join(clauses) or "1", parameters
+
+
 class JobLifecycleStore:
     """Persist private lifecycle metadata independently from transcript custody."""
 
@@ -142,29 +226,42 @@ class JobLifecycleStore:
         self.file_manager = file_manager
         self.paths = paths
         self.max_manifest_bytes = max_manifest_bytes
+        self._initialized = False
+        self._process_identity: tuple[int, float] | None = None
 
     @property
     def registry_dir(self) -> Path:
         return self.paths.state_dir / "job-lifecycle"
 
+    @property
+    def database_path(self) -> Path:
+        return self.registry_dir / _REGISTRY_FILE_NAME
+
+    @property
+    def live_dir(self) -> Path:
+        return self.registry_dir / "live"
+
     def start(self, job: Job) -> JobLifecycleRecord:
         now = self._now()
-        existing = self._load_if_present(job.job_id)
-        pid = os.getpid()
-        process_started_at = psutil.Process(pid).create_time()
-        record = JobLifecycleRecord(
-            job_id=job.job_id,
-            input_path=job.input_path,
-            output_dir=job.output_dir,
-            status=JobStatus.RUNNING,
-            started_at=existing.started_at if existing is not None else now,
-            updated_at=now,
-            process_id=pid,
-            process_started_at=process_started_at,
-            total_segments=None if existing is None else existing.total_segments,
-            completed_segments=0 if existing is None else existing.completed_segments,
-        )
-        self._write(record)
+        pid, process_started_at = self._current_process()
+        self._discard_live_progress(job.job_id)
+        with self._transaction() as connection:
+            existing = self._select(connection, job.job_id)
+            record = JobLifecycleRecord(
+                job_id=job.job_id,
+                input_path=job.input_path,
+                output_dir=job.output_dir,
+                status=JobStatus.RUNNING,
+                started_at=existing.started_at if existing is not None else now,
+                updated_at=now,
+                process_id=pid,
+                process_started_at=process_started_at,
+                total_segments=None if existing is None else existing.total_segments,
+                completed_segments=(
+                    0 if existing is None else existing.completed_segments
+                ),
+            )
+            self._upsert(connection, record)
         return record
 
     def record_progress(
@@ -174,33 +271,71 @@ class JobLifecycleStore:
         completed_segments: int,
         total_segments: int,
     ) -> JobLifecycleRecord:
-        record = self._required(job.job_id)
-        updated = replace(
-            record,
-            status=JobStatus.RUNNING,
-            completed_segments=completed_segments,
-            total_segments=total_segments,
-            updated_at=self._now(),
-        )
-        self._write(updated)
+        with self._transaction() as connection:
+            record = self._required(connection, job.job_id)
+            updated = replace(
+                record,
+                status=JobStatus.RUNNING,
+                completed_segments=completed_segments,
+                total_segments=total_segments,
+                updated_at=self._now(),
+            )
+            self._upsert(connection, updated)
         return updated
 
-    def complete(self, job: Job, artifact: Artifact) -> JobLifecycleRecord:
-        record = self._required(job.job_id)
-        completed = record.completed_segments
-        if record.total_segments is not None:
-            completed = record.total_segments
-        updated = replace(
-            record,
-            status=JobStatus.COMPLETED,
-            completed_segments=completed,
-            artifact_path=artifact.path,
-            error_code=None,
-            process_id=None,
-            process_started_at=None,
-            updated_at=self._now(),
+    def publish_progress(
+        self,
+        job: Job,
+        *,
+        completed_segments: int,
+        total_segments: int,
+    ) -> None:
+        """Expose live progress for this process's run without a durable write.
+
+        The status file is bound to the current process identity, so progress from a
+        previous run of the same job is never shown for a new one.
+        """
+        if not 0 <= completed_segments <= total_segments:
+            raise ValueError("live progress must satisfy 0 <= completed <= total")
+        pid, process_started_at = self._current_process()
+        payload = json.dumps(
+            {
+                "schema_version": _LIVE_PROGRESS_SCHEMA_VERSION,
+                "job_id": job.job_id.value,
+                "process_id": pid,
+                "process_started_at": process_started_at,
+                "completed_segments": completed_segments,
+                "total_segments": total_segments,
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+        ).encode()
+        self.file_manager.ensure_directory_exists(self.live_dir, private=True)
+        self.file_manager.save_file(
+            payload + b"\n",
+            self._live_path(job.job_id),
+            private=True,
+            durable=False,
         )
-        self._write(updated)
+
+    def complete(self, job: Job, artifact: Artifact) -> JobLifecycleRecord:
+        with self._transaction() as connection:
+            record = self._required(connection, job.job_id)
+            completed = record.completed_segments
+            if record.total_segments is not None:
+                completed = record.total_segments
+            updated = replace(
+                record,
+                status=JobStatus.COMPLETED,
+                completed_segments=completed,
+                artifact_path=artifact.path,
+                error_code=None,
+                process_id=None,
+                process_started_at=None,
+                updated_at=self._now(),
+            )
+            self._upsert(connection, updated)
+        self._discard_live_progress(job.job_id)
         return updated
 
     def interrupt(self, job: Job) -> JobLifecycleRecord:
@@ -210,29 +345,101 @@ class JobLifecycleStore:
         return self._finish(job, status=JobStatus.FAILED, error_code=error_code)
 
     def get(self, job_id: JobId) -> JobLifecycleRecord:
-        record = self._required(job_id)
+        with self._connection() as connection:
+            record = self._select(connection, job_id)
+        if record is None:
+            raise JobNotFoundError(job_id.value)
         if record.status is JobStatus.RUNNING and not self._process_is_active(record):
-            record = replace(
-                record,
-                status=JobStatus.INTERRUPTED,
-                process_id=None,
-                process_started_at=None,
-                updated_at=self._now(),
-            )
-            self._write(record)
-        return record
+            self._reconcile_stale((self._with_live_progress(record),))
+            return self.get(job_id)
+        return self._with_live_progress(record)
 
-    def list_records(self) -> tuple[JobLifecycleRecord, ...]:
-        self.file_manager.ensure_directory_exists(self.registry_dir, private=True)
-        records: list[JobLifecycleRecord] = []
-        for path in self.file_manager.list_files(
-            self.registry_dir, (_JOB_MANIFEST_SUFFIX,)
-        ):
-            try:
-                records.append(self.get(JobId(path.stem)))
-            except (JobNotFoundError, ValueError):
-                continue
-        return tuple(sorted(records, key=lambda item: item.updated_at, reverse=True))
+    def list_records(
+        self,
+        *,
+        statuses: Iterable[JobStatus] = (),
+        with_artifact: bool = False,
+        updated_before: datetime | None = None,
+    ) -> tuple[JobLifecycleRecord, ...]:
+        """Return matching records newest first, answered from the registry indexes."""
+        query = self._filter(statuses, with_artifact, updated_before)
+        self._reconcile_running()
+        where, parameters = query.where()
+        with self._connection() as connection:
+            rows = connection.execute(
+                f"""
+                SELECT {_RECORD_COLUMNS} FROM job_lifecycle
+                WHERE {where}
+                ORDER BY updated_at_us DESC, job_id DESC
+                """,
+                parameters,
+            ).fetchall()
+        return tuple(self._with_live_progress(self._record(row)) for row in rows)
+
+    def list_page(
+        self,
+        *,
+        statuses: Iterable[JobStatus] = (),
+        with_artifact: bool = False,
+        updated_before: datetime | None = None,
+        after: JobLifecycleCursor | None = None,
+        limit: int = _DEFAULT_PAGE_SIZE,
+        oldest_first: bool = False,
+    ) -> JobLifecyclePage:
+        """Return one keyset page of matching records, newest first by default.
+
+        ``oldest_first`` walks the same indexes in ascending order, which lets sweeps
+        such as retention stream the stalest records without loading the rest.
+        """
+        if not 1 <= limit <= _MAX_PAGE_SIZE:
+            raise ValueError(f"limit must be between 1 and {_MAX_PAGE_SIZE}")
+        query = self._filter(statuses, with_artifact, updated_before)
+        if after is None:
+            self._reconcile_running()
+        where, parameters = query.where()
+        comparison, direction = (">", "ASC") if oldest_first else ("<", "DESC")
+        if after is not None:
+            where = f"{where} AND (updated_at_us, job_id) {comparison} (?, ?)"
+            parameters.extend((_timestamp_key(after.updated_at), after.job_id))
+        with self._connection() as connection:
+            rows = connection.execute(
+                f"""
+                SELECT {_RECORD_COLUMNS} FROM job_lifecycle
+                WHERE {where}
+                ORDER BY updated_at_us {direction}, job_id {direction}
+                LIMIT ?
+                """,
+                (*parameters, limit + 1),
+            ).fetchall()
+        records = tuple(
+            self._with_live_progress(self._record(row)) for row in rows[:limit]
+        )
+        next_cursor = (
+            JobLifecycleCursor(records[-1].updated_at, records[-1].job_id.value)
+            if len(rows) > limit
+            else None
+        )
+        return JobLifecyclePage(records, next_cursor)
+
+    def completed_artifacts_digest(self) -> str:
+        """Return a SHA-256 over every completed job's identity and artifact path.
+
+        Library discovery depends only on these rows, so callers can detect that the
+        set changed without listing records or reacting to progress writes.
+        """
+        digest = sha256()
+        with self._connection() as connection:
+            rows = connection.execute(
+                """
+                SELECT job_id, artifact_path FROM job_lifecycle
+                WHERE status = ? AND artifact_path IS NOT NULL
+                ORDER BY job_id
+                """,
+                (JobStatus.COMPLETED.value,),
+            )
+            for job_id, artifact_path in rows:
+                digest.update(f"{job_id}\0{artifact_path}\n".encode())
+        return digest.hexdigest()
 
     def is_resumable(self, job_id: JobId) -> bool:
         return self.file_manager.file_exists(
@@ -246,9 +453,15 @@ class JobLifecycleStore:
         if workspace.parent == self.paths.jobs_dir.resolve() and workspace.is_dir():
             self.file_manager.delete_directory(workspace)
             found = True
+        with self._transaction() as connection:
+            deleted = connection.execute(
+                "DELETE FROM job_lifecycle WHERE job_id = ?", (job_id.value,)
+            ).rowcount
+        found = found or deleted > 0
         if self.file_manager.file_exists(manifest):
             self.file_manager.delete_file(manifest)
             found = True
+        self._discard_live_progress(job_id)
         if not found:
             raise JobNotFoundError(job_id.value)
 
@@ -259,27 +472,278 @@ class JobLifecycleStore:
         status: JobStatus,
         error_code: str | None,
     ) -> JobLifecycleRecord:
-        record = self._required(job.job_id)
-        updated = replace(
-            record,
-            status=status,
-            error_code=error_code,
-            process_id=None,
-            process_started_at=None,
-            updated_at=self._now(),
-        )
-        self._write(updated)
+        with self._transaction() as connection:
+            record = self._with_live_progress(self._required(connection, job.job_id))
+            updated = replace(
+                record,
+                status=status,
+                error_code=error_code,
+                process_id=None,
+                process_started_at=None,
+                updated_at=self._now(),
+            )
+            self._upsert(connection, updated)
+        self._discard_live_progress(job.job_id)
         return updated
 
-    def _required(self, job_id: JobId) -> JobLifecycleRecord:
-        record = self._load_if_present(job_id)
+    def _with_live_progress(self, record: JobLifecycleRecord) -> JobLifecycleRecord:
+        """Overlay live progress published by the process that owns a RUNNING record."""
+        if record.status is not JobStatus.RUNNING:
+            return record
+        live = self._load_live_progress(record.job_id)
+        if (
+            live is None
+            or live.process_id != record.process_id
+            or live.process_started_at != record.process_started_at
+        ):
+            return record
+        try:
+            return replace(
+                record,
+                completed_segments=live.completed_segments,
+                total_segments=live.total_segments,
+            )
+        except ValueError:
+            return record
+
+    def _load_live_progress(self, job_id: JobId) -> _StoredLiveProgress | None:
+        path = self._live_path(job_id)
+        if not self.file_manager.file_exists(path):
+            return None
+        try:
+            if self.file_manager.get_file_metadata(path)["size"] > (
+                _MAX_LIVE_PROGRESS_BYTES
+            ):
+                return None
+            stored = _StoredLiveProgress.model_validate(
+                json.loads(self.file_manager.read_file(path))
+            )
+        except (
+            StorageError,
+            UnicodeDecodeError,
+            json.JSONDecodeError,
+            ValidationError,
+        ):
+            return None
+        if (
+            stored.schema_version != _LIVE_PROGRESS_SCHEMA_VERSION
+            or stored.job_id != job_id.value
+        ):
+            return None
+        return stored
+
+    def _discard_live_progress(self, job_id: JobId) -> None:
+        path = self._live_path(job_id)
+        if self.file_manager.file_exists(path):
+            self.file_manager.delete_file(path)
+
+    def _live_path(self, job_id: JobId) -> Path:
+        return self.live_dir / f"{job_id.value}.json"
+
+    def _current_process(self) -> tuple[int, float]:
+        if self._process_identity is None or self._process_identity[0] != os.getpid():
+            import psutil
+
+            pid = os.getpid()
+            self._process_identity = (pid, psutil.Process(pid).create_time())
+        return self._process_identity
+
+    @staticmethod
+    def _filter(
+        statuses: Iterable[JobStatus],
+        with_artifact: bool,
+        updated_before: datetime | None,
+    ) -> _RecordFilter:
+        if updated_before is not None and updated_before.tzinfo is None:
+            raise ValueError("updated_before must be timezone-aware")
+        return _RecordFilter(
+            statuses=tuple(sorted(set(statuses))),
+            with_artifact=with_artifact,
+            updated_before=updated_before,
+        )
+
+    def _reconcile_running(self) -> None:
+        with self._connection() as connection:
+            rows = connection.execute(
+                f"SELECT {_RECORD_COLUMNS} FROM job_lifecycle WHERE status = ?",
+                (JobStatus.RUNNING.value,),
+            ).fetchall()
+        stale = tuple(
+            self._with_live_progress(record)
+            for record in (self._record(row) for row in rows)
+            if not self._process_is_active(record)
+        )
+        if stale:
+            self._reconcile_stale(stale)
+
+    def _reconcile_stale(self, records: tuple[JobLifecycleRecord, ...]) -> None:
+        now = self._now()
+        reconciled: list[JobId] = []
+        with self._transaction() as connection:
+            for record in records:
+                # Only reconcile the exact RUNNING row that was probed; a job that
+                # restarted or progressed meanwhile keeps its newer state. The last
+                # live progress the dead process published becomes durable here.
+                cursor = connection.execute(
+                    """
+                    UPDATE job_lifecycle
+                    SET status = ?, process_id = NULL, process_started_at = NULL,
+                        completed_segments = ?, total_segments = ?,
+                        updated_at = ?, updated_at_us = ?
+                    WHERE job_id = ? AND status = ? AND updated_at = ?
+                    """,
+                    (
+                        JobStatus.INTERRUPTED.value,
+                        record.completed_segments,
+                        record.total_segments,
+                        now,
+                        _timestamp_key(now),
+                        record.job_id.value,
+                        JobStatus.RUNNING.value,
+                        record.updated_at,
+                    ),
+                )
+                if cursor.rowcount:
+                    reconciled.append(record.job_id)
+        for job_id in reconciled:
+            self._discard_live_progress(job_id)
+
+    def _required(
+        self, connection: sqlite3.Connection, job_id: JobId
+    ) -> JobLifecycleRecord:
+        record = self._select(connection, job_id)
         if record is None:
             raise JobNotFoundError(job_id.value)
         return record
 
-    def _load_if_present(self, job_id: JobId) -> JobLifecycleRecord | None:
-        path = self._manifest_path(job_id)
-        if not self.file_manager.file_exists(path):
+    def _select(
+        self, connection: sqlite3.Connection, job_id: JobId
+    ) -> JobLifecycleRecord | None:
+        row = connection.execute(
+            f"SELECT {_RECORD_COLUMNS} FROM job_lifecycle WHERE job_id = ?",
+            (job_id.value,),
+        ).fetchone()
+        return None if row is None else self._record(row)
+
+    @staticmethod
+    def _record(row: tuple[object, ...]) -> JobLifecycleRecord:
+        return JobLifecycleRecord.from_dict(
+            {
+                "schema_version": 1,
+                "job_id": row[0],
+                "input_path": row[1],
+                "output_dir": row[2],
+                "status": row[3],
+                "started_at": row[4],
+                "updated_at": row[5],
+                "process_id": row[6],
+                "process_started_at": row[7],
+                "total_segments": row[8],
+                "completed_segments": row[9],
+                "artifact_path": row[10],
+                "error_code": row[11],
+            }
+        )
+
+    def _upsert(
+        self, connection: sqlite3.Connection, record: JobLifecycleRecord
+    ) -> None:
+        connection.execute(
+            f"""
+            INSERT OR REPLACE INTO job_lifecycle ({_RECORD_COLUMNS}, updated_at_us)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                record.job_id.value,
+                str(record.input_path),
+                str(record.output_dir),
+                record.status.value,
+                record.started_at,
+                record.updated_at,
+                record.process_id,
+                record.process_started_at,
+                record.total_segments,
+                record.completed_segments,
+                None if record.artifact_path is None else str(record.artifact_path),
+                record.error_code,
+                _timestamp_key(record.updated_at),
+            ),
+        )
+
+    def _initialize(self, connection: sqlite3.Connection) -> None:
+        connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS registry_metadata (
+                singleton INTEGER PRIMARY KEY CHECK (singleton = 1),
+                schema_version INTEGER NOT NULL,
+                manifests_imported INTEGER NOT NULL DEFAULT 0
+            );
+            CREATE TABLE IF NOT EXISTS job_lifecycle (
+                job_id TEXT PRIMARY KEY,
+                input_path TEXT NOT NULL,
+                output_dir TEXT NOT NULL,
+                status TEXT NOT NULL,
+                started_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL,
+                updated_at_us INTEGER NOT NULL,
+                process_id INTEGER,
+                process_started_at REAL,
+                total_segments INTEGER,
+                completed_segments INTEGER NOT NULL,
+                artifact_path TEXT,
+                error_code TEXT
+            );
+            CREATE INDEX IF NOT EXISTS job_lifecycle_status_updated_us_idx
+                ON job_lifecycle(status, updated_at_us, job_id);
+            CREATE INDEX IF NOT EXISTS job_lifecycle_updated_us_idx
+                ON job_lifecycle(updated_at_us, job_id);
+            """
+        )
+        connection.execute("BEGIN IMMEDIATE")
+        connection.execute(
+            """
+            INSERT OR IGNORE INTO registry_metadata (singleton, schema_version)
+            VALUES (1, ?)
+            """,
+            (_REGISTRY_SCHEMA_VERSION,),
+        )
+        row = connection.execute(
+            """
+            SELECT schema_version, manifests_imported FROM registry_metadata
+            WHERE singleton = 1
+            """
+        ).fetchone()
+        if row is None or int(row[0]) != _REGISTRY_SCHEMA_VERSION:
+            connection.rollback()
+            raise ValueError("job lifecycle registry schema is unsupported")
+        if not row[1]:
+            for record in self._legacy_manifests():
+                exists = connection.execute(
+                    "SELECT 1 FROM job_lifecycle WHERE job_id = ?",
+                    (record.job_id.value,),
+                ).fetchone()
+                if exists is None:
+                    self._upsert(connection, record)
+            connection.execute(
+                "UPDATE registry_metadata SET manifests_imported = 1 WHERE singleton = 1"
+            )
+        connection.commit()
+
+    def _legacy_manifests(self) -> Iterator[JobLifecycleRecord]:
+        for path in self.file_manager.list_files(
+            self.registry_dir, (_JOB_MANIFEST_SUFFIX,)
+        ):
+            try:
+                record = self._load_manifest(path)
+            except (ValueError, StorageError):
+                continue
+            if record is not None:
+                yield record
+
+    def _load_manifest(self, path: Path) -> JobLifecycleRecord | None:
+        try:
+            job_id = JobId(path.stem)
+        except ScholionError:
             return None
         metadata = self.file_manager.get_file_metadata(path)
         if metadata["size"] < 2 or metadata["size"] > self.max_manifest_bytes:
@@ -297,19 +761,45 @@ class JobLifecycleStore:
             raise ValueError("private job lifecycle manifest belongs to another job")
         return record
 
-    def _write(self, record: JobLifecycleRecord) -> None:
-        self.file_manager.ensure_directory_exists(self.registry_dir, private=True)
-        path = self._manifest_path(record.job_id)
-        payload = json.dumps(
-            record.to_dict(), sort_keys=True, separators=(",", ":")
-        ).encode()
-        if len(payload) > self.max_manifest_bytes:
-            raise ValueError("private job lifecycle manifest exceeds safe bounds")
-        self.file_manager.save_file(payload + b"\n", path, private=True)
-
     def _manifest_path(self, job_id: JobId) -> Path:
         return self.registry_dir / f"{job_id.value}{_JOB_MANIFEST_SUFFIX}"
 
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._connection() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            yield connection
+            connection.commit()
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        connection: sqlite3.Connection | None = None
+        try:
+            if not self._initialized:
+                self.file_manager.ensure_directory_exists(
+                    self.registry_dir, private=True
+                )
+            connection = sqlite3.connect(self.database_path, timeout=5.0)
+            connection.execute("PRAGMA busy_timeout = 5000")
+            connection.execute("PRAGMA synchronous = FULL")
+            if not self._initialized:
+                self._initialize(connection)
+                self._initialized = True
+            yield connection
+        except sqlite3.Error as exc:
+            if connection is not None:
+                connection.rollback()
+            raise StorageError(
+                "access job lifecycle registry", self.database_path, cause=exc
+            ) from exc
+        except BaseException:
+            if connection is not None:
+                connection.rollback()
+            raise
+        finally:
+            if connection is not None:
+                connection.close()
+
     @staticmethod
     def _now() -> str:
         return datetime.now(UTC).isoformat()
@@ -318,6 +808,9 @@ class JobLifecycleStore:
     def _process_is_active(record: JobLifecycleRecord) -> bool:
         if record.process_id is None or record.process_started_at is None:
             return False
+        # Imported here so reading lifecycle state without running jobs stays cheap.
+        import psutil
+
         try:
             process = psutil.Process(record.process_id)
             return abs(process.create_time() - record.process_started_at) < 0.01
@@ -325,3 +818,18 @@ class JobLifecycleStore:
             return False
         except psutil.AccessDenied:
             return True
+
+
+def _timestamp_micros(value: datetime) -> int:
+    delta = value.astimezone(UTC) - datetime(1970, 1, 1, tzinfo=UTC)
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def _timestamp_key(value: str) -> int:
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return _UNORDERED_TIMESTAMP_US
+    if parsed.tzinfo is None:
+        return _UNORDERED_TIMESTAMP_US
+    return _timestamp_micros(parsed)
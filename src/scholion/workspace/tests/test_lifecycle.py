@@ -1,3 +1,6 @@
+import json
+import sqlite3
+from datetime import UTC, datetime
 from unittest.mock import Mock
 
 import pytest
@@ -48,6 +51,25 @@ def test_lifecycle_tracks_progress_completion_and_listing(lifecycle_setup):
     assert not store.is_resumable(job.job_id)
 
 
+def test_completed_artifacts_digest_ignores_progress_and_tracks_completion(
+    lifecycle_setup,
+):
+    store, workspace, job, _ = lifecycle_setup
+    store.start(job)
+    before = store.completed_artifacts_digest()
+
+    store.record_progress(job, completed_segments=1, total_segments=5)
+    assert store.completed_artifacts_digest() == before
+
+    artifact = workspace.reserve_artifact(job, ArtifactKind.CANONICAL_JSON)
+    store.complete(job, artifact)
+    completed = store.completed_artifacts_digest()
+    assert completed != before
+
+    store.discard(job.job_id)
+    assert store.completed_artifacts_digest() == before
+
+
 def test_lifecycle_marks_interrupt_failure_and_stale_process(
     lifecycle_setup, monkeypatch
 ):
@@ -100,3 +122,134 @@ def test_lifecycle_rejects_invalid_limits_and_missing_jobs(lifecycle_setup):
         store.get(JobId("missing"))
     with pytest.raises(JobNotFoundError):
         store.discard(JobId("missing"))
+
+
+def test_registry_imports_legacy_manifests_once(lifecycle_setup):
+    store, _, job, paths = lifecycle_setup
+    legacy = JobLifecycleStore(store.file_manager, paths)
+    legacy.start(job)
+    record = legacy.complete(job, Mock(path=job.output_dir / "transcript.json"))
+    legacy.database_path.unlink()
+    manifest = legacy.registry_dir / "job-1.json"
+    manifest.write_text(json.dumps(record.to_dict()))
+    (legacy.registry_dir / "broken.json").write_text("{")
+
+    migrated = JobLifecycleStore(store.file_manager, paths)
+
+    assert migrated.list_records() == (record,)
+    migrated.discard(job.job_id)
+    assert not manifest.exists()
+    assert JobLifecycleStore(store.file_manager, paths).list_records() == ()
+
+
+def test_registry_filters_and_pages_newest_first(tmp_path, monkeypatch):
+    paths = WorkspacePaths(
+        state_dir=tmp_path / "state",
+        cache_dir=tmp_path / "cache",
+        model_dir=tmp_path / "cache" / "models",
+        output_dir=tmp_path / "output",
+    )
+    facade = FileManagerFacade(LocalFileManager(), Mock(), PerformanceTracker())
+    ids = iter(f"job-{index}" for index in range(5))
+    workspace = WorkspaceService(paths, facade, id_factory=lambda: next(ids))
+    store = JobLifecycleStore(facade, paths)
+    clock = iter(f"2026-08-0{day}T00:00:00+00:00" for day in range(1, 10))
+    monkeypatch.setattr(JobLifecycleStore, "_now", staticmethod(lambda: next(clock)))
+    source = tmp_path / "interview.wav"
+    source.write_bytes(b"audio")
+    jobs = [workspace.create_job(source) for _ in range(4)]
+    for job in jobs:
+        store.start(job)
+    for job in jobs[:3]:
+        artifact = workspace.reserve_artifact(job, ArtifactKind.CANONICAL_JSON)
+        store.complete(job, artifact)
+    monkeypatch.setattr(
+        JobLifecycleStore,
+        "_process_is_active",
+        staticmethod(lambda record: True),
+    )
+
+    completed = store.list_records(statuses=(JobStatus.COMPLETED,), with_artifact=True)
+    old = store.list_records(
+        statuses=(JobStatus.COMPLETED,),
+        updated_before=datetime(2026, 8, 5, tzinfo=UTC),
+    )
+    first = store.list_page(limit=3)
+    second = store.list_page(limit=3, after=first.next_cursor)
+
+    assert [record.job_id.value for record in completed] == ["job-2", "job-1", "job-0"]
+    assert [record.job_id.value for record in old] == ["job-0"]
+    assert [record.job_id.value for record in first.records] == [
+        "job-2",
+        "job-1",
+        "job-0",
+    ]
+    assert [record.job_id.value for record in second.records] == ["job-3"]
+    assert second.next_cursor is None
+    oldest = store.list_page(limit=2, oldest_first=True)
+    rest = store.list_page(limit=2, oldest_first=True, after=oldest.next_cursor)
+    assert [record.job_id.value for record in oldest.records] == ["job-3", "job-0"]
+    assert [record.job_id.value for record in rest.records] == ["job-1", "job-2"]
+    assert rest.next_cursor is None
+    with pytest.raises(ValueError, match="limit"):
+        store.list_page(limit=0)
+
+
+def test_updated_before_cutoffs_are_index_ranges(lifecycle_setup):
+    store, _, job, _ = lifecycle_setup
+    store.start(job)
+    cutoff = datetime(2026, 8, 5, tzinfo=UTC)
+    queries = (
+        store._filter((), False, cutoff),
+        store._filter((JobStatus.COMPLETED,), True, cutoff),
+        store._filter((JobStatus.COMPLETED, JobStatus.FAILED), False, cutoff),
+    )
+
+    with sqlite3.connect(store.database_path) as connection:
+        for query in queries:
+            where, parameters = query.where()
+            plan = connection.execute(
+                f"""
+                EXPLAIN QUERY PLAN SELECT job_id FROM job_lifecycle WHERE {where}
+                ORDER BY updated_at_us, job_id LIMIT 10
+                """,  # noqa: S608 - the store's own filter clauses; values stay bound.
+                parameters,
+            ).fetchall()
+            details = " ".join(str(row[3]) for row in plan)
+            assert "updated_at_us<?" in details
+            assert "SCAN job_lifecycle" not in details
+
+
+def test_unorderable_legacy_timestamps_stay_inside_every_cutoff(lifecycle_setup):
+    store, _, job, paths = lifecycle_setup
+    store.start(job)
+    record = store.interrupt(job)
+    store.database_path.unlink()
+    manifest = store.registry_dir / "job-1.json"
+    manifest.write_text(json.dumps({**record.to_dict(), "updated_at": "not-a-time"}))
+
+    reopened = JobLifecycleStore(store.file_manager, paths)
+    old = reopened.list_records(updated_before=datetime(2000, 1, 1, tzinfo=UTC))
+
+    assert [record.updated_at for record in old] == ["not-a-time"]
+
+
+def test_live_progress_is_overlaid_then_folded_into_transitions(lifecycle_setup):
+    store, _, job, _ = lifecycle_setup
+    store.start(job)
+    store.record_progress(job, completed_segments=1, total_segments=10)
+
+    store.publish_progress(job, completed_segments=7, total_segments=10)
+
+    assert store.get(job.job_id).completed_segments == 7
+    assert store.list_records()[0].completed_segments == 7
+    interrupted = store.interrupt(job)
+    assert interrupted.completed_segments == 7
+    assert not (store.live_dir / "job-1.json").exists()
+
+    store.start(job)
+    store.publish_progress(job, completed_segments=9, total_segments=10)
+    (store.live_dir / "job-1.json").write_text("{")
+    assert store.get(job.job_id).completed_segments == 7
+    with pytest.raises(ValueError, match="live progress"):
+        store.publish_progress(job, completed_segments=11, total_segments=10)